@@ -5,7 +5,7 @@ v1 엔드포인트 통합
 """
 
 from fastapi import APIRouter
-from app.api.v1.endpoints import query, health
+from app.api.v1.endpoints import query, health, admin
 
 # v1 라우터
 api_router = APIRouter()
@@ -13,6 +13,7 @@ api_router = APIRouter()
 # 엔드포인트 등록
 api_router.include_router(query.router, tags=["Query"])
 api_router.include_router(health.router, tags=["Health"])
+api_router.include_router(admin.router, tags=["Admin"])
 
 
 
@@ -0,0 +1,60 @@
+"""
+Admin Endpoint - RAG 인덱스 무중단 교체
+"""
+
+from dataclasses import asdict
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from app.models import IndexReloadRequest, IndexReloadResponse
+from app.core.deps import get_index_reloader
+from core.agents import IndexReloader
+from core.types.errors import HRAgentError
+
+router = APIRouter(prefix="/admin")
+
+
+@router.post(
+    "/index/reload",
+    response_model=IndexReloadResponse,
+    summary="RAG 인덱스 교체",
+    description=(
+        "build_index.py가 게시한 최신 인덱스 버전(CURRENT)을 재시작 없이 로드해 교체합니다. "
+        "요청을 받은 워커 프로세스만 교체되므로, 워커가 여러 개면 RAG_INDEX_WATCH_ENABLED로 "
+        "각 워커가 CURRENT를 감시하게 하거나 모든 워커에 요청해야 합니다."
+    ),
+)
+async def reload_index(
+    request: Optional[IndexReloadRequest] = None,
+    reloader: IndexReloader = Depends(get_index_reloader),
+) -> IndexReloadResponse:
+    """새 인덱스는 스레드풀에서 로드 (이벤트 루프/처리 중인 요청을 막지 않음)"""
+    try:
+        report = await run_in_threadpool(reloader.reload, bool(request and request.force))
+    except HRAgentError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": e.code, "message": e.message},
+        )
+    return IndexReloadResponse(**asdict(report))
+
+
+@router.get(
+    "/index",
+    response_model=IndexReloadResponse,
+    summary="RAG 인덱스 버전",
+    description="현재 서빙 중인 인덱스 버전과 마지막 교체 결과를 확인합니다.",
+)
+async def index_status(
+    reloader: IndexReloader = Depends(get_index_reloader),
+) -> IndexReloadResponse:
+    """마지막 교체 기록 (없으면 현재 버전만)"""
+    last = reloader.last_swap
+    return IndexReloadResponse(
+        swapped=last is not None,
+        version=reloader.version,
+        previous_version=last.previous_version if last else None,
+        elapsed_ms=last.elapsed_ms if last else 0.0,
+    )
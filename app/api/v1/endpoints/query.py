@@ -4,9 +4,10 @@ Query Endpoint - HR Agent 통합 API (DI 적용)
 
 from fastapi import APIRouter, HTTPException, Depends
 
-from app.models import QueryRequest, QueryResponse
+from app.models import AnswerStatsResponse, QueryRequest, QueryResponse
 from app.core.deps import get_hr_agent
 from core.agents import HRAgent
+from core.retrieval.sharded import SearchFilter
 from core.types.errors import HRAgentError
 
 router = APIRouter(prefix="/query")
@@ -26,7 +27,16 @@ async def query(
     HR Agent 통합 질의 엔드포인트
     """
     try:
-        result = hr_agent.query(request.question)
+        search_filter = SearchFilter(
+            collections=request.collections,
+            sources=request.sources,
+            pages=request.pages,
+        )
+        result = hr_agent.query(
+            request.question,
+            answer_mode=request.answer_mode,
+            search_filter=search_filter or None,
+        )
 
         return QueryResponse(
             question=request.question,
@@ -46,3 +56,16 @@ async def query(
             status_code=500,
             detail=f"질의 처리 중 오류 발생: {str(e)}",
         )
+
+
+@router.get(
+    "/stats",
+    response_model=AnswerStatsResponse,
+    summary="RAG 응답 방식 통계",
+    description="추출 모드 요청 중 LLM 생성을 생략한 비율을 확인합니다.",
+)
+async def answer_stats(
+    hr_agent: HRAgent = Depends(get_hr_agent),
+) -> AnswerStatsResponse:
+    """RAG Agent 추출 응답 통계 (프로세스 시작 이후 누적)"""
+    return AnswerStatsResponse(**hr_agent.rag_agent.answer_stats())
@@ -40,11 +40,70 @@ class Settings(BaseSettings):
 
     # === SQL Agent 설정 ===
     SQL_AGENT_MAX_ATTEMPTS: int = 3
+    SQL_QUERY_LOG_ENABLED: bool = False  # 실행 SQL 로그 (지연 시간/조회 행 수, 인덱스 추천용)
+    SQL_QUERY_LOG_PATH: str = "data/query_log.db"  # SQLite 파일 경로
+
+    # === Analytics 설정 (SQL Agent 집계 가속) ===
+    ANALYTICS_REPLICA_ENABLED: bool = False  # 인메모리 컬럼형 레플리카 사용 여부
+    ANALYTICS_REPLICA_REFRESH_INTERVAL: float = 60.0  # 증분 갱신 주기(초)
+    ANALYTICS_REPLICA_FULL_REFRESH_INTERVAL: float = 3600.0  # 전체 재로드 주기(초)
+    ANALYTICS_ROLLUPS_ENABLED: bool = False  # 부서×직급×월 사전 집계 롤업 사용 여부
+    ANALYTICS_ROLLUPS_REFRESH_INTERVAL: float = 300.0  # 변경 감지 주기(초)
+    ANALYTICS_ROLLUPS_MAX_AGE: float = 3600.0  # 변경이 감지되지 않아도 강제 재계산하는 주기(초)
+    ANALYTICS_ROLLUPS_CHECKSUM_INTERVAL: float = 900.0  # 행 체크섬(전체 스캔) 재계산 주기(초)
+    ANALYTICS_APPROX_ENABLED: bool = False  # 대용량 테이블 표본 근사 집계 사용 여부
+    ANALYTICS_APPROX_SAMPLE_SIZE: int = 20000  # 테이블별 저수지 표본 크기
+    ANALYTICS_APPROX_MIN_POPULATION: int = 1_000_000  # 근사 응답을 허용하는 최소 행 수
+    ANALYTICS_APPROX_MAX_RELATIVE_ERROR: float = 0.05  # 초과 시 정확 실행 폴백
+    ANALYTICS_ATTENDANCE_ENABLED: bool = False  # 근태 이상 감지 (일괄 계산) 사용 여부
+    ANALYTICS_ATTENDANCE_CACHE_TTL: float = 300.0  # 분석 결과 캐시 유효 시간(초)
+    ANALYTICS_ATTENDANCE_Z_THRESHOLD: float = 3.5  # 출근 시각 이상치 robust z-score 임계값
 
     # === RAG Agent 설정 ===
     RAG_TOP_K: int = 3
-    RAG_EMBEDDING_MODEL: str = "text-embedding-3-small"
-    RAG_INDEX_PATH: Optional[str] = None  # None이면 기본 경로 사용
+    RAG_EMBEDDING_PROVIDER: str = ""  # 빈 값이면 LLM_PROVIDER, "local": 외부 호출 없는 해싱 임베딩
+    RAG_EMBEDDING_MODEL: str = "text-embedding-3-small"  # local이면 "hash-<차원>" (아니면 hash-384)
+    RAG_INDEX_PATH: Optional[str] = None  # 인덱스 루트 (None이면 기본 경로, CURRENT 버전 로드)
+    RAG_SHARD_BY: str = ""  # 빌드 시 샤드 기준 metadata ("source": 원본 파일별, 빈 값: 끄기)
+    RAG_SHARD_WORKERS: int = 4  # 샤드 동시 검색 스레드 수
+    RAG_INDEX_WATCH_ENABLED: bool = False  # CURRENT 변경 감시 → 무중단 인덱스 교체 (워커마다)
+    RAG_INDEX_WATCH_INTERVAL: float = 10.0  # CURRENT 확인 주기 (초)
+    RAG_INDEX_KEEP_VERSIONS: int = 3  # build_index.py가 남길 인덱스 버전 수
+    RAG_EMBEDDING_CACHE_ENABLED: bool = True  # 질문 임베딩 디스크 캐시 (워커 간 공유)
+    RAG_EMBEDDING_CACHE_PATH: str = "data/embedding_cache.db"  # SQLite 파일 경로
+    RAG_EMBEDDING_CACHE_SIZE: int = 1024  # 메모리 LRU 크기
+    RAG_EMBED_BATCH_SIZE: int = 64  # 인덱스 빌드 임베딩 배치 크기
+    RAG_EMBED_WORKERS: int = 4  # 인덱스 빌드 동시 임베딩 요청 수 (Ollama는 1~2 권장)
+    RAG_PARSE_CACHE_PATH: str = "data/parse_cache.db"  # PDF 파싱 캐시 (파일 해시+페이지)
+    RAG_CHUNKER: str = "recursive"  # "article": 장/조/항 단위 | "recursive": 고정 길이
+    RAG_CHILD_CHUNK_SIZE: int = 0  # 부모-자식 인덱스 자식 청크 크기 (0이면 끄기, 예: 200)
+    RAG_DEDUP_THRESHOLD: float = 0.8  # 유사 중복 청크 제거 Jaccard 기준 (0이면 끄기)
+    RAG_HYBRID_ENABLED: bool = False  # BM25 + 벡터 하이브리드 검색 (bm25.json 있을 때)
+    RAG_RRF_K: int = 60  # Reciprocal Rank Fusion 상수
+    RAG_ARTICLE_LOOKUP_ENABLED: bool = False  # 조 번호/제목으로 직접 조회 (articles.json 있을 때)
+    RAG_FACT_TABLE_ENABLED: bool = True  # 인덱스 빌드 시 조문 수치 사실 추출 (facts.json)
+    RAG_FACT_LOOKUP_ENABLED: bool = False  # 수치 질문에 사실 테이블로 응답 (facts.json 있을 때)
+    # 빌드 시 FAQ 원본 (쉼표 구분)
+    RAG_FAQ_SOURCES: str = "data/finetuning/rag_train.json,data/faq_approved.json"
+    RAG_FAQ_ENABLED: bool = False  # FAQ 질문과 일치하면 저장된 답변으로 응답 (faq.json 있을 때)
+    RAG_FAQ_MIN_SCORE: float = 0.85  # FAQ 응답 최소 점수 (어휘 + 질문 벡터 유사도, 0~1)
+    RAG_PARENT_CHILD_ENABLED: bool = False  # 자식 청크 검색 → 부모 청크 반환 (parents.json 있을 때)
+    RAG_CONTEXT_TOKEN_BUDGET: int = 1500  # 프롬프트에 넣을 부모 청크 토큰 합 상한
+    RAG_ADAPTIVE_K_ENABLED: bool = False  # 점수 분포로 검색 개수 결정 (RAG_TOP_K 대체)
+    RAG_MIN_K: int = 1
+    RAG_MAX_K: int = 6
+    RAG_MAX_DISTANCE: Optional[float] = None  # 벡터 검색 L2 거리 상한 (None이면 미사용)
+    RAG_SCORE_GAP: float = 0.5  # 점수 폭 대비 이 비율 이상 떨어지면 자름 (0이면 미사용)
+    RAG_MMR_ENABLED: bool = False  # 중복 결과 대신 다양한 결과 선택
+    RAG_MMR_LAMBDA: float = 0.7  # MMR 관련도 가중치 (1=관련도만, 0=다양성만)
+    RAG_ANSWER_MODE: str = "llm"  # "llm" | "extractive": 확신 높으면 LLM 생략 (요청마다 변경 가능)
+    RAG_EXTRACTIVE_MIN_SCORE: float = 0.6  # 추출 응답 최소 점수 (어휘 + 의미 유사도, 0~1)
+    RAG_EXTRACTIVE_MIN_MARGIN: float = 0.05  # 추출 응답 1위/2위 문장 최소 점수 차이
+    RAG_CONTEXT_COMPRESSION_ENABLED: bool = False  # LLM 생성 전 질문 관련 문장만 남김
+    RAG_COMPRESSION_TOKEN_BUDGET: int = 600  # 압축 후 프롬프트 문맥 토큰 상한
+    RAG_INDEX_FORMAT: str = "auto"  # "auto"(mmap 우선) | "mmap" | "pickle"
+    RAG_INDEX_TYPE: str = "flat"  # flat | ivf | ivfpq | ivfsq | sq | hnsw (예: "hnsw:m=32")
+    RAG_VECTOR_QUANTIZATION: str = "float32"  # float32 | float16 | int8[:dims=N,rescore=M]
 
     # === Database 설정 ===
     DATABASE_URL: Optional[str] = Field(default=None, env="DATABASE_URL")
@@ -4,7 +4,7 @@ FastAPI 의존성 주입 (Container 기반)
 """
 
 from core.container import get_container
-from core.agents import HRAgent
+from core.agents import HRAgent, IndexReloader
 
 
 def get_hr_agent() -> HRAgent:
@@ -15,3 +15,13 @@ def get_hr_agent() -> HRAgent:
         HRAgent 인스턴스 (Container에서 관리)
     """
     return get_container().hr_agent
+
+
+def get_index_reloader() -> IndexReloader:
+    """
+    IndexReloader 의존성 주입
+
+    Returns:
+        IndexReloader 인스턴스 (Container에서 관리)
+    """
+    return get_container().index_reloader
@@ -21,6 +21,8 @@ async def lifespan(app: FastAPI):
     Startup:
     - DI Container 초기화
     - DB 연결 테스트
+    - 롤업 변경 감지 스레드 시작 (활성화 시)
+    - RAG 인덱스 CURRENT 감시 스레드 시작 (활성화 시)
 
     Shutdown:
     - 정리 작업
@@ -37,9 +39,30 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             print(f"⚠️ DB 연결 실패 (나중에 연결 시도): {e}")
 
+        # 롤업 백그라운드 갱신 (대시보드성 집계 사전 계산)
+        if container.rollups is not None:
+            container.rollups.start()
+
+        # 대용량 테이블 표본 추출/유지 (요청 경로 밖에서 수행)
+        if container.approximator is not None:
+            container.approximator.start()
+
+    # 재빌드된 RAG 인덱스 무중단 교체 (워커마다 CURRENT 감시, 요청 경로 밖에서 로드)
+    if settings.RAG_INDEX_WATCH_ENABLED:
+        try:
+            container.index_reloader.start()
+        except Exception as e:
+            print(f"⚠️ RAG 인덱스 감시 시작 실패 (수동 교체만 가능): {e}")
+
     yield
 
     # Shutdown
+    if "index_reloader" in container.__dict__:  # 감시를 시작한 경우만 (cached_property)
+        container.index_reloader.stop()
+    if settings.DATABASE_URL and container.rollups is not None:
+        container.rollups.stop()
+    if settings.DATABASE_URL and container.approximator is not None:
+        container.approximator.stop()
     print("👋 애플리케이션 종료")
 
 
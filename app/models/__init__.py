@@ -4,10 +4,22 @@ Pydantic Models
 Request/Response 모델
 """
 
-from app.models.request import QueryRequest
-from app.models.response import QueryResponse, HealthResponse
+from app.models.request import QueryRequest, IndexReloadRequest
+from app.models.response import (
+    QueryResponse,
+    HealthResponse,
+    AnswerStatsResponse,
+    IndexReloadResponse,
+)
 
-__all__ = ["QueryRequest", "QueryResponse", "HealthResponse"]
+__all__ = [
+    "QueryRequest",
+    "IndexReloadRequest",
+    "QueryResponse",
+    "HealthResponse",
+    "AnswerStatsResponse",
+    "IndexReloadResponse",
+]
 
 
 
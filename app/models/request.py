@@ -4,6 +4,8 @@ Request Models
 API 요청 Pydantic 모델
 """
 
+from typing import List, Literal, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -17,6 +19,25 @@ class QueryRequest(BaseModel):
         max_length=500,
         example="직원은 총 몇 명인가요?"
     )
+    answer_mode: Optional[Literal["llm", "extractive"]] = Field(
+        None,
+        description=(
+            "규정 질문 응답 방식"
+            " (extractive: 답 문장을 확신하면 LLM 생성 생략, 기본: RAG_ANSWER_MODE)"
+        ),
+    )
+    collections: Optional[List[str]] = Field(
+        None,
+        description="규정 검색 컬렉션(샤드) 이름 (기본: 전체)",
+    )
+    sources: Optional[List[str]] = Field(
+        None,
+        description="규정 검색 대상 파일명 (예: [\"02_회사규정.pdf\"], 기본: 전체)",
+    )
+    pages: Optional[List[int]] = Field(
+        None,
+        description="규정 검색 대상 페이지 (1부터, 기본: 전체)",
+    )
     
     class Config:
         json_schema_extra = {
@@ -26,5 +47,11 @@ class QueryRequest(BaseModel):
         }
 
 
+class IndexReloadRequest(BaseModel):
+    """RAG 인덱스 교체 요청 모델"""
+
+    force: bool = Field(False, description="버전이 같아도 다시 로드")
+
+
 
 
@@ -29,6 +29,26 @@ class QueryResponse(BaseModel):
         }
 
 
+class AnswerStatsResponse(BaseModel):
+    """RAG 응답 방식 통계 모델"""
+
+    queries: int = Field(..., description="RAG 질의 수")
+    faq_answers: int = Field(..., description="FAQ 색인으로 응답한 수 (검색·LLM 생략)")
+    fact_answers: int = Field(..., description="수치 사실 테이블로 응답한 수 (검색·LLM 생략)")
+    extractive_requests: int = Field(..., description="추출 모드 요청 수")
+    llm_skipped: int = Field(..., description="LLM 생성 없이 추출 응답한 수")
+    llm_skip_rate: float = Field(..., description="추출 모드 요청 중 LLM을 생략한 비율")
+
+
+class IndexReloadResponse(BaseModel):
+    """RAG 인덱스 교체 결과 모델"""
+
+    swapped: bool = Field(..., description="새 인덱스로 교체했는지 여부")
+    version: Optional[str] = Field(None, description="현재 서빙 중인 인덱스 버전")
+    previous_version: Optional[str] = Field(None, description="교체 전 인덱스 버전")
+    elapsed_ms: float = Field(..., description="새 인덱스 로드 + 교체 시간 (ms)")
+
+
 class HealthResponse(BaseModel):
     """헬스체크 응답 모델"""
     
@@ -6,5 +6,6 @@ SQL, RAG, HR Agent 클래스
 from core.agents.sql_agent import SQLAgent
 from core.agents.rag_agent import RAGAgent
 from core.agents.hr_agent import HRAgent
+from core.agents.index_reloader import IndexReloader, ReloadReport
 
-__all__ = ["SQLAgent", "RAGAgent", "HRAgent"]
+__all__ = ["SQLAgent", "RAGAgent", "HRAgent", "IndexReloader", "ReloadReport"]
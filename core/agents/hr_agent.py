@@ -6,7 +6,7 @@ HR Agent - 통합 HR Agent (LangGraph 기반)
     result = agent.query("직원 수는?")
 """
 
-from typing import Literal
+from typing import Literal, Optional
 
 from langgraph.graph import StateGraph, END
 
@@ -14,6 +14,7 @@ from core.types.agent_types import HRAgentState, AgentResult
 from core.routing.router import Router
 from core.agents.sql_agent import SQLAgent
 from core.agents.rag_agent import RAGAgent
+from core.retrieval.sharded import SearchFilter
 
 
 class HRAgent:
@@ -86,7 +87,11 @@ class HRAgent:
         self._log("[RAG Agent] 질문 처리 중...")
 
         try:
-            result = self.rag_agent.query(state["question"])
+            result = self.rag_agent.query(
+                state["question"],
+                answer_mode=state.get("answer_mode"),
+                search_filter=state.get("search_filter"),
+            )
             self._log("[RAG Agent] 완료")
             return {**state, "agent_result": result, "error": ""}
         except Exception as e:
@@ -131,12 +136,19 @@ class HRAgent:
 
         return workflow.compile()
 
-    def query(self, question: str) -> AgentResult:
+    def query(
+        self,
+        question: str,
+        answer_mode: Optional[str] = None,
+        search_filter: Optional[SearchFilter] = None,
+    ) -> AgentResult:
         """
         질문에 대한 답변 생성
 
         Args:
             question: 사용자 질문
+            answer_mode: RAG 응답 방식 ("llm" | "extractive", None이면 RAGAgent 기본값)
+            search_filter: RAG 검색 범위 (컬렉션/파일/페이지)
 
         Returns:
             AgentResult: 통일된 결과 형식
@@ -155,6 +167,8 @@ class HRAgent:
             "agent_type": "",
             "agent_result": None,
             "error": "",
+            "answer_mode": answer_mode,
+            "search_filter": search_filter,
         }
 
         result = self.app.invoke(initial_state)
@@ -171,12 +185,19 @@ class HRAgent:
             error=result.get("error"),
         )
 
-    def stream(self, question: str):
+    def stream(
+        self,
+        question: str,
+        answer_mode: Optional[str] = None,
+        search_filter: Optional[SearchFilter] = None,
+    ):
         """
         스트리밍 응답 (향후 구현)
 
         Args:
             question: 사용자 질문
+            answer_mode: RAG 응답 방식 ("llm" | "extractive", None이면 RAGAgent 기본값)
+            search_filter: RAG 검색 범위 (컬렉션/파일/페이지)
 
         Yields:
             상태 업데이트
@@ -186,6 +207,8 @@ class HRAgent:
             "agent_type": "",
             "agent_result": None,
             "error": "",
+            "answer_mode": answer_mode,
+            "search_filter": search_filter,
         }
 
         for state in self.app.stream(initial_state):
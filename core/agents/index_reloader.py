@@ -0,0 +1,139 @@
+"""
+Index Reloader
+재빌드된 RAG 인덱스를 API 재시작 없이 교체 (무중단)
+
+- build_index.py가 새 버전 디렉토리를 게시(CURRENT 교체)하면
+    1) 요청 경로 밖(감시 스레드 또는 관리자 API의 스레드풀)에서 새 RAGAgent를 로드
+       (FAISS/BM25/조문/FAQ/사실 테이블, with_index() - 응답 통계는 공유)
+    2) 로드가 끝난 뒤 hr_agent.rag_agent 참조 하나만 교체 (원자적 대입)
+    3) 이전 에이전트 close() - 진행 중인 샤드 검색이 끝나면 스레드 풀 종료
+       (교체마다 풀이 쌓이지 않음)
+- 이미 처리 중인 요청은 기존 에이전트로 끝나고, 이후 요청부터 새 인덱스 사용
+- 새 인덱스 로드에 실패하면 기존 에이전트 유지
+- 동시에 여러 번 요청돼도 로드는 한 번에 하나
+
+사용법:
+    reloader = IndexReloader(hr_agent, index_root="data/faiss_index", poll_interval=10)
+    reloader.start()  # CURRENT 변경 감시
+    report = reloader.reload()  # 즉시 확인 (관리자 API)
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from core.agents.hr_agent import HRAgent
+from core.agents.rag_agent import RAGAgent
+from core.retrieval.index_versions import current_version, resolve_index_path
+from core.types.errors import RAGRetrievalError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReloadReport:
+    """인덱스 교체 결과"""
+    swapped: bool
+    version: Optional[str]  # 현재 서빙 중인 버전
+    previous_version: Optional[str]
+    elapsed_ms: float
+
+
+class IndexReloader:
+    """
+    CURRENT 포인터 감시 + RAGAgent 교체
+    """
+
+    def __init__(
+        self,
+        hr_agent: HRAgent,
+        index_root: Union[str, Path],
+        poll_interval: float = 10.0,
+        on_swap: Optional[Callable[[RAGAgent], None]] = None,
+    ):
+        """
+        Args:
+            hr_agent: rag_agent를 교체할 HRAgent
+            index_root: 인덱스 루트 (CURRENT 파일 위치)
+            poll_interval: 감시 스레드의 CURRENT 확인 주기 (초)
+            on_swap: 교체 직후 호출 (컨테이너 캐시 갱신 등)
+        """
+        self.hr_agent = hr_agent
+        self.index_root = Path(index_root)
+        self.poll_interval = poll_interval
+        self.on_swap = on_swap
+        self.last_swap: Optional[ReloadReport] = None
+        self._reload_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def version(self) -> Optional[str]:
+        """현재 서빙 중인 인덱스 버전"""
+        return self.hr_agent.rag_agent.index_version
+
+    def reload(self, force: bool = False) -> ReloadReport:
+        """
+        CURRENT가 가리키는 버전이 서빙 중인 버전과 다르면 새 에이전트를 로드해 교체
+
+        Args:
+            force: 버전이 같아도 다시 로드 (같은 디렉토리를 덮어쓴 경우)
+
+        Raises:
+            RAGRetrievalError: 새 인덱스 로드 실패 (기존 에이전트 유지)
+        """
+        with self._reload_lock:
+            started = time.perf_counter()
+            current = self.hr_agent.rag_agent
+            previous = current.index_version
+            target = current_version(self.index_root)
+            if target == previous and not force:
+                return ReloadReport(False, previous, previous, 0.0)
+
+            try:
+                agent = current.with_index(resolve_index_path(self.index_root))
+            except Exception as e:
+                raise RAGRetrievalError(f"인덱스 교체 실패 ({target}): {e}") from e
+
+            self.hr_agent.rag_agent = agent
+            if self.on_swap is not None:
+                self.on_swap(agent)
+            current.close()
+            report = ReloadReport(
+                swapped=True,
+                version=agent.index_version,
+                previous_version=previous,
+                elapsed_ms=round((time.perf_counter() - started) * 1000, 1),
+            )
+            self.last_swap = report
+            logger.info("인덱스 교체: %s → %s (%.1fms)",
+                        previous, report.version, report.elapsed_ms)
+            return report
+
+    # --------------------------
+    # 감시 스레드
+    # --------------------------
+    def start(self):
+        """백그라운드 CURRENT 감시 스레드 시작"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="index-reloader", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """백그라운드 스레드 종료"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.reload()
+            except Exception as e:
+                logger.warning("인덱스 교체 실패, 기존 인덱스 유지: %s", e)
@@ -6,24 +6,60 @@ RAG Agent - 회사 규정 검색 및 답변 생성
     result = agent.query("연차는 몇일인가요?")
 """
 
+import copy
+import threading
+import time
+from collections import Counter
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnablePassthrough
 
 from core.types.agent_types import AgentResult
 from core.types.errors import RAGRetrievalError
 from core.llm.factory import create_chat_model, create_embeddings
+from core.llm.embedding_cache import CachedEmbeddings, EmbeddingStore
+from core.retrieval.adaptive import AdaptiveKConfig, select_adaptive
+from core.retrieval.article_index import ArticleIndex
+from core.retrieval.bm25 import BM25Index
+from core.retrieval.compression import ContextCompressor
+from core.retrieval.extractive import ExtractiveAnswer, ExtractiveAnswerer
+from core.retrieval.fact_table import FactTable
+from core.retrieval.faq_index import FAQIndex
+from core.retrieval.hybrid import HybridRetriever
+from core.retrieval.index_versions import resolve_index_path
+from core.retrieval.sharded import SHARDS_DIR, SearchFilter, Shard, ShardedRetriever, load_catalog
+from core.retrieval.mmap_index import has_mmap_index, load_mmap_index
+from core.retrieval.parent_store import ParentStore, estimate_tokens
+
+ANSWER_MODES = ("llm", "extractive")
+
+# 부모-자식 인덱스에서 자식 청크를 top_k의 몇 배까지 검색할지
+# (같은 부모의 자식이 겹치므로 여유 있게)
+CHILD_FETCH_FACTOR = 4
 
 
 class RAGAgent:
     """
     RAG Agent 클래스
 
-    - FAISS 기반 벡터 검색
+    - FAISS 기반 벡터 검색 (요청당 1회: 질문 임베딩 1회 + 검색 1회)
+    - 검색 결과(문서, 점수)를 프롬프트와 metadata에 함께 사용
+    - 질문 임베딩 캐시 (메모리 LRU + 선택적 SQLite 공유 캐시)
+    - 하이브리드 검색 (인덱스에 bm25.json이 있으면 BM25 + 벡터 RRF 결합)
+    - 조문 직접 조회 (질문에 "제12조"/조문 제목이 있으면 임베딩·벡터 검색 없이 해당 조문 반환)
+    - 적응형 top-k (후보 max_k개를 점수 간격/거리 임계값/MMR로 질문마다 다른 개수로 선택)
+    - FAQ 색인 (faq.json이 있으면 검수된 질문/답변과 일치하는 질문은 저장된 답변으로 바로 응답)
+    - 수치 사실 테이블 (facts.json이 있으면 "연차는 며칠?" 같은 질문은 검색·생성 없이 조회로 응답)
+    - 추출 응답 모드 (답 문장을 확신할 수 있으면 LLM 생성 생략, 요청마다 선택)
+    - 문맥 압축 (LLM 생성 전 질문 관련 문장만 토큰 예산만큼 남김, 순서/조문 머리 줄 유지)
+    - 부모-자식 검색 (parents.json이 있으면 작은 자식 청크로 검색 → 부모 조문을 토큰 예산만큼 사용)
+    - 샤드 인덱스 (shards.json이 있으면 문서 묶음별 샤드를 병렬 검색 후 병합, 검색 범위로 샤드 선택)
+    - 버전별 인덱스 디렉토리 (CURRENT가 가리키는 버전 로드, with_index()로 새 버전 에이전트 생성)
+    - mmap 인덱스 포맷 우선 로드 (pickle 역직렬화 없음, 워커 간 메모리 공유)
     - OpenAI LLM 답변 생성
     """
 
@@ -36,6 +72,25 @@ class RAGAgent:
         index_path: Optional[str] = None,
         provider: str = "openai",  # LLM Provider ("openai" | "ollama")
         base_url: Optional[str] = None,  # Ollama 서버 URL
+        embedding_provider: Optional[str] = None,  # None이면 provider, "local": 로컬 해싱
+        embedding_store: Optional[EmbeddingStore] = None,  # 임베딩 디스크 캐시 (선택)
+        embedding_cache_size: int = 1024,
+        hybrid: bool = False,  # BM25 + 벡터 하이브리드 검색
+        rrf_k: int = 60,
+        article_lookup: bool = False,  # 조 번호/조문 제목 직접 조회
+        parent_child: bool = False,  # 자식 청크 검색 → 부모 청크 반환
+        context_token_budget: int = 1500,  # 부모 청크 프롬프트 토큰 예산
+        adaptive: Optional[AdaptiveKConfig] = None,  # 적응형 top-k (None이면 top_k 고정)
+        faq: bool = False,  # FAQ 색인 직접 응답
+        faq_min_score: float = 0.85,
+        fact_lookup: bool = False,  # 수치 사실 테이블 직접 응답
+        answer_mode: str = "llm",  # 기본 응답 방식 ("llm" | "extractive")
+        extractive_min_score: float = 0.6,
+        extractive_min_margin: float = 0.05,
+        context_compression: bool = False,  # LLM 생성 전 관련 문장만 남김
+        compression_token_budget: int = 600,
+        shard_workers: int = 4,  # 샤드 동시 검색 스레드 수
+        index_format: str = "auto",  # "auto" | "mmap" | "pickle"
     ):
         """
         Args:
@@ -43,9 +98,32 @@ class RAGAgent:
             temperature: LLM temperature (0=결정적)
             top_k: 검색할 상위 k개 문서
             embedding_model: 임베딩 모델명 (예: "text-embedding-3-small", "nomic-embed-text")
-            index_path: FAISS 인덱스 경로 (None이면 기본 경로)
+            index_path: FAISS 인덱스 루트 경로
+                (None이면 기본 경로, CURRENT가 있으면 해당 버전 디렉토리 사용)
             provider: LLM Provider ("openai" 또는 "ollama")
             base_url: Ollama 서버 URL (ollama일 때만 사용)
+            embedding_provider: 임베딩 Provider
+                ("openai" | "ollama" | "local", None이면 provider와 같음)
+            embedding_store: EmbeddingStore 인스턴스 (워커 간 공유 질문 임베딩 캐시)
+            embedding_cache_size: 메모리 LRU 크기 (0이면 비활성화)
+            hybrid: True면 BM25 색인이 있을 때 하이브리드 검색 (없으면 벡터 검색만)
+            rrf_k: Reciprocal Rank Fusion 상수
+            article_lookup: True면 articles.json이 있을 때 조 번호/조문 제목으로 직접 조회
+            parent_child: True면 parents.json이 있을 때 검색된 자식 청크를 부모 청크로 확장
+            context_token_budget: 부모 청크 토큰 합 상한 (부모 개수 결정, 0이면 제한 없음)
+            adaptive: 적응형 top-k 설정 (지정하면 top_k 대신 adaptive.max_k개 후보에서 선택)
+            faq: True면 faq.json이 있고 인덱스 버전이 같을 때
+                FAQ 질문과 일치하면 저장된 답변으로 응답
+            faq_min_score: FAQ 응답 최소 점수 (어휘 + 질문 벡터 유사도 결합, 0~1)
+            fact_lookup: True면 facts.json이 있을 때 수치 질문을 사실 테이블로 바로 응답
+            answer_mode: "extractive"면 답 문장 추출을 먼저 시도하고 확신이 낮을 때만 LLM 생성
+            extractive_min_score: 추출 응답 최소 점수 (어휘 + 의미 유사도 결합, 0~1)
+            extractive_min_margin: 추출 응답 1위/2위 문장 최소 점수 차이
+            context_compression: True면 LLM 프롬프트에 질문 관련 문장만 넣음
+                (검색 결과 metadata는 원문)
+            compression_token_budget: 압축 후 문맥 토큰 상한 (문맥이 이보다 짧으면 압축 안 함)
+            shard_workers: 샤드 인덱스일 때 동시에 검색할 샤드 수
+            index_format: "auto"면 mmap 포맷이 있으면 사용, 없으면 pickle(load_local)
         """
         self.model = model
         self.temperature = temperature
@@ -53,23 +131,54 @@ class RAGAgent:
         self.embedding_model = embedding_model
         self.provider = provider
         self.base_url = base_url
+        self.embedding_provider = embedding_provider or provider
+        self.embedding_store = embedding_store
+        self.embedding_cache_size = embedding_cache_size
+        self.hybrid = hybrid
+        self.rrf_k = rrf_k
+        self.article_lookup = article_lookup
+        self.parent_child = parent_child
+        self.context_token_budget = context_token_budget
+        self.adaptive = adaptive
+        self.faq = faq
+        self.faq_min_score = faq_min_score
+        self.fact_lookup = fact_lookup
+        if answer_mode not in ANSWER_MODES:
+            raise ValueError(
+                f"지원하지 않는 answer_mode: {answer_mode} (가능: {', '.join(ANSWER_MODES)})"
+            )
+        self.answer_mode = answer_mode
+        self.extractive_min_score = extractive_min_score
+        self.extractive_min_margin = extractive_min_margin
+        self.context_compression = context_compression
+        self.compression_token_budget = compression_token_budget
+        self._answer_counts: Counter = Counter()
+        self._answer_lock = threading.Lock()
+        self.shard_workers = shard_workers
+        self.index_format = index_format
 
-        # 인덱스 경로 설정
+        # 인덱스 경로 설정 (루트 → CURRENT 버전 디렉토리)
         if index_path is None:
             project_root = Path(__file__).parent.parent.parent
-            self.index_path = project_root / "data" / "faiss_index"
+            self.index_root = project_root / "data" / "faiss_index"
         else:
-            self.index_path = Path(index_path)
+            self.index_root = Path(index_path)
+        self.index_path = resolve_index_path(self.index_root)
 
         self._init_components()
 
     def _init_components(self):
         """벡터스토어 및 RAG Chain 초기화"""
-        # Embeddings (LLM Factory 패턴 사용)
-        self.embeddings = create_embeddings(
-            provider=self.provider,
-            model=self.embedding_model,
-            base_url=self.base_url
+        # Embeddings (LLM Factory 패턴 사용, 질문 임베딩 캐시로 감쌈)
+        self.embeddings = CachedEmbeddings(
+            create_embeddings(
+                provider=self.embedding_provider,
+                model=self.embedding_model,
+                base_url=self.base_url
+            ),
+            namespace=f"{self.embedding_provider}/{self.embedding_model}",
+            store=self.embedding_store,
+            lru_size=self.embedding_cache_size,
         )
 
         # FAISS 인덱스 로드
@@ -79,14 +188,76 @@ class RAGAgent:
                 "Please run exp_06_faiss_index.py first."
             )
 
-        self.vectorstore = FAISS.load_local(
-            str(self.index_path),
-            self.embeddings,
-            allow_dangerous_deserialization=True,
+        # 샤드 인덱스면 샤드별 로드 (조문 조회 테이블은 샤드 것을 합침), 아니면 단일 인덱스
+        catalog = load_catalog(self.index_path)
+        if catalog:
+            shards = []
+            articles = {}
+            for name, entry in catalog.items():
+                shard_path = self.index_path / SHARDS_DIR / name
+                shards.append(Shard(
+                    name=name,
+                    vectorstore=self._load_vectorstore(shard_path),
+                    bm25=BM25Index.load(shard_path) if self.hybrid else None,
+                    sources=entry["sources"],
+                ))
+                shard_articles = ArticleIndex.load(shard_path) if self.article_lookup else None
+                for key, article in (shard_articles.articles if shard_articles else {}).items():
+                    merged = articles.setdefault(key, {**article, "doc_ids": []})
+                    merged["doc_ids"] = merged["doc_ids"] + article["doc_ids"]
+            self.sharded = ShardedRetriever(shards, rrf_k=self.rrf_k,
+                                            max_workers=self.shard_workers)
+            self.vectorstore = None
+            self.hybrid_retriever = None
+            self.article_index = ArticleIndex(articles) if articles else None
+        else:
+            self.sharded = None
+            self.vectorstore = self._load_vectorstore(self.index_path)
+
+            # 하이브리드 검색기 (build_index.py가 만든 BM25 색인 사용)
+            bm25 = BM25Index.load(self.index_path) if self.hybrid else None
+            self.hybrid_retriever = (
+                HybridRetriever(self.vectorstore, bm25, top_k=self.top_k, rrf_k=self.rrf_k)
+                if bm25 is not None else None
+            )
+
+            # 조문 직접 조회 테이블 (조문 단위로 청킹된 인덱스에만 있음)
+            self.article_index = ArticleIndex.load(self.index_path) if self.article_lookup else None
+
+        # 부모 청크 저장소 (build_index.py가 부모-자식 인덱스로 빌드한 경우)
+        self.parent_store = ParentStore.load(self.index_path) if self.parent_child else None
+
+        # Retriever (LangChain 호환용, query/stream은 retrieve()로 1회만 검색, 샤드 인덱스면 없음)
+        self.retriever = (self.vectorstore.as_retriever(search_kwargs={"k": self.top_k})
+                          if self.vectorstore is not None else None)
+
+        # FAQ 색인 (build_index.py가 rag_train.json + 승인 답변으로 생성, 인덱스 버전이 다르면 None)
+        self.faq_index = (
+            FAQIndex.load(self.index_path, namespace=self.embeddings.namespace,
+                          min_score=self.faq_min_score)
+            if self.faq else None
         )
 
-        # Retriever
-        self.retriever = self.vectorstore.as_retriever(search_kwargs={"k": self.top_k})
+        # 수치 사실 테이블 (build_index.py가 조문에서 추출)
+        self.fact_table = FactTable.load(self.index_path) if self.fact_lookup else None
+
+        # 추출 응답기 / 문맥 압축기 (규정 문장 임베딩은 반복되므로 문서 임베딩도 캐시, 둘이 공유)
+        sentence_embeddings = CachedEmbeddings(
+            self.embeddings.base,
+            namespace=f"{self.embedding_provider}/{self.embedding_model}:sentences",
+            store=self.embedding_store,
+            lru_size=max(self.embedding_cache_size, 4096),
+            cache_documents=True,
+        )
+        self.extractor = ExtractiveAnswerer(
+            sentence_embeddings,
+            min_score=self.extractive_min_score,
+            min_margin=self.extractive_min_margin,
+        )
+        self.compressor = (
+            ContextCompressor(sentence_embeddings, token_budget=self.compression_token_budget)
+            if self.context_compression else None
+        )
 
         # LLM (LLM Factory 패턴 사용)
         self.llm = create_chat_model(
@@ -111,37 +282,260 @@ class RAGAgent:
 
         self.prompt = ChatPromptTemplate.from_template(template)
 
-        # RAG Chain (LCEL)
-        self.rag_chain = (
-            {
-                "context": self.retriever | self._format_docs,
-                "question": RunnablePassthrough(),
-            }
-            | self.prompt
-            | self.llm
-            | StrOutputParser()
+        # 생성 Chain (LCEL) - 검색 결과를 입력으로 받음
+        self.answer_chain = self.prompt | self.llm | StrOutputParser()
+
+    @property
+    def index_version(self) -> Optional[str]:
+        """로드한 인덱스 버전 디렉토리 이름 (버전 디렉토리가 아니면 None)"""
+        return self.index_path.name if self.index_path != self.index_root else None
+
+    def with_index(self, index_path: Path) -> "RAGAgent":
+        """
+        같은 설정으로 다른 인덱스 디렉토리를 로드한 새 에이전트 (무중단 교체용)
+
+        - 인덱스/검색기/LLM은 새로 만들고, 응답 통계는 공유 (교체 후에도 누적)
+        - 현재 에이전트는 그대로 두므로 처리 중인 요청은 기존 인덱스로 끝남
+        """
+        agent = copy.copy(self)
+        agent.index_path = Path(index_path)
+        agent._init_components()
+        return agent
+
+    def close(self):
+        """
+        교체된 에이전트 리소스 정리 (샤드 검색 스레드 풀)
+
+        - 진행 중인 샤드 검색이 끝날 때까지 기다린 뒤 종료
+        - 이 에이전트를 이미 잡은 요청은 이후에도 응답 가능 (샤드를 호출 스레드에서 순차 검색)
+        """
+        if self.sharded is not None:
+            self.sharded.close()
+
+    def _load_vectorstore(self, path: Path) -> FAISS:
+        """인덱스 디렉토리 로드 (mmap 포맷 우선, 없으면 pickle)"""
+        if self.index_format != "pickle" and has_mmap_index(path):
+            return load_mmap_index(path, self.embeddings)
+        if self.index_format == "mmap":
+            raise RAGRetrievalError(
+                f"mmap index not found at {path}. "
+                "Please rebuild with scripts/build_index.py."
+            )
+        return FAISS.load_local(
+            str(path),
+            self.embeddings,
+            allow_dangerous_deserialization=True,
         )
 
+    def _document(self, doc_id: str) -> Optional[Document]:
+        if self.sharded is not None:
+            return self.sharded.get_document(doc_id)
+        doc = self.vectorstore.docstore.search(doc_id)
+        return doc if isinstance(doc, Document) else None
+
     def _format_docs(self, docs) -> str:
         """검색된 문서를 문자열로 포맷팅"""
         return "\n\n".join(doc.page_content for doc in docs)
 
-    def query(self, question: str) -> AgentResult:
+    def _retrieve(
+        self, question: str, search_filter: Optional[SearchFilter] = None
+    ) -> Tuple[List[Tuple[Document, float]], str]:
+        """문서 검색 + 사용한 검색 방식 ("article" | "hybrid" | "vector")"""
+        scored_docs, mode = None, None
+        if self.article_index is not None:
+            docs = [self._document(i) for i in self.article_index.lookup(question)]
+            docs = [
+                doc for doc in docs
+                if doc is not None and (not search_filter or search_filter.matches(doc.metadata))
+            ]
+            if docs:
+                scored_docs, mode = [(doc, 1.0) for doc in docs], "article"
+        if scored_docs is None:
+            k = self.adaptive.max_k if self.adaptive is not None else self.top_k
+            if self.parent_store is not None:
+                k *= CHILD_FETCH_FACTOR
+            if self.sharded is not None:
+                scored_docs, mode = self.sharded.retrieve(
+                    question, k, self.embeddings.embed_query, search_filter)
+            elif search_filter:
+                # 단일 인덱스 범위 검색 (벡터 후보를 넉넉히 뽑아 metadata 필터)
+                scored_docs = self.vectorstore.similarity_search_with_score(
+                    question, k=k, filter=search_filter.matches, fetch_k=max(k * 10, 50))
+                mode = "vector"
+            elif self.hybrid_retriever is not None:
+                scored_docs, mode = self.hybrid_retriever.retrieve(question, k=k), "hybrid"
+            else:
+                scored_docs = self.vectorstore.similarity_search_with_score(question, k=k)
+                mode = "vector"
+            if self.adaptive is not None:
+                scored_docs = select_adaptive(scored_docs, self.adaptive,
+                                              higher_is_better=mode == "hybrid", max_k=k)
+        if self.parent_store is not None:
+            scored_docs = self.parent_store.expand(scored_docs, self.context_token_budget)
+        return scored_docs, mode
+
+    def retrieve(
+        self, question: str, search_filter: Optional[SearchFilter] = None
+    ) -> List[Tuple[Document, float]]:
+        """
+        문서 검색 (조문 직접 조회 → 하이브리드 → 벡터 검색 순, 부모-자식 인덱스면 부모로 확장)
+
+        Args:
+            search_filter: 검색 범위 (컬렉션/파일/페이지, 샤드 인덱스면 범위 밖 샤드는 검색 안 함)
+
+        Returns:
+            (문서, 점수) 리스트
+            - 조문 직접 조회: 해당 조문 청크 전체, 점수 1.0
+            - 부모-자식: 부모 청크 (토큰 예산 안, 점수는 가장 먼저 검색된 자식 기준)
+            - 하이브리드: RRF 점수 (높을수록 관련)
+            - 벡터 검색만: FAISS L2 거리 (낮을수록 유사)
+        """
+        return self._retrieve(question, search_filter)[0]
+
+    def extract(self, question: str, docs: List[Document]) -> Optional[ExtractiveAnswer]:
+        """추출 응답 시도 (확신이 낮으면 None, 질문 벡터는 검색과 같은 캐시 사용)"""
+        return self.extractor.answer(question, docs, self.embeddings.embed_query)
+
+    def compress(self, question: str, docs: List[Document]) -> List[Document]:
+        """프롬프트용 문맥 압축 (압축기가 없으면 그대로, 질문 벡터는 검색과 같은 캐시 사용)"""
+        if self.compressor is None:
+            return docs
+        return self.compressor.compress(question, docs, self.embeddings.embed_query)
+
+    def generate(self, question: str, docs: List[Document]) -> str:
+        """검색된 문서로 답변 생성 (재검색 없음)"""
+        return self.answer_chain.invoke(
+            {"context": self._format_docs(docs), "question": question}
+        )
+
+    def _resolve_answer_mode(self, answer_mode: Optional[str]) -> str:
+        answer_mode = answer_mode or self.answer_mode
+        if answer_mode not in ANSWER_MODES:
+            raise ValueError(
+                f"지원하지 않는 answer_mode: {answer_mode} (가능: {', '.join(ANSWER_MODES)})"
+            )
+        return answer_mode
+
+    def _lookup_answer(self, question: str) -> Optional[Tuple[str, str, dict]]:
+        """
+        검색 전 직접 응답 (FAQ → 수치 사실 테이블 순)
+
+        Returns:
+            (응답 방식 "faq" | "fact", 답변, metadata) - 해당 없으면 None
+        """
+        if self.faq_index is not None:
+            # 질문 벡터는 CachedEmbeddings에 남아 FAQ가 빗나가도 이어지는 검색이 재사용
+            match = self.faq_index.match(question, self.embeddings.embed_query)
+            if match is not None:
+                return "faq", match.entry.answer, {
+                    "source_docs": [match.entry.question],
+                    "citation": match.entry.source,
+                    "faq_score": match.score,
+                    "index_version": self.faq_index.index_version,
+                }
+        facts = self.fact_table.lookup(question) if self.fact_table is not None else None
+        if facts:
+            return "fact", FactTable.format_answer(facts), {
+                "source_docs": [fact.text for fact in facts],
+                "citation": "; ".join(dict.fromkeys(fact.citation for fact in facts)),
+            }
+        return None
+
+    def _record_answer(self, answer_mode: str, extracted: bool, lookup: Optional[str] = None):
+        with self._answer_lock:
+            self._answer_counts["queries"] += 1
+            if lookup:
+                self._answer_counts[f"{lookup}_answers"] += 1
+            elif answer_mode == "extractive":
+                self._answer_counts["extractive_requests"] += 1
+                self._answer_counts["llm_skipped"] += int(extracted)
+
+    def answer_stats(self) -> dict:
+        """
+        응답 방식 통계
+
+        Returns:
+            queries: 전체 질의 수
+            faq_answers: FAQ 색인으로 응답한 수 (검색·LLM 모두 생략)
+            fact_answers: 사실 테이블로 응답한 수 (검색·LLM 모두 생략)
+            extractive_requests: 추출 모드 요청 수
+            llm_skipped: LLM 생성 없이 추출 응답한 수
+            llm_skip_rate: 추출 모드 요청 중 LLM을 생략한 비율
+        """
+        with self._answer_lock:
+            stats = {
+                key: self._answer_counts[key]
+                for key in ("queries", "faq_answers", "fact_answers",
+                            "extractive_requests", "llm_skipped")
+            }
+        requests = stats["extractive_requests"]
+        stats["llm_skip_rate"] = round(stats["llm_skipped"] / requests, 4) if requests else 0.0
+        return stats
+
+    def query(
+        self,
+        question: str,
+        answer_mode: Optional[str] = None,
+        search_filter: Optional[SearchFilter] = None,
+    ) -> AgentResult:
         """
         질문에 대한 답변 생성
 
         Args:
             question: 사용자 질문
+            answer_mode: 이번 요청의 응답 방식 ("llm" | "extractive", None이면 기본값)
+            search_filter: 검색 범위 (지정하면 FAQ/사실 테이블 직접 응답은 건너뜀)
 
         Returns:
             AgentResult: 통일된 결과 형식
         """
         try:
-            # 검색
-            source_docs = self.retriever.invoke(question)
+            answer_mode = self._resolve_answer_mode(answer_mode)
+            started = time.perf_counter()
 
-            # 답변 생성
-            answer = self.rag_chain.invoke(question)
+            # FAQ / 수치 사실 테이블 (일치하면 검색/생성 없이 응답)
+            looked_up = None if search_filter else self._lookup_answer(question)
+            if looked_up is not None:
+                answered_by, answer, metadata = looked_up
+                finished = time.perf_counter()
+                self._record_answer(answer_mode, False, lookup=answered_by)
+                return AgentResult(
+                    success=True,
+                    answer=answer,
+                    metadata={
+                        "agent_type": "RAG_AGENT",
+                        "source_scores": [],
+                        "retrieval": answered_by,
+                        "context_tokens": 0,
+                        "prompt_context_tokens": 0,
+                        "answered_by": answered_by,
+                        "extractive_score": None,
+                        **metadata,
+                        "timings": {
+                            "retrieve_ms": round((finished - started) * 1000, 1),
+                            "generate_ms": 0.0,
+                            "total_ms": round((finished - started) * 1000, 1),
+                        },
+                    },
+                    error=None,
+                )
+
+            # 검색 (1회)
+            scored_docs, retrieval = self._retrieve(question, search_filter)
+            retrieved = time.perf_counter()
+
+            # 추출 응답 (확신이 높을 때만) → 아니면 LLM 답변 생성 (검색 결과 재사용)
+            source_docs = [doc for doc, _ in scored_docs]
+            extracted = (self.extract(question, source_docs)
+                         if answer_mode == "extractive" else None)
+            context_docs = None
+            if extracted:
+                answer = extracted.text
+            else:
+                context_docs = self.compress(question, source_docs)
+                answer = self.generate(question, context_docs)
+            finished = time.perf_counter()
+            self._record_answer(answer_mode, extracted is not None)
 
             return AgentResult(
                 success=True,
@@ -149,6 +543,21 @@ class RAGAgent:
                 metadata={
                     "agent_type": "RAG_AGENT",
                     "source_docs": [doc.page_content[:200] for doc in source_docs],
+                    "source_scores": [float(score) for _, score in scored_docs],
+                    "retrieval": retrieval,
+                    "context_tokens": sum(estimate_tokens(doc.page_content) for doc in source_docs),
+                    "prompt_context_tokens": (
+                        sum(estimate_tokens(doc.page_content) for doc in context_docs)
+                        if context_docs is not None else 0
+                    ),
+                    "answered_by": "extractive" if extracted else "llm",
+                    "extractive_score": extracted.score if extracted else None,
+                    "citation": extracted.citation if extracted else None,
+                    "timings": {
+                        "retrieve_ms": round((retrieved - started) * 1000, 1),
+                        "generate_ms": round((finished - retrieved) * 1000, 1),
+                        "total_ms": round((finished - started) * 1000, 1),
+                    },
                 },
                 error=None,
             )
@@ -161,15 +570,35 @@ class RAGAgent:
                 error=str(e),
             )
 
-    def stream(self, question: str):
+    def stream(
+        self,
+        question: str,
+        answer_mode: Optional[str] = None,
+        search_filter: Optional[SearchFilter] = None,
+    ):
         """
         스트리밍 응답 생성
 
         Args:
             question: 사용자 질문
+            answer_mode: 이번 요청의 응답 방식 ("llm" | "extractive", None이면 기본값)
+            search_filter: 검색 범위 (지정하면 FAQ/사실 테이블 직접 응답은 건너뜀)
 
         Yields:
-            답변 청크 (문자열)
+            답변 청크 (문자열) - 추출 응답이면 한 번에 전체
         """
-        for chunk in self.rag_chain.stream(question):
+        answer_mode = self._resolve_answer_mode(answer_mode)
+        looked_up = None if search_filter else self._lookup_answer(question)
+        if looked_up is not None:
+            self._record_answer(answer_mode, False, lookup=looked_up[0])
+            yield looked_up[1]
+            return
+        docs = [doc for doc, _ in self.retrieve(question, search_filter)]
+        extracted = self.extract(question, docs) if answer_mode == "extractive" else None
+        self._record_answer(answer_mode, extracted is not None)
+        if extracted:
+            yield extracted.text
+            return
+        inputs = {"context": self._format_docs(self.compress(question, docs)), "question": question}
+        for chunk in self.answer_chain.stream(inputs):
             yield chunk
@@ -9,6 +9,7 @@ SQL Agent (Refactored)
 """
 
 import re
+import time
 from typing import Optional, List, Dict, Any
 
 from langchain_core.prompts import ChatPromptTemplate
@@ -16,7 +17,13 @@ from langchain_core.output_parsers import StrOutputParser
 from langgraph.graph import StateGraph, END
 
 from core.database.connection import DatabaseConnection
+from core.analytics.replica import ColumnarReplica
+from core.analytics.rollups import RollupStore
+from core.analytics.attendance import AttendanceAnalyzer, is_attendance_anomaly_question
+from core.analytics.sampling import ApproximateAggregator, requires_exact
+from core.analytics.query_log import QueryLog
 from core.types.agent_types import SQLAgentState, AgentResult
+from core.types.errors import DatabaseConnectionError, UnsupportedQueryError
 from core.llm.factory import create_chat_model
 
 
@@ -27,6 +34,10 @@ class SQLAgent:
     - 자연어 → SQL 생성
     - 실행 및 Self-Correction (최대 N회)
     - LangGraph 기반 워크플로우
+    - (선택) 롤업 → 인메모리 레플리카 순으로 집계 쿼리 실행, 미지원 쿼리는 MySQL 폴백
+    - (선택) 대용량 테이블 집계는 표본 근사 응답 (정확한 값을 요구하면 정확 실행)
+    - (선택) 근태 이상/패턴 질문은 근태 분석기의 일괄 계산 결과로 응답
+    - (선택) 실행한 SQL을 지연 시간·조회 행 수와 함께 쿼리 로그에 기록 (인덱스 추천용)
     """
 
     def __init__(
@@ -36,6 +47,11 @@ class SQLAgent:
         max_attempts: int = 3,
         provider: str = "openai",  # LLM Provider ("openai" | "ollama")
         base_url: Optional[str] = None,  # Ollama 서버 URL
+        replica: Optional[ColumnarReplica] = None,  # 인메모리 레플리카 (선택)
+        rollups: Optional[RollupStore] = None,  # 사전 집계 롤업 (선택)
+        attendance_analyzer: Optional[AttendanceAnalyzer] = None,  # 근태 이상 감지 (선택)
+        approximator: Optional[ApproximateAggregator] = None,  # 표본 근사 집계 (선택)
+        query_log: Optional[QueryLog] = None,  # SQL 실행 로그 (선택)
     ):
         """
         Args:
@@ -44,8 +60,18 @@ class SQLAgent:
             max_attempts: Self-Correction 최대 시도 횟수
             provider: LLM Provider ("openai" 또는 "ollama")
             base_url: Ollama 서버 URL (ollama일 때만 사용)
+            replica: ColumnarReplica 인스턴스 (None이면 항상 MySQL 실행)
+            rollups: RollupStore 인스턴스 (대시보드성 집계를 롤업에서 응답)
+            attendance_analyzer: AttendanceAnalyzer 인스턴스 (근태 이상/패턴 질문 응답)
+            approximator: ApproximateAggregator 인스턴스 (대용량 집계 근사 응답)
+            query_log: QueryLog 인스턴스 (실행 SQL 기록)
         """
         self.db = db
+        self.replica = replica
+        self.rollups = rollups
+        self.attendance_analyzer = attendance_analyzer
+        self.approximator = approximator
+        self.query_log = query_log
         self.model = model
         self.max_attempts = max_attempts
         self.provider = provider
@@ -70,6 +96,11 @@ class SQLAgent:
         Returns:
             AgentResult: 통일된 결과 형식
         """
+        if self.attendance_analyzer is not None and is_attendance_anomaly_question(question):
+            result = self._query_attendance(question)
+            if result is not None:
+                return result
+
         # 매 요청마다 최신 스키마 로딩
         schema = self.db.get_table_schema()
 
@@ -81,6 +112,8 @@ class SQLAgent:
             "results": None,
             "attempt": 0,
             "max_attempts": self.max_attempts,
+            "engine": "mysql",
+            "approximation": None,
         }
 
         final = self.app.invoke(state)
@@ -90,6 +123,12 @@ class SQLAgent:
 
         if success:
             answer = self._generate_answer(question, final["results"])
+            if final["approximation"] is not None:
+                confidence = int(final["approximation"]["confidence"] * 100)
+                answer += (
+                    f"\n\n(표본 기반 근사치입니다. "
+                    f"{confidence}% 신뢰구간은 메타데이터를 참고하세요.)"
+                )
         else:
             answer = f"SQL 실행 오류: {final['error']}"
 
@@ -101,10 +140,32 @@ class SQLAgent:
                 "sql": final["sql"],
                 "results": final["results"],
                 "attempts": final["attempt"],
+                "engine": final["engine"],
+                "approximation": final["approximation"],
             },
             error=final["error"],
         )
 
+    def _query_attendance(self, question: str) -> Optional[AgentResult]:
+        """근태 분석기로 응답 (로드 실패 시 None → 일반 SQL 경로)"""
+        try:
+            summary = self.attendance_analyzer.investigate(question)
+        except DatabaseConnectionError:
+            return None
+
+        return AgentResult(
+            success=True,
+            answer=self._generate_answer(question, [summary]),
+            metadata={
+                "agent_type": "SQL_AGENT",
+                "sql": "",
+                "results": [summary],
+                "attempts": 0,
+                "engine": "attendance",
+            },
+            error=None,
+        )
+
     def _generate_answer(self, question: str, results: List[Dict[str, Any]]) -> str:
         """LLM으로 자연어 답변 생성"""
         if not results:
@@ -189,11 +250,65 @@ SQL만 출력하세요.
     # Node: SQL Execution
     # --------------------------
     def _execute_sql_node(self, state: SQLAgentState) -> SQLAgentState:
-        results, error = self.db.execute_query(state["sql"])
+        state = {**state, "approximation": None}
+        sql = state["sql"]
+
+        # 롤업 → 표본 근사 → 레플리카 순으로 시도 (지원 범위 밖이면 MySQL 폴백)
+        if self.rollups is not None:
+            started = time.perf_counter()
+            try:
+                results = self.rollups.execute(sql)
+                self._log_query(sql, "rollup", started, results)
+                return {**state, "error": None, "results": results, "engine": "rollup"}
+            except UnsupportedQueryError:
+                pass
+
+        if self.approximator is not None and not requires_exact(state["question"]):
+            started = time.perf_counter()
+            try:
+                results, approximation = self.approximator.execute(sql)
+                self._log_query(sql, "sample", started, results)
+                return {**state, "error": None, "results": results, "engine": "sample",
+                        "approximation": approximation}
+            except UnsupportedQueryError:
+                pass
+
+        if self.replica is not None:
+            started = time.perf_counter()
+            try:
+                results = self.replica.execute(sql)
+                self._log_query(sql, "replica", started, results)
+                return {**state, "error": None, "results": results, "engine": "replica"}
+            except UnsupportedQueryError:
+                pass
+
+        if self.query_log is not None:
+            results, error, stats = self.db.execute_query_with_stats(sql)
+            self.query_log.record(
+                sql,
+                engine="mysql",
+                latency_ms=stats["latency_ms"],
+                rows_examined=stats["rows_examined"],
+                rows_returned=len(results) if results else 0,
+                success=error is None,
+            )
+        else:
+            results, error = self.db.execute_query(sql)
 
         if error:
-            return {**state, "error": error, "results": None}
-        return {**state, "error": None, "results": results}
+            return {**state, "error": error, "results": None, "engine": "mysql"}
+        return {**state, "error": None, "results": results, "engine": "mysql"}
+
+    def _log_query(self, sql: str, engine: str, started: float, results: List[Dict[str, Any]]):
+        """인메모리 엔진 실행 기록 (조회 행 수는 MySQL 실행분만 기록)"""
+        if self.query_log is None:
+            return
+        self.query_log.record(
+            sql,
+            engine=engine,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            rows_returned=len(results),
+        )
 
     # --------------------------
     # Node: SQL Correction
@@ -0,0 +1,37 @@
+"""
+Analytics Module
+SQL Agent 집계 가속 (인메모리 컬럼형 레플리카, 사전 집계 롤업, 표본 근사 집계, 근태 이상 감지)
+쿼리 로그 기반 인덱스 추천
+"""
+
+from core.analytics.attendance import AttendanceAnalyzer, AttendanceReport
+from core.analytics.columnar import ColumnarTable
+from core.analytics.engine import QueryEngine
+from core.analytics.index_advisor import IndexAdvisor, IndexRecommendation
+from core.analytics.query_log import QueryLog, QueryShape, fingerprint
+from core.analytics.replica import ColumnarReplica, TableSpec, DEFAULT_TABLES
+from core.analytics.sampling import ApproximateAggregator, requires_exact
+from core.analytics.rollups import RollupStore, RollupSpec, DEFAULT_ROLLUPS
+from core.analytics.sql_parser import parse_select, SelectQuery
+
+__all__ = [
+    "ColumnarTable",
+    "QueryEngine",
+    "ColumnarReplica",
+    "TableSpec",
+    "DEFAULT_TABLES",
+    "RollupStore",
+    "RollupSpec",
+    "DEFAULT_ROLLUPS",
+    "ApproximateAggregator",
+    "requires_exact",
+    "AttendanceAnalyzer",
+    "AttendanceReport",
+    "QueryLog",
+    "QueryShape",
+    "fingerprint",
+    "IndexAdvisor",
+    "IndexRecommendation",
+    "parse_select",
+    "SelectQuery",
+]
@@ -0,0 +1,416 @@
+"""
+Attendance Analyzer
+근태 이상 감지 (NumPy 벡터화 일괄 계산)
+
+- attendance 전체를 한 번에 로드 → 직원별 통계를 한 번의 패스로 계산
+  - 지각 연속 일수 (최장 / 현재 진행 중)
+  - 출근 시각 분포 (평균, 중앙값, p90, 표준편차) 및 30분 단위 히스토그램
+  - 직원별 중앙값/MAD 기반 출근 시각 이상치
+- 결과는 TTL + 데이터 시그니처(COUNT, MAX(att_id)) 기준으로 캐시
+- SQL Agent가 직접 호출하거나 LangChain Tool로 노출
+
+사용법:
+    analyzer = AttendanceAnalyzer(db=db, cache_ttl=300)
+    summary = analyzer.lookup(emp_name="김철수")
+    tool = analyzer.as_tool()
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.tools import StructuredTool
+
+from core.analytics.columnar import null_mask, to_array, to_python
+from core.analytics.replica import ColumnarReplica
+from core.database.connection import DatabaseConnection
+from core.types.errors import DatabaseConnectionError
+
+logger = logging.getLogger(__name__)
+
+# 질문 라우팅 키워드 (근태 관련 + 패턴/이상 탐지 의도가 모두 있어야 함)
+ATTENDANCE_KEYWORDS = ("지각", "출근", "근태", "결근")
+ANOMALY_KEYWORDS = ("이상", "연속", "패턴", "분포", "특이", "상습", "반복")
+
+# 중앙값 기준 이상치 판정 시 MAD 하한(분) - 매일 같은 시각에 출근하는 직원의 0 나눗셈 방지
+MIN_MAD_MINUTES = 5.0
+HISTOGRAM_BIN_MINUTES = 30
+
+
+def is_attendance_anomaly_question(question: str) -> bool:
+    """근태 이상/패턴 분석 질문인지 판별"""
+    return (any(k in question for k in ATTENDANCE_KEYWORDS)
+            and any(k in question for k in ANOMALY_KEYWORDS))
+
+
+# ===== 벡터화 계산 =====
+def to_minutes(array: np.ndarray) -> np.ndarray:
+    """출근 시각(TIME) 배열 → 자정 기준 분 (NULL → NaN)"""
+    nulls = null_mask(array)
+    if array.dtype.kind != "m":
+        if nulls.all():
+            return np.full(len(array), np.nan)
+        array = to_array(list(array))
+        nulls = null_mask(array)
+    minutes = array.astype("timedelta64[s]").astype(np.int64).astype(np.float64) / 60.0
+    minutes[nulls] = np.nan
+    return minutes
+
+
+def _format_minutes(value: float) -> Optional[str]:
+    if np.isnan(value):
+        return None
+    total = int(round(value))
+    return f"{total // 60:02d}:{total % 60:02d}"
+
+
+def _group_quantile(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray,
+                    q: float) -> np.ndarray:
+    """그룹별로 정렬·연속 배치된 값의 분위수 (선형 보간, 빈 그룹은 NaN)"""
+    result = np.full(len(counts), np.nan)
+    has = counts > 0
+    if not has.any():
+        return result
+    pos = starts[has] + q * (counts[has] - 1)
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.ceil(pos).astype(np.int64)
+    frac = pos - lo
+    result[has] = sorted_values[lo] * (1 - frac) + sorted_values[hi] * frac
+    return result
+
+
+def _late_streaks(
+    codes: np.ndarray, late: np.ndarray, n_groups: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    직원별 지각 연속 일수 (run-length)
+
+    Args:
+        codes: 직원 코드 (직원, 날짜 순 정렬 상태)
+        late: 지각 여부
+
+    Returns:
+        (최장 연속, 마지막 기록 기준 현재 연속)
+    """
+    longest = np.zeros(n_groups, dtype=np.int64)
+    current = np.zeros(n_groups, dtype=np.int64)
+    n = len(codes)
+    if n == 0:
+        return longest, current
+
+    boundary = np.ones(n, dtype=bool)
+    boundary[1:] = (codes[1:] != codes[:-1]) | (late[1:] != late[:-1])
+    run_id = np.cumsum(boundary) - 1
+    run_start = np.flatnonzero(boundary)
+    run_len = np.diff(np.append(run_start, n))
+    run_late = late[run_start]
+    np.maximum.at(longest, codes[run_start][run_late], run_len[run_late])
+
+    last_row = np.flatnonzero(np.append(codes[1:] != codes[:-1], True))
+    last_run = run_id[last_row]
+    current[codes[last_row]] = np.where(run_late[last_run], run_len[last_run], 0)
+    return longest, current
+
+
+def analyze_attendance(
+    emp_ids: np.ndarray,
+    dates: np.ndarray,
+    check_ins: np.ndarray,
+    statuses: np.ndarray,
+    z_threshold: float = 3.5,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, int]]:
+    """
+    근태 기록 일괄 분석
+
+    지각 연속 일수는 휴가(VACATION)를 건너뛴 근무일 기준으로 센다.
+
+    Args:
+        emp_ids: 직원 ID
+        dates: 근무일
+        check_ins: 출근 시각 (TIME → timedelta64)
+        statuses: 근태 상태 (PRESENT, LATE, ABSENT, VACATION)
+        z_threshold: 이상치 판정 robust z-score 임계값
+
+    Returns:
+        (직원별 통계, 이상치 기록, 출근 시각 히스토그램)
+    """
+    if len(emp_ids) == 0:
+        return [], [], {}
+
+    order = np.lexsort((dates, emp_ids))
+    emp_ids, dates = emp_ids[order], dates[order]
+    minutes = to_minutes(check_ins)[order]
+    statuses = np.asarray(statuses, dtype=object)[order].astype(str)
+
+    emp_keys, first_rows, codes = np.unique(emp_ids, return_index=True, return_inverse=True)
+    codes = codes.reshape(-1)
+    n_emp = len(emp_keys)
+
+    def count(mask: np.ndarray) -> np.ndarray:
+        return np.bincount(codes[mask], minlength=n_emp)
+
+    late = statuses == "LATE"
+    workday = statuses != "VACATION"
+    days = np.bincount(codes, minlength=n_emp)
+    late_days = count(late)
+    absent_days = count(statuses == "ABSENT")
+    work_days = count(workday)
+
+    longest, current = _late_streaks(codes[workday], late[workday], n_emp)
+
+    # 출근 시각 분포 (직원 코드 → 시각 순 정렬 후 그룹 구간별 분위수)
+    valid = ~np.isnan(minutes)
+    v_codes, v_minutes = codes[valid], minutes[valid]
+    v_counts = np.bincount(v_codes, minlength=n_emp)
+    starts = np.concatenate([[0], np.cumsum(v_counts)[:-1]])
+    v_sorted = v_minutes[np.lexsort((v_minutes, v_codes))]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(v_codes, weights=v_minutes, minlength=n_emp) / v_counts
+        mean_sq = np.bincount(v_codes, weights=v_minutes ** 2, minlength=n_emp) / v_counts
+    std = np.sqrt(np.clip(mean_sq - mean ** 2, 0, None))
+    median = _group_quantile(v_sorted, starts, v_counts, 0.5)
+    p90 = _group_quantile(v_sorted, starts, v_counts, 0.9)
+
+    # 직원별 robust z-score (중앙값/MAD)
+    deviation = np.abs(v_minutes - median[v_codes])
+    mad = _group_quantile(deviation[np.lexsort((deviation, v_codes))], starts, v_counts, 0.5)
+    scale = np.maximum(mad, MIN_MAD_MINUTES) / 0.6745
+    z = (v_minutes - median[v_codes]) / scale[v_codes]
+    outlier = np.abs(z) > z_threshold
+    outlier_days = np.bincount(v_codes[outlier], minlength=n_emp)
+
+    employees = []
+    emp_list = to_python(emp_keys)
+    for i, emp_id in enumerate(emp_list):
+        employees.append({
+            "emp_id": emp_id,
+            "days": int(days[i]),
+            "late_days": int(late_days[i]),
+            "absent_days": int(absent_days[i]),
+            "late_rate": round(float(late_days[i] / work_days[i]), 3) if work_days[i] else 0.0,
+            "longest_late_streak": int(longest[i]),
+            "current_late_streak": int(current[i]),
+            "checkin_mean": _format_minutes(mean[i]),
+            "checkin_median": _format_minutes(median[i]),
+            "checkin_p90": _format_minutes(p90[i]),
+            "checkin_std_minutes": None if np.isnan(std[i]) else round(float(std[i]), 1),
+            "outlier_days": int(outlier_days[i]),
+        })
+
+    rows = np.flatnonzero(valid)[outlier]
+    anomalies = [
+        {
+            "emp_id": emp_list[codes[row]],
+            "date": date,
+            "check_in": _format_minutes(minutes[row]),
+            "status": statuses[row],
+            "usual_check_in": _format_minutes(median[codes[row]]),
+            "deviation_minutes": round(float(minutes[row] - median[codes[row]]), 1),
+            "z_score": round(float(score), 2),
+        }
+        for row, date, score in zip(rows, to_python(dates[rows]), z[outlier])
+    ]
+    anomalies.sort(key=lambda a: -abs(a["z_score"]))
+
+    bins = (v_minutes // HISTOGRAM_BIN_MINUTES).astype(np.int64)
+    histogram = {
+        _format_minutes(float(b * HISTOGRAM_BIN_MINUTES)): int(n)
+        for b, n in zip(*np.unique(bins, return_counts=True))
+    }
+    return employees, anomalies, histogram
+
+
+# ===== Analyzer =====
+@dataclass
+class AttendanceReport:
+    """근태 분석 결과 스냅샷"""
+    employees: List[Dict[str, Any]]
+    anomalies: List[Dict[str, Any]]
+    checkin_histogram: Dict[str, int]
+    signature: Tuple[Any, ...]
+    computed_at: float = field(default_factory=time.monotonic)
+
+
+class AttendanceAnalyzer:
+    """
+    근태 이상 감지기
+
+    - 레플리카가 있으면 레플리카 스냅샷, 없으면 단일 쿼리로 attendance 일괄 로드
+    - cache_ttl 동안은 캐시 사용, 이후 시그니처가 바뀌었을 때만 재계산
+    - max_age가 지나면 시그니처와 무관하게 재계산 (UPDATE 반영)
+    """
+
+    LOAD_SQL = (
+        "SELECT a.emp_id, e.name, a.date, a.check_in, a.status "
+        "FROM attendance a LEFT JOIN employees e ON a.emp_id = e.emp_id"
+    )
+    SIGNATURE_SQL = "SELECT COUNT(*) AS n, MAX(att_id) AS max_id FROM attendance"
+
+    def __init__(
+        self,
+        db: DatabaseConnection,  # 의존성 주입
+        replica: Optional[ColumnarReplica] = None,  # 인메모리 레플리카 (선택)
+        cache_ttl: float = 300.0,
+        max_age: float = 86400.0,
+        z_threshold: float = 3.5,
+    ):
+        """
+        Args:
+            db: DatabaseConnection 인스턴스 (주입)
+            replica: ColumnarReplica 인스턴스 (있으면 DB 대신 레플리카에서 로드)
+            cache_ttl: 캐시 유효 시간(초), 이후 시그니처 확인
+            max_age: 시그니처가 같아도 재계산하는 최대 경과 시간(초)
+            z_threshold: 이상치 판정 robust z-score 임계값
+        """
+        self.db = db
+        self.replica = replica
+        self.cache_ttl = cache_ttl
+        self.max_age = max_age
+        self.z_threshold = z_threshold
+
+        self._report: Optional[AttendanceReport] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    # --------------------------
+    # Load
+    # --------------------------
+    def _signature(self) -> Tuple[Any, ...]:
+        if self.replica is not None:
+            self.replica.maybe_refresh()
+            table = self.replica.tables["attendance"]
+            return (table.n_rows, table.max_value("att_id"))
+        results, error = self.db.execute_query(self.SIGNATURE_SQL)
+        if error:
+            raise DatabaseConnectionError(f"근태 시그니처 조회 실패: {error}")
+        row = (results or [{}])[0]
+        return (row.get("n"), row.get("max_id"))
+
+    def _load(self) -> Tuple[Dict[str, np.ndarray], Dict[Any, Any]]:
+        """attendance 일괄 로드 → (컬럼 배열, emp_id → 이름)"""
+        if self.replica is not None:
+            attendance = self.replica.tables["attendance"]
+            employees = self.replica.tables["employees"]
+            columns = {
+                name: attendance.column(name)
+                for name in ("emp_id", "date", "check_in", "status")
+            }
+            names = dict(zip(to_python(employees.column("emp_id")),
+                             to_python(employees.column("name"))))
+            return columns, names
+
+        results, error = self.db.execute_query(self.LOAD_SQL)
+        if error:
+            raise DatabaseConnectionError(f"근태 데이터 로드 실패: {error}")
+        results = results or []
+        columns = {
+            name: to_array([row.get(name) for row in results])
+            for name in ("emp_id", "date", "check_in", "status")
+        }
+        names = {row.get("emp_id"): row.get("name") for row in results}
+        return columns, names
+
+    # --------------------------
+    # Analyze
+    # --------------------------
+    def analyze(self, force: bool = False) -> AttendanceReport:
+        """
+        근태 분석 결과 반환 (캐시 우선)
+
+        Raises:
+            DatabaseConnectionError: 데이터 로드 실패 (캐시도 없는 경우)
+        """
+        report = self._report
+        if (not force and report is not None
+                and time.monotonic() - self._checked_at < self.cache_ttl):
+            return report
+
+        with self._lock:
+            report = self._report
+            now = time.monotonic()
+            if not force and report is not None and now - self._checked_at < self.cache_ttl:
+                return report
+            try:
+                signature = self._signature()
+                if (not force and report is not None and report.signature == signature
+                        and now - report.computed_at < self.max_age):
+                    self._checked_at = now
+                    return report
+
+                started = time.perf_counter()
+                columns, names = self._load()
+                employees, anomalies, histogram = analyze_attendance(
+                    columns["emp_id"], columns["date"], columns["check_in"],
+                    columns["status"], z_threshold=self.z_threshold,
+                )
+            except DatabaseConnectionError as e:
+                if report is None:
+                    raise
+                logger.warning("근태 분석 갱신 실패, 기존 결과 사용: %s", e)
+                return report
+
+            for row in employees:
+                row["name"] = names.get(row["emp_id"])
+            for row in anomalies:
+                row["name"] = names.get(row["emp_id"])
+
+            report = AttendanceReport(employees, anomalies, histogram, signature)
+            self._report = report
+            self._checked_at = now
+            logger.info("근태 분석 완료: %d명, 이상치 %d건 (%.1fms)", len(employees),
+                        len(anomalies), (time.perf_counter() - started) * 1000)
+            return report
+
+    def lookup(self, emp_name: Optional[str] = None, top_n: int = 5) -> Dict[str, Any]:
+        """
+        근태 이상 요약 조회
+
+        Args:
+            emp_name: 직원 이름 (부분 일치, None이면 전체에서 상위 top_n명)
+            top_n: 반환할 직원/이상치 수
+
+        Returns:
+            {"employees": [...], "anomalies": [...], "checkin_histogram": {...}}
+        """
+        report = self.analyze()
+        employees = report.employees
+        anomalies = report.anomalies
+        if emp_name:
+            employees = [e for e in employees if e.get("name") and emp_name in e["name"]]
+            emp_ids = {e["emp_id"] for e in employees}
+            anomalies = [a for a in anomalies if a["emp_id"] in emp_ids]
+
+        ranked = sorted(
+            employees,
+            key=lambda e: (e["longest_late_streak"], e["late_days"], e["outlier_days"]),
+            reverse=True,
+        )
+        return {
+            "employees": ranked[:top_n],
+            "anomalies": anomalies[:top_n],
+            "checkin_histogram": report.checkin_histogram,
+        }
+
+    def investigate(self, question: str, top_n: int = 5) -> Dict[str, Any]:
+        """질문에 언급된 직원이 있으면 해당 직원, 없으면 전체 상위 요약"""
+        report = self.analyze()
+        mentioned = [e["name"] for e in report.employees if e.get("name") and e["name"] in question]
+        if len(mentioned) == 1:
+            return self.lookup(emp_name=mentioned[0], top_n=top_n)
+        return self.lookup(top_n=top_n)
+
+    def as_tool(self) -> StructuredTool:
+        """LangChain Tool로 노출 (에이전트 tool calling용)"""
+        return StructuredTool.from_function(
+            func=self.lookup,
+            name="attendance_anomalies",
+            description=(
+                "직원별 지각 횟수, 최장/현재 지각 연속 일수, 출근 시각 분포(평균/중앙값/p90)와 "
+                "평소와 크게 다른 출근 기록(이상치)을 조회합니다. "
+                "emp_name을 주면 해당 직원만, "
+                "없으면 지각 패턴이 두드러진 상위 top_n명을 반환합니다."
+            ),
+        )
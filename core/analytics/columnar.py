@@ -0,0 +1,277 @@
+"""
+Columnar Table
+NumPy 배열 기반 컬럼형 테이블 (인메모리 집계용)
+
+- 컬럼별 np.ndarray 저장 (정수/실수/날짜/시간/문자열)
+- 기본키 기준 upsert (증분 갱신)
+- 갱신 시 새 배열을 만들어 교체 (읽는 쪽은 락 없이 이전 스냅샷 사용)
+
+사용법:
+    table = ColumnarTable.from_rows("employees", "emp_id", rows)
+    table.upsert(new_rows)
+    dept_ids = table.column("dept_id")
+"""
+
+import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+
+# ===== 배열 변환 헬퍼 =====
+def to_array(values: List[Any]) -> np.ndarray:
+    """
+    DB 값 리스트 → NumPy 배열
+
+    - int (NULL 없음) → int64, NULL 포함 숫자 → float64 (NaN)
+    - date → datetime64[D], datetime → datetime64[us]
+    - timedelta (MySQL TIME) → timedelta64[us]
+    - 그 외 → object
+    """
+    non_null = [v for v in values if v is not None]
+    if not non_null:
+        return np.array(values, dtype=object)
+
+    if all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in non_null):
+        if len(non_null) == len(values):
+            return np.array(values, dtype=np.int64)
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    if all(isinstance(v, (int, float, Decimal, np.number)) and not isinstance(v, bool)
+           for v in non_null):
+        return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+    if all(isinstance(v, datetime.datetime) for v in non_null):
+        return np.array(values, dtype="datetime64[us]")
+    if all(isinstance(v, datetime.date) and not isinstance(v, datetime.datetime)
+           for v in non_null):
+        return np.array(values, dtype="datetime64[D]")
+    if all(isinstance(v, datetime.timedelta) for v in non_null):
+        return np.array(values, dtype="timedelta64[us]")
+    if all(isinstance(v, datetime.time) for v in non_null):
+        return np.array(
+            [None if v is None else datetime.timedelta(
+                hours=v.hour, minutes=v.minute, seconds=v.second, microseconds=v.microsecond)
+             for v in values],
+            dtype="timedelta64[us]",
+        )
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def null_mask(array: np.ndarray) -> np.ndarray:
+    """NULL(NaN/NaT/None) 위치 마스크"""
+    kind = array.dtype.kind
+    if kind == "f":
+        return np.isnan(array)
+    if kind in "mM":
+        return np.isnat(array)
+    if kind == "O":
+        return np.fromiter((v is None for v in array), dtype=bool, count=len(array))
+    return np.zeros(len(array), dtype=bool)
+
+
+def null_array(dtype: np.dtype, size: int) -> np.ndarray:
+    """dtype에 맞는 NULL로 채운 배열"""
+    kind = np.dtype(dtype).kind
+    if kind in "iuf":
+        return np.full(size, np.nan, dtype=np.float64)
+    if kind in "mM":
+        return np.full(size, np.datetime64("NaT") if kind == "M" else np.timedelta64("NaT"),
+                       dtype=dtype)
+    return np.full(size, None, dtype=object)
+
+
+def take(array: np.ndarray, index: np.ndarray) -> np.ndarray:
+    """index 위치 값 추출 (index == -1 은 NULL, LEFT JOIN용)"""
+    missing = index < 0
+    if not missing.any():
+        return array[index]
+    if array.dtype.kind in "iub":
+        array = array.astype(np.float64)
+    result = array[np.where(missing, 0, index)] if len(array) else null_array(
+        array.dtype, len(index))
+    result = result.copy()
+    result[missing] = null_array(array.dtype, 1)[0]
+    return result
+
+
+def promote(left: np.ndarray, right: np.ndarray):
+    """두 배열을 이어붙일 수 있도록 dtype 통일"""
+    if left.dtype == right.dtype:
+        return left, right
+    left_null = left.dtype.kind == "O" and null_mask(left).all()
+    right_null = right.dtype.kind == "O" and null_mask(right).all()
+    if left_null and not right_null:
+        return null_array(right.dtype, len(left)), _as_nullable(right)
+    if right_null and not left_null:
+        return _as_nullable(left), null_array(left.dtype, len(right))
+
+    kinds = {left.dtype.kind, right.dtype.kind}
+    if kinds <= {"i", "u", "f"}:
+        return left.astype(np.float64), right.astype(np.float64)
+    if kinds == {"M"} or kinds == {"m"}:
+        dtype = np.promote_types(left.dtype, right.dtype)
+        return left.astype(dtype), right.astype(dtype)
+    return left.astype(object), right.astype(object)
+
+
+def _as_nullable(array: np.ndarray) -> np.ndarray:
+    return array.astype(np.float64) if array.dtype.kind in "iub" else array
+
+
+def to_python(array: np.ndarray, as_int: bool = False) -> List[Any]:
+    """NumPy 배열 → 파이썬 값 리스트 (NaN/NaT → None)"""
+    nulls = null_mask(array)
+    if as_int and array.dtype.kind == "f":
+        values = [None if n else int(v) for v, n in zip(array.tolist(), nulls)]
+        return values
+    values = array.tolist()
+    if nulls.any():
+        values = [None if n else v for v, n in zip(values, nulls)]
+    return values
+
+
+# ===== Columnar Table =====
+class ColumnarTable:
+    """
+    NumPy 컬럼형 테이블
+
+    - columns: 컬럼명 → np.ndarray (모두 같은 길이)
+    - int_columns: 원본이 정수인 컬럼 (NULL 때문에 float으로 승격돼도 정수로 반환)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        primary_key: Optional[str] = None,
+        columns: Optional[Mapping[str, np.ndarray]] = None,
+    ):
+        """
+        Args:
+            name: 테이블명
+            primary_key: 기본키 컬럼명 (upsert 기준, None이면 append only)
+            columns: 초기 컬럼 데이터
+        """
+        self.name = name
+        self.primary_key = primary_key
+        self.columns: Dict[str, np.ndarray] = dict(columns or {})
+        self.int_columns = {
+            col for col, arr in self.columns.items() if arr.dtype.kind in "iu"
+        }
+        self._pk_positions: Dict[Any, int] = self._build_pk_positions()
+
+    @classmethod
+    def from_rows(
+        cls, name: str, primary_key: Optional[str], rows: Iterable[Mapping[str, Any]]
+    ) -> "ColumnarTable":
+        """딕셔너리 행 목록으로 테이블 생성"""
+        table = cls(name, primary_key)
+        table.upsert(rows)
+        return table
+
+    @property
+    def n_rows(self) -> int:
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns.keys())
+
+    def has_column(self, name: str) -> bool:
+        return name in self.columns
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def max_value(self, name: str) -> Any:
+        """컬럼 최댓값 (증분 갱신 기준점)"""
+        if name not in self.columns or self.n_rows == 0:
+            return None
+        array = self.columns[name]
+        valid = array[~null_mask(array)]
+        if len(valid) == 0:
+            return None
+        return to_python(np.array([valid.max()], dtype=valid.dtype),
+                         as_int=name in self.int_columns)[0]
+
+    def copy(self) -> "ColumnarTable":
+        """스냅샷 복사 (배열은 공유, upsert 시 새 배열로 교체됨)"""
+        clone = ColumnarTable(self.name, self.primary_key)
+        clone.columns = dict(self.columns)
+        clone.int_columns = set(self.int_columns)
+        clone._pk_positions = self._pk_positions
+        return clone
+
+    def _build_pk_positions(self) -> Dict[Any, int]:
+        if self.primary_key is None or self.primary_key not in self.columns:
+            return {}
+        keys = to_python(self.columns[self.primary_key])
+        return {key: pos for pos, key in enumerate(keys)}
+
+    def upsert(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """
+        행 추가/갱신 (기본키가 같으면 덮어쓰기)
+
+        Args:
+            rows: DB 조회 결과 (딕셔너리 리스트)
+
+        Returns:
+            반영된 행 수
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        n_before = self.n_rows
+        names = list(dict.fromkeys(
+            [*self.columns.keys(), *(key for row in rows for key in row.keys())]
+        ))
+
+        # 기존 행 위치 (-1 = 신규)
+        if self.primary_key is not None:
+            positions = np.array(
+                [self._pk_positions.get(row.get(self.primary_key), -1) for row in rows],
+                dtype=np.int64,
+            )
+        else:
+            positions = np.full(len(rows), -1, dtype=np.int64)
+        existing = positions >= 0
+
+        # 같은 배치 안의 중복 기본키는 마지막 값만 신규로 추가
+        new_rows_mask = ~existing
+        if self.primary_key is not None and new_rows_mask.any():
+            last_seen: Dict[Any, int] = {}
+            for i in np.flatnonzero(new_rows_mask):
+                last_seen[rows[i].get(self.primary_key)] = i
+            keep = np.zeros(len(rows), dtype=bool)
+            keep[list(last_seen.values())] = True
+            new_rows_mask &= keep
+
+        new_columns: Dict[str, np.ndarray] = {}
+        for name in names:
+            values = [row.get(name) for row in rows]
+            incoming = to_array(values)
+            if incoming.dtype.kind in "iu" or (incoming.dtype.kind == "f" and all(
+                    isinstance(v, (int, np.integer)) for v in values if v is not None)):
+                self.int_columns.add(name)
+            base = self.columns.get(name)
+            if base is None:
+                base = np.full(n_before, None, dtype=object)
+            base, incoming = promote(base, incoming)
+            if existing.any():
+                base = base.copy()
+                base[positions[existing]] = incoming[existing]
+            new_columns[name] = np.concatenate([base, incoming[new_rows_mask]])
+
+        # 신규 행 기본키 위치 등록 후 새 스냅샷으로 교체
+        if self.primary_key is not None:
+            pk_positions = dict(self._pk_positions)
+            for offset, i in enumerate(np.flatnonzero(new_rows_mask)):
+                pk_positions[rows[i].get(self.primary_key)] = n_before + offset
+            self._pk_positions = pk_positions
+        self.columns = new_columns
+        return int(existing.sum() + new_rows_mask.sum())
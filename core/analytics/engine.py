@@ -0,0 +1,472 @@
+"""
+Query Engine
+ColumnarTable 위에서 SelectQuery(부분집합 SQL)를 NumPy로 실행
+
+처리 순서:
+    FROM/JOIN (정렬 기반 등가 조인) → WHERE (벡터 마스크)
+    → GROUP BY (코드화 + bincount 집계) → ORDER BY → LIMIT
+
+사용법:
+    engine = QueryEngine({"employees": table, "departments": dept_table})
+    rows = engine.execute(parse_select("SELECT COUNT(*) FROM employees;"))
+"""
+
+import datetime
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.analytics.columnar import ColumnarTable, null_mask, take, to_python
+from core.analytics.sql_parser import (
+    Aggregate,
+    ColumnRef,
+    Predicate,
+    SelectItem,
+    SelectQuery,
+)
+from core.types.errors import UnsupportedQueryError
+
+
+# ===== Frame (조인/필터 결과) =====
+@dataclass
+class Frame:
+    """
+    조인·필터가 적용된 가상 테이블
+
+    - tables: 별칭 → ColumnarTable
+    - index: 별칭 → 원본 행 위치 배열 (-1 = LEFT JOIN NULL)
+    """
+    tables: Dict[str, ColumnarTable]
+    index: Dict[str, np.ndarray]
+
+    @property
+    def n_rows(self) -> int:
+        return len(next(iter(self.index.values())))
+
+    def resolve(self, ref: ColumnRef) -> Tuple[str, str]:
+        """컬럼 참조 → (별칭, 컬럼명)"""
+        if ref.table is not None:
+            if ref.table not in self.tables:
+                raise UnsupportedQueryError(f"알 수 없는 테이블 별칭: {ref.table}")
+            if not self.tables[ref.table].has_column(ref.name):
+                raise UnsupportedQueryError(f"알 수 없는 컬럼: {ref.table}.{ref.name}")
+            return ref.table, ref.name
+        owners = [alias for alias, table in self.tables.items() if table.has_column(ref.name)]
+        if len(owners) != 1:
+            raise UnsupportedQueryError(f"컬럼을 특정할 수 없습니다: {ref.name}")
+        return owners[0], ref.name
+
+    def column(self, ref: ColumnRef) -> np.ndarray:
+        alias, name = self.resolve(ref)
+        return take(self.tables[alias].column(name), self.index[alias])
+
+    def is_int_column(self, ref: ColumnRef) -> bool:
+        alias, name = self.resolve(ref)
+        return name in self.tables[alias].int_columns
+
+    def filter(self, mask: np.ndarray) -> "Frame":
+        return Frame(self.tables, {alias: idx[mask] for alias, idx in self.index.items()})
+
+
+# ===== 벡터 연산 헬퍼 =====
+def equi_join(left_keys: np.ndarray, right_keys: np.ndarray, left_outer: bool = False):
+    """
+    정렬 + searchsorted 기반 등가 조인
+
+    Returns:
+        (left_idx, right_idx) - right_idx == -1 은 매칭 없음 (LEFT JOIN)
+    """
+    right_valid = np.flatnonzero(~null_mask(right_keys))
+    order = right_valid[np.argsort(right_keys[right_valid], kind="stable")]
+    sorted_right = right_keys[order]
+
+    left_null = null_mask(left_keys)
+    if len(sorted_right):
+        probe = left_keys.copy()
+        # NULL 키는 임의 값으로 채운 뒤 count를 0으로 만든다
+        probe[left_null] = sorted_right[0]
+        lo = np.searchsorted(sorted_right, probe, side="left")
+        hi = np.searchsorted(sorted_right, probe, side="right")
+        counts = np.where(left_null, 0, hi - lo)
+    else:
+        lo = np.zeros(len(left_keys), dtype=np.int64)
+        counts = np.zeros(len(left_keys), dtype=np.int64)
+
+    unmatched = (counts == 0) if left_outer else np.zeros(len(counts), dtype=bool)
+    out_counts = np.where(unmatched, 1, counts)
+
+    left_idx = np.repeat(np.arange(len(left_keys)), out_counts)
+    starts = np.repeat(np.cumsum(out_counts) - out_counts, out_counts)
+    right_pos = np.repeat(lo, out_counts) + (np.arange(len(left_idx)) - starts)
+    right_idx = np.full(len(left_idx), -1, dtype=np.int64)
+    matched = ~np.repeat(unmatched, out_counts)
+    right_idx[matched] = order[right_pos[matched]]
+    return left_idx, right_idx
+
+
+def factorize(array: np.ndarray) -> Tuple[np.ndarray, int]:
+    """값 → 정수 코드 (NULL도 하나의 그룹)"""
+    if array.dtype.kind == "O":
+        lookup: Dict[Any, int] = {}
+        codes = np.fromiter(
+            (lookup.setdefault(v, len(lookup)) for v in array), dtype=np.int64, count=len(array)
+        )
+        return codes, len(lookup)
+    _, codes = np.unique(array, return_inverse=True)
+    codes = codes.reshape(-1)
+    return codes, int(codes.max()) + 1 if len(codes) else 0
+
+
+def group_codes(keys: Sequence[np.ndarray], n_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    여러 그룹 키 → 그룹 코드
+
+    Returns:
+        (codes, first_rows) - 행별 그룹 번호, 그룹별 첫 행 위치
+    """
+    if not keys:
+        return np.zeros(n_rows, dtype=np.int64), np.zeros(1 if n_rows else 0, dtype=np.int64)
+    composite = np.zeros(n_rows, dtype=np.int64)
+    for key in keys:
+        codes, cardinality = factorize(key)
+        composite = composite * max(cardinality, 1) + codes
+    _, first_rows, codes = np.unique(composite, return_index=True, return_inverse=True)
+    return codes.reshape(-1), first_rows
+
+
+def reduce(func: str, values: Optional[np.ndarray], codes: np.ndarray, n_groups: int,
+           distinct: bool = False) -> np.ndarray:
+    """
+    그룹별 집계 (COUNT/SUM/AVG/MIN/MAX)
+
+    Returns:
+        그룹별 결과 배열 (값이 없는 그룹은 NULL)
+    """
+    if values is None:  # COUNT(*)
+        return np.bincount(codes, minlength=n_groups).astype(np.int64)
+
+    valid = ~null_mask(values)
+    codes, values = codes[valid], values[valid]
+
+    if distinct:
+        # (그룹, 값) 쌍의 첫 등장만 남긴다
+        value_codes, cardinality = factorize(values)
+        _, first = np.unique(codes * max(cardinality, 1) + value_codes, return_index=True)
+        codes, values = codes[first], values[first]
+
+    counts = np.bincount(codes, minlength=n_groups)
+    if func == "COUNT":
+        return counts.astype(np.int64)
+
+    if func in ("SUM", "AVG"):
+        if values.dtype.kind not in "iuf":
+            raise UnsupportedQueryError(f"숫자가 아닌 컬럼의 {func}는 지원하지 않습니다.")
+        sums = np.bincount(codes, weights=values.astype(np.float64), minlength=n_groups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = sums if func == "SUM" else sums / counts
+        return np.where(counts > 0, result, np.nan)
+
+    if func in ("MIN", "MAX"):
+        order = np.lexsort((values, codes))
+        sorted_codes = codes[order]
+        groups, first = np.unique(sorted_codes, return_index=True)
+        if func == "MAX":
+            last = np.append(first[1:], len(sorted_codes)) - 1
+            picked = values[order][last]
+        else:
+            picked = values[order][first]
+        result = take(picked, np.full(n_groups, -1, dtype=np.int64))
+        result[groups] = picked
+        return result
+
+    raise UnsupportedQueryError(f"지원하지 않는 집계 함수: {func}")
+
+
+def sort_rank(array: np.ndarray) -> np.ndarray:
+    """정렬용 순위 (NULL이 가장 앞, MySQL ASC 규칙)"""
+    nulls = null_mask(array)
+    ranks = np.full(len(array), -1, dtype=np.int64)
+    valid = array[~nulls]
+    if len(valid):
+        try:
+            _, inverse = np.unique(valid, return_inverse=True)
+        except TypeError:
+            _, inverse = np.unique(valid.astype(str), return_inverse=True)
+        ranks[~nulls] = inverse.reshape(-1)
+    return ranks
+
+
+# ===== 리터럴 변환 =====
+_TIME_RE = re.compile(r"^(\d{1,3}):(\d{2})(?::(\d{2}))?$")
+
+
+def coerce_literal(value: Any, dtype: np.dtype) -> Any:
+    """WHERE 리터럴을 컬럼 dtype으로 변환 (MySQL 암묵 변환 흉내)"""
+    if value is None:
+        return None
+    kind = dtype.kind
+    try:
+        if kind in "iuf":
+            return float(value) if isinstance(value, str) else value
+        if kind == "M":
+            return np.datetime64(str(value).strip())
+        if kind == "m":
+            match = _TIME_RE.match(str(value).strip())
+            if not match:
+                raise ValueError(value)
+            hours, minutes, seconds = (int(g or 0) for g in match.groups())
+            return np.timedelta64(
+                int(datetime.timedelta(hours=hours, minutes=minutes,
+                                       seconds=seconds).total_seconds() * 1_000_000), "us")
+    except ValueError:
+        raise UnsupportedQueryError(f"리터럴 변환 실패: {value!r}")
+    if kind == "O":
+        if not isinstance(value, str):
+            raise UnsupportedQueryError("문자열 컬럼과 숫자 비교는 지원하지 않습니다.")
+        return value
+    raise UnsupportedQueryError(f"지원하지 않는 컬럼 타입: {dtype}")
+
+
+def _like_regex(pattern: str) -> "re.Pattern":
+    parts = []
+    for ch in pattern:
+        if ch == "%":
+            parts.append(".*")
+        elif ch == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(ch))
+    return re.compile("^" + "".join(parts) + "$", re.IGNORECASE | re.DOTALL)
+
+
+def predicate_mask(values: np.ndarray, predicate: Predicate) -> np.ndarray:
+    """단일 조건 → 불리언 마스크 (NULL은 항상 False)"""
+    op = predicate.op
+    nulls = null_mask(values)
+    if op == "IS NULL":
+        return nulls
+    if op == "IS NOT NULL":
+        return ~nulls
+
+    valid = ~nulls
+    result = np.zeros(len(values), dtype=bool)
+    subset = values[valid]
+    is_text = values.dtype.kind == "O"
+
+    if op in ("LIKE", "NOT LIKE"):
+        if not is_text:
+            raise UnsupportedQueryError("LIKE는 문자열 컬럼만 지원합니다.")
+        regex = _like_regex(predicate.value)
+        matched = np.fromiter((bool(regex.match(str(v))) for v in subset),
+                              dtype=bool, count=len(subset))
+        result[valid] = matched if op == "LIKE" else ~matched
+        return result
+
+    if is_text:
+        # utf8mb4_unicode_ci: 대소문자 구분 없는 비교
+        if op not in ("=", "!=", "IN", "NOT IN"):
+            raise UnsupportedQueryError("문자열 대소 비교는 지원하지 않습니다.")
+        subset = np.array([str(v).casefold() for v in subset], dtype=object)
+        literals = predicate.value if op in ("IN", "NOT IN") else (predicate.value,)
+        literals = tuple(str(coerce_literal(v, values.dtype)).casefold() for v in literals)
+    else:
+        literals = predicate.value if op in ("IN", "NOT IN", "BETWEEN") else (predicate.value,)
+        literals = tuple(coerce_literal(v, values.dtype) for v in literals)
+
+    if op in ("IN", "NOT IN"):
+        matched = np.isin(subset, np.array(literals, dtype=subset.dtype if is_text else None))
+        result[valid] = matched if op == "IN" else ~matched
+    elif op == "BETWEEN":
+        result[valid] = (subset >= literals[0]) & (subset <= literals[1])
+    else:
+        literal = literals[0]
+        comparisons = {
+            "=": np.equal, "!=": np.not_equal, "<": np.less,
+            "<=": np.less_equal, ">": np.greater, ">=": np.greater_equal,
+        }
+        result[valid] = comparisons[op](subset, literal)
+    return result
+
+
+# ===== 정렬 / 결과 변환 =====
+def order_index(query: SelectQuery, items: List[SelectItem], columns,
+                frame: Optional[Frame] = None) -> Optional[np.ndarray]:
+    """ORDER BY 정렬 순서 (결과 컬럼 또는 Frame 컬럼 기준)"""
+    if not query.order_by:
+        return None
+
+    grouped = query.has_aggregates or bool(query.group_by) or query.distinct
+    by_name = {name: values for name, values, _ in columns}
+    rank_keys = []
+    for order in query.order_by:
+        key = order.key
+        values = None
+        if isinstance(key, int):
+            if not 1 <= key <= len(columns):
+                raise UnsupportedQueryError(f"ORDER BY 위치 범위 초과: {key}")
+            values = columns[key - 1][1]
+        elif isinstance(key, ColumnRef) and key.table is None and key.name in by_name:
+            values = by_name[key.name]
+        else:
+            for item, (_, col_values, _) in zip(items, columns):
+                if item.expr == key:
+                    values = col_values
+                    break
+            if values is None and isinstance(key, ColumnRef):
+                for item, (_, col_values, _) in zip(items, columns):
+                    if isinstance(item.expr, ColumnRef) and item.expr.name == key.name \
+                            and key.table in (None, item.expr.table):
+                        values = col_values
+                        break
+            if values is None and not grouped and frame is not None \
+                    and isinstance(key, ColumnRef):
+                values = frame.column(key)
+        if values is None:
+            raise UnsupportedQueryError("ORDER BY 키를 해석할 수 없습니다.")
+        rank = sort_rank(values)
+        rank_keys.append(-rank if order.descending else rank)
+
+    # lexsort는 마지막 키가 1순위
+    return np.lexsort(tuple(reversed(rank_keys)))
+
+
+def materialize(query: SelectQuery, items: List[SelectItem], columns,
+                frame: Optional[Frame] = None) -> List[Dict[str, Any]]:
+    """
+    결과 컬럼 → 딕셔너리 행 목록 (ORDER BY, LIMIT/OFFSET 적용)
+
+    Args:
+        columns: (결과 컬럼명, 값 배열, 정수 여부) 목록
+    """
+    order = order_index(query, items, columns, frame)
+    if order is not None:
+        columns = [(name, values[order], as_int) for name, values, as_int in columns]
+
+    n_rows = len(columns[0][1]) if columns else 0
+    start = min(query.offset, n_rows)
+    stop = n_rows if query.limit is None else min(start + query.limit, n_rows)
+
+    names = [name for name, _, _ in columns]
+    values = [to_python(arr[start:stop], as_int=as_int) for _, arr, as_int in columns]
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+# ===== Query Engine =====
+class QueryEngine:
+    """
+    인메모리 컬럼형 SQL 실행기
+
+    - 지원 범위 밖이면 UnsupportedQueryError (호출 측에서 MySQL 폴백)
+    - 결과는 DatabaseConnection.execute_query와 같은 딕셔너리 리스트
+    """
+
+    def __init__(self, tables: Mapping[str, ColumnarTable]):
+        """
+        Args:
+            tables: 테이블명 → ColumnarTable
+        """
+        self.tables = tables
+
+    def execute(self, query: SelectQuery) -> List[Dict[str, Any]]:
+        """SelectQuery 실행"""
+        frame = self.build_frame(query)
+
+        if query.star:
+            items = [
+                SelectItem(ColumnRef(ref.alias, name), name)
+                for ref in query.tables
+                for name in frame.tables[ref.alias].column_names
+            ]
+        else:
+            items = query.select
+
+        if query.has_aggregates or query.group_by or query.distinct:
+            columns = self._aggregate(query, frame, items)
+        else:
+            columns = [(item.output_name, frame.column(item.expr),
+                        frame.is_int_column(item.expr)) for item in items]
+
+        return materialize(query, items, columns, frame)
+
+    # --------------------------
+    # FROM / JOIN / WHERE
+    # --------------------------
+    def build_frame(self, query: SelectQuery) -> Frame:
+        """조인·WHERE가 적용된 Frame 생성"""
+        tables: Dict[str, ColumnarTable] = {}
+        for ref in query.tables:
+            if ref.name not in self.tables:
+                raise UnsupportedQueryError(f"레플리카에 없는 테이블: {ref.name}")
+            if ref.alias in tables:
+                raise UnsupportedQueryError(f"중복 별칭: {ref.alias}")
+
+        base = query.from_table
+        tables[base.alias] = self.tables[base.name]
+        frame = Frame(tables, {base.alias: np.arange(tables[base.alias].n_rows)})
+
+        for join in query.joins:
+            new_alias = join.table.alias
+            new_table = self.tables[join.table.name]
+            if join.left.table == new_alias or (
+                join.left.table is None and join.right.table != new_alias
+                and new_table.has_column(join.left.name)
+            ):
+                new_side, old_side = join.left, join.right
+            else:
+                new_side, old_side = join.right, join.left
+            if new_side.table not in (None, new_alias) or not new_table.has_column(new_side.name):
+                raise UnsupportedQueryError("조인 조건을 해석할 수 없습니다.")
+
+            left_keys = frame.column(old_side)
+            right_keys = new_table.column(new_side.name)
+            left_idx, right_idx = equi_join(left_keys, right_keys, left_outer=join.kind == "LEFT")
+
+            tables[new_alias] = new_table
+            index = {alias: idx[left_idx] for alias, idx in frame.index.items()}
+            index[new_alias] = right_idx
+            frame = Frame(tables, index)
+
+        if query.where:
+            mask = np.ones(frame.n_rows, dtype=bool)
+            for predicate in query.where:
+                mask &= predicate_mask(frame.column(predicate.column), predicate)
+            frame = frame.filter(mask)
+        return frame
+
+    # --------------------------
+    # GROUP BY / 집계
+    # --------------------------
+    def _aggregate(self, query: SelectQuery, frame: Frame, items: List[SelectItem]):
+        group_by = list(query.group_by)
+        if query.distinct and not group_by:
+            if query.has_aggregates:
+                raise UnsupportedQueryError("DISTINCT + 집계 조합은 지원하지 않습니다.")
+            group_by = [item.expr for item in items]
+
+        keys = [frame.column(ref) for ref in group_by]
+        codes, first_rows = group_codes(keys, frame.n_rows)
+        n_groups = len(first_rows)
+        if not group_by:
+            n_groups = 1  # 전체 집계는 행이 없어도 결과 1행
+
+        columns = []
+        for item in items:
+            expr = item.expr
+            if isinstance(expr, Aggregate):
+                values = None if expr.arg is None else frame.column(expr.arg)
+                result = reduce(expr.func, values, codes, n_groups, expr.distinct)
+                as_int = expr.func == "COUNT" or (
+                    expr.func in ("SUM", "MIN", "MAX") and expr.arg is not None
+                    and frame.is_int_column(expr.arg)
+                )
+                columns.append((item.output_name, result, as_int))
+            else:
+                values = frame.column(expr)
+                if group_by:
+                    picked = values[first_rows]
+                else:
+                    picked = take(values, np.array([0 if frame.n_rows else -1]))
+                columns.append((item.output_name, picked, frame.is_int_column(expr)))
+        return columns
@@ -0,0 +1,314 @@
+"""
+Index Advisor
+쿼리 로그 기반 인덱스 추천
+
+- QueryLog에서 누적 지연 시간 상위 쿼리 형태를 가져와 EXPLAIN 실행
+- 전체 스캔(type=ALL) 또는 인덱스를 못 쓰는 테이블에 대해 후보 인덱스 구성
+  - 등가(=, IN, IS NULL, 조인 키) 컬럼 → 범위(<, >, BETWEEN, LIKE 'x%') 컬럼 1개
+  - 범위 컬럼이 없으면 GROUP BY / ORDER BY 컬럼을 뒤에 추가 (filesort 회피)
+- EXPLAIN rows/filtered와 로그의 지연 시간·조회 행 수로 기대 효과 추정
+- 기존 인덱스가 후보를 이미 포함하면 제외, 같은 테이블의 접두 후보는 긴 후보로 병합
+
+사용법:
+    advisor = IndexAdvisor(db=db, query_log=QueryLog("data/query_log.db"))
+    for rec in advisor.recommend():
+        print(rec.ddl, rec.estimated_latency_saved_ms)
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from core.analytics.query_log import QueryLog, QueryShape
+from core.analytics.rollups import HR_COLUMNS
+from core.analytics.sql_parser import ColumnRef, SelectQuery, parse_select
+from core.database.connection import DatabaseConnection
+from core.types.errors import UnsupportedQueryError
+
+logger = logging.getLogger(__name__)
+
+EQUALITY_OPS = {"=", "IN", "IS NULL"}
+RANGE_OPS = {"<", "<=", ">", ">=", "BETWEEN"}
+MAX_INDEX_COLUMNS = 4
+
+_TABLE_REF = re.compile(
+    r"\b(?:from|join)\s+`?(\w+)`?(?:\s+(?:as\s+)?"
+    r"(?!on\b|where\b|join\b|inner\b|left\b|right\b|group\b|order\b|limit\b)(\w+))?", re.I)
+_CLAUSE_START = re.compile(r"\b(?:where|on)\b", re.I)
+_CONDITION = re.compile(
+    r"(?<![\w(])(?:`?(\w+)`?\.)?`?(\w+)`?\s*(=|<=|>=|<>|!=|<|>|\bin\b|\bbetween\b|\blike\b)", re.I)
+
+
+@dataclass
+class ColumnUsage:
+    """테이블별 컬럼 사용 (인덱스 후보 구성용)"""
+    equality: List[str] = field(default_factory=list)
+    range: List[str] = field(default_factory=list)
+    ordering: List[str] = field(default_factory=list)
+
+    def add(self, bucket: str, column: str):
+        values = getattr(self, bucket)
+        if column not in values:
+            values.append(column)
+
+    def candidate(self) -> Tuple[str, ...]:
+        """등가 → 범위 1개 → (범위가 없을 때) 정렬/그룹 컬럼"""
+        columns = list(self.equality)
+        if self.range:
+            columns += [c for c in self.range[:1] if c not in columns]
+        else:
+            columns += [c for c in self.ordering if c not in columns]
+        return tuple(columns[:MAX_INDEX_COLUMNS])
+
+
+@dataclass
+class IndexRecommendation:
+    """인덱스 추천 결과"""
+    table: str
+    columns: Tuple[str, ...]
+    shape_ids: List[str]
+    executions: int
+    rows_before: float  # 실행당 추정 조회 행 수 (현재)
+    rows_after: float  # 실행당 추정 조회 행 수 (인덱스 적용 후)
+    estimated_rows_saved: float  # 로그 기간 전체 기준
+    estimated_latency_saved_ms: float  # 로그 기간 전체 기준
+    reason: str
+
+    @property
+    def name(self) -> str:
+        return f"idx_{self.table}_{'_'.join(self.columns)}"[:64]
+
+    @property
+    def ddl(self) -> str:
+        return f"CREATE INDEX {self.name} ON {self.table} ({', '.join(self.columns)});"
+
+
+class IndexAdvisor:
+    """
+    쿼리 로그 + EXPLAIN 기반 인덱스 추천기
+
+    - 추천만 수행, DDL 적용은 운영자가 판단
+    """
+
+    def __init__(
+        self,
+        db: DatabaseConnection,  # 의존성 주입
+        query_log: QueryLog,
+        schema: Optional[Dict[str, Sequence[str]]] = None,
+    ):
+        """
+        Args:
+            db: DatabaseConnection 인스턴스 (주입)
+            query_log: SQL Agent 실행 로그
+            schema: 테이블 → 컬럼 목록 (별칭 없는 컬럼 소유 테이블 판별용)
+        """
+        self.db = db
+        self.query_log = query_log
+        self.schema = {t: set(cols) for t, cols in (schema or HR_COLUMNS).items()}
+        self._indexes: Dict[str, List[Tuple[str, ...]]] = {}
+
+    def recommend(
+        self,
+        limit: int = 20,
+        since: Optional[float] = None,
+        min_executions: int = 1,
+    ) -> List[IndexRecommendation]:
+        """
+        인덱스 추천
+
+        Args:
+            limit: 분석할 상위 쿼리 형태 수 (누적 지연 시간 기준)
+            since: 이 시각(epoch 초) 이후 로그만 분석
+            min_executions: 분석 대상 최소 실행 횟수
+
+        Returns:
+            기대 지연 감소 순 추천 목록
+        """
+        merged: Dict[Tuple[str, Tuple[str, ...]], IndexRecommendation] = {}
+        for shape in self.query_log.top_shapes(limit=limit, since=since):
+            if shape.count < min_executions:
+                continue
+            for rec in self._analyze_shape(shape):
+                key = (rec.table, rec.columns)
+                if key in merged:
+                    self._merge(merged[key], rec)
+                else:
+                    merged[key] = rec
+
+        # 같은 테이블의 접두 후보는 긴 후보가 대신 처리
+        recs = sorted(merged.values(), key=lambda r: -len(r.columns))
+        result: List[IndexRecommendation] = []
+        for rec in recs:
+            wider = next((r for r in result if r.table == rec.table
+                          and r.columns[:len(rec.columns)] == rec.columns), None)
+            if wider is not None:
+                self._merge(wider, rec)
+            else:
+                result.append(rec)
+        return sorted(result, key=lambda r: -r.estimated_latency_saved_ms)
+
+    @staticmethod
+    def _merge(target: IndexRecommendation, other: IndexRecommendation):
+        target.shape_ids += [s for s in other.shape_ids if s not in target.shape_ids]
+        target.executions += other.executions
+        target.estimated_rows_saved += other.estimated_rows_saved
+        target.estimated_latency_saved_ms += other.estimated_latency_saved_ms
+        target.rows_before = max(target.rows_before, other.rows_before)
+
+    # --------------------------
+    # Shape Analysis
+    # --------------------------
+    def _analyze_shape(self, shape: QueryShape) -> List[IndexRecommendation]:
+        plan, error = self.db.explain(shape.sample_sql)
+        if error or not plan:
+            logger.info("EXPLAIN 실패 (%s): %s", shape.shape_id, error)
+            return []
+
+        usage = self.column_usage(shape.sample_sql)
+        aliases = self._aliases(shape.sample_sql)
+        total_rows = sum(float(row.get("rows") or 0) for row in plan) or 1.0
+        examined = shape.avg_rows_examined if shape.avg_rows_examined is not None else total_rows
+
+        recs = []
+        for row in plan:
+            table = aliases.get(row.get("table"), row.get("table"))
+            access = (row.get("type") or "").upper()
+            if table not in usage or access in ("CONST", "EQ_REF", "SYSTEM"):
+                continue
+            columns = usage[table].candidate()
+            if not columns or self._covered(table, columns):
+                continue
+            # 이미 인덱스로 접근 중이면 후보가 더 많은 컬럼을 쓸 때만 추천
+            if row.get("key") and access != "ALL" and len(columns) <= 1:
+                continue
+
+            rows_before = float(row.get("rows") or 0)
+            filtered = float(row.get("filtered") or 100.0) / 100.0
+            rows_after = max(rows_before * filtered, 1.0)
+            if rows_before <= rows_after:
+                continue
+            reduction = 1.0 - rows_after / rows_before
+            share = rows_before / total_rows
+            recs.append(IndexRecommendation(
+                table=table,
+                columns=columns,
+                shape_ids=[shape.shape_id],
+                executions=shape.count,
+                rows_before=rows_before,
+                rows_after=rows_after,
+                estimated_rows_saved=shape.count * examined * share * reduction,
+                estimated_latency_saved_ms=shape.total_latency_ms * share * reduction,
+                reason=(f"{access or '?'} 접근, 조건 통과율 {filtered:.0%}"
+                        f" ({shape.fingerprint[:80]})"),
+            ))
+        return recs
+
+    def _covered(self, table: str, columns: Tuple[str, ...]) -> bool:
+        """기존 인덱스가 후보를 접두로 포함하는지"""
+        if table not in self._indexes:
+            results, error = self.db.execute_query(f"SHOW INDEX FROM {table}")
+            indexes: Dict[str, List[Tuple[int, str]]] = {}
+            for row in results or []:
+                indexes.setdefault(row["Key_name"], []).append(
+                    (int(row["Seq_in_index"]), row["Column_name"]))
+            self._indexes[table] = [
+                tuple(col for _, col in sorted(cols)) for cols in indexes.values()
+            ]
+        return any(index[:len(columns)] == columns for index in self._indexes[table])
+
+    # --------------------------
+    # Column Extraction
+    # --------------------------
+    def column_usage(self, sql: str) -> Dict[str, ColumnUsage]:
+        """SQL → 테이블별 컬럼 사용 (파서 지원 범위 밖이면 정규식으로 WHERE/ON 조건만 추출)"""
+        try:
+            return self._usage_from_query(parse_select(sql))
+        except UnsupportedQueryError:
+            return self._usage_from_text(sql)
+
+    def _usage_from_query(self, query: SelectQuery) -> Dict[str, ColumnUsage]:
+        aliases = {ref.alias: ref.name for ref in query.tables}
+        tables = list(dict.fromkeys(aliases.values()))
+        usage: Dict[str, ColumnUsage] = {}
+
+        def owner(ref: ColumnRef) -> Optional[str]:
+            if ref.table is not None:
+                return aliases.get(ref.table)
+            owners = [t for t in tables if ref.name in self.schema.get(t, ())]
+            return owners[0] if len(owners) == 1 else (tables[0] if len(tables) == 1 else None)
+
+        def add(bucket: str, ref: ColumnRef):
+            table = owner(ref)
+            if table is not None:
+                usage.setdefault(table, ColumnUsage()).add(bucket, ref.name)
+
+        for predicate in query.where:
+            if predicate.op in EQUALITY_OPS:
+                add("equality", predicate.column)
+            elif predicate.op in RANGE_OPS or (
+                predicate.op == "LIKE" and isinstance(predicate.value, str)
+                and not predicate.value.startswith(("%", "_"))
+            ):
+                add("range", predicate.column)
+        for join in query.joins:
+            add("equality", join.left)
+            add("equality", join.right)
+        for ref in query.group_by:
+            add("ordering", ref)
+        for item in query.order_by:
+            if isinstance(item.key, ColumnRef):
+                add("ordering", item.key)
+        return usage
+
+    def _aliases(self, sql: str) -> Dict[str, str]:
+        aliases: Dict[str, str] = {}
+        for table, alias in _TABLE_REF.findall(sql):
+            aliases[table] = table
+            if alias:
+                aliases[alias] = table
+        return aliases
+
+    def _usage_from_text(self, sql: str) -> Dict[str, ColumnUsage]:
+        aliases = self._aliases(sql)
+        tables = list(dict.fromkeys(aliases.values()))
+        usage: Dict[str, ColumnUsage] = {}
+        clause = _CLAUSE_START.search(sql)
+        if clause is None:
+            return usage
+
+        for qualifier, column, op in _CONDITION.findall(sql[clause.start():]):
+            if qualifier:
+                table = aliases.get(qualifier)
+            else:
+                owners: Set[str] = {t for t in tables if column in self.schema.get(t, ())}
+                table = owners.pop() if len(owners) == 1 else None
+            if table is None or column not in self.schema.get(table, {column}):
+                continue
+            op = op.upper()
+            if op in ("=", "IN"):
+                bucket = "equality"
+            elif op in ("<", "<=", ">", ">=", "BETWEEN", "LIKE"):
+                bucket = "range"
+            else:
+                continue
+            usage.setdefault(table, ColumnUsage()).add(bucket, column)
+        return usage
+
+
+def format_recommendations(recs: List[IndexRecommendation]) -> List[Dict[str, Any]]:
+    """추천 결과 → 출력/직렬화용 딕셔너리"""
+    return [
+        {
+            "table": r.table,
+            "columns": list(r.columns),
+            "ddl": r.ddl,
+            "executions": r.executions,
+            "rows_before": round(r.rows_before),
+            "rows_after": round(r.rows_after),
+            "estimated_rows_saved": round(r.estimated_rows_saved),
+            "estimated_latency_saved_ms": round(r.estimated_latency_saved_ms, 1),
+            "reason": r.reason,
+        }
+        for r in recs
+    ]
@@ -0,0 +1,201 @@
+"""
+Query Log
+SQL Agent가 실행한 SQL 기록 (SQLite)
+
+- SQL, 실행 엔진, 지연 시간, 조회(examined) 행 수, 반환 행 수, 성공 여부 저장
+- 리터럴을 ? 로 치환한 fingerprint 단위로 쿼리 형태(shape) 집계
+- 기록 실패는 경고만 남기고 질의 처리는 계속
+
+사용법:
+    log = QueryLog("data/query_log.db")
+    log.record(sql, engine="mysql", latency_ms=12.3, rows_examined=1200, rows_returned=5)
+    shapes = log.top_shapes(limit=20)
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """
+    SQL → 쿼리 형태 (리터럴 제거, 공백/대소문자 정규화)
+
+    예: "SELECT * FROM attendance WHERE emp_id = 3 AND status IN ('LATE','ABSENT');"
+        → "select * from attendance where emp_id = ? and status in (?)"
+    """
+    text = _STRING.sub("?", sql.strip().rstrip(";"))
+    text = _NUMBER.sub("?", text)
+    text = _SPACES.sub(" ", text).lower()
+    return _IN_LIST.sub("in (?)", text)
+
+
+@dataclass
+class QueryShape:
+    """fingerprint 단위 집계"""
+    shape_id: str
+    fingerprint: str
+    sample_sql: str  # 가장 최근 실행된 원본 SQL (EXPLAIN용)
+    count: int
+    total_latency_ms: float
+    avg_latency_ms: float
+    max_latency_ms: float
+    avg_rows_examined: Optional[float]  # MySQL 실행분만 (인메모리 엔진은 NULL)
+    avg_rows_returned: float
+    engines: List[str]
+
+
+class QueryLog:
+    """
+    SQLite 기반 SQL 실행 로그
+
+    - 스레드마다 짧은 연결을 열어 사용 (FastAPI 워커 스레드 안전)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:"는 테스트용, 단일 연결 유지)
+        """
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._memory_conn: Optional[sqlite3.Connection] = None
+        if self.path == ":memory:":
+            self._memory_conn = sqlite3.connect(":memory:", check_same_thread=False)
+        else:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._memory_conn is not None:
+            return self._memory_conn
+        return sqlite3.connect(self.path, timeout=5)
+
+    def _init_schema(self):
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.executescript(
+                    """
+                    CREATE TABLE IF NOT EXISTS query_log (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        ts REAL NOT NULL,
+                        shape_id TEXT NOT NULL,
+                        fingerprint TEXT NOT NULL,
+                        sql TEXT NOT NULL,
+                        engine TEXT NOT NULL,
+                        latency_ms REAL NOT NULL,
+                        rows_examined INTEGER,
+                        rows_returned INTEGER,
+                        success INTEGER NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_query_log_shape ON query_log (shape_id, ts);
+                    """
+                )
+                conn.commit()
+            finally:
+                if conn is not self._memory_conn:
+                    conn.close()
+
+    def record(
+        self,
+        sql: str,
+        engine: str,
+        latency_ms: float,
+        rows_examined: Optional[int] = None,
+        rows_returned: Optional[int] = None,
+        success: bool = True,
+    ):
+        """SQL 실행 기록 (실패해도 예외를 던지지 않음)"""
+        shape = fingerprint(sql)
+        shape_id = hashlib.sha1(shape.encode("utf-8")).hexdigest()[:16]
+        try:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    conn.execute(
+                        "INSERT INTO query_log (ts, shape_id, fingerprint, sql, engine,"
+                        " latency_ms, rows_examined, rows_returned, success)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (time.time(), shape_id, shape, sql, engine, float(latency_ms),
+                         rows_examined, rows_returned, int(success)),
+                    )
+                    conn.commit()
+                finally:
+                    if conn is not self._memory_conn:
+                        conn.close()
+        except sqlite3.Error as e:
+            logger.warning("쿼리 로그 기록 실패: %s", e)
+
+    def top_shapes(
+        self,
+        limit: int = 20,
+        since: Optional[float] = None,
+        successful_only: bool = True,
+    ) -> List[QueryShape]:
+        """
+        누적 지연 시간 기준 상위 쿼리 형태
+
+        Args:
+            limit: 반환할 형태 수
+            since: 이 시각(epoch 초) 이후 기록만 집계
+            successful_only: 성공한 실행만 집계
+        """
+        conditions, params = [], []
+        if since is not None:
+            conditions.append("ts >= ?")
+            params.append(since)
+        if successful_only:
+            conditions.append("success = 1")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    f"""
+                    SELECT shape_id, fingerprint,
+                           (SELECT sql FROM query_log l2 WHERE l2.shape_id = l.shape_id
+                            ORDER BY id DESC LIMIT 1),
+                           COUNT(*), SUM(latency_ms), AVG(latency_ms), MAX(latency_ms),
+                           AVG(rows_examined), AVG(rows_returned), GROUP_CONCAT(DISTINCT engine)
+                    FROM query_log l
+                    {where}
+                    GROUP BY shape_id, fingerprint
+                    ORDER BY SUM(latency_ms) DESC
+                    LIMIT ?
+                    """,
+                    (*params, limit),
+                ).fetchall()
+            finally:
+                if conn is not self._memory_conn:
+                    conn.close()
+
+        return [
+            QueryShape(
+                shape_id=row[0],
+                fingerprint=row[1],
+                sample_sql=row[2],
+                count=row[3],
+                total_latency_ms=row[4] or 0.0,
+                avg_latency_ms=row[5] or 0.0,
+                max_latency_ms=row[6] or 0.0,
+                avg_rows_examined=row[7],
+                avg_rows_returned=row[8] or 0.0,
+                engines=sorted((row[9] or "").split(",")),
+            )
+            for row in rows
+        ]
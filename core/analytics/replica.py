@@ -0,0 +1,190 @@
+"""
+Columnar Replica
+MySQL HR 테이블의 인메모리 컬럼형 복제본 (집계 쿼리 가속)
+
+- employees, departments, salaries, evaluations, attendance 복제
+- 기본키(또는 변경 시각 컬럼) 기준 증분 갱신, 주기적 전체 갱신
+- 지원 범위 SQL은 NumPy 엔진으로 실행, 나머지는 UnsupportedQueryError → MySQL 폴백
+
+사용법:
+    replica = ColumnarReplica(db=db, refresh_interval=60)
+    try:
+        results = replica.execute("SELECT COUNT(*) FROM employees;")
+    except UnsupportedQueryError:
+        results, error = db.execute_query(sql)
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.analytics.columnar import ColumnarTable
+from core.analytics.engine import QueryEngine
+from core.analytics.sql_parser import parse_select
+from core.database.connection import DatabaseConnection
+from core.types.errors import DatabaseConnectionError, UnsupportedQueryError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """복제 대상 테이블 정의"""
+    name: str
+    primary_key: str
+    updated_at: Optional[str] = None  # 변경 시각 컬럼 (있으면 UPDATE도 증분 반영)
+
+
+# init.sql 기준 HR 테이블 (현재 스키마에는 변경 시각 컬럼이 없음)
+DEFAULT_TABLES = (
+    TableSpec("departments", "dept_id"),
+    TableSpec("employees", "emp_id"),
+    TableSpec("salaries", "salary_id"),
+    TableSpec("evaluations", "eval_id"),
+    TableSpec("attendance", "att_id"),
+)
+
+
+class ColumnarReplica:
+    """
+    인메모리 컬럼형 레플리카
+
+    - 첫 실행 시 전체 로드, 이후 refresh_interval마다 증분 갱신
+    - full_refresh_interval마다 전체 재로드 (DELETE 반영)
+    - 갱신은 한 스레드만 수행, 나머지 요청은 기존 스냅샷으로 즉시 실행
+    """
+
+    def __init__(
+        self,
+        db: DatabaseConnection,  # 의존성 주입
+        tables: Sequence[TableSpec] = DEFAULT_TABLES,
+        refresh_interval: float = 60.0,
+        full_refresh_interval: float = 3600.0,
+    ):
+        """
+        Args:
+            db: DatabaseConnection 인스턴스 (주입)
+            tables: 복제할 테이블 정의
+            refresh_interval: 증분 갱신 주기(초)
+            full_refresh_interval: 전체 재로드 주기(초)
+        """
+        self.db = db
+        self.specs = {spec.name: spec for spec in tables}
+        self.refresh_interval = refresh_interval
+        self.full_refresh_interval = full_refresh_interval
+
+        self.tables: Dict[str, ColumnarTable] = {}
+        self._watermarks: Dict[str, Dict[str, Any]] = {}
+        self._last_refresh = 0.0
+        self._last_full_refresh = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return len(self.tables) == len(self.specs)
+
+    # --------------------------
+    # Refresh
+    # --------------------------
+    def refresh(self, full: bool = False) -> Dict[str, int]:
+        """
+        DB → 레플리카 동기화
+
+        Args:
+            full: True면 전체 재로드, False면 증분 갱신
+
+        Returns:
+            테이블별 반영 행 수
+
+        Raises:
+            DatabaseConnectionError: 조회 실패
+        """
+        with self._lock:
+            return self._refresh_locked(full or not self.is_loaded)
+
+    def _refresh_locked(self, full: bool) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        new_tables = dict(self.tables)
+
+        for spec in self.specs.values():
+            table = None if full else new_tables.get(spec.name)
+            rows = self._fetch(spec, table)
+            if table is None:
+                table = ColumnarTable.from_rows(spec.name, spec.primary_key, rows)
+            else:
+                # 실행 중인 쿼리가 보는 스냅샷은 건드리지 않는다
+                table = table.copy()
+                table.upsert(rows)
+            new_tables[spec.name] = table
+            counts[spec.name] = len(rows)
+            self._watermarks[spec.name] = {
+                "pk": table.max_value(spec.primary_key),
+                "updated_at": table.max_value(spec.updated_at) if spec.updated_at else None,
+            }
+
+        self.tables = new_tables
+        now = time.monotonic()
+        self._last_refresh = now
+        if full:
+            self._last_full_refresh = now
+        logger.info("레플리카 갱신 (%s): %s", "full" if full else "incremental", counts)
+        return counts
+
+    def _fetch(self, spec: TableSpec, table: Optional[ColumnarTable]) -> List[Dict[str, Any]]:
+        sql = f"SELECT * FROM {spec.name}"
+        if table is not None:
+            watermark = self._watermarks.get(spec.name, {})
+            conditions = []
+            if watermark.get("pk") is not None:
+                conditions.append(f"{spec.primary_key} > {int(watermark['pk'])}")
+            if spec.updated_at and watermark.get("updated_at") is not None:
+                conditions.append(f"{spec.updated_at} > '{watermark['updated_at']}'")
+            if conditions:
+                sql += " WHERE " + " OR ".join(conditions)
+
+        results, error = self.db.execute_query(sql)
+        if error:
+            raise DatabaseConnectionError(f"레플리카 갱신 실패 ({spec.name}): {error}")
+        return results or []
+
+    def maybe_refresh(self):
+        """갱신 주기가 지났으면 갱신 (다른 스레드가 갱신 중이면 건너뜀)"""
+        now = time.monotonic()
+        if self.is_loaded and now - self._last_refresh < self.refresh_interval:
+            return
+        if not self._lock.acquire(blocking=not self.is_loaded):
+            return
+        try:
+            if self.is_loaded and time.monotonic() - self._last_refresh < self.refresh_interval:
+                return
+            full = not self.is_loaded or now - self._last_full_refresh >= self.full_refresh_interval
+            self._refresh_locked(full)
+        finally:
+            self._lock.release()
+
+    # --------------------------
+    # Execute
+    # --------------------------
+    def execute(self, sql: str) -> List[Dict[str, Any]]:
+        """
+        SQL을 레플리카에서 실행
+
+        Args:
+            sql: SQL Agent가 생성한 SELECT 쿼리
+
+        Returns:
+            DatabaseConnection.execute_query와 같은 형식의 결과
+
+        Raises:
+            UnsupportedQueryError: 지원 범위 밖이거나 레플리카를 사용할 수 없는 경우
+        """
+        query = parse_select(sql)
+        try:
+            self.maybe_refresh()
+        except DatabaseConnectionError as e:
+            if not self.is_loaded:
+                raise UnsupportedQueryError(f"레플리카 미적재: {e}")
+            logger.warning("레플리카 갱신 실패, 기존 스냅샷 사용: %s", e)
+        return QueryEngine(self.tables).execute(query)
@@ -0,0 +1,517 @@
+"""
+HR Rollups
+자주 묻는 집계(부서별 인원, 직급별 평균 급여, 부서별 근태 현황)를 미리 계산해 두는 롤업 저장소
+
+- 부서 × 직급 × (월) 단위 집계 테이블을 MySQL GROUP BY 한 번으로 생성
+- 원본 테이블 시그니처(COUNT, MAX(pk), 행 내용 체크섬)가 바뀌었을 때만 재계산 (주기 점검)
+  (체크섬 = BIT_XOR(CRC32(행)) → 행 수가 같은 UPDATE(재직 상태, 부서 이동 등)도 감지)
+  시그니처는 점검마다 원본 테이블당 한 번만 조회해 롤업끼리 공유하고,
+  전체 스캔인 체크섬은 checksum_interval마다만 다시 계산 (그 사이는 COUNT/MAX(pk)만)
+- SQL Agent가 생성한 쿼리가 롤업으로 답할 수 있는 모양이면 롤업에서 바로 응답
+  (COUNT → row_count 합, AVG → 합계/건수, MIN/MAX → 롤업 최소/최대)
+
+사용법:
+    rollups = RollupStore(db=db, refresh_interval=300)
+    rollups.start()  # 백그라운드 변경 감지
+    results = rollups.execute(
+        "SELECT d.name, COUNT(*) FROM employees e "
+        "JOIN departments d ON e.dept_id = d.dept_id GROUP BY d.name;"
+    )
+"""
+
+import calendar
+import datetime
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.analytics.columnar import ColumnarTable, null_mask, take
+from core.analytics.engine import Frame, group_codes, materialize, predicate_mask, reduce
+from core.analytics.replica import DEFAULT_TABLES
+from core.analytics.sql_parser import Aggregate, ColumnRef, Predicate, SelectQuery, parse_select
+from core.database.connection import DatabaseConnection
+from core.types.errors import DatabaseConnectionError, UnsupportedQueryError
+
+logger = logging.getLogger(__name__)
+
+
+# init.sql 기준 테이블별 컬럼 (별칭 없는 컬럼 참조 해석용)
+HR_COLUMNS: Dict[str, FrozenSet[str]] = {
+    "departments": frozenset({"dept_id", "name", "location"}),
+    "employees": frozenset({"emp_id", "name", "email", "dept_id", "position", "join_date",
+                            "status"}),
+    "salaries": frozenset({"salary_id", "emp_id", "base_salary", "bonus", "payment_date"}),
+    "evaluations": frozenset({"eval_id", "emp_id", "year", "quarter", "score", "feedback"}),
+    "attendance": frozenset({"att_id", "emp_id", "date", "check_in", "check_out", "status"}),
+}
+
+PRIMARY_KEYS: Dict[str, str] = {spec.name: spec.primary_key for spec in DEFAULT_TABLES}
+
+
+@dataclass(frozen=True)
+class RollupSpec:
+    """
+    롤업 정의
+
+    - dimensions: "테이블.컬럼" → 롤업 컬럼 (그룹/필터 가능)
+    - measures: "테이블.컬럼" → 롤업 컬럼 접두어 ({prefix}_count/_sum/_min/_max)
+    - month_source: 월 단위로 접힌 날짜 컬럼 (롤업의 month 컬럼, 월 경계 조건만 허용)
+    - 팩트 외 테이블은 LEFT JOIN, has_{테이블} 플래그로 INNER JOIN 조건 재현
+    """
+    name: str
+    fact_table: str
+    tables: Tuple[str, ...]
+    joins: FrozenSet[FrozenSet[str]]
+    dimensions: Dict[str, str]
+    source_sql: str
+    measures: Dict[str, str] = field(default_factory=dict)
+    month_source: Optional[str] = None
+
+
+_EMPLOYEE_DIMENSIONS = {
+    "employees.dept_id": "dept_id",
+    "departments.dept_id": "dept_id",
+    "departments.name": "dept_name",
+    "departments.location": "dept_location",
+    "employees.position": "position",
+    "employees.status": "emp_status",
+}
+
+_DEPT_JOIN = frozenset({"employees.dept_id", "departments.dept_id"})
+
+_DEPT_SELECT = """
+    e.dept_id AS dept_id, d.name AS dept_name, d.location AS dept_location,
+    e.position AS position, e.status AS emp_status,
+    (d.dept_id IS NOT NULL) AS has_departments"""
+
+_DEPT_GROUP = "e.dept_id, d.name, d.location, e.position, e.status, has_departments"
+
+
+def _measure_sql(column: str, prefix: str) -> str:
+    return (
+        f"COUNT({column}) AS {prefix}_count, SUM({column}) AS {prefix}_sum, "
+        f"MIN({column}) AS {prefix}_min, MAX({column}) AS {prefix}_max"
+    )
+
+
+DEFAULT_ROLLUPS: Tuple[RollupSpec, ...] = (
+    # 부서별/직급별 직원 수
+    RollupSpec(
+        name="employee_headcount",
+        fact_table="employees",
+        tables=("employees", "departments"),
+        joins=frozenset({_DEPT_JOIN}),
+        dimensions=_EMPLOYEE_DIMENSIONS,
+        source_sql=f"""
+SELECT {_DEPT_SELECT},
+    COUNT(*) AS row_count
+FROM employees e
+LEFT JOIN departments d ON e.dept_id = d.dept_id
+GROUP BY {_DEPT_GROUP}
+""",
+    ),
+    # 부서 × 직급 × 월 급여
+    RollupSpec(
+        name="salary_monthly",
+        fact_table="salaries",
+        tables=("salaries", "employees", "departments"),
+        joins=frozenset({_DEPT_JOIN, frozenset({"salaries.emp_id", "employees.emp_id"})}),
+        dimensions=_EMPLOYEE_DIMENSIONS,
+        measures={"salaries.base_salary": "base_salary", "salaries.bonus": "bonus"},
+        month_source="salaries.payment_date",
+        source_sql=f"""
+SELECT {_DEPT_SELECT},
+    (e.emp_id IS NOT NULL) AS has_employees,
+    YEAR(s.payment_date) AS yr, MONTH(s.payment_date) AS mon,
+    COUNT(*) AS row_count,
+    {_measure_sql("s.base_salary", "base_salary")},
+    {_measure_sql("s.bonus", "bonus")}
+FROM salaries s
+LEFT JOIN employees e ON s.emp_id = e.emp_id
+LEFT JOIN departments d ON e.dept_id = d.dept_id
+GROUP BY {_DEPT_GROUP}, has_employees, yr, mon
+""",
+    ),
+    # 부서 × 직급 × 월 × 근태 상태
+    RollupSpec(
+        name="attendance_monthly",
+        fact_table="attendance",
+        tables=("attendance", "employees", "departments"),
+        joins=frozenset({_DEPT_JOIN, frozenset({"attendance.emp_id", "employees.emp_id"})}),
+        dimensions={**_EMPLOYEE_DIMENSIONS, "attendance.status": "att_status"},
+        month_source="attendance.date",
+        source_sql=f"""
+SELECT {_DEPT_SELECT},
+    (e.emp_id IS NOT NULL) AS has_employees,
+    a.status AS att_status,
+    YEAR(a.date) AS yr, MONTH(a.date) AS mon,
+    COUNT(*) AS row_count
+FROM attendance a
+LEFT JOIN employees e ON a.emp_id = e.emp_id
+LEFT JOIN departments d ON e.dept_id = d.dept_id
+GROUP BY {_DEPT_GROUP}, has_employees, att_status, yr, mon
+""",
+    ),
+)
+
+
+class RollupStore:
+    """
+    HR 롤업 저장소 + 쿼리 재작성기
+
+    - execute(sql): 롤업으로 답할 수 있으면 결과 반환, 아니면 UnsupportedQueryError
+    - refresh(): 원본 시그니처가 바뀐 롤업만 재계산
+    - start()/stop(): 백그라운드 주기 점검 스레드
+    """
+
+    def __init__(
+        self,
+        db: DatabaseConnection,  # 의존성 주입
+        specs: Sequence[RollupSpec] = DEFAULT_ROLLUPS,
+        refresh_interval: float = 300.0,
+        max_age: float = 3600.0,
+        checksum_interval: float = 900.0,
+    ):
+        """
+        Args:
+            db: DatabaseConnection 인스턴스 (주입)
+            specs: 롤업 정의
+            refresh_interval: 변경 감지 주기(초)
+            max_age: 변경이 없어도 강제 재계산하는 주기(초)
+                (체크섬 충돌 등 시그니처로 못 본 변경 대비)
+            checksum_interval: 행 내용 체크섬(테이블 전체 스캔) 재계산 주기(초)
+                (0이면 점검마다 계산)
+        """
+        self.db = db
+        self.specs = list(specs)
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.checksum_interval = checksum_interval
+
+        self.rollups: Dict[str, ColumnarTable] = {}
+        self._signatures: Dict[str, Tuple] = {}
+        self._built_at: Dict[str, float] = {}
+        self._checksums: Dict[str, Any] = {}
+        self._last_check = 0.0
+        self._last_checksum: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # --------------------------
+    # Refresh
+    # --------------------------
+    def _table_signature(self, table: str, with_checksum: bool) -> Tuple:
+        """
+        원본 테이블 변경 감지용 시그니처 (행 수 + 최대 기본키 + 행 내용 체크섬)
+
+        Args:
+            with_checksum: False면 COUNT/MAX(pk)만 조회하고 체크섬은 마지막 계산 값 사용
+        """
+        pk = PRIMARY_KEYS[table]
+        sql = f"SELECT COUNT(*) AS n, MAX({pk}) AS max_pk"
+        if with_checksum:
+            # CONCAT_WS는 NULL을 건너뛰므로 빈 문자열로 치환 (컬럼 위치 유지)
+            columns = ", ".join(f"IFNULL({column}, '')" for column in sorted(HR_COLUMNS[table]))
+            sql += f", BIT_XOR(CRC32(CONCAT_WS('|', {columns}))) AS checksum"
+        results, error = self.db.execute_query(f"{sql} FROM {table}")
+        if error:
+            raise DatabaseConnectionError(f"롤업 시그니처 조회 실패 ({table}): {error}")
+        row = results[0] if results else {}
+        if with_checksum:
+            self._checksums[table] = row.get("checksum")
+        return (table, row.get("n"), row.get("max_pk"), self._checksums.get(table))
+
+    def _build(self, spec: RollupSpec) -> ColumnarTable:
+        results, error = self.db.execute_query(spec.source_sql)
+        if error:
+            raise DatabaseConnectionError(f"롤업 생성 실패 ({spec.name}): {error}")
+        rows = []
+        for row in results or []:
+            row = dict(row)
+            year, month = row.pop("yr", None), row.pop("mon", None)
+            if spec.month_source is not None:
+                row["month"] = datetime.date(int(year), int(month), 1) if year else None
+            rows.append(row)
+        return ColumnarTable.from_rows(spec.name, None, rows)
+
+    def refresh(self, force: bool = False) -> List[str]:
+        """
+        변경된 롤업 재계산
+
+        Args:
+            force: True면 시그니처와 무관하게 전체 재계산
+
+        Returns:
+            재계산된 롤업 이름 목록
+        """
+        rebuilt = []
+        with self._lock:
+            now = time.monotonic()
+            with_checksum = (force or self._last_checksum is None
+                             or now - self._last_checksum >= self.checksum_interval)
+            # 여러 롤업이 같은 원본 테이블(employees, departments)을 쓰므로 테이블당 한 번 조회
+            tables = dict.fromkeys(table for spec in self.specs for table in spec.tables)
+            signatures = {table: self._table_signature(table, with_checksum) for table in tables}
+            if with_checksum:
+                self._last_checksum = now
+            for spec in self.specs:
+                signature = tuple(signatures[table] for table in spec.tables)
+                stale = now - self._built_at.get(spec.name, -self.max_age) >= self.max_age
+                if force or stale or signature != self._signatures.get(spec.name):
+                    self.rollups = {**self.rollups, spec.name: self._build(spec)}
+                    self._signatures[spec.name] = signature
+                    self._built_at[spec.name] = now
+                    rebuilt.append(spec.name)
+            self._last_check = now
+        if rebuilt:
+            logger.info("롤업 재계산: %s", rebuilt)
+        return rebuilt
+
+    def maybe_refresh(self):
+        """점검 주기가 지났으면 변경 감지 (백그라운드 스레드 미사용 시)"""
+        if self.rollups and time.monotonic() - self._last_check < self.refresh_interval:
+            return
+        try:
+            self.refresh()
+        except DatabaseConnectionError as e:
+            if not self.rollups:
+                raise UnsupportedQueryError(f"롤업 미생성: {e}")
+            logger.warning("롤업 갱신 실패, 기존 롤업 사용: %s", e)
+
+    def start(self):
+        """백그라운드 변경 감지 스레드 시작"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="rollup-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """백그라운드 스레드 종료"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning("롤업 주기 갱신 실패: %s", e)
+            self._stop_event.wait(self.refresh_interval)
+
+    # --------------------------
+    # Query Rewrite
+    # --------------------------
+    def execute(self, sql: str) -> List[Dict[str, Any]]:
+        """
+        롤업으로 쿼리 응답
+
+        Args:
+            sql: SQL Agent가 생성한 SELECT 쿼리
+
+        Returns:
+            DatabaseConnection.execute_query와 같은 형식의 결과
+
+        Raises:
+            UnsupportedQueryError: 롤업으로 답할 수 없는 쿼리
+        """
+        query = parse_select(sql)
+        if not (query.has_aggregates or query.group_by) or query.star or query.distinct:
+            raise UnsupportedQueryError("집계 쿼리가 아닙니다.")
+
+        self.maybe_refresh()
+        for spec in self.specs:
+            table = self.rollups.get(spec.name)
+            if table is None:
+                continue
+            try:
+                return _RollupRewrite(spec, table, query).run()
+            except UnsupportedQueryError:
+                continue
+        raise UnsupportedQueryError("일치하는 롤업이 없습니다.")
+
+
+class _RollupRewrite:
+    """SelectQuery를 롤업 테이블 위의 재집계로 변환·실행"""
+
+    def __init__(self, spec: RollupSpec, table: ColumnarTable, query: SelectQuery):
+        self.spec = spec
+        self.table = table
+        self.query = query
+        self.aliases = {ref.alias: ref.name for ref in query.tables}
+        self.frame = Frame({"r": table}, {"r": np.arange(table.n_rows)})
+        if table.n_rows == 0:
+            raise UnsupportedQueryError(f"빈 롤업: {spec.name}")
+
+    # --- 컬럼 해석 ---
+    def _canonical(self, ref: ColumnRef) -> str:
+        """컬럼 참조 → "테이블.컬럼" """
+        if ref.table is not None:
+            if ref.table not in self.aliases:
+                raise UnsupportedQueryError(f"알 수 없는 별칭: {ref.table}")
+            return f"{self.aliases[ref.table]}.{ref.name}"
+        owners = [t for t in self.aliases.values() if ref.name in HR_COLUMNS.get(t, ())]
+        if len(owners) != 1:
+            raise UnsupportedQueryError(f"컬럼을 특정할 수 없습니다: {ref.name}")
+        return f"{owners[0]}.{ref.name}"
+
+    def _dimension(self, ref: ColumnRef) -> ColumnRef:
+        key = self._canonical(ref)
+        if key not in self.spec.dimensions:
+            raise UnsupportedQueryError(f"롤업 차원이 아닙니다: {key}")
+        return ColumnRef("r", self.spec.dimensions[key])
+
+    def _rollup_column(self, name: str) -> np.ndarray:
+        if not self.table.has_column(name):
+            raise UnsupportedQueryError(f"롤업 컬럼 없음: {name}")
+        return take(self.table.column(name), self.frame.index["r"])
+
+    # --- 적용 가능성 검사 ---
+    def _check_tables(self) -> np.ndarray:
+        """테이블/조인 구성 검사 후 INNER JOIN 조건 마스크 반환"""
+        tables = list(self.aliases.values())
+        if len(set(tables)) != len(tables):
+            raise UnsupportedQueryError("셀프 조인은 지원하지 않습니다.")
+        if self.spec.fact_table not in tables or not set(tables) <= set(self.spec.tables):
+            raise UnsupportedQueryError("롤업 테이블 구성과 다릅니다.")
+
+        mask = np.ones(self.table.n_rows, dtype=bool)
+        for join in self.query.joins:
+            pair = frozenset({self._canonical(join.left), self._canonical(join.right)})
+            if pair not in self.spec.joins:
+                raise UnsupportedQueryError("롤업과 다른 조인 조건입니다.")
+            if join.kind == "LEFT":
+                if join.table.name == self.spec.fact_table:
+                    raise UnsupportedQueryError("팩트 테이블 LEFT JOIN은 지원하지 않습니다.")
+                continue
+            # INNER JOIN: 양쪽 테이블 행이 모두 존재하는 롤업 행만 남긴다
+            for key in pair:
+                table = key.split(".", 1)[0]
+                if table != self.spec.fact_table:
+                    mask &= self._rollup_column(f"has_{table}") == 1
+        return mask
+
+    def _month_predicate(self, predicate: Predicate) -> Predicate:
+        """월 경계에 맞는 날짜 조건만 month 컬럼 조건으로 변환"""
+        def parse(value) -> datetime.date:
+            try:
+                return datetime.date.fromisoformat(str(value))
+            except ValueError:
+                raise UnsupportedQueryError(f"날짜 리터럴이 아닙니다: {value!r}")
+
+        def is_month_end(day: datetime.date) -> bool:
+            return day.day == calendar.monthrange(day.year, day.month)[1]
+
+        month = ColumnRef("r", "month")
+        op, value = predicate.op, predicate.value
+        if op in (">=", "<"):
+            day = parse(value)
+            if day.day == 1:
+                return Predicate(month, op, day.isoformat())
+        elif op in ("<=", ">"):
+            day = parse(value)
+            if is_month_end(day):
+                return Predicate(month, op, day.replace(day=1).isoformat())
+        elif op == "BETWEEN":
+            low, high = parse(value[0]), parse(value[1])
+            if low.day == 1 and is_month_end(high):
+                return Predicate(month, op, (low.isoformat(), high.replace(day=1).isoformat()))
+        elif op in ("IS NULL", "IS NOT NULL"):
+            return Predicate(month, op)
+        raise UnsupportedQueryError("월 경계와 맞지 않는 날짜 조건입니다.")
+
+    # --- 재집계 ---
+    def _aggregate(self, expr: Aggregate, codes: np.ndarray, n_groups: int):
+        if expr.distinct:
+            raise UnsupportedQueryError("DISTINCT 집계는 롤업으로 계산할 수 없습니다.")
+
+        def total(name: str, weights: Optional[np.ndarray] = None) -> np.ndarray:
+            values = self._rollup_column(name).astype(np.float64)
+            if weights is not None:
+                values = values * weights
+            return np.nan_to_num(reduce("SUM", values, codes, n_groups), nan=0.0)
+
+        row_count = "row_count"
+        if expr.func == "COUNT":
+            if expr.arg is None:
+                return total(row_count), True
+            key = self._canonical(expr.arg)
+            table, column = key.split(".", 1)
+            if key in self.spec.measures:
+                return total(f"{self.spec.measures[key]}_count"), True
+            if key in self.spec.dimensions:
+                dim = self._rollup_column(self.spec.dimensions[key])
+                return total(row_count, (~null_mask(dim)).astype(np.float64)), True
+            if PRIMARY_KEYS.get(table) == column:
+                if table == self.spec.fact_table:
+                    return total(row_count), True
+                return total(row_count, self._rollup_column(f"has_{table}")), True
+            raise UnsupportedQueryError(f"COUNT 대상이 롤업에 없습니다: {key}")
+
+        if expr.arg is None:
+            raise UnsupportedQueryError(f"{expr.func}(*)는 지원하지 않습니다.")
+        key = self._canonical(expr.arg)
+
+        if expr.func in ("SUM", "AVG"):
+            if key not in self.spec.measures:
+                raise UnsupportedQueryError(f"롤업 측정값이 아닙니다: {key}")
+            prefix = self.spec.measures[key]
+            counts = total(f"{prefix}_count")
+            sums = total(f"{prefix}_sum")
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result = sums if expr.func == "SUM" else sums / counts
+            source_is_int = f"{prefix}_sum" in self.table.int_columns
+            return np.where(counts > 0, result, np.nan), expr.func == "SUM" and source_is_int
+
+        if expr.func in ("MIN", "MAX"):
+            if key in self.spec.measures:
+                name = f"{self.spec.measures[key]}_{expr.func.lower()}"
+            elif key in self.spec.dimensions:
+                name = self.spec.dimensions[key]
+            else:
+                raise UnsupportedQueryError(f"롤업에 없는 컬럼: {key}")
+            values = self._rollup_column(name)
+            return reduce(expr.func, values, codes, n_groups), name in self.table.int_columns
+
+        raise UnsupportedQueryError(f"지원하지 않는 집계 함수: {expr.func}")
+
+    def run(self) -> List[Dict[str, Any]]:
+        query = self.query
+        mask = self._check_tables()
+
+        for predicate in query.where:
+            key = self._canonical(predicate.column)
+            if key == self.spec.month_source:
+                rewritten = self._month_predicate(predicate)
+            else:
+                rewritten = Predicate(self._dimension(predicate.column), predicate.op,
+                                      predicate.value)
+            mask &= predicate_mask(self.frame.column(rewritten.column), rewritten)
+        self.frame = self.frame.filter(mask)
+
+        group_by = [self._dimension(ref) for ref in query.group_by]
+        codes, first_rows = group_codes([self.frame.column(ref) for ref in group_by],
+                                        self.frame.n_rows)
+        n_groups = len(first_rows) if group_by else 1
+
+        columns = []
+        for item in query.select:
+            expr = item.expr
+            if isinstance(expr, Aggregate):
+                values, as_int = self._aggregate(expr, codes, n_groups)
+            else:
+                dim = self._dimension(expr)
+                if dim not in group_by:
+                    raise UnsupportedQueryError(f"GROUP BY에 없는 컬럼: {dim.name}")
+                values = self.frame.column(dim)[first_rows]
+                as_int = dim.name in self.table.int_columns
+            columns.append((item.output_name, values, as_int))
+
+        return materialize(query, query.select, columns)
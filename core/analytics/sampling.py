@@ -0,0 +1,447 @@
+"""
+Approximate Aggregates
+대용량 테이블(attendance, salaries) 집계를 저수지 표본(reservoir sample)으로 근사 응답
+
+- 테이블별 고정 크기 균등 표본 유지
+  - 최초: ORDER BY RAND() LIMIT k (테이블이 작으면 전체)
+  - 이후: 기본키 이후 신규 행만 조회해 저수지 샘플링(Algorithm R)으로 반영
+  - full_refresh_interval마다 재추출 (UPDATE/DELETE 반영)
+- COUNT/SUM/AVG만 근사, 신뢰구간은 결과 메타데이터로 반환
+- 다음 경우 UnsupportedQueryError → 정확 실행 폴백
+  - MIN/MAX/DISTINCT 등 표본으로 답할 수 없는 쿼리
+  - 모집단이 min_population 미만 (정확 실행도 충분히 빠름)
+  - 그룹 표본 수 부족 또는 상대 오차가 max_relative_error 초과
+
+사용법:
+    sampler = ApproximateAggregator(db=db, sample_size=20000)
+    if not requires_exact(question):
+        try:
+            results, approximation = sampler.execute(sql)
+        except UnsupportedQueryError:
+            results, error = db.execute_query(sql)
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.analytics.columnar import ColumnarTable, null_mask, promote, to_array, take
+from core.analytics.engine import QueryEngine, group_codes, materialize
+from core.analytics.sql_parser import Aggregate, SelectQuery, parse_select
+from core.database.connection import DatabaseConnection
+from core.types.errors import DatabaseConnectionError, UnsupportedQueryError
+
+logger = logging.getLogger(__name__)
+
+# 정확한 값을 요구하는 질문 (근사 응답 금지)
+PRECISION_KEYWORDS = ("정확", "정밀", "전수", "exact", "precise")
+
+# 표본 테이블 → 기본키, 조인 가능한 차원 테이블 → 기본키 (다대일 조인만 허용)
+DEFAULT_SAMPLED_TABLES = {"attendance": "att_id", "salaries": "salary_id"}
+DEFAULT_DIMENSION_TABLES = {"employees": "emp_id", "departments": "dept_id"}
+
+_CI_SUFFIX = "__ci"
+
+
+def requires_exact(question: str) -> bool:
+    """정확한 값을 요구하는 질문인지 판별"""
+    lowered = question.lower()
+    return any(k in lowered for k in PRECISION_KEYWORDS)
+
+
+@dataclass
+class TableSample:
+    """테이블 표본 상태"""
+    table: ColumnarTable
+    population: int  # 모집단 행 수 (표본 유지 중 신규 행 반영)
+    watermark: Any  # 마지막으로 반영한 기본키
+    built_at: float
+
+
+def reservoir_slots(size: int, capacity: int, population: int, n_new: int,
+                    rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    신규 행의 표본 반영 위치 (Algorithm R)
+
+    Args:
+        size: 현재 표본 크기
+        capacity: 표본 최대 크기
+        population: 신규 행 이전 모집단 크기
+        n_new: 신규 행 수
+
+    Returns:
+        (반영할 신규 행 번호, 표본 내 위치) - 위치 >= size 이면 추가
+    """
+    # 빈 자리는 그대로 채운다
+    n_fill = min(max(capacity - size, 0), n_new)
+    latest: Dict[int, int] = {size + i: i for i in range(n_fill)}
+
+    rest = np.arange(n_fill, n_new)
+    if len(rest):
+        seen = population + rest + 1  # 각 신규 행까지의 누적 모집단 크기
+        accepted = rest[rng.random(len(rest)) < capacity / seen]
+        # 같은 위치를 여러 번 교체하면 마지막 행만 남는다
+        for row, slot in zip(accepted.tolist(), rng.integers(0, capacity, len(accepted)).tolist()):
+            latest[slot] = row
+    slots = np.array(sorted(latest), dtype=np.int64)
+    rows = np.array([latest[slot] for slot in slots.tolist()], dtype=np.int64)
+    return rows, slots
+
+
+class ApproximateAggregator:
+    """
+    표본 기반 근사 집계기
+
+    - 갱신은 한 스레드만 수행, 다른 스레드가 갱신 중이면 폴백 (대화형 응답 지연 방지)
+    - start()로 백그라운드 갱신 시 최초 표본 추출도 요청 경로 밖에서 수행
+    """
+
+    def __init__(
+        self,
+        db: DatabaseConnection,  # 의존성 주입
+        sample_size: int = 20000,
+        min_population: int = 1_000_000,
+        max_relative_error: float = 0.05,
+        min_group_rows: int = 30,
+        confidence: float = 0.95,
+        refresh_interval: float = 60.0,
+        full_refresh_interval: float = 3600.0,
+        sampled_tables: Optional[Dict[str, str]] = None,
+        dimension_tables: Optional[Dict[str, str]] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            db: DatabaseConnection 인스턴스 (주입)
+            sample_size: 테이블별 표본 크기
+            min_population: 근사 응답을 허용하는 최소 모집단 크기
+            max_relative_error: 허용 상대 오차 (신뢰구간 반폭 / 추정값)
+            min_group_rows: 그룹별 최소 표본 행 수
+            confidence: 신뢰수준
+            refresh_interval: 신규 행 반영 주기(초)
+            full_refresh_interval: 표본 재추출 주기(초)
+            sampled_tables: 표본 대상 테이블 → 기본키
+            dimension_tables: 전체 로드할 차원 테이블 → 기본키
+            seed: 난수 시드 (테스트용)
+        """
+        self.db = db
+        self.sample_size = sample_size
+        self.min_population = min_population
+        self.max_relative_error = max_relative_error
+        self.min_group_rows = min_group_rows
+        self.confidence = confidence
+        self.refresh_interval = refresh_interval
+        self.full_refresh_interval = full_refresh_interval
+        self.sampled_tables = dict(sampled_tables or DEFAULT_SAMPLED_TABLES)
+        self.dimension_tables = dict(dimension_tables or DEFAULT_DIMENSION_TABLES)
+        self._z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self._rng = np.random.default_rng(seed)
+
+        self.samples: Dict[str, TableSample] = {}
+        self.dimensions: Dict[str, ColumnarTable] = {}
+        self._last_refresh = 0.0
+        self._last_full_refresh = 0.0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return len(self.samples) == len(self.sampled_tables)
+
+    # --------------------------
+    # Sample Maintenance
+    # --------------------------
+    def refresh(self, full: bool = False) -> Dict[str, int]:
+        """
+        표본 갱신
+
+        Args:
+            full: True면 표본 재추출, False면 신규 행만 반영
+
+        Returns:
+            테이블별 조회 행 수
+
+        Raises:
+            DatabaseConnectionError: 조회 실패
+        """
+        with self._lock:
+            return self._refresh_locked(full or not self.is_loaded)
+
+    def _refresh_locked(self, full: bool) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        samples = dict(self.samples)
+        for name, pk in self.sampled_tables.items():
+            current = None if full else samples.get(name)
+            if current is None:
+                samples[name], counts[name] = self._build_sample(name, pk)
+            else:
+                samples[name], counts[name] = self._extend_sample(name, pk, current)
+
+        dimensions = dict(self.dimensions)
+        if full or not dimensions:
+            for name, pk in self.dimension_tables.items():
+                rows = self._query(f"SELECT * FROM {name}")
+                dimensions[name] = ColumnarTable.from_rows(name, pk, rows)
+
+        self.samples, self.dimensions = samples, dimensions
+        now = time.monotonic()
+        self._last_refresh = now
+        if full:
+            self._last_full_refresh = now
+        logger.info("근사 집계 표본 갱신 (%s): %s", "full" if full else "incremental", counts)
+        return counts
+
+    def _query(self, sql: str) -> List[Dict[str, Any]]:
+        results, error = self.db.execute_query(sql)
+        if error:
+            raise DatabaseConnectionError(f"표본 갱신 실패: {error}")
+        return results or []
+
+    def _build_sample(self, name: str, pk: str) -> Tuple[TableSample, int]:
+        stats = self._query(f"SELECT COUNT(*) AS n, MAX({pk}) AS max_pk FROM {name}")[0]
+        population = int(stats.get("n") or 0)
+        sql = f"SELECT * FROM {name}"
+        if population > self.sample_size:
+            # 전체 스캔 1회 (MySQL은 LIMIT 정렬을 top-k 힙으로 처리)
+            sql += f" ORDER BY RAND() LIMIT {int(self.sample_size)}"
+        rows = self._query(sql)
+        table = ColumnarTable.from_rows(name, pk, rows)
+        return TableSample(table, population, stats.get("max_pk"), time.monotonic()), len(rows)
+
+    def _extend_sample(self, name: str, pk: str, current: TableSample) -> Tuple[TableSample, int]:
+        sql = f"SELECT * FROM {name}"
+        if current.watermark is not None:
+            sql += f" WHERE {pk} > {int(current.watermark)}"
+        rows = self._query(sql + f" ORDER BY {pk}")
+        if not rows:
+            return current, 0
+
+        table = current.table
+        row_idx, slots = reservoir_slots(table.n_rows, self.sample_size, current.population,
+                                         len(rows), self._rng)
+        if len(row_idx):
+            table = self._replace_rows(table, [rows[i] for i in row_idx], slots)
+        return TableSample(
+            table,
+            current.population + len(rows),
+            rows[-1].get(pk),
+            current.built_at,
+        ), len(rows)
+
+    @staticmethod
+    def _replace_rows(table: ColumnarTable, rows: List[Dict[str, Any]],
+                      slots: np.ndarray) -> ColumnarTable:
+        """표본 위치에 행 덮어쓰기/추가 (새 테이블 반환)"""
+        n_rows = max(table.n_rows, int(slots.max()) + 1)
+        names = list(dict.fromkeys([*table.column_names, *(k for row in rows for k in row)]))
+        columns = {}
+        for name in names:
+            base = table.columns.get(name)
+            if base is None:
+                base = np.full(table.n_rows, None, dtype=object)
+            base, incoming = promote(base, to_array([row.get(name) for row in rows]))
+            if n_rows > len(base):
+                base = np.concatenate([base, take(base, np.full(n_rows - len(base), -1))])
+            else:
+                base = base.copy()
+            base[slots] = incoming
+            columns[name] = base
+        replaced = ColumnarTable(table.name, table.primary_key, columns)
+        replaced.int_columns |= table.int_columns
+        return replaced
+
+    def maybe_refresh(self):
+        """갱신 주기가 지났으면 갱신 (다른 스레드가 갱신 중이면 건너뜀)"""
+        now = time.monotonic()
+        if self.is_loaded and now - self._last_refresh < self.refresh_interval:
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self.is_loaded and time.monotonic() - self._last_refresh < self.refresh_interval:
+                return
+            full = not self.is_loaded or now - self._last_full_refresh >= self.full_refresh_interval
+            self._refresh_locked(full)
+        finally:
+            self._lock.release()
+
+    def start(self):
+        """백그라운드 표본 갱신 스레드 시작"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="sample-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """백그라운드 스레드 종료"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.maybe_refresh()
+            except Exception as e:
+                logger.warning("표본 주기 갱신 실패: %s", e)
+            self._stop_event.wait(self.refresh_interval)
+
+    # --------------------------
+    # Approximate Execution
+    # --------------------------
+    def execute(self, sql: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        표본으로 집계 쿼리 근사 실행
+
+        Args:
+            sql: SQL Agent가 생성한 SELECT 쿼리
+
+        Returns:
+            (DatabaseConnection.execute_query와 같은 형식의 결과, 근사 메타데이터)
+
+        Raises:
+            UnsupportedQueryError: 근사 불가 또는 오차 허용 범위 초과
+        """
+        query = parse_select(sql)
+        fact = self._check_query(query)
+
+        try:
+            self.maybe_refresh()
+        except DatabaseConnectionError as e:
+            if fact not in self.samples:
+                raise UnsupportedQueryError(f"표본 미적재: {e}")
+            logger.warning("표본 갱신 실패, 기존 표본 사용: %s", e)
+        sample = self.samples.get(fact)
+        if sample is None:
+            raise UnsupportedQueryError("표본 준비 중")
+        if sample.population < self.min_population:
+            raise UnsupportedQueryError("모집단이 작아 정확 실행")
+
+        tables = {**self.dimensions, fact: sample.table}
+        frame = QueryEngine(tables).build_frame(query)
+        keys = [frame.column(ref) for ref in query.group_by]
+        codes, first_rows = group_codes(keys, frame.n_rows)
+        n_groups = len(first_rows) if query.group_by else 1
+
+        n, N = sample.table.n_rows, sample.population
+        fpc = np.sqrt((N - n) / (N - 1)) if N > 1 else 0.0
+
+        columns, intervals = [], []
+        for item in query.select:
+            expr = item.expr
+            if not isinstance(expr, Aggregate):
+                values = frame.column(expr)
+                columns.append((item.output_name, values[first_rows], frame.is_int_column(expr)))
+                continue
+            values = None if expr.arg is None else frame.column(expr.arg)
+            estimate, half_width, support = self._estimate(
+                expr.func, values, codes, n_groups, n, N, fpc)
+            if (support < self.min_group_rows).any():
+                raise UnsupportedQueryError("그룹별 표본 수 부족")
+            with np.errstate(invalid="ignore", divide="ignore"):
+                relative = np.abs(half_width / estimate)
+            if not (relative <= self.max_relative_error).all():
+                raise UnsupportedQueryError("근사 오차가 허용 범위를 초과")
+            as_int = expr.func == "COUNT"
+            if as_int:
+                estimate = np.rint(estimate)
+            columns.append((item.output_name, estimate, as_int))
+            intervals.append((item.output_name, estimate - half_width, estimate + half_width))
+
+        # 신뢰구간을 결과 컬럼 뒤에 붙여 정렬/LIMIT을 함께 적용한 뒤 분리
+        extra = []
+        for name, low, high in intervals:
+            extra += [(f"{name}{_CI_SUFFIX}_low", low, False),
+                      (f"{name}{_CI_SUFFIX}_high", high, False)]
+        rows = materialize(query, query.select, columns + extra)
+        ci_rows = [
+            {
+                name: [round(row.pop(f"{name}{_CI_SUFFIX}_low"), 4),
+                       round(row.pop(f"{name}{_CI_SUFFIX}_high"), 4)]
+                for name, _, _ in intervals
+            }
+            for row in rows
+        ]
+
+        approximation = {
+            "method": "reservoir_sample",
+            "table": fact,
+            "population": N,
+            "sample_size": n,
+            "confidence": self.confidence,
+            "confidence_intervals": ci_rows,
+        }
+        return rows, approximation
+
+    def _check_query(self, query: SelectQuery) -> str:
+        """근사 가능한 쿼리인지 검사 → 표본 테이블명"""
+        if not query.has_aggregates or query.star or query.distinct:
+            raise UnsupportedQueryError("집계 쿼리만 근사 응답합니다.")
+        for item in query.select:
+            expr = item.expr
+            if isinstance(expr, Aggregate):
+                if expr.func not in ("COUNT", "SUM", "AVG") or expr.distinct:
+                    raise UnsupportedQueryError(f"근사 불가 집계: {expr.func}")
+            elif expr not in query.group_by:
+                raise UnsupportedQueryError("GROUP BY 밖의 컬럼")
+
+        fact = query.from_table.name
+        if fact not in self.sampled_tables:
+            raise UnsupportedQueryError(f"표본 대상이 아닌 테이블: {fact}")
+        for join in query.joins:
+            pk = self.dimension_tables.get(join.table.name)
+            if pk is None:
+                raise UnsupportedQueryError(f"조인 불가 테이블: {join.table.name}")
+            # 차원 테이블 기본키 조인만 허용 (표본 행이 중복되지 않아야 추정이 유효)
+            dim_side = [ref for ref in (join.left, join.right)
+                        if ref.name == pk and ref.table in (None, join.table.alias)]
+            if not dim_side:
+                raise UnsupportedQueryError("차원 테이블 기본키 조인만 근사 응답합니다.")
+        return fact
+
+    def _estimate(self, func: str, values: Optional[np.ndarray], codes: np.ndarray,
+                  n_groups: int, n: int, N: int, fpc: float):
+        """
+        그룹별 추정값, 신뢰구간 반폭, 표본 행 수
+
+        - COUNT: N·p̂, SE = N·√(p̂(1-p̂)/n)
+        - SUM:   N·ȳ (그룹 밖 행은 0), SE = N·s/√n
+        - AVG:   그룹 내 평균, SE = s/√m
+        """
+        if values is None:
+            valid = np.ones(len(codes), dtype=bool)
+        else:
+            valid = ~null_mask(values)
+        g_codes = codes[valid]
+        support = np.bincount(g_codes, minlength=n_groups)
+
+        if func == "COUNT":
+            p = support / n
+            estimate = N * p
+            se = N * np.sqrt(p * (1 - p) / n)
+        else:
+            if values.dtype.kind not in "iuf":
+                raise UnsupportedQueryError(f"숫자가 아닌 컬럼의 {func}는 지원하지 않습니다.")
+            y = values[valid].astype(np.float64)
+            sums = np.bincount(g_codes, weights=y, minlength=n_groups)
+            squares = np.bincount(g_codes, weights=y ** 2, minlength=n_groups)
+            if func == "SUM":
+                mean = sums / n
+                var = np.clip(squares / n - mean ** 2, 0, None) * n / max(n - 1, 1)
+                estimate = N * mean
+                se = N * np.sqrt(var / n)
+            else:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    estimate = sums / support
+                    var = np.clip(squares / support - estimate ** 2, 0, None) \
+                        * support / np.maximum(support - 1, 1)
+                    se = np.sqrt(var / support)
+        return estimate, self._z * se * fpc, support
@@ -0,0 +1,458 @@
+"""
+SQL Parser (Subset)
+SQL Agent가 생성하는 SELECT 쿼리 중 인메모리 실행 가능한 부분집합만 파싱
+
+지원 범위:
+    SELECT [DISTINCT] 컬럼 / COUNT·SUM·AVG·MIN·MAX
+    FROM 테이블 [별칭] [INNER|LEFT] JOIN ... ON a.x = b.y
+    WHERE 조건 AND 조건 ... (=, !=, <, <=, >, >=, IN, BETWEEN, LIKE, IS NULL)
+    GROUP BY / ORDER BY / LIMIT
+
+지원하지 않는 구문(서브쿼리, OR, 함수 호출, HAVING 등)은
+UnsupportedQueryError를 발생시키며, 호출 측은 MySQL로 폴백합니다.
+
+사용법:
+    query = parse_select("SELECT COUNT(*) FROM employees;")
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple, Union
+
+from core.types.errors import UnsupportedQueryError
+
+
+AGGREGATE_FUNCS = {"COUNT", "SUM", "AVG", "MIN", "MAX"}
+
+COMPARISON_OPS = {"=", "!=", "<>", "<", "<=", ">", ">="}
+
+RESERVED = {
+    "SELECT", "DISTINCT", "FROM", "WHERE", "GROUP", "BY", "ORDER", "LIMIT",
+    "OFFSET", "JOIN", "INNER", "LEFT", "OUTER", "RIGHT", "CROSS", "ON", "AS",
+    "AND", "OR", "NOT", "IN", "BETWEEN", "LIKE", "IS", "NULL", "ASC", "DESC",
+    "HAVING", "UNION", "USING",
+}
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<ws>\s+)
+  | (?P<string>'(?:[^']|'')*'|"(?:[^"]|"")*")
+  | (?P<number>\d+(?:\.\d+)?)
+  | (?P<ident>`[^`]+`|[A-Za-z_가-힣][\w가-힣]*)
+  | (?P<op><=|>=|<>|!=|[=<>(),.*;])
+    """,
+    re.VERBOSE,
+)
+
+
+# ===== AST =====
+@dataclass(frozen=True)
+class ColumnRef:
+    """컬럼 참조 (table은 별칭 또는 테이블명, 생략 가능)"""
+    table: Optional[str]
+    name: str
+
+
+@dataclass(frozen=True)
+class Aggregate:
+    """집계 함수 (arg=None이면 COUNT(*))"""
+    func: str
+    arg: Optional[ColumnRef]
+    distinct: bool = False
+
+
+Expression = Union[ColumnRef, Aggregate]
+
+
+@dataclass(frozen=True)
+class SelectItem:
+    """SELECT 항목 (output_name은 MySQL 결과 컬럼명과 동일)"""
+    expr: Expression
+    output_name: str
+
+
+@dataclass(frozen=True)
+class TableRef:
+    """FROM/JOIN 테이블"""
+    name: str
+    alias: str
+
+
+@dataclass(frozen=True)
+class Join:
+    """등가 조인 (kind: INNER | LEFT)"""
+    kind: str
+    table: TableRef
+    left: ColumnRef
+    right: ColumnRef
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """WHERE 단일 조건 (value는 리터럴, IN/BETWEEN이면 튜플)"""
+    column: ColumnRef
+    op: str
+    value: Any = None
+
+
+@dataclass(frozen=True)
+class OrderItem:
+    """ORDER BY 항목 (key: 컬럼/집계/결과 컬럼명/1-based 위치)"""
+    key: Union[ColumnRef, Aggregate, str, int]
+    descending: bool = False
+
+
+@dataclass
+class SelectQuery:
+    """파싱된 SELECT 쿼리"""
+    select: List[SelectItem]
+    from_table: TableRef
+    joins: List[Join] = field(default_factory=list)
+    where: List[Predicate] = field(default_factory=list)
+    group_by: List[ColumnRef] = field(default_factory=list)
+    order_by: List[OrderItem] = field(default_factory=list)
+    limit: Optional[int] = None
+    offset: int = 0
+    distinct: bool = False
+    star: bool = False
+
+    @property
+    def tables(self) -> List[TableRef]:
+        """FROM + JOIN 테이블 목록"""
+        return [self.from_table] + [j.table for j in self.joins]
+
+    @property
+    def has_aggregates(self) -> bool:
+        return any(isinstance(item.expr, Aggregate) for item in self.select)
+
+
+# ===== Tokenizer =====
+@dataclass(frozen=True)
+class _Token:
+    kind: str
+    value: str
+    start: int
+    end: int
+
+    @property
+    def upper(self) -> str:
+        return self.value.upper()
+
+
+def _tokenize(sql: str) -> List[_Token]:
+    tokens = []
+    pos = 0
+    while pos < len(sql):
+        match = _TOKEN_RE.match(sql, pos)
+        if not match:
+            raise UnsupportedQueryError(f"토큰화 불가: {sql[pos:pos + 20]!r}")
+        kind = match.lastgroup
+        if kind != "ws":
+            tokens.append(_Token(kind, match.group(), match.start(), match.end()))
+        pos = match.end()
+    return tokens
+
+
+# ===== Parser =====
+class _Parser:
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.tokens = _tokenize(sql)
+        self.pos = 0
+
+    # --- 토큰 헬퍼 ---
+    def _peek(self, offset: int = 0) -> Optional[_Token]:
+        idx = self.pos + offset
+        return self.tokens[idx] if idx < len(self.tokens) else None
+
+    def _next(self) -> _Token:
+        token = self._peek()
+        if token is None:
+            raise UnsupportedQueryError("쿼리가 예상보다 일찍 끝났습니다.")
+        self.pos += 1
+        return token
+
+    def _at_keyword(self, *words: str) -> bool:
+        token = self._peek()
+        return token is not None and token.kind == "ident" and token.upper in words
+
+    def _accept_keyword(self, *words: str) -> bool:
+        if self._at_keyword(*words):
+            self.pos += 1
+            return True
+        return False
+
+    def _expect_keyword(self, word: str):
+        if not self._accept_keyword(word):
+            raise UnsupportedQueryError(f"'{word}' 키워드가 필요합니다.")
+
+    def _accept_op(self, op: str) -> bool:
+        token = self._peek()
+        if token is not None and token.kind == "op" and token.value == op:
+            self.pos += 1
+            return True
+        return False
+
+    def _expect_op(self, op: str):
+        if not self._accept_op(op):
+            raise UnsupportedQueryError(f"'{op}' 가 필요합니다.")
+
+    def _identifier(self) -> str:
+        token = self._next()
+        if token.kind != "ident" or token.upper in RESERVED:
+            raise UnsupportedQueryError(f"식별자가 필요합니다: {token.value}")
+        return token.value.strip("`")
+
+    # --- 문법 ---
+    def parse(self) -> SelectQuery:
+        self._expect_keyword("SELECT")
+        distinct = self._accept_keyword("DISTINCT")
+
+        star = False
+        select: List[SelectItem] = []
+        if self._accept_op("*"):
+            star = True
+        else:
+            select.append(self._select_item())
+            while self._accept_op(","):
+                select.append(self._select_item())
+
+        self._expect_keyword("FROM")
+        query = SelectQuery(
+            select=select,
+            from_table=self._table_ref(),
+            distinct=distinct,
+            star=star,
+        )
+
+        while self._at_keyword("JOIN", "INNER", "LEFT"):
+            query.joins.append(self._join())
+
+        if self._accept_keyword("WHERE"):
+            query.where = self._conditions()
+
+        if self._accept_keyword("GROUP"):
+            self._expect_keyword("BY")
+            query.group_by.append(self._column_ref())
+            while self._accept_op(","):
+                query.group_by.append(self._column_ref())
+
+        if self._accept_keyword("ORDER"):
+            self._expect_keyword("BY")
+            query.order_by.append(self._order_item())
+            while self._accept_op(","):
+                query.order_by.append(self._order_item())
+
+        if self._accept_keyword("LIMIT"):
+            first = self._int_literal()
+            if self._accept_op(","):
+                query.offset, query.limit = first, self._int_literal()
+            else:
+                query.limit = first
+                if self._accept_keyword("OFFSET"):
+                    query.offset = self._int_literal()
+
+        self._accept_op(";")
+        if self._peek() is not None:
+            raise UnsupportedQueryError(f"지원하지 않는 구문: {self._peek().value}")
+
+        if star and (query.group_by or distinct):
+            raise UnsupportedQueryError("SELECT * 와 GROUP BY/DISTINCT 조합은 지원하지 않습니다.")
+        return query
+
+    def _select_item(self) -> SelectItem:
+        start = self._peek().start if self._peek() else 0
+        expr = self._expression()
+        end = self.tokens[self.pos - 1].end
+
+        alias = None
+        if self._accept_keyword("AS"):
+            alias = self._alias_name()
+        elif self._peek() is not None and self._peek().kind in ("ident", "string") \
+                and self._peek().upper not in RESERVED:
+            alias = self._alias_name()
+
+        if alias is None:
+            alias = expr.name if isinstance(expr, ColumnRef) else self.sql[start:end]
+        return SelectItem(expr=expr, output_name=alias)
+
+    def _alias_name(self) -> str:
+        token = self._next()
+        if token.kind == "string":
+            return token.value[1:-1]
+        if token.kind != "ident" or token.upper in RESERVED:
+            raise UnsupportedQueryError(f"별칭이 필요합니다: {token.value}")
+        return token.value.strip("`")
+
+    def _expression(self) -> Expression:
+        token = self._peek()
+        nxt = self._peek(1)
+        if token is not None and token.kind == "ident" and nxt is not None \
+                and nxt.kind == "op" and nxt.value == "(":
+            func = token.upper
+            if func not in AGGREGATE_FUNCS:
+                raise UnsupportedQueryError(f"지원하지 않는 함수: {token.value}")
+            self.pos += 2
+            distinct = self._accept_keyword("DISTINCT")
+            if self._accept_op("*"):
+                if func != "COUNT" or distinct:
+                    raise UnsupportedQueryError(f"{func}(*)는 지원하지 않습니다.")
+                arg = None
+            else:
+                arg = self._column_ref()
+            self._expect_op(")")
+            return Aggregate(func=func, arg=arg, distinct=distinct)
+        return self._column_ref()
+
+    def _column_ref(self) -> ColumnRef:
+        first = self._identifier()
+        if self._accept_op("."):
+            return ColumnRef(table=first, name=self._identifier())
+        return ColumnRef(table=None, name=first)
+
+    def _table_ref(self) -> TableRef:
+        name = self._identifier()
+        if self._accept_op("."):
+            raise UnsupportedQueryError("스키마 한정 테이블명은 지원하지 않습니다.")
+        alias = name
+        if self._accept_keyword("AS"):
+            alias = self._identifier()
+        elif self._peek() is not None and self._peek().kind == "ident" \
+                and self._peek().upper not in RESERVED:
+            alias = self._identifier()
+        return TableRef(name=name, alias=alias)
+
+    def _join(self) -> Join:
+        kind = "INNER"
+        if self._accept_keyword("LEFT"):
+            kind = "LEFT"
+            self._accept_keyword("OUTER")
+        else:
+            self._accept_keyword("INNER")
+        self._expect_keyword("JOIN")
+        table = self._table_ref()
+        self._expect_keyword("ON")
+        left = self._column_ref()
+        self._expect_op("=")
+        right = self._column_ref()
+        if self._at_keyword("AND", "OR"):
+            raise UnsupportedQueryError("복합 조인 조건은 지원하지 않습니다.")
+        return Join(kind=kind, table=table, left=left, right=right)
+
+    def _conditions(self) -> List[Predicate]:
+        predicates = [self._predicate()]
+        while self._accept_keyword("AND"):
+            predicates.append(self._predicate())
+        if self._at_keyword("OR"):
+            raise UnsupportedQueryError("OR 조건은 지원하지 않습니다.")
+        return predicates
+
+    def _predicate(self) -> Predicate:
+        column = self._column_ref()
+
+        if self._accept_keyword("IS"):
+            negated = self._accept_keyword("NOT")
+            self._expect_keyword("NULL")
+            return Predicate(column, "IS NOT NULL" if negated else "IS NULL")
+
+        negated = self._accept_keyword("NOT")
+        if self._accept_keyword("IN"):
+            self._expect_op("(")
+            values = [self._literal()]
+            while self._accept_op(","):
+                values.append(self._literal())
+            self._expect_op(")")
+            return Predicate(column, "NOT IN" if negated else "IN", tuple(values))
+        if self._accept_keyword("LIKE"):
+            pattern = self._literal()
+            if not isinstance(pattern, str):
+                raise UnsupportedQueryError("LIKE 패턴은 문자열이어야 합니다.")
+            return Predicate(column, "NOT LIKE" if negated else "LIKE", pattern)
+        if self._accept_keyword("BETWEEN"):
+            low = self._literal()
+            self._expect_keyword("AND")
+            high = self._literal()
+            if negated:
+                raise UnsupportedQueryError("NOT BETWEEN은 지원하지 않습니다.")
+            return Predicate(column, "BETWEEN", (low, high))
+        if negated:
+            raise UnsupportedQueryError("지원하지 않는 NOT 조건입니다.")
+
+        token = self._next()
+        if token.kind != "op" or token.value not in COMPARISON_OPS:
+            raise UnsupportedQueryError(f"지원하지 않는 연산자: {token.value}")
+        op = "!=" if token.value == "<>" else token.value
+        return Predicate(column, op, self._literal())
+
+    def _literal(self) -> Any:
+        token = self._next()
+        if token.kind == "string":
+            quote = token.value[0]
+            return token.value[1:-1].replace(quote * 2, quote)
+        if token.kind == "number":
+            return float(token.value) if "." in token.value else int(token.value)
+        if token.kind == "op" and token.value == "(":
+            raise UnsupportedQueryError("서브쿼리는 지원하지 않습니다.")
+        raise UnsupportedQueryError(f"리터럴이 필요합니다: {token.value}")
+
+    def _int_literal(self) -> int:
+        value = self._literal()
+        if not isinstance(value, int):
+            raise UnsupportedQueryError("LIMIT/OFFSET은 정수여야 합니다.")
+        return value
+
+    def _order_item(self) -> OrderItem:
+        token = self._peek()
+        if token is not None and token.kind == "number":
+            key: Union[ColumnRef, Aggregate, str, int] = self._int_literal()
+        else:
+            key = self._expression()
+        descending = False
+        if self._accept_keyword("DESC"):
+            descending = True
+        else:
+            self._accept_keyword("ASC")
+        return OrderItem(key=key, descending=descending)
+
+
+def parse_select(sql: str) -> SelectQuery:
+    """
+    SELECT 쿼리 파싱
+
+    Args:
+        sql: SQL 문자열
+
+    Returns:
+        SelectQuery
+
+    Raises:
+        UnsupportedQueryError: 지원 범위를 벗어난 쿼리
+    """
+    return _Parser(sql.strip()).parse()
+
+
+def referenced_columns(query: SelectQuery) -> List[Tuple[str, ColumnRef]]:
+    """
+    쿼리가 참조하는 모든 컬럼을 (역할, 컬럼) 목록으로 반환
+
+    역할: "select" | "join" | "where" | "group" | "order"
+    """
+    refs: List[Tuple[str, ColumnRef]] = []
+    for item in query.select:
+        expr = item.expr
+        if isinstance(expr, ColumnRef):
+            refs.append(("select", expr))
+        elif expr.arg is not None:
+            refs.append(("select", expr.arg))
+    for join in query.joins:
+        refs.extend([("join", join.left), ("join", join.right)])
+    for predicate in query.where:
+        refs.append(("where", predicate.column))
+    for column in query.group_by:
+        refs.append(("group", column))
+    for order in query.order_by:
+        if isinstance(order.key, ColumnRef):
+            refs.append(("order", order.key))
+        elif isinstance(order.key, Aggregate) and order.key.arg is not None:
+            refs.append(("order", order.key.arg))
+    return refs
@@ -18,10 +18,19 @@ from functools import cached_property
 
 from app.core.config import Settings, get_settings
 from core.database.connection import DatabaseConnection
+from core.analytics.replica import ColumnarReplica
+from core.analytics.rollups import RollupStore
+from core.analytics.attendance import AttendanceAnalyzer
+from core.analytics.sampling import ApproximateAggregator
+from core.analytics.query_log import QueryLog
+from core.llm.embedding_cache import EmbeddingStore
+from core.llm.factory import resolve_local_embedding_model
+from core.retrieval.adaptive import AdaptiveKConfig
 from core.routing.router import Router
 from core.agents.sql_agent import SQLAgent
 from core.agents.rag_agent import RAGAgent
 from core.agents.hr_agent import HRAgent
+from core.agents.index_reloader import IndexReloader
 
 
 @dataclass
@@ -37,10 +46,17 @@ class Container:
 
     # 테스트용 의존성 주입 (Optional)
     _db: Optional[DatabaseConnection] = field(default=None, repr=False)
+    _replica: Optional[ColumnarReplica] = field(default=None, repr=False)
+    _rollups: Optional[RollupStore] = field(default=None, repr=False)
+    _attendance_analyzer: Optional[AttendanceAnalyzer] = field(default=None, repr=False)
+    _approximator: Optional[ApproximateAggregator] = field(default=None, repr=False)
+    _query_log: Optional[QueryLog] = field(default=None, repr=False)
+    _embedding_store: Optional[EmbeddingStore] = field(default=None, repr=False)
     _router: Optional[Router] = field(default=None, repr=False)
     _sql_agent: Optional[SQLAgent] = field(default=None, repr=False)
     _rag_agent: Optional[RAGAgent] = field(default=None, repr=False)
     _hr_agent: Optional[HRAgent] = field(default=None, repr=False)
+    _index_reloader: Optional[IndexReloader] = field(default=None, repr=False)
 
     @cached_property
     def db(self) -> DatabaseConnection:
@@ -53,6 +69,79 @@ class Container:
             pool_recycle=self.settings.DB_POOL_RECYCLE,
         )
 
+    @cached_property
+    def replica(self) -> Optional[ColumnarReplica]:
+        """ColumnarReplica 인스턴스 (비활성화 시 None)"""
+        if self._replica is not None:
+            return self._replica
+        if not self.settings.ANALYTICS_REPLICA_ENABLED:
+            return None
+        return ColumnarReplica(
+            db=self.db,
+            refresh_interval=self.settings.ANALYTICS_REPLICA_REFRESH_INTERVAL,
+            full_refresh_interval=self.settings.ANALYTICS_REPLICA_FULL_REFRESH_INTERVAL,
+        )
+
+    @cached_property
+    def rollups(self) -> Optional[RollupStore]:
+        """RollupStore 인스턴스 (비활성화 시 None)"""
+        if self._rollups is not None:
+            return self._rollups
+        if not self.settings.ANALYTICS_ROLLUPS_ENABLED:
+            return None
+        return RollupStore(
+            db=self.db,
+            refresh_interval=self.settings.ANALYTICS_ROLLUPS_REFRESH_INTERVAL,
+            max_age=self.settings.ANALYTICS_ROLLUPS_MAX_AGE,
+            checksum_interval=self.settings.ANALYTICS_ROLLUPS_CHECKSUM_INTERVAL,
+        )
+
+    @cached_property
+    def query_log(self) -> Optional[QueryLog]:
+        """QueryLog 인스턴스 (비활성화 시 None)"""
+        if self._query_log is not None:
+            return self._query_log
+        if not self.settings.SQL_QUERY_LOG_ENABLED:
+            return None
+        return QueryLog(self.settings.SQL_QUERY_LOG_PATH)
+
+    @cached_property
+    def approximator(self) -> Optional[ApproximateAggregator]:
+        """ApproximateAggregator 인스턴스 (비활성화 시 None)"""
+        if self._approximator is not None:
+            return self._approximator
+        if not self.settings.ANALYTICS_APPROX_ENABLED:
+            return None
+        return ApproximateAggregator(
+            db=self.db,
+            sample_size=self.settings.ANALYTICS_APPROX_SAMPLE_SIZE,
+            min_population=self.settings.ANALYTICS_APPROX_MIN_POPULATION,
+            max_relative_error=self.settings.ANALYTICS_APPROX_MAX_RELATIVE_ERROR,
+        )
+
+    @cached_property
+    def attendance_analyzer(self) -> Optional[AttendanceAnalyzer]:
+        """AttendanceAnalyzer 인스턴스 (비활성화 시 None)"""
+        if self._attendance_analyzer is not None:
+            return self._attendance_analyzer
+        if not self.settings.ANALYTICS_ATTENDANCE_ENABLED:
+            return None
+        return AttendanceAnalyzer(
+            db=self.db,
+            replica=self.replica,
+            cache_ttl=self.settings.ANALYTICS_ATTENDANCE_CACHE_TTL,
+            z_threshold=self.settings.ANALYTICS_ATTENDANCE_Z_THRESHOLD,
+        )
+
+    @cached_property
+    def embedding_store(self) -> Optional[EmbeddingStore]:
+        """EmbeddingStore 인스턴스 (비활성화 시 None)"""
+        if self._embedding_store is not None:
+            return self._embedding_store
+        if not self.settings.RAG_EMBEDDING_CACHE_ENABLED:
+            return None
+        return EmbeddingStore(self.settings.RAG_EMBEDDING_CACHE_PATH)
+
     @cached_property
     def router(self) -> Router:
         """Router 인스턴스"""
@@ -92,6 +181,11 @@ class Container:
             max_attempts=self.settings.SQL_AGENT_MAX_ATTEMPTS,
             provider=self.settings.LLM_PROVIDER,
             base_url=self.settings.OLLAMA_BASE_URL,
+            replica=self.replica,
+            rollups=self.rollups,
+            attendance_analyzer=self.attendance_analyzer,
+            approximator=self.approximator,
+            query_log=self.query_log,
         )
 
     @cached_property
@@ -107,11 +201,26 @@ class Container:
             else self.settings.LLM_MODEL
         )
 
-        # Provider에 따라 임베딩 모델명 선택
-        embedding_model = (
-            self.settings.OLLAMA_EMBEDDING_MODEL
-            if self.settings.LLM_PROVIDER == "ollama"
-            else self.settings.RAG_EMBEDDING_MODEL
+        # 임베딩 Provider(미지정 시 LLM Provider)에 따라 임베딩 모델명 선택
+        # (local은 hash-<차원> 모델명만 허용 → RAG_EMBEDDING_MODEL이 아니면 hash-384)
+        embedding_provider = self.settings.RAG_EMBEDDING_PROVIDER or self.settings.LLM_PROVIDER
+        if embedding_provider == "ollama":
+            embedding_model = self.settings.OLLAMA_EMBEDDING_MODEL
+        elif embedding_provider == "local":
+            embedding_model = resolve_local_embedding_model(self.settings.RAG_EMBEDDING_MODEL)
+        else:
+            embedding_model = self.settings.RAG_EMBEDDING_MODEL
+
+        adaptive = (
+            AdaptiveKConfig(
+                min_k=self.settings.RAG_MIN_K,
+                max_k=self.settings.RAG_MAX_K,
+                max_distance=self.settings.RAG_MAX_DISTANCE,
+                score_gap=self.settings.RAG_SCORE_GAP,
+                mmr=self.settings.RAG_MMR_ENABLED,
+                mmr_lambda=self.settings.RAG_MMR_LAMBDA,
+            )
+            if self.settings.RAG_ADAPTIVE_K_ENABLED else None
         )
 
         return RAGAgent(
@@ -122,6 +231,25 @@ class Container:
             index_path=self.settings.RAG_INDEX_PATH,
             provider=self.settings.LLM_PROVIDER,
             base_url=self.settings.OLLAMA_BASE_URL,
+            embedding_provider=embedding_provider,
+            embedding_store=self.embedding_store,
+            embedding_cache_size=self.settings.RAG_EMBEDDING_CACHE_SIZE,
+            hybrid=self.settings.RAG_HYBRID_ENABLED,
+            rrf_k=self.settings.RAG_RRF_K,
+            article_lookup=self.settings.RAG_ARTICLE_LOOKUP_ENABLED,
+            parent_child=self.settings.RAG_PARENT_CHILD_ENABLED,
+            faq=self.settings.RAG_FAQ_ENABLED,
+            faq_min_score=self.settings.RAG_FAQ_MIN_SCORE,
+            fact_lookup=self.settings.RAG_FACT_LOOKUP_ENABLED,
+            context_token_budget=self.settings.RAG_CONTEXT_TOKEN_BUDGET,
+            adaptive=adaptive,
+            answer_mode=self.settings.RAG_ANSWER_MODE,
+            extractive_min_score=self.settings.RAG_EXTRACTIVE_MIN_SCORE,
+            extractive_min_margin=self.settings.RAG_EXTRACTIVE_MIN_MARGIN,
+            context_compression=self.settings.RAG_CONTEXT_COMPRESSION_ENABLED,
+            compression_token_budget=self.settings.RAG_COMPRESSION_TOKEN_BUDGET,
+            shard_workers=self.settings.RAG_SHARD_WORKERS,
+            index_format=self.settings.RAG_INDEX_FORMAT,
         )
 
     @cached_property
@@ -136,6 +264,23 @@ class Container:
             verbose=self.settings.DEBUG,
         )
 
+    @cached_property
+    def index_reloader(self) -> IndexReloader:
+        """IndexReloader 인스턴스 (hr_agent.rag_agent 무중단 교체)"""
+        if self._index_reloader is not None:
+            return self._index_reloader
+
+        def on_swap(agent: RAGAgent):
+            # cached_property 값 갱신 → container.rag_agent도 새 인덱스
+            self.__dict__["rag_agent"] = agent
+
+        return IndexReloader(
+            self.hr_agent,
+            self.hr_agent.rag_agent.index_root,
+            poll_interval=self.settings.RAG_INDEX_WATCH_INTERVAL,
+            on_swap=on_swap,
+        )
+
 
 # 전역 컨테이너 (FastAPI lifespan에서 초기화)
 _container: Optional[Container] = None
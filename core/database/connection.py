@@ -3,6 +3,7 @@ Database Connection
 MySQL 데이터베이스 연결 관리 (DI 친화적)
 """
 
+import time
 from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
@@ -81,6 +82,56 @@ class DatabaseConnection:
         except Exception as e:
             return None, str(e)
 
+    def execute_query_with_stats(
+        self, query: str
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str], Dict[str, Any]]:
+        """
+        SQL 쿼리 실행 + 실행 통계 (쿼리 로그/인덱스 추천용)
+
+        조회 행 수는 같은 세션의 Handler_read% 카운터 증가분 합계 (근사값)
+
+        Args:
+            query: 실행할 SQL 쿼리 문자열
+
+        Returns:
+            tuple: (결과 리스트, 에러 메시지, {"latency_ms", "rows_examined"})
+        """
+        stats: Dict[str, Any] = {"latency_ms": 0.0, "rows_examined": None}
+        try:
+            with self.engine.connect() as conn:
+                before = self._handler_reads(conn)
+                started = time.perf_counter()
+                result = conn.execute(text(query))
+                rows = result.fetchall()
+                stats["latency_ms"] = (time.perf_counter() - started) * 1000
+                columns = result.keys()
+                after = self._handler_reads(conn)
+                if before is not None and after is not None:
+                    stats["rows_examined"] = max(after - before, 0)
+
+                results = [dict(zip(columns, row)) for row in rows]
+                return results, None, stats
+        except Exception as e:
+            return None, str(e), stats
+
+    @staticmethod
+    def _handler_reads(conn) -> Optional[int]:
+        """세션 Handler_read% 카운터 합계 (조회 실패 시 None)"""
+        try:
+            rows = conn.execute(text("SHOW SESSION STATUS LIKE 'Handler_read%'")).fetchall()
+            return sum(int(value) for _, value in rows)
+        except Exception:
+            return None
+
+    def explain(self, query: str) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        EXPLAIN 실행 계획 조회
+
+        Returns:
+            tuple: (EXPLAIN 결과 행 리스트, 에러 메시지)
+        """
+        return self.execute_query(f"EXPLAIN {query.strip().rstrip(';')}")
+
     def get_table_schema(self) -> str:
         """
         DB의 모든 테이블 및 컬럼 스키마를 문자열로 반환.
@@ -0,0 +1,33 @@
+"""
+Indexing Module
+RAG 인덱스 빌드 (scripts/build_index.py에서 사용)
+"""
+
+from core.indexing.ann import ANNConfig, BenchmarkResult, benchmark_indexes, build_ann_index
+from core.indexing.article_chunker import chunk_articles
+from core.indexing.dedup import DedupReport, deduplicate_chunks
+from core.indexing.embedding_pipeline import EmbeddingPipeline, PipelineStats
+from core.indexing.fact_extraction import extract_facts
+from core.indexing.incremental import IncrementalIndexer, IndexUpdateReport, assign_chunk_ids
+from core.indexing.parent_child import split_parent_child
+from core.indexing.pdf_extraction import ExtractionStats, ParseCache, PDFExtractor
+
+__all__ = [
+    "ANNConfig",
+    "BenchmarkResult",
+    "benchmark_indexes",
+    "build_ann_index",
+    "chunk_articles",
+    "DedupReport",
+    "deduplicate_chunks",
+    "EmbeddingPipeline",
+    "PipelineStats",
+    "extract_facts",
+    "IncrementalIndexer",
+    "IndexUpdateReport",
+    "assign_chunk_ids",
+    "split_parent_child",
+    "PDFExtractor",
+    "ParseCache",
+    "ExtractionStats",
+]
@@ -0,0 +1,226 @@
+"""
+ANN Index
+FAISS 근사 최근접 탐색(ANN) 인덱스 구성 + recall/지연 벤치마크
+
+- 인덱스 종류
+    flat   : 전수 비교 (정확, 청크 수에 비례해 느려짐)
+    ivf    : IVF{nlist},Flat  - 클러스터 nprobe개만 탐색
+    ivfpq  : IVF{nlist},PQ{m}x{bits} - 벡터 압축 (메모리 절감, recall 손실)
+    ivfsq  : IVF{nlist},{sq}  - 스칼라 양자화 (SQ8 = 차원당 1바이트)
+    sq     : {sq}            - 양자화만 적용한 전수 비교
+    hnsw   : HNSW{m},Flat    - 그래프 탐색 (학습 불필요, 메모리 증가)
+- 탐색 파라미터(nprobe, efSearch)는 인덱스 파일에 함께 저장됨
+- 증분 빌드용 pickle 인덱스는 항상 flat (삭제/추가 지원), ANN 인덱스는 서빙용 mmap 포맷에만 적용
+
+사용법:
+    config = ANNConfig.from_spec("hnsw:m=32,ef_search=64")
+    index = build_ann_index(vectors, config)
+    results = benchmark_indexes(vectors, [ANNConfig("flat"), config], sizes=[10_000, 100_000])
+"""
+
+import logging
+import math
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import List, Optional, Sequence
+
+import faiss
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_TYPES = ("flat", "ivf", "ivfpq", "ivfsq", "sq", "hnsw")
+
+# k-means 학습 시 클러스터당 권장 최소 학습 벡터 수 (FAISS 경고 기준)
+MIN_POINTS_PER_CENTROID = 39
+
+
+@dataclass
+class ANNConfig:
+    """ANN 인덱스 설정"""
+    kind: str = "flat"
+    nlist: int = 256  # IVF 클러스터 수
+    nprobe: int = 16  # IVF 탐색 클러스터 수
+    m: int = 32  # HNSW 이웃 수
+    ef_construction: int = 80  # HNSW 구축 탐색 폭
+    ef_search: int = 64  # HNSW 검색 탐색 폭
+    pq_m: Optional[int] = None  # PQ 서브벡터 수 (None이면 차원에 맞춰 자동)
+    pq_bits: int = 8  # PQ 코드 비트 수
+    sq: str = "SQ8"  # 스칼라 양자화 종류 (SQ8 | SQ4 | SQfp16)
+
+    def __post_init__(self):
+        if self.kind not in INDEX_TYPES:
+            raise ValueError(
+                f"지원하지 않는 인덱스 종류: {self.kind} (가능: {', '.join(INDEX_TYPES)})"
+            )
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "ANNConfig":
+        """
+        "종류:키=값,키=값" 문자열 파싱
+
+        예: "flat", "ivf:nlist=1024,nprobe=32", "ivfpq:pq_m=16", "hnsw:m=32,ef_search=128"
+        """
+        kind, _, params = spec.strip().partition(":")
+        types = {f.name: f.type for f in fields(cls)}
+        values = {}
+        for item in filter(None, (p.strip() for p in params.split(","))):
+            key, _, value = item.partition("=")
+            key = key.strip()
+            if key not in types or key == "kind":
+                raise ValueError(f"알 수 없는 인덱스 파라미터: {key}")
+            values[key] = value.strip() if key == "sq" else int(value)
+        return cls(kind=kind.strip().lower() or "flat", **values)
+
+    @property
+    def spec(self) -> str:
+        """from_spec과 호환되는 문자열 (기본값과 다른 파라미터만)"""
+        default = ANNConfig(self.kind)
+        params = [f"{k}={v}" for k, v in asdict(self).items()
+                  if k != "kind" and v != getattr(default, k)]
+        return self.kind + (":" + ",".join(params) if params else "")
+
+    def factory_string(self, dim: int, n_vectors: int, storage: Optional[str] = None) -> str:
+        """
+        faiss.index_factory 문자열 (학습 데이터 크기에 맞춰 nlist/PQ 비트 조정)
+
+        Args:
+            storage: 벡터 저장 코드 ("SQfp16" | "SQ8", None이면 float32) - PQ 계열은 무시
+        """
+        nlist = max(1, min(self.nlist, n_vectors // MIN_POINTS_PER_CENTROID))
+        codes = storage or "Flat"
+        if self.kind == "flat":
+            return codes
+        if self.kind == "ivf":
+            return f"IVF{nlist},{codes}"
+        if self.kind == "ivfsq":
+            return f"IVF{nlist},{storage or self.sq}"
+        if self.kind == "sq":
+            return storage or self.sq
+        if self.kind == "hnsw":
+            return f"HNSW{self.m},{codes}"
+        # ivfpq
+        if storage:
+            logger.warning("ivfpq 인덱스는 이미 압축되어 있어 %s 저장 옵션을 무시합니다.", storage)
+        pq_m = self.pq_m or next(m for m in (16, 8, 4, 2, 1) if dim % m == 0)
+        if dim % pq_m:
+            raise ValueError(f"pq_m({pq_m})은 벡터 차원({dim})의 약수여야 합니다.")
+        max_bits = int(math.log2(max(2, n_vectors // MIN_POINTS_PER_CENTROID)))
+        return f"IVF{nlist},PQ{pq_m}x{max(1, min(self.pq_bits, max_bits))}"
+
+
+def build_ann_index(vectors: np.ndarray, config: ANNConfig,
+                    storage: Optional[str] = None) -> faiss.Index:
+    """
+    벡터로 ANN 인덱스 생성 (학습 + 추가 + 탐색 파라미터 설정)
+
+    - 행 번호가 입력 순서와 같음 → 기존 docstore 매핑 그대로 사용 가능
+    - storage: 양자화 저장 코드 (QuantizationConfig.storage)
+    """
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    n_vectors, dim = vectors.shape
+    factory = config.factory_string(dim, n_vectors, storage)
+    index = faiss.index_factory(dim, factory)
+    if config.kind == "hnsw":
+        index.hnsw.efConstruction = config.ef_construction
+    if not index.is_trained:
+        index.train(vectors)
+    index.add(vectors)
+
+    if config.kind.startswith("ivf"):
+        faiss.extract_index_ivf(index).nprobe = config.nprobe
+    if config.kind == "hnsw":
+        index.hnsw.efSearch = config.ef_search
+    logger.info("ANN 인덱스 생성: %s (%d개, %d차원)", factory, n_vectors, dim)
+    return index
+
+
+def reconstruct_vectors(index: faiss.Index) -> np.ndarray:
+    """flat 인덱스에 저장된 원본 벡터 복원"""
+    return index.reconstruct_n(0, index.ntotal)
+
+
+# --------------------------
+# Benchmark
+# --------------------------
+@dataclass
+class BenchmarkResult:
+    """인덱스 1개 x 코퍼스 크기 1개 측정 결과"""
+    spec: str
+    size: int
+    recall: float  # recall@k (정확 검색 대비)
+    p50_ms: float
+    p99_ms: float
+    build_sec: float
+    index_mb: float
+
+
+def synthesize_corpus(vectors: np.ndarray, size: int, noise: float,
+                      rng: np.random.Generator) -> np.ndarray:
+    """
+    실제 청크 벡터 분포를 유지한 채 코퍼스 크기 확장/축소
+
+    - size가 원본보다 작으면 표본 추출, 크면 원본 벡터에 가우시안 잡음을 더해 생성
+      (회사별 규정이 추가되는 상황을 흉내)
+    """
+    if size <= len(vectors):
+        return vectors[rng.choice(len(vectors), size, replace=False)]
+    base = vectors[rng.integers(0, len(vectors), size)]
+    scale = noise * float(vectors.std())
+    return (base + rng.normal(0, scale, base.shape)).astype(np.float32)
+
+
+def benchmark_indexes(
+    vectors: np.ndarray,
+    configs: Sequence[ANNConfig],
+    sizes: Sequence[int],
+    k: int = 10,
+    n_queries: int = 200,
+    noise: float = 0.1,
+    seed: int = 0,
+) -> List[BenchmarkResult]:
+    """
+    인덱스 종류별 recall@k, 검색 지연(p50/p99), 빌드 시간, 크기 측정
+
+    Args:
+        vectors: 실제 청크 벡터 (코퍼스 분포 기준)
+        configs: 비교할 인덱스 설정
+        sizes: 측정할 코퍼스 크기
+        k: recall@k의 k
+        n_queries: 질의 수 (코퍼스 벡터 + 잡음, 질의 1건씩 검색해 지연 측정)
+        noise: 합성 벡터/질의 잡음 크기 (벡터 표준편차 대비)
+    """
+    rng = np.random.default_rng(seed)
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    results = []
+    for size in sizes:
+        corpus = synthesize_corpus(vectors, size, noise, rng)
+        queries = synthesize_corpus(corpus, n_queries, noise, rng)
+        exact = faiss.IndexFlatL2(corpus.shape[1])
+        exact.add(corpus)
+        _, truth = exact.search(queries, k)
+
+        for config in configs:
+            started = time.perf_counter()
+            index = build_ann_index(corpus, config)
+            build_sec = time.perf_counter() - started
+
+            latencies = []
+            hits = 0
+            for query, expected in zip(queries, truth):
+                started = time.perf_counter()
+                _, found = index.search(query[None, :], k)
+                latencies.append((time.perf_counter() - started) * 1000)
+                hits += len(set(found[0]) & set(expected))
+
+            results.append(BenchmarkResult(
+                spec=config.spec,
+                size=size,
+                recall=round(hits / (len(queries) * k), 4),
+                p50_ms=round(float(np.percentile(latencies, 50)), 3),
+                p99_ms=round(float(np.percentile(latencies, 99)), 3),
+                build_sec=round(build_sec, 2),
+                index_mb=round(len(faiss.serialize_index(index)) / 1e6, 2),
+            ))
+            logger.info("벤치마크: %s", asdict(results[-1]))
+    return results
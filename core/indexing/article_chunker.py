@@ -0,0 +1,219 @@
+"""
+Article Chunker
+한국어 규정 문서 구조(장/조/항) 기반 청킹
+
+- 페이지를 파일 단위로 이어 붙인 뒤 조문 머리 기준으로 분할
+    ("**제12조의2 휴가 신청 절차**", "제15조(연차휴가)")
+  → 조문이 페이지 경계나 문장 중간에서 잘리지 않음
+- PDF 추출 특유의 띄어쓰기("제1 장", "제12 조")도 인식, 청크 머리는 "제12조"로 정규화
+- 장(또는 "## 부칙" 같은 2단계 제목)이 바뀌면 조 번호가 다시 시작하므로 section + 조 번호로 식별
+- max_chars를 넘는 긴 조문은 항(①②…) 경계로 나누고, 나뉜 청크마다 조문 머리를 반복
+- 조문 밖 텍스트(서문, 용어 정의 표 등)는 RecursiveCharacterTextSplitter로 분할
+- metadata: section, article_id("제12조의2"), article_key("제1장 제12조의2"), article_title, part
+
+사용법:
+    chunks = chunk_articles(documents, max_chars=1200)
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+logger = logging.getLogger(__name__)
+
+# "## 제1장 총칙", "## 제1 장 총칙", "## 부칙"
+_SECTION = re.compile(r"^#{1,2}\s+(?P<text>[^#].*?)\s*$")
+_CHAPTER = re.compile(r"제\s*(?P<num>\d+)\s*장")
+# "**제10조의3 근무시간 예외**", "**제3조 (다른 규정과의 관계)**", "제15조(연차휴가) 본문..."
+_ARTICLE = re.compile(
+    r"^\s*(?P<bold>\*\*)?\s*제\s*(?P<num>\d+)\s*조(?:\s*의\s*(?P<sub>\d+))?"
+    r"(?P<rest>.*)$"
+)
+# "3-1 (제1조 ~ 제9조)", "**7-1 정보보안 규정 (...)**"
+_SUBSECTION = re.compile(r"^\W*\d+\s*-\s*\d+")
+_PARAGRAPH = re.compile(r"^\s*[①-⑳]")
+# 빈 줄, "### 1-1 (제1조 ~ 제9조)" 같은 소제목, "---" 구분선
+_DECORATION = re.compile(r"^\s*(#{3,}.*|-{3,}|\*{3,})?\s*$")
+
+
+def article_id(num: int, sub: Optional[int] = None) -> str:
+    """조 번호 표기 정규화 ("제12조", "제12조의2")"""
+    return f"제{num}조" + (f"의{sub}" if sub else "")
+
+
+def _normalize_heading(text: str) -> str:
+    text = re.sub(r"\s+", " ", text.replace("**", "")).strip()
+    return _CHAPTER.sub(lambda m: f"제{m.group('num')}장", text)
+
+
+def section_label(heading: str) -> str:
+    """장 제목 → 식별 라벨 ("제1 장 총칙" → "제1장", "부칙" → "부칙")"""
+    chapter = _CHAPTER.search(heading)
+    return f"제{chapter.group('num')}장" if chapter else re.sub(r"\s+", " ", heading).strip()
+
+
+def _parse_article_header(line: str) -> Optional[Tuple[str, str, str]]:
+    """
+    조문 머리 줄 파싱
+
+    Returns:
+        (article_id, 제목, 같은 줄 본문) - 조문 머리가 아니면 None
+        (본문 중 "제12조에 따라"로 시작하는 줄은 제외:
+         굵게 표시되었거나 괄호 제목이 있어야 머리로 인정)
+    """
+    match = _ARTICLE.match(line)
+    if not match:
+        return None
+    rest = match.group("rest")
+    sub = match.group("sub")
+    aid = article_id(int(match.group("num")), int(sub) if sub else None)
+    if match.group("bold"):
+        title, _, body = rest.partition("**")
+        return aid, title.strip(" ()"), body.strip()
+    paren = re.match(r"\s*\(([^)]*)\)(.*)$", rest)
+    if paren:
+        return aid, paren.group(1).strip(), paren.group(2).strip()
+    return None
+
+
+@dataclass
+class _Article:
+    section: str
+    section_title: str
+    article_id: str
+    title: str
+    page: object
+    lines: List[str] = field(default_factory=list)
+
+    @property
+    def header(self) -> str:
+        return f"{self.article_id} {self.title}".strip()
+
+    @property
+    def key(self) -> str:
+        return f"{self.section} {self.article_id}".strip()
+
+
+def _split_paragraphs(lines: List[str], max_chars: int) -> List[List[str]]:
+    """항(①②…) 경계로 max_chars 이하 묶음 (항 하나가 길면 그대로 한 묶음)"""
+    groups, current, size = [], [], 0
+    for line in lines:
+        starts_paragraph = _PARAGRAPH.match(line) is not None
+        if current and starts_paragraph and size + len(line) > max_chars:
+            groups.append(current)
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        groups.append(current)
+    return groups
+
+
+def chunk_articles(
+    documents: List[Document],
+    max_chars: int = 1200,
+    fallback_chunk_size: int = 500,
+    fallback_overlap: int = 50,
+) -> List[Document]:
+    """
+    페이지 Document 목록 → 조문 단위 청크
+
+    Args:
+        documents: 페이지 단위 Document (metadata: source, page)
+        max_chars: 조문 청크 최대 길이 (넘으면 항 단위로 분할)
+        fallback_chunk_size: 조문 밖 텍스트 청크 크기
+        fallback_overlap: 조문 밖 텍스트 청크 겹침
+    """
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=fallback_chunk_size,
+        chunk_overlap=fallback_overlap,
+        separators=["\n\n", "\n", " ", ""],
+    )
+    chunks: List[Document] = []
+
+    def flush_loose(loose: List[str], source, page, section_title):
+        # 소제목/구분선만 있는 조각은 버림
+        if all(_DECORATION.match(line) for line in loose):
+            return
+        text = "\n".join(loose).strip()
+        meta = {"source": source, "page": page}
+        if section_title:
+            meta["section"] = section_title
+        chunks.extend(splitter.split_documents([Document(page_content=text, metadata=meta)]))
+
+    def flush_article(article: _Article, source):
+        body = [line for line in article.lines if line.strip()]
+        groups = _split_paragraphs(body, max_chars) if body else [[]]
+        prefix = f"[{article.section_title}] " if article.section_title else ""
+        for part, group in enumerate(groups):
+            chunks.append(Document(
+                page_content="\n".join([prefix + article.header] + group),
+                metadata={
+                    "source": source,
+                    "page": article.page,
+                    "section": article.section_title,
+                    "article_id": article.article_id,
+                    "article_key": article.key,
+                    "article_title": article.title,
+                    "part": part,
+                },
+            ))
+
+    # 파일(source) 단위로 페이지를 이어서 처리 (조문이 페이지를 넘어가도 하나로 유지)
+    sources: List[str] = []
+    pages_by_source = {}
+    for doc in documents:
+        source = doc.metadata.get("source")
+        if source not in pages_by_source:
+            sources.append(source)
+            pages_by_source[source] = []
+        pages_by_source[source].append(doc)
+
+    n_articles = 0
+    for source in sources:
+        section, section_title = "", ""
+        article: Optional[_Article] = None
+        loose: List[str] = []
+        loose_page = None
+        for doc in pages_by_source[source]:
+            page = doc.metadata.get("page")
+            for line in doc.page_content.splitlines():
+                heading = _SECTION.match(line)
+                if heading and _SUBSECTION.match(heading.group("text")):
+                    # "## 3-1 (제1조 ~ 제9조)" 같은 장 안의 소구분은 장을 바꾸지 않음
+                    heading = None
+                    line = ""
+                header = _parse_article_header(line)
+                if heading or header:
+                    if article is not None:
+                        flush_article(article, source)
+                        n_articles += 1
+                        article = None
+                    flush_loose(loose, source, loose_page, section_title)
+                    loose = []
+                if heading:
+                    section_title = _normalize_heading(heading.group("text"))
+                    section = section_label(section_title)
+                elif header:
+                    aid, title, body = header
+                    article = _Article(section, section_title, aid, title, page)
+                    if body:
+                        article.lines.append(body)
+                elif article is not None:
+                    if not _DECORATION.match(line):
+                        article.lines.append(line)
+                else:
+                    if not loose:
+                        loose_page = page
+                    loose.append(line)
+        if article is not None:
+            flush_article(article, source)
+            n_articles += 1
+        flush_loose(loose, source, loose_page, section_title)
+
+    logger.info("조문 청킹: %d개 조문 → %d개 청크", n_articles, len(chunks))
+    return chunks
@@ -0,0 +1,138 @@
+"""
+Chunk Dedup
+MinHash + LSH 기반 유사 중복 청크 제거 (임베딩 전 단계)
+
+- 청크 텍스트(공백 제거) 문자 shingle → MinHash 서명 (num_perm개 해시 최솟값)
+- LSH 밴딩(bands x rows)으로 후보 쌍만 비교 → 청크 수에 거의 선형
+- 후보 쌍은 서명 일치율(Jaccard 추정치) ≥ threshold일 때 같은 클러스터 (union-find)
+- 클러스터마다 첫 청크만 남기고, 모든 출처를 metadata["sources"]에 기록
+  (같은 규정의 다른 판본·형식처럼 내용이 겹치는 문서 → 검색 결과 중복, 프롬프트 낭비 방지)
+
+사용법:
+    chunks, report = deduplicate_chunks(chunks, threshold=0.8)
+"""
+
+import logging
+import re
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_SPACES = re.compile(r"\s+")
+
+
+def shingles(text: str, size: int = 5) -> np.ndarray:
+    """공백 제거 텍스트의 문자 n-gram 해시 (중복 제거)"""
+    compact = _SPACES.sub("", text)
+    if len(compact) <= size:
+        grams = {compact}
+    else:
+        grams = {compact[i:i + size] for i in range(len(compact) - size + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.int64)
+
+
+class MinHasher:
+    """고정 시드 MinHash (a*x + b mod p 해시족, 빌드마다 같은 서명)"""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, _MERSENNE_PRIME, num_perm, dtype=np.int64)[:, None]
+        self._b = rng.integers(0, _MERSENNE_PRIME, num_perm, dtype=np.int64)[:, None]
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        # crc32 < 2^32, a < 2^31 → 곱이 int64 범위 안
+        values = (self._a * (hashes[None, :] % _MERSENNE_PRIME) + self._b) % _MERSENNE_PRIME
+        return values.min(axis=1)
+
+
+@dataclass
+class DedupReport:
+    """중복 제거 결과"""
+    total: int
+    kept: int
+    removed: int
+    clusters: int  # 2개 이상 청크가 합쳐진 클러스터 수
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def deduplicate_chunks(
+    chunks: List[Document],
+    threshold: float = 0.8,
+    num_perm: int = 128,
+    bands: int = 16,
+    shingle_size: int = 5,
+) -> Tuple[List[Document], DedupReport]:
+    """
+    유사 중복 청크 제거
+
+    Args:
+        chunks: 청크 목록 (순서 유지, 클러스터의 첫 청크가 대표)
+        threshold: 같은 청크로 볼 Jaccard 유사도 (추정치)
+        num_perm: MinHash 해시 수 (bands로 나누어떨어져야 함)
+        bands: LSH 밴드 수 (많을수록 낮은 유사도도 후보로 잡힘)
+        shingle_size: 문자 shingle 길이
+
+    Returns:
+        (대표 청크 목록, DedupReport) - 대표 청크 metadata에 sources(출처 목록) 추가
+    """
+    if num_perm % bands:
+        raise ValueError(f"num_perm({num_perm})은 bands({bands})로 나누어떨어져야 합니다.")
+    hasher = MinHasher(num_perm)
+    signatures = np.stack([hasher.signature(shingles(c.page_content, shingle_size))
+                           for c in chunks]) if chunks else np.empty((0, num_perm))
+
+    # LSH: 밴드별로 서명 구간이 같은 청크끼리 후보
+    parent = list(range(len(chunks)))
+    rows = num_perm // bands
+    for band in range(bands):
+        buckets: Dict[bytes, int] = {}
+        for i, sig in enumerate(signatures):
+            key = sig[band * rows:(band + 1) * rows].tobytes()
+            first = buckets.setdefault(key, i)
+            if first == i:
+                continue
+            a, b = _find(parent, first), _find(parent, i)
+            if a != b and np.mean(signatures[first] == sig) >= threshold:
+                parent[max(a, b)] = min(a, b)
+
+    members: Dict[int, List[int]] = {}
+    for i in range(len(chunks)):
+        members.setdefault(_find(parent, i), []).append(i)
+
+    kept = []
+    for root in sorted(members):
+        group = members[root]
+        sources = []
+        for i in group:
+            provenance = {"source": chunks[i].metadata.get("source"),
+                          "page": chunks[i].metadata.get("page")}
+            if provenance not in sources:
+                sources.append(provenance)
+        representative = chunks[root]
+        kept.append(Document(
+            page_content=representative.page_content,
+            metadata=dict(representative.metadata, sources=sources),
+        ))
+
+    report = DedupReport(
+        total=len(chunks),
+        kept=len(kept),
+        removed=len(chunks) - len(kept),
+        clusters=sum(len(group) > 1 for group in members.values()),
+    )
+    logger.info("중복 청크 제거: %d → %d (%d개 제거, 중복 클러스터 %d개)",
+                report.total, report.kept, report.removed, report.clusters)
+    return kept, report
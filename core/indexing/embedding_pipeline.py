@@ -0,0 +1,153 @@
+"""
+Embedding Pipeline
+인덱스 빌드용 배치·병렬 임베딩 단계
+
+- 텍스트를 batch_size 단위로 나눠 최대 max_workers개 배치를 동시에 요청
+- 배치 실패 시 지수 백오프(+지터)로 재시도 (OpenAI rate limit, Ollama 과부하 대응)
+- 완료된 배치부터 콜백으로 전달 → 인덱스에 바로 추가 (전체 완료를 기다리지 않음)
+- 처리량(chunks/sec), 재시도 횟수 집계
+
+사용법:
+    pipeline = EmbeddingPipeline(embeddings.embed_documents, batch_size=64, max_workers=4)
+    stats = pipeline.run(texts, on_batch=lambda start, vectors: ...)
+    print(stats.chunks_per_sec)
+"""
+
+import logging
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+from core.types.errors import IndexBuildError
+
+logger = logging.getLogger(__name__)
+
+EmbedFn = Callable[[List[str]], List[List[float]]]
+BatchCallback = Callable[[int, List[List[float]]], None]
+
+
+@dataclass
+class PipelineStats:
+    """임베딩 단계 실행 결과"""
+    chunks: int = 0
+    batches: int = 0
+    retries: int = 0
+    elapsed_sec: float = 0.0
+
+    @property
+    def chunks_per_sec(self) -> float:
+        return self.chunks / self.elapsed_sec if self.elapsed_sec > 0 else 0.0
+
+
+class EmbeddingPipeline:
+    """
+    배치·병렬 임베딩 실행기
+
+    - 워커 스레드는 임베딩 호출만 담당, 콜백은 호출한 스레드에서 순차 실행
+      (FAISS 인덱스 추가를 락 없이 안전하게 수행)
+    """
+
+    def __init__(
+        self,
+        embed_fn: EmbedFn,
+        batch_size: int = 64,
+        max_workers: int = 4,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+    ):
+        """
+        Args:
+            embed_fn: 텍스트 리스트 → 벡터 리스트 (예: OpenAIEmbeddings.embed_documents)
+            batch_size: 요청당 텍스트 수
+            max_workers: 동시 요청 배치 수
+            max_retries: 배치별 최대 재시도 횟수
+            backoff_base: 첫 재시도 대기(초), 이후 2배씩 증가
+            backoff_max: 재시도 대기 상한(초)
+        """
+        if batch_size < 1 or max_workers < 1:
+            raise ValueError("batch_size와 max_workers는 1 이상이어야 합니다.")
+        self.embed_fn = embed_fn
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._sleep = time.sleep
+
+    def _embed_batch(self, texts: List[str], stats: PipelineStats) -> List[List[float]]:
+        for attempt in range(self.max_retries + 1):
+            try:
+                vectors = self.embed_fn(texts)
+                if len(vectors) != len(texts):
+                    raise IndexBuildError(
+                        f"임베딩 결과 수 불일치: 요청 {len(texts)}개, 응답 {len(vectors)}개")
+                return vectors
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise IndexBuildError(f"임베딩 배치 실패 ({attempt + 1}회 시도): {e}") from e
+                delay = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+                delay *= random.uniform(0.5, 1.0)
+                stats.retries += 1
+                logger.warning("임베딩 배치 재시도 %d/%d (%.1fs 후): %s",
+                               attempt + 1, self.max_retries, delay, e)
+                self._sleep(delay)
+        raise IndexBuildError("임베딩 배치 실패")  # pragma: no cover
+
+    def run(self, texts: Sequence[str], on_batch: BatchCallback,
+            progress_every: Optional[int] = None) -> PipelineStats:
+        """
+        전체 텍스트 임베딩
+
+        Args:
+            texts: 임베딩할 텍스트
+            on_batch: (배치 시작 위치, 벡터 리스트) 콜백 - 완료 순서대로 호출
+            progress_every: N개 배치마다 진행률 로그 (None이면 생략)
+
+        Returns:
+            PipelineStats
+
+        Raises:
+            IndexBuildError: 재시도 후에도 실패한 배치가 있는 경우
+        """
+        stats = PipelineStats()
+        starts = list(range(0, len(texts), self.batch_size))
+        if not starts:
+            return stats
+
+        started = time.perf_counter()
+        pending: Dict[Future, int] = {}
+        next_batch = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="embed") as executor:
+            try:
+                while next_batch < len(starts) or pending:
+                    # 동시 요청 수를 max_workers로 제한 (메모리/요청 폭주 방지)
+                    while next_batch < len(starts) and len(pending) < self.max_workers:
+                        start = starts[next_batch]
+                        batch = list(texts[start:start + self.batch_size])
+                        pending[executor.submit(self._embed_batch, batch, stats)] = start
+                        next_batch += 1
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        start = pending.pop(future)
+                        vectors = future.result()
+                        on_batch(start, vectors)
+                        stats.chunks += len(vectors)
+                        stats.batches += 1
+                        if progress_every and stats.batches % progress_every == 0:
+                            elapsed = time.perf_counter() - started
+                            logger.info("임베딩 진행: %d/%d (%.1f chunks/sec)",
+                                        stats.chunks, len(texts), stats.chunks / elapsed)
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        stats.elapsed_sec = time.perf_counter() - started
+        logger.info("임베딩 완료: %d개, %d배치, 재시도 %d회, %.1f chunks/sec",
+                    stats.chunks, stats.batches, stats.retries, stats.chunks_per_sec)
+        return stats
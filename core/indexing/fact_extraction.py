@@ -0,0 +1,98 @@
+"""
+Fact Extraction
+조문 청크에서 수치 사실(주제어 + 수치 문장)을 규칙 기반으로 추출 (인덱스 빌드 단계, LLM 호출 없음)
+
+- 대상 문장: 수치 + 단위(일/개월/년/시간/분/%/원/회/세/주/점)가 있는 완결된 문장
+  ("사례" 예시 문장, PDF 줄바꿈/표에서 잘린 조각 제외)
+- 주제어
+    "① 연차휴가 신청: ..." → 항 라벨 "연차휴가 신청"
+    "질병휴직은 최대 3개월까지 ..." → 문장 첫 주제("~은/는/이/가")
+    "지각 및 조퇴는 ..." → "지각", "조퇴" 각각
+    주제어가 없는 문장은 같은 문단 앞 문장의 주제어를 이어받음 (표 행은 행마다 새로 시작)
+- "회사", "직원"처럼 어디에나 나오는 주어나 "기간", "금액" 같은 속성어는 주제어로 쓰지 않음
+  ("출산휴가는 ... 기간은 90일로 한다." → 주제어 "출산휴가")
+
+사용법:
+    facts = extract_facts(chunks)
+    FactTable(facts).save(index_path)
+"""
+
+import logging
+import re
+from typing import List, Optional
+
+from langchain_core.documents import Document
+
+from core.retrieval.extractive import citation, sentences_of, split_paragraphs
+from core.retrieval.fact_table import QUANTITY, Fact, is_complete_sentence
+
+logger = logging.getLogger(__name__)
+
+_EXAMPLE = re.compile(r"^\W*사례\s*\d*\s*:")
+_ITEM_MARK = re.compile(r"^[①-⑳•·※▶\-\s]+")
+# "연차휴가 신청: 사내 근태 시스템을 통해 ..." (항 라벨)
+_LABEL = re.compile(r"^(?P<subject>[가-힣A-Za-z0-9·\s]{2,20}?)\s*:\s")
+# "질병휴직은 ...", "지각 및 조퇴는 ..." (문장 첫 주제)
+_TOPIC = re.compile(r"^(?P<subject>[가-힣A-Za-z0-9·\s]{2,20}?)(?:은|는|이|가)\s")
+_SPACES = re.compile(r"\s+")
+
+# 주제어로 쓰지 않는 일반 주어
+GENERIC_SUBJECTS = {
+    "회사", "직원", "모든직원", "해당직원", "근로자", "본규정", "이규정", "인사팀", "인사부서",
+    "부서장", "팀장", "본부장", "대표이사", "신청자", "대상자", "이경우", "다만", "단",
+    "기간", "일수", "금액", "한도", "비율", "횟수", "시간",
+}
+
+
+def _subjects(sentence: str) -> Optional[List[str]]:
+    """문장 첫 주제어 목록 (없으면 None, 일반 주어면 빈 리스트)"""
+    sentence = _ITEM_MARK.sub("", sentence)
+    match = _LABEL.match(sentence) or _TOPIC.match(sentence)
+    if not match:
+        return None
+    subjects = []
+    for part in re.split(r"\s+및\s+|·|,", match.group("subject")):
+        part = part.strip()
+        # "경우 추가 2일" → "경우 추"처럼 조사로 잘못 자른 주제어(마지막 단어 1음절) 제외
+        if len(part.split()[-1] if part else "") < 2:
+            continue
+        if _SPACES.sub("", part) not in GENERIC_SUBJECTS:
+            subjects.append(part)
+    return subjects
+
+
+def extract_facts(chunks: List[Document]) -> List[Fact]:
+    """
+    청크 목록 → 수치 사실 목록
+
+    Args:
+        chunks: 조문 청크 (chunk_articles 결과 권장, 조문 metadata가 출처에 표기됨)
+    """
+    facts: List[Fact] = []
+    seen = set()
+    for chunk in chunks:
+        cite = citation(chunk)
+        for paragraph in split_paragraphs(chunk):
+            current: List[str] = []
+            for sentence in sentences_of(paragraph):
+                subjects = _subjects(sentence)
+                if subjects:
+                    current = subjects
+                if (_EXAMPLE.match(sentence) or not QUANTITY.search(sentence)
+                        or not is_complete_sentence(sentence)):
+                    continue
+                for subject in current:
+                    key = _SPACES.sub("", subject)
+                    if (key, sentence) in seen:
+                        continue
+                    seen.add((key, sentence))
+                    facts.append(Fact(
+                        key=key,
+                        subject=subject,
+                        text=_ITEM_MARK.sub("", sentence),
+                        citation=cite,
+                        article_key=chunk.metadata.get("article_key"),
+                        direct=bool(subjects),
+                    ))
+    logger.info("수치 사실 추출: %d개 (주제어 %d개)", len(facts), len({f.key for f in facts}))
+    return facts
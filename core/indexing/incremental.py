@@ -0,0 +1,246 @@
+"""
+Incremental Index Builder
+청크 해시 기반 FAISS 인덱스 증분 빌드
+
+- 청크 ID: (출처, 페이지, 내용, 같은 내용의 출현 순번) 해시 → 변경/삭제 판별
+- 임베딩: CachedEmbeddings(cache_documents=True)로 (모델, 내용 해시) 단위 재사용
+  → 페이지가 밀리거나 다시 추가된 청크도 임베딩 재호출 없음
+- 기존 인덱스에서 삭제된 청크는 FAISS.delete, 신규 청크만 add_embeddings
+- 인덱스 옆 manifest.json에 임베딩 네임스페이스와 청크 목록 기록
+  (네임스페이스가 바뀌었거나 manifest가 없으면 전체 재빌드)
+  version: 네임스페이스 + 청크 ID 해시 (청크가 바뀌면 달라짐, FAQ 색인 등 파생 데이터 무효화에 사용)
+- 저장 시 docstore 전체로 BM25 색인(bm25.json)을 다시 만들어 함께 저장
+- 서빙용 mmap 포맷(vectors.faiss + chunks.db)도 함께 저장
+  (ann_config가 있으면 vectors.faiss는 IVF/HNSW/PQ/SQ 인덱스, pickle 인덱스는 flat 유지)
+  (quantization이 있으면 축소·양자화 벡터로 구성 + 재채점용 원본 벡터 저장)
+- 캐시 미스 청크는 EmbeddingPipeline으로 배치·병렬 임베딩,
+  완료된 배치부터 바로 인덱스에 추가
+
+사용법:
+    indexer = IncrementalIndexer(embeddings, index_path)
+    report = indexer.update(chunks)
+    indexer.save()
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+
+from core.indexing.ann import ANNConfig, build_ann_index, reconstruct_vectors
+from core.indexing.embedding_pipeline import EmbeddingPipeline
+from core.llm.embedding_cache import CachedEmbeddings, normalize_text, text_key
+from core.retrieval.article_index import ArticleIndex
+from core.retrieval.bm25 import BM25Index
+from core.retrieval.mmap_index import save_mmap_index
+from core.retrieval.quantized import QuantizationConfig, save_quantization
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+
+def assign_chunk_ids(chunks: List[Document]) -> List[str]:
+    """청크별 안정 ID (같은 위치의 같은 내용이면 빌드마다 같은 ID)"""
+    seen: Counter = Counter()
+    ids = []
+    for chunk in chunks:
+        source = str(chunk.metadata.get("source", ""))
+        page = str(chunk.metadata.get("page", ""))
+        content = text_key(chunk.page_content)
+        occurrence = seen[(source, page, content)]
+        seen[(source, page, content)] += 1
+        raw = f"{source}\x1f{page}\x1f{content}\x1f{occurrence}"
+        ids.append(hashlib.sha1(raw.encode("utf-8")).hexdigest())
+    return ids
+
+
+@dataclass
+class IndexUpdateReport:
+    """증분 빌드 결과"""
+    mode: str  # "full" | "incremental"
+    total: int
+    added: int
+    removed: int
+    unchanged: int
+    embedded: int  # 실제 임베딩 호출한 청크 수 (캐시 미스)
+    reused: int  # 저장소에서 재사용한 임베딩 수
+    elapsed_sec: float
+    batches: int = 0  # 임베딩 요청 배치 수
+    retries: int = 0  # 임베딩 배치 재시도 횟수
+    chunks_per_sec: float = 0.0  # 임베딩 처리량 (캐시 미스 기준)
+
+
+class IncrementalIndexer:
+    """
+    FAISS 인덱스 증분 빌더
+
+    - embeddings는 문서 캐시가 켜진 CachedEmbeddings (임베딩 저장소 공유)
+    """
+
+    def __init__(self, embeddings: CachedEmbeddings, index_path: Path,
+                 pipeline: Optional[EmbeddingPipeline] = None,
+                 ann_config: Optional[ANNConfig] = None,
+                 quantization: Optional[QuantizationConfig] = None):
+        """
+        Args:
+            embeddings: CachedEmbeddings (cache_documents=True 권장)
+            index_path: 인덱스 디렉토리
+            pipeline: 캐시 미스 임베딩 실행기 (None이면 기본 배치/동시성)
+            ann_config: 서빙용 ANN 인덱스 설정 (None이면 flat)
+            quantization: 서빙용 벡터 양자화/차원 축소 설정 (None이면 float32 전체 차원)
+        """
+        self.embeddings = embeddings
+        self.index_path = Path(index_path)
+        self.pipeline = pipeline or EmbeddingPipeline(embeddings.base.embed_documents)
+        self.ann_config = ann_config or ANNConfig()
+        self.quantization = quantization or QuantizationConfig()
+        self.vectorstore: Optional[FAISS] = None
+        self.manifest: Dict = {}
+
+    def _load_existing(self) -> bool:
+        manifest_path = self.index_path / MANIFEST_FILE
+        if not manifest_path.exists() or not (self.index_path / "index.faiss").exists():
+            logger.info("기존 manifest 없음 → 전체 빌드")
+            return False
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("namespace") != self.embeddings.namespace:
+            logger.info(
+                "임베딩 모델 변경 (%s → %s) → 전체 빌드",
+                manifest.get("namespace"), self.embeddings.namespace,
+            )
+            return False
+        self.vectorstore = FAISS.load_local(
+            str(self.index_path), self.embeddings, allow_dangerous_deserialization=True
+        )
+        self.manifest = manifest
+        return True
+
+    def _add(self, entries: List[Tuple[str, List[float], str, Dict]], create: bool):
+        """(텍스트, 벡터, ID, 메타데이터) 목록을 인덱스에 추가 (create=True면 새 인덱스)"""
+        texts, vectors, ids, metadatas = (list(col) for col in zip(*entries))
+        if create:
+            self.vectorstore = FAISS.from_embeddings(
+                list(zip(texts, vectors)), self.embeddings, metadatas=metadatas, ids=ids
+            )
+        else:
+            self.vectorstore.add_embeddings(list(zip(texts, vectors)), metadatas=metadatas, ids=ids)
+
+    def update(self, chunks: List[Document], full: bool = False) -> IndexUpdateReport:
+        """
+        청크 목록으로 인덱스 갱신
+
+        Args:
+            chunks: 이번 빌드의 전체 청크
+            full: True면 기존 인덱스를 무시하고 전체 재빌드 (임베딩은 저장소에서 재사용)
+
+        Returns:
+            IndexUpdateReport
+        """
+        started = time.perf_counter()
+        ids = assign_chunk_ids(chunks)
+        by_id = dict(zip(ids, chunks))
+
+        incremental = not full and self._load_existing()
+        if incremental:
+            existing = set(self.vectorstore.index_to_docstore_id.values())
+            removed = [i for i in existing if i not in by_id]
+            added = [i for i in ids if i not in existing]
+            if removed:
+                self.vectorstore.delete(removed)
+        else:
+            existing, removed, added = set(), [], list(ids)
+
+        if not incremental and not added:
+            raise ValueError("인덱싱할 청크가 없습니다.")
+        create = not incremental
+
+        # 캐시 적중분은 바로 추가, 미스는 내용 해시별로 모아 파이프라인으로 임베딩
+        cached, keys = self.embeddings.lookup([by_id[i].page_content for i in added])
+        ready, waiting = [], {}
+        for chunk_id, key, vector in zip(added, keys, cached):
+            entry = (by_id[chunk_id].page_content, vector, chunk_id,
+                     dict(by_id[chunk_id].metadata, chunk_id=chunk_id))
+            if vector is None:
+                waiting.setdefault(key, []).append(entry)
+            else:
+                ready.append(entry)
+        if ready:
+            self._add(ready, create)
+            create = False
+
+        pending_keys = list(waiting)
+
+        def on_batch(start: int, vectors: List[List[float]]):
+            nonlocal create
+            batch_keys = pending_keys[start:start + len(vectors)]
+            self.embeddings.remember(batch_keys, vectors)
+            self._add([(text, vector, chunk_id, metadata)
+                       for key, vector in zip(batch_keys, vectors)
+                       for text, _, chunk_id, metadata in waiting[key]], create)
+            create = False
+
+        texts = [normalize_text(waiting[key][0][0]) for key in pending_keys]
+        stats = self.pipeline.run(texts, on_batch, progress_every=10)
+        embedded = len(pending_keys)
+
+        self.manifest = {
+            "version": hashlib.sha1(
+                "\x1f".join([self.embeddings.namespace, *sorted(ids)]).encode("utf-8")
+            ).hexdigest()[:12],
+            "namespace": self.embeddings.namespace,
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "ann_index": self.ann_config.spec,
+            "quantization": asdict(self.quantization),
+            "chunks": {
+                i: {
+                    "source": by_id[i].metadata.get("source"),
+                    "page": by_id[i].metadata.get("page"),
+                    "hash": text_key(by_id[i].page_content),
+                }
+                for i in ids
+            },
+        }
+
+        report = IndexUpdateReport(
+            mode="incremental" if incremental else "full",
+            total=len(ids),
+            added=len(added),
+            removed=len(removed),
+            unchanged=len(ids) - len(added),
+            embedded=embedded,
+            reused=len(added) - embedded,
+            elapsed_sec=round(time.perf_counter() - started, 2),
+            batches=stats.batches,
+            retries=stats.retries,
+            chunks_per_sec=round(stats.chunks_per_sec, 1),
+        )
+        logger.info("인덱스 갱신: %s", asdict(report))
+        return report
+
+    def save(self):
+        """인덱스 + BM25 색인 + 조문 조회 테이블 + mmap 포맷 + manifest 저장"""
+        if self.vectorstore is None:
+            raise ValueError("저장할 인덱스가 없습니다. update()를 먼저 실행하세요.")
+        self.index_path.mkdir(parents=True, exist_ok=True)
+        self.vectorstore.save_local(str(self.index_path))
+        BM25Index.from_vectorstore(self.vectorstore).save(self.index_path)
+        ArticleIndex.from_vectorstore(self.vectorstore).save(self.index_path)
+        ann_index = None
+        vectors = reconstruct_vectors(self.vectorstore.index)
+        if self.ann_config.kind != "flat" or self.quantization.enabled:
+            ann_index = build_ann_index(self.quantization.prepare(vectors), self.ann_config,
+                                        storage=self.quantization.storage)
+        save_mmap_index(self.vectorstore, self.index_path, index=ann_index)
+        save_quantization(self.index_path, self.quantization, vectors)
+        (self.index_path / MANIFEST_FILE).write_text(
+            json.dumps(self.manifest, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        logger.info(f"인덱스 저장 완료: {self.index_path}")
@@ -0,0 +1,59 @@
+"""
+Parent-Child Chunks
+2단계 인덱스용 청크 분할 (작은 자식 청크로 검색, 부모 청크를 프롬프트에 사용)
+
+- 부모: 기존 청킹 결과 (조문 청킹이면 조문 단위) → parents.json에 저장, 임베딩하지 않음
+- 자식: 부모를 child_size 이하로 다시 나눈 청크 → FAISS/BM25에 색인
+  (조문 부모는 첫 줄의 조문 머리 "[제1장 총칙] 제12조 제목"을 자식마다 반복
+   → 자식만으로도 어느 조문인지 검색됨)
+- 자식 metadata = 부모 metadata + parent_id + child(부모 안 순번)
+
+사용법:
+    parents, children = split_parent_child(chunks, child_size=200)
+"""
+
+import logging
+from typing import List, Tuple
+
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from core.indexing.incremental import assign_chunk_ids
+
+logger = logging.getLogger(__name__)
+
+
+def split_parent_child(
+    chunks: List[Document],
+    child_size: int = 200,
+    child_overlap: int = 20,
+) -> Tuple[List[Document], List[Document]]:
+    """
+    부모 청크 → (parent_id가 붙은 부모 목록, 자식 청크 목록)
+
+    Args:
+        chunks: 부모 청크 (조문 청크 또는 고정 길이 청크)
+        child_size: 자식 청크 최대 길이 (조문 머리 제외)
+        child_overlap: 자식 청크 겹침
+    """
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=child_size,
+        chunk_overlap=child_overlap,
+        separators=["\n", ". ", " ", ""],
+    )
+    parents, children = [], []
+    for chunk, parent_id in zip(chunks, assign_chunk_ids(chunks)):
+        parent = Document(page_content=chunk.page_content,
+                          metadata=dict(chunk.metadata, parent_id=parent_id))
+        parents.append(parent)
+
+        header, body = "", chunk.page_content
+        if "article_key" in chunk.metadata and "\n" in body:
+            header, body = body.split("\n", 1)
+        for n, piece in enumerate(splitter.split_text(body) or [""]):
+            children.append(Document(
+                page_content=f"{header}\n{piece}" if header else piece,
+                metadata=dict(parent.metadata, child=n),
+            ))
+    logger.info("부모-자식 분할: 부모 %d개 → 자식 %d개", len(parents), len(children))
+    return parents, children
@@ -1,8 +1,17 @@
 """
 LLM Module
-Provider(OpenAI/Ollama)에 따른 LLM 인스턴스 생성
+Provider(OpenAI/Ollama)에 따른 LLM 인스턴스 생성 (임베딩은 로컬 해싱 임베딩도 지원)
 """
 
-from core.llm.factory import create_chat_model, create_embeddings
+from core.llm.factory import create_chat_model, create_embeddings, resolve_local_embedding_model
+from core.llm.embedding_cache import CachedEmbeddings, EmbeddingStore
+from core.llm.hashing_embeddings import HashingEmbeddings
 
-__all__ = ["create_chat_model", "create_embeddings"]
+__all__ = [
+    "create_chat_model",
+    "create_embeddings",
+    "resolve_local_embedding_model",
+    "CachedEmbeddings",
+    "EmbeddingStore",
+    "HashingEmbeddings",
+]
@@ -0,0 +1,259 @@
+"""
+Embedding Cache
+임베딩 결과 캐시 (메모리 LRU + SQLite 디스크 계층)
+
+- 키: namespace(provider/model) + 정규화 텍스트(NFC, 공백 정리)의 SHA-256
+- 메모리 LRU → SQLite → 실제 임베딩 호출 순으로 조회
+- SQLite는 WAL 모드로 여러 워커 프로세스가 공유
+- 질문 임베딩은 항상 캐시, 문서 임베딩은 cache_documents=True일 때만 캐시
+
+사용법:
+    store = EmbeddingStore("data/embedding_cache.db")
+    embeddings = CachedEmbeddings(
+        create_embeddings(provider="openai", model="text-embedding-3-small"),
+        namespace="openai/text-embedding-3-small",
+        store=store,
+    )
+    vector = embeddings.embed_query("연차는 몇일인가요?")
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC, 연속 공백 → 공백 1개, 앞뒤 공백 제거)"""
+    return _SPACES.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def text_key(text: str) -> str:
+    """정규화 텍스트 해시"""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class EmbeddingStore:
+    """
+    SQLite 임베딩 저장소 (float32 BLOB)
+
+    - (namespace, key) 기본키, 스레드별 연결 재사용
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+        conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=10)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_many(self, namespace: str, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """저장된 벡터 조회 (없는 키는 결과에서 제외)"""
+        found: Dict[str, np.ndarray] = {}
+        unique = list(dict.fromkeys(keys))
+        conn = self._connect()
+        # SQLite 바인딩 변수 한도 고려해 나눠서 조회
+        for start in range(0, len(unique), 500):
+            batch = unique[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            try:
+                rows = conn.execute(
+                    "SELECT key, vector FROM embeddings"
+                    f" WHERE namespace = ? AND key IN ({placeholders})",
+                    (namespace, *batch),
+                ).fetchall()
+            except sqlite3.Error as e:
+                logger.warning("임베딩 캐시 조회 실패: %s", e)
+                return found
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, namespace: str, items: Iterable[Tuple[str, Sequence[float]]]):
+        """벡터 저장 (실패해도 예외를 던지지 않음)"""
+        now = time.time()
+        rows = [
+            (namespace, key, len(vector), np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for key, vector in items
+        ]
+        if not rows:
+            return
+        conn = self._connect()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (namespace, key, dim, vector, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("임베딩 캐시 저장 실패: %s", e)
+
+    def delete_many(self, namespace: str, keys: Sequence[str]):
+        """벡터 삭제"""
+        conn = self._connect()
+        conn.executemany(
+            "DELETE FROM embeddings WHERE namespace = ? AND key = ?",
+            [(namespace, key) for key in keys],
+        )
+        conn.commit()
+
+    def count(self, namespace: Optional[str] = None) -> int:
+        conn = self._connect()
+        if namespace is None:
+            return conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return conn.execute(
+            "SELECT COUNT(*) FROM embeddings WHERE namespace = ?", (namespace,)
+        ).fetchone()[0]
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    캐시 계층을 둔 Embeddings 래퍼
+
+    - FAISS 등 LangChain 컴포넌트에 원본 Embeddings 대신 그대로 전달 가능
+    - 미스 시 정규화된 텍스트로 임베딩 (같은 키 = 같은 벡터 보장)
+    """
+
+    def __init__(
+        self,
+        base: Embeddings,
+        namespace: str,
+        store: Optional[EmbeddingStore] = None,
+        lru_size: int = 1024,
+        cache_documents: bool = False,
+    ):
+        """
+        Args:
+            base: 실제 임베딩 모델 (create_embeddings 결과)
+            namespace: 캐시 네임스페이스 (예: "openai/text-embedding-3-small")
+            store: 디스크 저장소 (None이면 메모리 LRU만 사용)
+            lru_size: 메모리 LRU 크기 (0이면 메모리 계층 비활성화)
+            cache_documents: embed_documents 결과도 캐시할지 여부
+        """
+        self.base = base
+        self.namespace = namespace
+        self.store = store
+        self.lru_size = lru_size
+        self.cache_documents = cache_documents
+        self._lru: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    # --------------------------
+    # Memory Tier
+    # --------------------------
+    def _lru_get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._lru.get(key)
+            if vector is not None:
+                self._lru.move_to_end(key)
+            return vector
+
+    def _lru_put(self, key: str, vector: List[float]):
+        if self.lru_size <= 0:
+            return
+        with self._lock:
+            self._lru[key] = vector
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    # --------------------------
+    # Lookup
+    # --------------------------
+    def lookup(self, texts: Sequence[str]) -> Tuple[List[Optional[List[float]]], List[str]]:
+        """
+        캐시 조회 (메모리 → 디스크)
+
+        Returns:
+            (텍스트별 벡터 또는 None, 텍스트별 캐시 키)
+        """
+        keys = [text_key(text) for text in texts]
+        vectors: List[Optional[List[float]]] = [self._lru_get(key) for key in keys]
+        self.stats["memory_hits"] += sum(v is not None for v in vectors)
+
+        missing = [key for key, vector in zip(keys, vectors) if vector is None]
+        if missing and self.store is not None:
+            found = self.store.get_many(self.namespace, missing)
+            for i, key in enumerate(keys):
+                if vectors[i] is None and key in found:
+                    vectors[i] = found[key].tolist()
+                    self._lru_put(key, vectors[i])
+                    self.stats["disk_hits"] += 1
+        return vectors, keys
+
+    def remember(self, keys: Sequence[str], vectors: Sequence[List[float]]):
+        """외부에서 계산한 임베딩을 캐시에 기록 (배치 파이프라인용, 미스로 집계)"""
+        self.stats["misses"] += len(keys)
+        for key, vector in zip(keys, vectors):
+            self._lru_put(key, vector)
+        if self.store is not None:
+            self.store.put_many(self.namespace, zip(keys, vectors))
+
+    def _embed_missing(self, texts: Sequence[str], embed_fn) -> List[List[float]]:
+        vectors, keys = self.lookup(texts)
+        pending: Dict[str, str] = {}
+        for text, key, vector in zip(texts, keys, vectors):
+            if vector is None:
+                pending.setdefault(key, normalize_text(text))
+
+        if pending:
+            self.stats["misses"] += len(pending)
+            computed = dict(zip(pending.keys(), embed_fn(list(pending.values()))))
+            for key, vector in computed.items():
+                self._lru_put(key, vector)
+            if self.store is not None:
+                self.store.put_many(self.namespace, computed.items())
+            vectors = [computed[key] if vector is None else vector
+                       for key, vector in zip(keys, vectors)]
+        return vectors
+
+    # --------------------------
+    # Embeddings 인터페이스
+    # --------------------------
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed_missing([text], lambda texts: [self.base.embed_query(texts[0])])[0]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not self.cache_documents:
+            return self.base.embed_documents(texts)
+        return self._embed_missing(texts, self.base.embed_documents)
@@ -1,6 +1,7 @@
 """
 LLM Factory Module
 Provider(openai/ollama)에 따라 적절한 LLM 인스턴스를 생성합니다.
+임베딩은 외부 서비스 없는 결정적 로컬 임베딩(local)도 지원합니다 (벤치마크/부하 테스트용).
 
 사용법:
     from core.llm.factory import create_chat_model, create_embeddings
@@ -14,12 +15,34 @@ Provider(openai/ollama)에 따라 적절한 LLM 인스턴스를 생성합니다.
         model="llama3.1:8b",
         base_url="http://localhost:11434"
     )
+
+    # 로컬 해싱 임베딩 (384차원)
+    embeddings = create_embeddings(provider="local", model="hash-384")
 """
 
+import re
 from typing import Optional, Union
 from langchain_core.language_models import BaseChatModel
 from langchain_core.embeddings import Embeddings
 
+_HASH_MODEL = re.compile(r"hash(?:-(\d+))?")
+DEFAULT_LOCAL_EMBEDDING_MODEL = "hash-384"
+
+
+def resolve_local_embedding_model(model: Optional[str]) -> str:
+    """
+    local 임베딩 모델명 결정 (RAG_EMBEDDING_MODEL이 OpenAI 모델명 등이면 기본 해싱 모델)
+
+    Examples:
+        >>> resolve_local_embedding_model("hash-128")
+        'hash-128'
+        >>> resolve_local_embedding_model("text-embedding-3-small")
+        'hash-384'
+    """
+    if model and _HASH_MODEL.fullmatch(model):
+        return model
+    return DEFAULT_LOCAL_EMBEDDING_MODEL
+
 
 def create_chat_model(
     provider: str,
@@ -69,19 +92,21 @@ def create_embeddings(
     Embedding 모델 인스턴스 생성 (RAG 벡터 검색용)
 
     Args:
-        provider: "openai" 또는 "ollama"
-        model: 임베딩 모델명 (예: "text-embedding-3-small", "nomic-embed-text")
+        provider: "openai", "ollama" 또는 "local" (문자 n-gram 해싱, 외부 호출 없음)
+        model: 임베딩 모델명 (예: "text-embedding-3-small", "nomic-embed-text",
+               local은 "hash-<차원>", 차원 생략 시 384)
         base_url: Ollama 서버 URL (ollama일 때만 사용)
 
     Returns:
         LangChain Embeddings 인스턴스
 
     Raises:
-        ValueError: 지원하지 않는 provider일 경우
+        ValueError: 지원하지 않는 provider 또는 local 모델명이 잘못된 경우
 
     Examples:
         >>> embeddings = create_embeddings("openai", "text-embedding-3-small")
         >>> embeddings = create_embeddings("ollama", "nomic-embed-text")
+        >>> embeddings = create_embeddings("local", "hash-384")
     """
     if provider == "ollama":
         from langchain_ollama import OllamaEmbeddings
@@ -92,5 +117,16 @@ def create_embeddings(
     elif provider == "openai":
         from langchain_openai import OpenAIEmbeddings
         return OpenAIEmbeddings(model=model)
+    elif provider == "local":
+        from core.llm.hashing_embeddings import HashingEmbeddings
+        match = _HASH_MODEL.fullmatch(model)
+        if match is None:
+            raise ValueError(
+                f"local 임베딩 모델명은 'hash' 또는 'hash-<차원>' 형식이어야 합니다: {model}"
+            )
+        return HashingEmbeddings(dimension=int(match.group(1) or 384))
     else:
-        raise ValueError(f"지원하지 않는 Embedding provider입니다: {provider}. 'openai' 또는 'ollama'를 사용하세요.")
+        raise ValueError(
+            f"지원하지 않는 Embedding provider입니다: {provider}. "
+            "'openai', 'ollama' 또는 'local'을 사용하세요."
+        )
@@ -0,0 +1,92 @@
+"""
+Hashing Embeddings
+외부 서비스 없이 동작하는 결정적 로컬 임베딩 (벤치마크/부하 테스트/오프라인 개발용)
+
+- 정규화 텍스트(NFC, 소문자, 공백 정리)의 문자 n-gram(기본 1~3)을
+  feature hashing으로 dimension 차원에 누적
+    해시: 유니코드 코드포인트 배열에 FNV-1a(64bit)를 n-gram 단위로 벡터 연산
+          (프로세스/머신이 달라도 같은 값)
+    부호: 해시 최상위 비트로 ±1 (해시 충돌 상쇄)
+- 배치 전체를 한 번에 계산 (문서 경계를 넘는 n-gram 제외 → bincount 한 번에 문서×차원 행렬)
+- 빈도는 log(1 + tf)로 완화 후 L2 정규화 (코사인 = 내적, FAISS L2 거리와 순위 일치)
+- 의미 유사도는 없음 (어휘 겹침 기반) → 검색 품질 평가가 아니라 지연/처리량 측정용
+
+사용법:
+    embeddings = create_embeddings(provider="local", model="hash-384")
+    embeddings = HashingEmbeddings(dimension=384)
+    vectors = embeddings.embed_documents(["연차휴가는 15일", "근무시간은 8시간"])
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from core.llm.embedding_cache import normalize_text
+
+_FNV_OFFSET = np.uint64(0xCBF29CE484222325)
+_FNV_PRIME = np.uint64(0x100000001B3)
+_SPACE = ord(" ")
+
+
+class HashingEmbeddings(Embeddings):
+    """
+    문자 n-gram feature hashing 임베딩
+    """
+
+    def __init__(self, dimension: int = 384, ngram_range: Tuple[int, int] = (1, 3)):
+        """
+        Args:
+            dimension: 벡터 차원
+            ngram_range: 문자 n-gram 길이 범위 (최소, 최대)
+        """
+        if dimension <= 0:
+            raise ValueError(f"dimension은 1 이상이어야 합니다: {dimension}")
+        if not 1 <= ngram_range[0] <= ngram_range[1]:
+            raise ValueError(f"잘못된 ngram_range: {ngram_range}")
+        self.dimension = dimension
+        self.ngram_range = ngram_range
+
+    def _vectorize(self, texts: Sequence[str]) -> np.ndarray:
+        """텍스트 배치 → (문서 수, dimension) float32 행렬"""
+        dim = self.dimension
+        counts = np.zeros(len(texts) * dim, dtype=np.float64)
+        if not texts:
+            return counts.reshape(0, dim).astype(np.float32)
+
+        # 문서마다 앞뒤 공백 (단어 경계 n-gram), 코드포인트 배열로 이어 붙임
+        codes = [
+            np.frombuffer(f" {normalize_text(text).lower()} ".encode("utf-32-le"), dtype=np.uint32)
+            for text in texts
+        ]
+        owner = np.repeat(np.arange(len(texts)), [len(c) for c in codes])
+        flat = np.concatenate(codes).astype(np.uint64)
+
+        with np.errstate(over="ignore"):
+            for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+                count = len(flat) - n + 1
+                if count <= 0:
+                    break
+                hashes = np.full(count, _FNV_OFFSET ^ np.uint64(n), dtype=np.uint64)
+                for j in range(n):
+                    hashes = (hashes ^ flat[j:j + count]) * _FNV_PRIME
+                # 문서 경계를 넘거나 공백으로 시작하고 끝나는 n-gram 제외 (빈 텍스트는 0 벡터)
+                same_doc = owner[:count] == owner[n - 1:]
+                keep = same_doc & ((flat[:count] != _SPACE) | (flat[n - 1:] != _SPACE))
+                hashes = hashes[keep]
+                hashes ^= hashes >> np.uint64(29)
+                signs = np.where(hashes >> np.uint64(63), -1.0, 1.0)
+                buckets = (hashes % np.uint64(dim)).astype(np.int64)
+                counts += np.bincount(owner[:count][keep] * dim + buckets, weights=signs,
+                                      minlength=len(texts) * dim)
+
+        matrix = counts.reshape(len(texts), dim)
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return (matrix / np.maximum(norms, 1e-12)).astype(np.float32)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._vectorize(texts).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._vectorize([text])[0].tolist()
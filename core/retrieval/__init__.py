@@ -0,0 +1,60 @@
+"""
+Retrieval Module
+RAG 검색 단계
+(조문 직접 조회, FAQ 색인, 수치 사실 테이블, 적응형 top-k, 추출 응답, 문맥 압축,
+ 키워드 역색인, 하이브리드 결합, 부모-자식 확장, 인덱스 버전 디렉토리, 샤드 병렬 검색,
+ mmap 인덱스 포맷, 벡터 양자화)
+"""
+
+from core.retrieval.adaptive import AdaptiveKConfig, select_adaptive
+from core.retrieval.article_index import ArticleIndex
+from core.retrieval.bm25 import BM25Index, tokenize
+from core.retrieval.compression import ContextCompressor
+from core.retrieval.extractive import ExtractiveAnswer, ExtractiveAnswerer
+from core.retrieval.fact_table import Fact, FactTable
+from core.retrieval.faq_index import FAQEntry, FAQIndex, FAQMatch, load_faq_entries
+from core.retrieval.hybrid import HybridRetriever, reciprocal_rank_fusion
+from core.retrieval.index_versions import (
+    create_version_dir,
+    prune_versions,
+    publish_version,
+    resolve_index_path,
+)
+from core.retrieval.mmap_index import has_mmap_index, load_mmap_index, save_mmap_index
+from core.retrieval.parent_store import ParentStore, estimate_tokens
+from core.retrieval.sharded import SearchFilter, Shard, ShardedRetriever
+from core.retrieval.quantized import QuantizationConfig, QuantizedFAISS, benchmark_quantization
+
+__all__ = [
+    "AdaptiveKConfig",
+    "select_adaptive",
+    "ArticleIndex",
+    "BM25Index",
+    "tokenize",
+    "ContextCompressor",
+    "ExtractiveAnswer",
+    "ExtractiveAnswerer",
+    "Fact",
+    "FactTable",
+    "FAQEntry",
+    "FAQIndex",
+    "FAQMatch",
+    "load_faq_entries",
+    "HybridRetriever",
+    "reciprocal_rank_fusion",
+    "create_version_dir",
+    "prune_versions",
+    "publish_version",
+    "resolve_index_path",
+    "has_mmap_index",
+    "load_mmap_index",
+    "save_mmap_index",
+    "ParentStore",
+    "estimate_tokens",
+    "SearchFilter",
+    "Shard",
+    "ShardedRetriever",
+    "QuantizationConfig",
+    "QuantizedFAISS",
+    "benchmark_quantization",
+]
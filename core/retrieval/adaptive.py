@@ -0,0 +1,108 @@
+"""
+Adaptive Top-k
+질문마다 검색 결과 개수를 점수 분포로 결정 (고정 RAG_TOP_K 대신)
+
+- 후보 max_k개를 검색한 뒤 순서대로
+    1) 절대 임계값: 벡터 검색 L2 거리가 max_distance를 넘는 결과 제외
+    2) 점수 간격: 인접 결과 점수 차이가 후보 전체 점수 폭의 score_gap 이상이면 그 앞에서 자름
+       (1위가 압도적인 쉬운 질문 → 1~2개, 점수가 고르게 분포한 어려운 질문 → max_k개까지)
+    3) MMR(선택): 관련도와 이미 고른 결과와의 중복도(토큰 Jaccard)를 함께 고려해 재선택
+- 결과 개수는 항상 min_k ~ max_k (min_k개는 임계값과 상관없이 유지)
+- 점수 방향: 벡터 검색은 L2 거리(낮을수록 관련), 하이브리드는 RRF 점수(높을수록 관련)
+  → 절대 임계값은 벡터 검색에만 적용, 점수 간격은 척도와 무관해 둘 다 적용
+
+사용법:
+    config = AdaptiveKConfig(min_k=1, max_k=6, score_gap=0.5)
+    docs = select_adaptive(scored_docs, config, higher_is_better=False)
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+from core.retrieval.bm25 import tokenize
+
+
+@dataclass
+class AdaptiveKConfig:
+    """적응형 top-k 설정"""
+    min_k: int = 1
+    max_k: int = 6  # 검색 후보 수 = 최대 결과 수
+    max_distance: Optional[float] = None  # 벡터 검색 L2 거리 상한 (None이면 미사용)
+    score_gap: float = 0.5  # 후보 점수 폭 대비 끊을 간격 비율 (0이면 미사용)
+    mmr: bool = False
+    mmr_lambda: float = 0.7  # 1이면 관련도만, 0이면 다양성만
+
+    def __post_init__(self):
+        if not 1 <= self.min_k <= self.max_k:
+            raise ValueError(f"1 <= min_k({self.min_k}) <= max_k({self.max_k})여야 합니다.")
+
+
+def _gap_cutoff(scores: Sequence[float], min_k: int, score_gap: float) -> int:
+    """점수 간격이 전체 폭의 score_gap 이상인 첫 지점 (없으면 전체)"""
+    if score_gap <= 0 or len(scores) < 3:
+        return len(scores)
+    spread = abs(scores[0] - scores[-1])
+    if spread == 0:
+        return len(scores)
+    for i in range(max(min_k, 1), len(scores)):
+        if abs(scores[i - 1] - scores[i]) >= score_gap * spread:
+            return i
+    return len(scores)
+
+
+def _mmr(
+    docs: List[Tuple[Document, float]], k: int, mmr_lambda: float
+) -> List[Tuple[Document, float]]:
+    """관련도(순위 기반) - 중복도(토큰 Jaccard) 최대화 순서로 k개 선택"""
+    tokens = [set(tokenize(doc.page_content)) for doc, _ in docs]
+    relevance = [1 - i / len(docs) for i in range(len(docs))]
+    selected: List[int] = []
+    remaining = list(range(len(docs)))
+    while remaining and len(selected) < k:
+        def gain(i):
+            redundancy = max(
+                (len(tokens[i] & tokens[j]) / max(len(tokens[i] | tokens[j]), 1) for j in selected),
+                default=0.0,
+            )
+            return mmr_lambda * relevance[i] - (1 - mmr_lambda) * redundancy
+        best = max(remaining, key=gain)
+        selected.append(best)
+        remaining.remove(best)
+    return [docs[i] for i in selected]
+
+
+def select_adaptive(
+    scored_docs: Sequence[Tuple[Document, float]],
+    config: AdaptiveKConfig,
+    higher_is_better: bool,
+    max_k: Optional[int] = None,
+) -> List[Tuple[Document, float]]:
+    """
+    검색 후보(점수 순) → 적응형 개수의 결과
+
+    Args:
+        scored_docs: (문서, 점수) 리스트 - 관련도 순
+        higher_is_better: True면 RRF 점수, False면 L2 거리 (절대 임계값 적용)
+        max_k: 결과 상한 (None이면 config.max_k, 부모-자식 검색처럼 후보를 더 받을 때 지정)
+    """
+    max_k = max_k or config.max_k
+    docs = list(scored_docs)[:max_k]
+    if not docs:
+        return []
+
+    # 1) 절대 임계값 → 임계값 통과 후보 (min_k개는 유지)
+    passed = len(docs)
+    if config.max_distance is not None and not higher_is_better:
+        passed = max(sum(1 for _, score in docs if score <= config.max_distance), config.min_k)
+    pool = docs[:passed]
+
+    # 2) 점수 간격 → 결과 개수
+    keep = max(_gap_cutoff([score for _, score in pool], config.min_k, config.score_gap),
+               min(config.min_k, len(pool)))
+
+    # 3) MMR → 임계값 통과 후보 중 keep개를 다양하게 선택
+    if config.mmr:
+        return _mmr(pool, keep, config.mmr_lambda)
+    return pool[:keep]
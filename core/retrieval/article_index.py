@@ -0,0 +1,133 @@
+"""
+Article Index
+조문 직접 조회 테이블 (조 번호 / 조문 제목 → 청크 ID)
+
+- 조문 청커(chunk_articles)가 남긴 metadata(section, article_id, article_title, part)로 구성
+- 질문에 "제12조", "제12조의2", "제3장 제5조" 같은 조 번호나 조문 제목("연차휴가 사용 촉진")이
+  있으면 벡터 검색 없이 해당 조문 청크를 그대로 반환 (임베딩 호출 0회)
+- 조 번호는 장마다 다시 시작하므로 "제12조"가 여러 장에 있으면 제목/장 표기로 좁히고,
+  그래도 max_articles개를 넘으면 조회 실패(빈 리스트) → 기존 검색으로 폴백
+- 인덱스 디렉토리에 articles.json으로 저장
+
+사용법:
+    articles = ArticleIndex.from_vectorstore(vectorstore)
+    articles.save(index_path)
+    doc_ids = ArticleIndex.load(index_path).lookup("제12조 내용 알려줘")
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_FILE = "articles.json"
+
+_ARTICLE_REF = re.compile(r"제\s*(\d+)\s*조(?:\s*의\s*(\d+))?")
+_CHAPTER_REF = re.compile(r"제\s*(\d+)\s*장")
+_SPACES = re.compile(r"\s+")
+
+
+def _compact(text: str) -> str:
+    return _SPACES.sub("", text)
+
+
+class ArticleIndex:
+    """
+    article_key("제1장 제12조") → 조문 정보 + 청크 ID(part 순)
+    """
+
+    def __init__(self, articles: Dict[str, dict], min_title_chars: int = 4):
+        """
+        Args:
+            articles: article_key → {"section", "article_id", "title", "doc_ids"}
+            min_title_chars: 제목 매칭에 쓸 최소 제목 길이 (공백 제외, "목적" 같은 짧은 제목 제외)
+        """
+        self.articles = articles
+        self.min_title_chars = min_title_chars
+        self._by_id: Dict[str, List[str]] = {}
+        self._by_title: Dict[str, List[str]] = {}
+        for key, article in articles.items():
+            self._by_id.setdefault(article["article_id"], []).append(key)
+            title = _compact(article["title"])
+            if len(title) >= min_title_chars:
+                self._by_title.setdefault(title, []).append(key)
+
+    @classmethod
+    def from_vectorstore(cls, vectorstore, **kwargs) -> "ArticleIndex":
+        """FAISS docstore에서 조문 청크(article_key metadata)만 모아 생성"""
+        parts: Dict[str, List[tuple]] = {}
+        articles: Dict[str, dict] = {}
+        for doc_id in vectorstore.index_to_docstore_id.values():
+            doc = vectorstore.docstore.search(doc_id)
+            key = doc.metadata.get("article_key")
+            if not key:
+                continue
+            articles.setdefault(key, {
+                "section": doc.metadata.get("section", ""),
+                "article_id": doc.metadata["article_id"],
+                "title": doc.metadata.get("article_title", ""),
+            })
+            # 부모-자식 인덱스면 자식 순번(child)까지 정렬
+            position = (doc.metadata.get("part", 0), doc.metadata.get("child", 0))
+            parts.setdefault(key, []).append((position, doc_id))
+        for key, article in articles.items():
+            article["doc_ids"] = [doc_id for _, doc_id in sorted(parts[key])]
+        return cls(articles, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def lookup(self, question: str, max_articles: int = 2) -> List[str]:
+        """
+        질문에서 조 번호/제목을 찾아 조문 청크 ID 반환
+
+        Returns:
+            청크 ID 리스트 (조문 순서, 같은 조문은 part 순) - 해당 없음/모호하면 []
+        """
+        refs = {
+            f"제{num}조" + (f"의{sub}" if sub else "")
+            for num, sub in _ARTICLE_REF.findall(question)
+        }
+        chapters = {f"제{num}장" for num in _CHAPTER_REF.findall(question)}
+
+        by_ref: Set[str] = {key for ref in refs for key in self._by_id.get(ref, [])}
+        if chapters:
+            by_ref = {key for key in by_ref
+                      if any(key.startswith(chapter + " ") for chapter in chapters)}
+        compact = _compact(question)
+        by_title: Set[str] = {key for title, keys in self._by_title.items()
+                              if title in compact for key in keys}
+
+        if by_ref and by_title:
+            # 조 번호 + 제목이 함께 있으면 둘 다 맞는 조문 우선
+            keys = (by_ref & by_title) or (by_ref | by_title)
+        else:
+            keys = by_ref or by_title
+        if not keys or len(keys) > max_articles:
+            return []
+
+        order = {key: n for n, key in enumerate(self.articles)}
+        return [doc_id for key in sorted(keys, key=order.get)
+                for doc_id in self.articles[key]["doc_ids"]]
+
+    # --------------------------
+    # 저장/로드
+    # --------------------------
+    def save(self, index_path: Union[str, Path]):
+        path = Path(index_path) / ARTICLE_FILE
+        data = {"min_title_chars": self.min_title_chars, "articles": self.articles}
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, index_path: Union[str, Path]) -> Optional["ArticleIndex"]:
+        """articles.json 로드 (없거나 조문이 없으면 None)"""
+        path = Path(index_path) / ARTICLE_FILE
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not data["articles"]:
+            return None
+        return cls(data["articles"], min_title_chars=data["min_title_chars"])
@@ -0,0 +1,160 @@
+"""
+BM25 Index
+한국어 문자 n-gram 기반 역색인 + BM25 점수
+
+- 토큰화: 단어(공백/구두점 기준) 원형 + 한글 음절 bigram
+  → "육아휴직을" = [육아휴직을, 육아, 아휴, 휴직, 직을] (조사가 붙어도 매칭)
+  → "15일", "제15조" 같은 숫자/조항 표기는 단어 원형으로 정확 매칭
+- 형태소 분석기 없이 동작 (추가 의존성 없음)
+- FAISS docstore ID 기준으로 색인 → 벡터 검색 결과와 바로 결합 가능
+- 인덱스 디렉토리에 bm25.json으로 저장
+
+사용법:
+    bm25 = BM25Index.from_documents(ids, documents)
+    bm25.save(index_path)
+    hits = BM25Index.load(index_path).search("육아휴직 기간", k=10)
+"""
+
+import json
+import logging
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+BM25_FILE = "bm25.json"
+
+_WORD = re.compile(r"[0-9A-Za-z가-힣]+")
+_HANGUL_RUN = re.compile(r"[가-힣]{2,}")
+
+
+def tokenize(text: str) -> List[str]:
+    """단어 원형 + 한글 음절 bigram 토큰"""
+    tokens = []
+    for word in _WORD.findall(text.lower()):
+        tokens.append(word)
+        for run in _HANGUL_RUN.findall(word):
+            if len(run) > 2 or run != word:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+class BM25Index:
+    """
+    메모리 역색인 (term → 문서 번호/빈도 배열)
+    """
+
+    def __init__(
+        self,
+        doc_ids: List[str],
+        doc_lens: Sequence[int],
+        postings: Dict[str, Tuple[Sequence[int], Sequence[int]]],
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        """
+        Args:
+            doc_ids: 문서 번호 → docstore ID
+            doc_lens: 문서별 토큰 수
+            postings: term → (문서 번호 목록, 빈도 목록)
+            k1: 빈도 포화 계수
+            b: 문서 길이 정규화 계수
+        """
+        self.doc_ids = doc_ids
+        self.doc_lens = np.asarray(doc_lens, dtype=np.float32)
+        self.postings = {
+            term: (np.asarray(docs, dtype=np.int32), np.asarray(tfs, dtype=np.float32))
+            for term, (docs, tfs) in postings.items()
+        }
+        self.k1 = k1
+        self.b = b
+        self.avg_len = float(self.doc_lens.mean()) if len(doc_ids) else 0.0
+
+    @classmethod
+    def from_documents(
+        cls, ids: Sequence[str], documents: Sequence[Document], **kwargs
+    ) -> "BM25Index":
+        """문서 목록으로 색인 생성"""
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        doc_lens = []
+        for n, doc in enumerate(documents):
+            counts = Counter(tokenize(doc.page_content))
+            doc_lens.append(sum(counts.values()))
+            for term, tf in counts.items():
+                docs, tfs = postings.setdefault(term, ([], []))
+                docs.append(n)
+                tfs.append(tf)
+        return cls(list(ids), doc_lens, postings, **kwargs)
+
+    @classmethod
+    def from_vectorstore(cls, vectorstore, **kwargs) -> "BM25Index":
+        """FAISS 벡터스토어의 docstore 전체로 색인 생성 (ID 공유)"""
+        ids = list(vectorstore.index_to_docstore_id.values())
+        return cls.from_documents(ids, [vectorstore.docstore.search(i) for i in ids], **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        BM25 검색
+
+        Returns:
+            (docstore ID, 점수) 리스트 - 점수 내림차순, 매칭 없는 문서 제외
+        """
+        n_docs = len(self.doc_ids)
+        if not n_docs:
+            return []
+        scores = np.zeros(n_docs, dtype=np.float32)
+        norm = self.k1 * (1 - self.b + self.b * self.doc_lens / max(self.avg_len, 1e-9))
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            docs, tfs = posting
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            scores[docs] += idf * tfs * (self.k1 + 1) / (tfs + norm[docs])
+
+        matched = np.flatnonzero(scores)
+        if not len(matched):
+            return []
+        top = matched[np.argsort(-scores[matched], kind="stable")[:k]]
+        return [(self.doc_ids[i], float(scores[i])) for i in top]
+
+    # --------------------------
+    # 저장/로드
+    # --------------------------
+    def save(self, index_path: Union[str, Path]):
+        path = Path(index_path) / BM25_FILE
+        data = {
+            "k1": self.k1,
+            "b": self.b,
+            "doc_ids": self.doc_ids,
+            "doc_lens": self.doc_lens.astype(int).tolist(),
+            "postings": {
+                term: [docs.tolist(), tfs.astype(int).tolist()]
+                for term, (docs, tfs) in self.postings.items()
+            },
+        }
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, index_path: Union[str, Path]) -> Optional["BM25Index"]:
+        """bm25.json 로드 (없으면 None)"""
+        path = Path(index_path) / BM25_FILE
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(
+            data["doc_ids"],
+            data["doc_lens"],
+            {term: tuple(value) for term, value in data["postings"].items()},
+            k1=data["k1"],
+            b=data["b"],
+        )
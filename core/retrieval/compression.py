@@ -0,0 +1,124 @@
+"""
+Context Compression
+LLM 생성 전 검색 문서에서 질문과 관련된 문장만 남겨 프롬프트 토큰 절감
+
+- 검색 문서 전체를 문장으로 나눈 뒤 모든 후보 문장을 한 번에 점수 계산 (행렬 연산)
+    어휘 점수: 질문 토큰(단어 + 한글 bigram) × 문장 포함 여부 행렬의 행 평균
+    의미 점수: 문장 벡터 행렬 @ 질문 벡터 (코사인, 문장 임베딩은 CachedEmbeddings로 재사용)
+- 점수 순으로 token_budget까지 문장 선택 (1위 문장은 항상 포함)
+- 선택한 문장은 원래 순서(문서 순위 → 문서 안 순서)로 다시 배치,
+  조문 머리 줄("[제1장 총칙] 제12조 제목")과 metadata(출처/페이지)는 그대로 유지
+- 문서 전체가 이미 token_budget 안이면 압축하지 않음 (임베딩 호출 없음)
+
+사용법:
+    compressor = ContextCompressor(sentence_embeddings, token_budget=600)
+    docs = compressor.compress("연차는 며칠인가요?", docs, embeddings.embed_query)
+"""
+
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from core.retrieval.bm25 import tokenize
+from core.retrieval.extractive import sentences_of, split_paragraphs
+from core.retrieval.parent_store import estimate_tokens
+
+
+class ContextCompressor:
+    """
+    질문 관련 문장 선택기 (토큰 예산)
+    """
+
+    def __init__(
+        self,
+        embeddings: Optional[Embeddings] = None,
+        token_budget: int = 600,
+        lexical_weight: float = 0.5,
+    ):
+        """
+        Args:
+            embeddings: 문장 임베딩 (None이면 어휘 점수만 사용,
+                        cache_documents=True인 CachedEmbeddings 권장)
+            token_budget: 압축 후 문맥 토큰 상한 (estimate_tokens 기준)
+            lexical_weight: 결합 점수에서 어휘 점수 비중 (나머지는 의미 점수)
+        """
+        self.embeddings = embeddings
+        self.token_budget = token_budget
+        self.lexical_weight = lexical_weight if embeddings is not None else 1.0
+
+    def _lexical(self, question: str, sentences: Sequence[str]) -> np.ndarray:
+        vocab = {token: i for i, token in enumerate(dict.fromkeys(tokenize(question)))}
+        if not vocab:
+            return np.zeros(len(sentences))
+        hits = np.zeros((len(sentences), len(vocab)), dtype=np.float32)
+        for row, sentence in enumerate(sentences):
+            cols = [vocab[token] for token in set(tokenize(sentence)) if token in vocab]
+            hits[row, cols] = 1.0
+        return hits.mean(axis=1)
+
+    def _semantic(self, query: Sequence[float], sentences: Sequence[str]) -> np.ndarray:
+        query = np.asarray(query, dtype=np.float32)
+        vectors = np.asarray(self.embeddings.embed_documents(list(sentences)), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1) * max(float(np.linalg.norm(query)), 1e-9)
+        return np.clip(vectors @ query / np.maximum(norms, 1e-9), 0.0, 1.0)
+
+    def compress(
+        self,
+        question: str,
+        docs: Sequence[Document],
+        embed_query: Optional[Callable[[str], List[float]]] = None,
+    ) -> List[Document]:
+        """
+        검색 문서 → 관련 문장만 남긴 문서 (순서/metadata 유지, 문장이 모두 빠진 문서는 제외)
+
+        Args:
+            embed_query: 질문 임베딩 함수 (RAG 검색과 같은 CachedEmbeddings.embed_query 권장,
+                         None이면 self.embeddings.embed_query)
+        """
+        docs = list(docs)
+        total = sum(estimate_tokens(d.page_content) for d in docs)
+        if self.token_budget <= 0 or total <= self.token_budget:
+            return docs
+
+        headers: List[str] = []
+        candidates: List[Tuple[int, str]] = []  # (문서 순번, 문장)
+        for n, doc in enumerate(docs):
+            lines = doc.page_content.splitlines()
+            headers.append(lines[0] if "article_key" in doc.metadata and lines else "")
+            candidates.extend((n, sentence) for paragraph in split_paragraphs(doc)
+                              for sentence in sentences_of(paragraph))
+        if not candidates:
+            return docs
+
+        sentences = [sentence for _, sentence in candidates]
+        scores = self.lexical_weight * self._lexical(question, sentences)
+        if self.lexical_weight < 1:
+            query = (embed_query or self.embeddings.embed_query)(question)
+            scores = scores + (1 - self.lexical_weight) * self._semantic(query, sentences)
+
+        # 점수 순으로 예산까지 선택 (머리 줄 토큰 포함, 1위 문장은 항상)
+        budget = self.token_budget
+        selected = set()
+        used_headers = set()
+        for i in np.argsort(-scores, kind="stable"):
+            n = candidates[i][0]
+            cost = estimate_tokens(sentences[i])
+            if n not in used_headers:
+                cost += estimate_tokens(headers[n])
+            if selected and cost > budget:
+                continue
+            selected.add(int(i))
+            used_headers.add(n)
+            budget -= cost
+
+        compressed = []
+        for n, doc in enumerate(docs):
+            kept = [sentences[i] for i in sorted(selected) if candidates[i][0] == n]
+            if not kept:
+                continue
+            content = "\n".join(filter(None, [headers[n], " ".join(kept)]))
+            metadata = {**doc.metadata, "compressed": True}
+            compressed.append(Document(page_content=content, metadata=metadata))
+        return compressed
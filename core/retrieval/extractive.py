@@ -0,0 +1,219 @@
+"""
+Extractive Answer
+검색된 청크에서 질문에 답하는 문장을 골라 LLM 생성 없이 응답
+
+- 청크를 문장 단위로 나눈 뒤 문장마다 점수 계산
+    어휘 점수: 질문 토큰(단어 + 한글 bigram) 중 문장에 있는 비율
+    의미 점수: 질문 벡터와 문장 벡터의 코사인 유사도
+- 1위 문장 점수 ≥ min_score이고 2위와 차이 ≥ min_margin일 때만 응답 (확신이 낮으면 None → LLM)
+- "몇/며칠/얼마/기간" 같은 수치 질문(is_quantity_question)은 숫자가 있는 문장만 후보
+- 문장 임베딩은 cache_documents=True인 CachedEmbeddings를 쓰면 규정 문장이 반복될수록 호출이 사라짐
+- 응답에 출처(파일, 페이지, 조문) 표기
+
+사용법:
+    extractor = ExtractiveAnswerer(sentence_embeddings, min_score=0.6)
+    extracted = extractor.answer("기본 근무시간은?", docs)  # None이면 LLM 사용
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from core.retrieval.bm25 import tokenize
+
+# 문장 끝 마침표/물음표 뒤 공백에서 분할 ("1.5배"처럼 공백 없는 마침표는 유지)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_MARKUP = re.compile(r"\*\*|^#+\s*|^\s*[-*]\s+")
+_DIGIT = re.compile(r"\d")
+_DIGIT_SPACE = re.compile(r"(?<=\d)\s+(?=[가-힣%])")
+# 새 문단으로 보는 줄 머리 (항 번호, 글머리 기호, "1." 목록)
+_ITEM_START = re.compile(r"^([①-⑳•·※▶-]|\d+[.)]\s)")
+# 수치로 답해야 하는 질문
+_QUANTITY_QUESTION = re.compile(r"몇|며칠|얼마|언제|기간|일수|금액|비율|한도")
+
+
+def is_quantity_question(question: str) -> bool:
+    """일수/기간/금액처럼 수치로 답해야 하는 질문인지"""
+    return _QUANTITY_QUESTION.search(question) is not None
+
+
+@dataclass
+class ExtractiveAnswer:
+    """추출 응답"""
+    text: str  # 응답 (문장 + 출처)
+    sentence: str
+    citation: str
+    score: float
+    lexical: float
+    semantic: float
+    margin: float  # 2위 문장과의 점수 차이
+
+
+def _clean_line(line: str) -> str:
+    line = _MARKUP.sub("", line).strip()
+    return _DIGIT_SPACE.sub("", line)
+
+
+def split_paragraphs(doc: Document) -> List[str]:
+    """
+    청크 → 문단 목록 (조문 머리 줄, 표 구분선 제외)
+
+    - PDF 줄바꿈으로 끊긴 문장은 이어 붙임 (항/글머리 기호로 시작하는 줄은 새 문단)
+    - 표 행은 한 문단 ("| 용어 | 설명 |" → "용어: 설명", 다음 줄로 넘어간 셀도 이어 붙임)
+    - "7 시간 30 분" 같은 PDF 띄어쓰기는 "7시간 30분"으로 보정
+    """
+    lines = doc.page_content.splitlines()
+    if "article_key" in doc.metadata and lines:
+        lines = lines[1:]  # "[제1장 총칙] 제12조 제목"은 출처로 사용
+    paragraphs: List[str] = []
+    continued = in_table = False
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("|"):
+            cells = [_clean_line(cell) for cell in stripped.strip("|").split("|")]
+            in_table = not stripped.endswith("|")
+            continued = False
+            if not all(set(cell) <= set("-: ") for cell in cells):
+                paragraphs.append(": ".join(cell for cell in cells if cell))
+            continue
+        if in_table and paragraphs:
+            # 셀 내용이 다음 줄로 넘어간 표 행
+            paragraphs[-1] += " " + ": ".join(
+                cell for cell in (_clean_line(c) for c in stripped.strip("|").split("|")) if cell)
+            in_table = not stripped.endswith("|")
+            continue
+        line = _clean_line(line)
+        if not line:
+            continued = False
+            continue
+        if continued and not _ITEM_START.match(line):
+            paragraphs[-1] += " " + line
+        else:
+            paragraphs.append(line)
+        continued = not line.endswith((".", "!", "?"))
+    return paragraphs
+
+
+def split_sentences(doc: Document) -> List[str]:
+    """청크 → 문장 목록 (문단을 문장 끝 기준으로 분할, 짧은 조각 제외)"""
+    return [sentence for paragraph in split_paragraphs(doc)
+            for sentence in sentences_of(paragraph)]
+
+
+def sentences_of(paragraph: str) -> List[str]:
+    return [s.strip() for s in _SENTENCE_END.split(paragraph) if len(s.strip()) >= 8]
+
+
+def citation(doc: Document) -> str:
+    """출처 표기 ("02_회사규정.pdf p.13 · 제4장 제3조 근무시간")"""
+    parts = []
+    source = doc.metadata.get("source")
+    if source:
+        page = doc.metadata.get("page")
+        suffix = f" p.{int(page) + 1}" if isinstance(page, int) else ""
+        parts.append(Path(str(source)).name + suffix)
+    if doc.metadata.get("article_id"):
+        article = " ".join(filter(None, (
+            doc.metadata.get("section", "").split(" ")[0],
+            doc.metadata["article_id"],
+            doc.metadata.get("article_title", ""),
+        )))
+        parts.append(article)
+    return " · ".join(parts)
+
+
+class ExtractiveAnswerer:
+    """
+    문장 추출 응답기 (확신이 높을 때만 응답)
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        min_score: float = 0.6,
+        min_margin: float = 0.05,
+        lexical_weight: float = 0.5,
+        max_sentences: int = 40,
+    ):
+        """
+        Args:
+            embeddings: 문장 임베딩 (문장 캐시를 켠 CachedEmbeddings 권장)
+            min_score: 응답할 최소 결합 점수 (0~1)
+            min_margin: 1위와 2위 문장의 최소 점수 차이
+            lexical_weight: 결합 점수에서 어휘 점수 비중 (나머지는 의미 점수)
+            max_sentences: 점수를 계산할 최대 문장 수 (검색 순위가 높은 청크부터)
+        """
+        self.embeddings = embeddings
+        self.min_score = min_score
+        self.min_margin = min_margin
+        self.lexical_weight = lexical_weight
+        self.max_sentences = max_sentences
+
+    def _lexical(self, question_tokens: set, sentence: str) -> float:
+        if not question_tokens:
+            return 0.0
+        return len(question_tokens & set(tokenize(sentence))) / len(question_tokens)
+
+    def _semantic(self, query: Sequence[float], sentences: Sequence[str]) -> np.ndarray:
+        query = np.asarray(query, dtype=np.float32)
+        vectors = np.asarray(self.embeddings.embed_documents(list(sentences)), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1) * max(float(np.linalg.norm(query)), 1e-9)
+        return np.clip(vectors @ query / np.maximum(norms, 1e-9), 0.0, 1.0)
+
+    def answer(
+        self,
+        question: str,
+        docs: Sequence[Document],
+        embed_query: Optional[Callable[[str], List[float]]] = None,
+    ) -> Optional[ExtractiveAnswer]:
+        """
+        검색된 문서에서 답 문장 추출
+
+        Args:
+            embed_query: 질문 임베딩 함수 (RAG 검색과 같은 CachedEmbeddings.embed_query 권장,
+                         None이면 self.embeddings.embed_query)
+
+        Returns:
+            ExtractiveAnswer - 확신이 낮거나 후보가 없으면 None (LLM으로 폴백)
+        """
+        needs_number = is_quantity_question(question)
+        candidates = []  # (문장, 문서)
+        for doc in docs:
+            for sentence in split_sentences(doc):
+                if needs_number and not _DIGIT.search(sentence):
+                    continue
+                candidates.append((sentence, doc))
+        candidates = candidates[:self.max_sentences]
+        if not candidates:
+            return None
+
+        question_tokens = set(tokenize(question))
+        lexical = np.array([self._lexical(question_tokens, s) for s, _ in candidates])
+        semantic = np.zeros(len(candidates))
+        if self.lexical_weight < 1:
+            query = (embed_query or self.embeddings.embed_query)(question)
+            semantic = self._semantic(query, [s for s, _ in candidates])
+        scores = self.lexical_weight * lexical + (1 - self.lexical_weight) * semantic
+
+        order = np.argsort(-scores, kind="stable")
+        best = int(order[0])
+        margin = float(scores[best] - scores[order[1]]) if len(order) > 1 else float(scores[best])
+        if scores[best] < self.min_score or margin < self.min_margin:
+            return None
+
+        sentence, doc = candidates[best]
+        cite = citation(doc)
+        return ExtractiveAnswer(
+            text=f"{sentence}\n\n(출처: {cite})" if cite else sentence,
+            sentence=sentence,
+            citation=cite,
+            score=round(float(scores[best]), 4),
+            lexical=round(float(lexical[best]), 4),
+            semantic=round(float(semantic[best]), 4),
+            margin=round(margin, 4),
+        )
@@ -0,0 +1,188 @@
+"""
+Fact Table
+규정 수치 사실(연차 일수, 휴직 기간, 지급 비율 등) key/value 조회 테이블
+
+- 인덱스 빌드 시 extract_facts()가 조문에서 뽑은 사실을 facts.json으로 저장
+- 질문이 수치를 묻고("몇/며칠/얼마/기간…") 사실 주제어("연차", "질병휴직")가 단어 단위로 포함되면
+  검색·생성 없이 사실 문장 하나 + 출처로 바로 응답 (딕셔너리 조회 1회)
+- 가장 긴 주제어만 사용 ("연차휴가 신청" > "연차")
+- 후보 사실 좁히기
+    완결된 문장만 ("…중단하는 것을"처럼 잘린 조각 제외)
+    질문이 묻는 단위("며칠" → 일, "몇 번" → 회, "기간" → 일/주/개월/년)의 수치가 있는 문장만
+    질문의 다른 단어("경고")가 들어간 문장이 있으면 그 문장만
+- 남은 사실이 하나이거나 모두 같은 값을 말할 때만 응답, 값이 엇갈리면 모호 → None (RAG로 폴백)
+
+사용법:
+    table = FactTable.load(index_path)
+    facts = table.lookup("연차는 며칠인가요?")  # None이면 RAG 검색으로 진행
+"""
+
+import json
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+from core.retrieval.extractive import is_quantity_question
+
+FACTS_FILE = "facts.json"
+
+# 수치 + 단위 ("15일", "3개월", "300만 원", "15~25일")
+QUANTITY = re.compile(
+    r"(?P<value>\d+(?:\.\d+)?)\s*(?:~\s*\d+\s*)?(?P<unit>일|개월|년|시간|분|%|만\s*원|원|회|세|주|점)"
+)
+# 완결된 문장 끝 ("~한다.", "~됩니다", "~임")
+_SENTENCE_END = re.compile(r"(?:[다요음함됨임]\s*[.!]?|[.!])\s*$")
+# 질문이 묻는 단위 (앞에서부터 처음 맞는 항목, 기간은 마지막)
+_ASKED_UNITS = [
+    (re.compile(r"며칠|몇\s*일|일수"), {"일"}),
+    (re.compile(r"몇\s*(?:개월|달)"), {"개월"}),
+    (re.compile(r"몇\s*년"), {"년"}),
+    (re.compile(r"몇\s*시간"), {"시간"}),
+    (re.compile(r"몇\s*분"), {"분"}),
+    (re.compile(r"몇\s*(?:번|회)|횟수"), {"회"}),
+    (re.compile(r"몇\s*주"), {"주"}),
+    (re.compile(r"몇\s*(?:살|세)|나이"), {"세"}),
+    (re.compile(r"몇\s*(?:%|퍼센트|프로)|비율"), {"%"}),
+    (re.compile(r"얼마(?!나)|금액|몇\s*원"), {"원"}),
+    (re.compile(r"기간|얼마나|언제까지"), {"일", "주", "개월", "년"}),
+]
+# 질문 단어 끝 조사/어미 ("경고는" → "경고")
+_WORD_ENDING = re.compile(
+    r"(?:은|는|이|가|을|를|의|에|에서|으로|로|도|만|까지|이면|면|인가요|인가|나요|요)$"
+)
+_QUESTION_WORD = re.compile(r"몇|며칠|얼마|언제")
+
+
+def quantities(text: str) -> List[str]:
+    """문장의 수치 ("15일", "300만원" - 공백 제거)"""
+    return [re.sub(r"\s+", "", match.group(0)) for match in QUANTITY.finditer(text)]
+
+
+def _unit(quantity: str) -> str:
+    unit = QUANTITY.match(quantity).group("unit")
+    return "원" if unit.endswith("원") else unit
+
+
+def is_complete_sentence(text: str) -> bool:
+    """문장이 끝까지 이어졌는지 (PDF 줄바꿈/표에서 잘린 조각이 아닌지)"""
+    return _SENTENCE_END.search(text) is not None
+
+
+def asked_units(question: str) -> Optional[set]:
+    """질문이 묻는 수치 단위 (알 수 없으면 None)"""
+    for pattern, units in _ASKED_UNITS:
+        if pattern.search(question):
+            return units
+    return None
+
+# 주제어 뒤에 올 수 있는 것 (조사, 공백, 문장부호, 끝) - "연차수당"이 "연차"로 매칭되지 않도록
+_KEY_BOUNDARY = r"(?=[은는이가을를의도에와과로으만\s?.,!]|$)"
+
+
+@dataclass
+class Fact:
+    """조문에서 추출한 수치 사실"""
+    key: str  # 공백 없는 주제어 ("기본근무시간")
+    subject: str  # 표시용 주제어 ("기본근무시간")
+    text: str  # 사실 문장
+    citation: str  # 출처 ("02_회사규정.pdf p.13 · 제1장 제10조 근무시간")
+    article_key: Optional[str] = None
+    direct: bool = True  # 문장 자체에 주제어가 있는지 (False면 앞 문장에서 이어받음)
+
+
+class FactTable:
+    """
+    주제어 → 사실 목록
+    """
+
+    def __init__(self, facts: Sequence[Fact], max_facts: int = 4):
+        """
+        Args:
+            facts: 추출된 사실 (같은 주제어는 추출 순서 유지)
+            max_facts: 후보를 좁힌 뒤에도 이보다 많은 사실이 남으면 조회하지 않음 (RAG로 폴백)
+        """
+        self.facts = list(facts)
+        self.max_facts = max_facts
+        self._by_key: Dict[str, List[Fact]] = {}
+        for fact in self.facts:
+            self._by_key.setdefault(fact.key, []).append(fact)
+        # 긴 주제어부터 검사 (띄어쓰기 무시 패턴)
+        self._patterns = [
+            (key, re.compile(r"\s*".join(map(re.escape, key)) + _KEY_BOUNDARY))
+            for key in sorted(self._by_key, key=len, reverse=True)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.facts)
+
+    def keys(self) -> List[str]:
+        return list(self._by_key)
+
+    def lookup(self, question: str) -> Optional[List[Fact]]:
+        """
+        수치 질문 → 답이 되는 사실 하나
+
+        Returns:
+            [사실] - 수치 질문이 아니거나, 일치하는 주제어가 없거나, 후보 사실의 값이 엇갈리면 None
+        """
+        if not is_quantity_question(question):
+            return None
+        for key, pattern in self._patterns:
+            match = pattern.search(question)
+            if match:
+                rest = question[:match.start()] + " " + question[match.end():]
+                return self._resolve(self._by_key[key], rest, asked_units(question))
+        return None
+
+    def _resolve(self, facts: List[Fact], rest: str, units: Optional[set]) -> Optional[List[Fact]]:
+        """후보 사실 좁히기 → 하나 또는 모두 같은 값일 때만 [사실]"""
+        values = {}
+        for fact in facts:
+            if not is_complete_sentence(fact.text):
+                continue
+            found = [q for q in quantities(fact.text) if units is None or _unit(q) in units]
+            if found:
+                values[id(fact)] = tuple(sorted(set(found)))
+        candidates = [fact for fact in facts if id(fact) in values]
+
+        # 질문의 다른 단어("경고")가 있는 문장 우선
+        words = {_WORD_ENDING.sub("", word) for word in re.findall(r"[가-힣A-Za-z0-9]+", rest)}
+        words = {word for word in words if len(word) >= 2 and not _QUESTION_WORD.search(word)}
+        hits = {id(fact): sum(word in fact.text for word in words) for fact in candidates}
+        best = max(hits.values(), default=0)
+        if best:
+            candidates = [fact for fact in candidates if hits[id(fact)] == best]
+
+        if not candidates or len(candidates) > self.max_facts:
+            return None
+        if len({values[id(fact)] for fact in candidates}) > 1:
+            return None
+        # 주제어가 문장에 직접 나오는 사실 우선
+        return [next((fact for fact in candidates if fact.direct), candidates[0])]
+
+    @staticmethod
+    def format_answer(facts: Sequence[Fact]) -> str:
+        """사실 문장 + 출처 응답"""
+        citations = list(dict.fromkeys(fact.citation for fact in facts if fact.citation))
+        body = "\n".join(fact.text for fact in facts)
+        return f"{body}\n\n(출처: {'; '.join(citations)})" if citations else body
+
+    # --------------------------
+    # 저장/로드
+    # --------------------------
+    def save(self, index_path: Union[str, Path]):
+        path = Path(index_path) / FACTS_FILE
+        data = {"max_facts": self.max_facts, "facts": [asdict(fact) for fact in self.facts]}
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    @classmethod
+    def load(cls, index_path: Union[str, Path]) -> Optional["FactTable"]:
+        """facts.json 로드 (없거나 비어 있으면 None)"""
+        path = Path(index_path) / FACTS_FILE
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not data["facts"]:
+            return None
+        return cls([Fact(**item) for item in data["facts"]], max_facts=data["max_facts"])
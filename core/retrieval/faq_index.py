@@ -0,0 +1,240 @@
+"""
+FAQ Index
+자주 묻는 질문 → 검수된 답변 직접 응답 색인 (RAG 검색 전에 조회)
+
+- 원본: data/finetuning/rag_train.json(대화형 질문/답변 쌍)
+        + 승인된 답변 파일({"question", "answer"} 목록)
+  같은 질문이 여러 파일에 있으면 나중 파일(승인 답변)이 우선
+- 조회 순서
+    1) 정규화 질문(공백/문장부호 제거) 완전 일치 → 딕셔너리 조회 (임베딩 호출 없음)
+    2) 어휘 점수(단어 + 한글 bigram Jaccard)가 min_lexical 미만이면 조회 실패 (임베딩 호출 없음)
+    3) 질문 벡터(CachedEmbeddings 캐시 → 이어지는 RAG 검색이 같은 벡터 재사용)와 FAQ 질문 벡터의
+       코사인 유사도를 어휘 점수와 결합해 min_score 이상이면 저장된 답변 반환
+- FAQ 질문 벡터는 인덱스 빌드 시 미리 계산 (faq.json + faq.npy)
+- 인덱스 버전(manifest.json의 version)과 임베딩 네임스페이스를 함께 저장 →
+  규정 청크가 바뀌었거나 임베딩 모델이 다르면 로드하지 않음 (build_index.py로 재생성)
+
+사용법:
+    faq = FAQIndex.load(index_path, namespace=embeddings.namespace)
+    match = faq.match("기본 근무시간은?", embeddings.embed_query)  # None이면 RAG 검색
+"""
+
+import json
+import logging
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from core.retrieval.bm25 import tokenize
+
+logger = logging.getLogger(__name__)
+
+FAQ_FILE = "faq.json"
+FAQ_VECTORS_FILE = "faq.npy"
+_MANIFEST_FILE = "manifest.json"  # core.indexing.incremental.MANIFEST_FILE
+
+_NON_WORD = re.compile(r"[\s?!.,~·]+")
+
+
+def normalize_question(question: str) -> str:
+    """완전 일치용 질문 키 (공백/문장부호 제거, 소문자)"""
+    return _NON_WORD.sub("", question).lower()
+
+
+def read_index_version(index_path: Union[str, Path]) -> Optional[str]:
+    """manifest.json의 인덱스 버전 (없으면 None)"""
+    path = Path(index_path) / _MANIFEST_FILE
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8")).get("version")
+
+
+@dataclass
+class FAQEntry:
+    """질문 + 검수된 답변"""
+    question: str
+    answer: str
+    source: str = ""  # 원본 파일명
+
+
+@dataclass
+class FAQMatch:
+    """FAQ 조회 결과"""
+    entry: FAQEntry
+    score: float
+    lexical: float
+    semantic: float
+
+
+def load_faq_entries(paths: Iterable[Union[str, Path]]) -> List[FAQEntry]:
+    """
+    FAQ 원본 파일들 → 질문/답변 목록 (없는 파일은 건너뜀)
+
+    지원 형식:
+        [{"conversations": [{"role": "user", ...}, {"role": "assistant", ...}]}]  (파인튜닝 데이터)
+        [{"question": "...", "answer": "..."}]  (승인된 답변)
+    """
+    by_key: Dict[str, FAQEntry] = {}
+    for path in map(Path, paths):
+        if not path.exists():
+            logger.info("FAQ 원본 없음, 건너뜀: %s", path)
+            continue
+        for item in json.loads(path.read_text(encoding="utf-8")):
+            if "conversations" in item:
+                turns = item["conversations"]
+                pairs = [
+                    (user["content"], reply["content"])
+                    for user, reply in zip(turns, turns[1:])
+                    if user["role"] == "user" and reply["role"] == "assistant"
+                ]
+            else:
+                pairs = [(item["question"], item["answer"])]
+            for question, answer in pairs:
+                if question.strip() and answer.strip():
+                    entry = FAQEntry(question.strip(), answer.strip(), path.name)
+                    by_key[normalize_question(question)] = entry
+    return list(by_key.values())
+
+
+class FAQIndex:
+    """
+    FAQ 질문 벡터 + 어휘 토큰 색인
+    """
+
+    def __init__(
+        self,
+        entries: Sequence[FAQEntry],
+        vectors: np.ndarray,
+        namespace: str,
+        index_version: Optional[str] = None,
+        min_score: float = 0.85,
+        min_lexical: float = 0.2,
+        lexical_weight: float = 0.3,
+    ):
+        """
+        Args:
+            entries: FAQ 질문/답변
+            vectors: FAQ 질문 벡터 (entries 순서)
+            namespace: 벡터를 만든 임베딩 네임스페이스 ("openai/text-embedding-3-small")
+            index_version: 빌드 당시 인덱스 버전 (manifest.json의 version)
+            min_score: 응답할 최소 결합 점수 (0~1)
+            min_lexical: 임베딩 비교를 시도할 최소 어휘 점수 (미만이면 바로 조회 실패)
+            lexical_weight: 결합 점수에서 어휘 점수 비중 (나머지는 코사인 유사도)
+        """
+        self.entries = list(entries)
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(self.entries), -1)
+        self.vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+        self.namespace = namespace
+        self.index_version = index_version
+        self.min_score = min_score
+        self.min_lexical = min_lexical
+        self.lexical_weight = lexical_weight
+        self._exact = {
+            normalize_question(entry.question): n for n, entry in enumerate(self.entries)
+        }
+        self._tokens = [set(tokenize(entry.question)) for entry in self.entries]
+
+    @classmethod
+    def build(cls, entries: Sequence[FAQEntry], embeddings: Embeddings, namespace: str,
+              index_version: Optional[str] = None, **kwargs) -> "FAQIndex":
+        """FAQ 질문 임베딩 (인덱스 빌드 시 1회)"""
+        questions = [entry.question for entry in entries]
+        vectors = np.asarray(embeddings.embed_documents(questions) if entries else [],
+                             dtype=np.float32)
+        return cls(entries, vectors, namespace, index_version, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def match(self, question: str, embed_query: Callable[[str], List[float]]) -> Optional[FAQMatch]:
+        """
+        질문 → 가장 가까운 FAQ
+
+        Args:
+            embed_query: 질문 임베딩 함수 (RAG 검색과 같은 CachedEmbeddings.embed_query 권장)
+
+        Returns:
+            FAQMatch - 완전 일치이거나 결합 점수 ≥ min_score일 때, 아니면 None
+        """
+        if not self.entries:
+            return None
+        exact = self._exact.get(normalize_question(question))
+        if exact is not None:
+            return FAQMatch(self.entries[exact], score=1.0, lexical=1.0, semantic=1.0)
+
+        tokens = set(tokenize(question))
+        if not tokens:
+            return None
+        lexical = np.array([
+            len(tokens & other) / max(len(tokens | other), 1) for other in self._tokens
+        ])
+        if lexical.max() < self.min_lexical:
+            return None
+
+        query = np.asarray(embed_query(question), dtype=np.float32)
+        query /= max(float(np.linalg.norm(query)), 1e-9)
+        semantic = np.clip(self.vectors @ query, 0.0, 1.0)
+        scores = self.lexical_weight * lexical + (1 - self.lexical_weight) * semantic
+        best = int(np.argmax(scores))
+        if scores[best] < self.min_score:
+            return None
+        return FAQMatch(
+            self.entries[best],
+            score=round(float(scores[best]), 4),
+            lexical=round(float(lexical[best]), 4),
+            semantic=round(float(semantic[best]), 4),
+        )
+
+    # --------------------------
+    # 저장/로드
+    # --------------------------
+    def save(self, index_path: Union[str, Path]):
+        index_path = Path(index_path)
+        data = {
+            "namespace": self.namespace,
+            "index_version": self.index_version,
+            "entries": [asdict(entry) for entry in self.entries],
+        }
+        (index_path / FAQ_FILE).write_text(
+            json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8"
+        )
+        np.save(index_path / FAQ_VECTORS_FILE, self.vectors)
+
+    @classmethod
+    def load(cls, index_path: Union[str, Path], namespace: Optional[str] = None,
+             **kwargs) -> Optional["FAQIndex"]:
+        """
+        faq.json + faq.npy 로드
+
+        Returns:
+            FAQIndex - 파일이 없거나 비었거나, 인덱스 버전/임베딩 네임스페이스가 다르면 None
+        """
+        index_path = Path(index_path)
+        path = index_path / FAQ_FILE
+        if not path.exists() or not (index_path / FAQ_VECTORS_FILE).exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not data["entries"]:
+            return None
+        current = read_index_version(index_path)
+        if data["index_version"] != current:
+            logger.warning(
+                "FAQ 색인 버전(%s)이 인덱스(%s)와 다름 → 사용 안 함 (build_index.py로 재생성)",
+                data["index_version"], current,
+            )
+            return None
+        if namespace is not None and data["namespace"] != namespace:
+            logger.warning("FAQ 색인 임베딩(%s)이 질문 임베딩(%s)과 다름 → 사용 안 함",
+                           data["namespace"], namespace)
+            return None
+        return cls(
+            [FAQEntry(**entry) for entry in data["entries"]],
+            np.load(index_path / FAQ_VECTORS_FILE),
+            data["namespace"],
+            data["index_version"],
+            **kwargs,
+        )
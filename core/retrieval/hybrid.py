@@ -0,0 +1,118 @@
+"""
+Hybrid Retriever
+BM25(키워드) + FAISS(벡터) 검색 결과를 Reciprocal Rank Fusion으로 결합
+
+- 벡터 검색은 의미 유사도, BM25는 조항 번호/용어/숫자("15일") 정확 매칭 담당
+- RRF: score(d) = Σ weight / (rrf_k + rank) → 점수 스케일이 다른 두 검색을 순위만으로 결합
+- 작은 top_k에서도 정밀도 유지 → 생성 프롬프트 길이 감소
+
+사용법:
+    retriever = HybridRetriever(vectorstore, BM25Index.load(index_path), top_k=3)
+    scored_docs = retriever.retrieve("육아휴직 기간")  # [(Document, RRF 점수)]
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+from core.retrieval.bm25 import BM25Index
+
+logger = logging.getLogger(__name__)
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Iterable[str]],
+    rrf_k: int = 60,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[str, float]]:
+    """
+    여러 순위 목록 결합
+
+    Args:
+        rankings: ID 순위 목록들 (앞쪽이 상위)
+        rrf_k: 순위 완화 상수 (클수록 하위 순위 영향 증가)
+        weights: 목록별 가중치 (None이면 모두 1)
+
+    Returns:
+        (ID, RRF 점수) 리스트 - 점수 내림차순
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, doc_id in enumerate(ranking, 1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + weight / (rrf_k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class HybridRetriever:
+    """
+    BM25 + 벡터 하이브리드 검색기
+
+    - 각 검색에서 candidate_k개 후보를 뽑아 RRF로 결합 후 top_k 반환
+    """
+
+    def __init__(
+        self,
+        vectorstore,
+        bm25: BM25Index,
+        top_k: int = 3,
+        candidate_k: Optional[int] = None,
+        rrf_k: int = 60,
+        bm25_weight: float = 1.0,
+        vector_weight: float = 1.0,
+    ):
+        """
+        Args:
+            vectorstore: FAISS 벡터스토어 (bm25와 docstore ID 공유)
+            bm25: BM25Index
+            top_k: 반환할 문서 수
+            candidate_k: 검색별 후보 수 (None이면 max(top_k * 4, 20))
+            rrf_k: RRF 상수
+            bm25_weight: BM25 순위 가중치
+            vector_weight: 벡터 순위 가중치
+        """
+        self.vectorstore = vectorstore
+        self.bm25 = bm25
+        self.top_k = top_k
+        self.candidate_k = candidate_k
+        self.rrf_k = rrf_k
+        self.bm25_weight = bm25_weight
+        self.vector_weight = vector_weight
+
+    def retrieve(self, question: str, k: Optional[int] = None) -> List[Tuple[Document, float]]:
+        """
+        하이브리드 검색
+
+        Returns:
+            (문서, RRF 점수) 리스트 - 점수가 높을수록 관련
+        """
+        k = k or self.top_k
+        candidate_k = self.candidate_k or max(k * 4, 20)
+
+        vector_hits = self.vectorstore.similarity_search_with_score(question, k=candidate_k)
+        docs: Dict[str, Document] = {}
+        vector_ranking = []
+        for doc, _ in vector_hits:
+            doc_id = doc.id or doc.page_content
+            docs[doc_id] = doc
+            vector_ranking.append(doc_id)
+
+        bm25_ranking = [doc_id for doc_id, _ in self.bm25.search(question, k=candidate_k)]
+
+        fused = reciprocal_rank_fusion(
+            [vector_ranking, bm25_ranking],
+            rrf_k=self.rrf_k,
+            weights=[self.vector_weight, self.bm25_weight],
+        )
+
+        results = []
+        for doc_id, score in fused:
+            doc = docs.get(doc_id) or self.vectorstore.docstore.search(doc_id)
+            if not isinstance(doc, Document):  # 색인 불일치 (BM25에만 남은 ID)
+                logger.warning("BM25 문서가 벡터스토어에 없음: %s", doc_id)
+                continue
+            results.append((doc, score))
+            if len(results) == k:
+                break
+        return results
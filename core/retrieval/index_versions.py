@@ -0,0 +1,111 @@
+"""
+Index Versions
+버전별 인덱스 디렉토리 + CURRENT 포인터 (무중단 인덱스 교체)
+
+- build_index.py는 항상 새 디렉토리(data/faiss_index/v20260101-093000-123456/)에 빌드하고,
+  저장이 끝난 뒤 CURRENT 파일을 임시 파일 + os.replace로 원자적으로 바꿈
+  → 서빙 중인 디렉토리는 빌드 도중 절대 수정되지 않음
+- 서빙(RAGAgent)은 CURRENT가 가리키는 디렉토리를 로드, CURRENT가 없으면 루트 자체를 인덱스로 사용
+  (버전 디렉토리 도입 전 인덱스와 호환)
+- 오래된 버전은 keep개만 남기고 삭제 (CURRENT 버전은 항상 유지)
+
+사용법:
+    target = create_version_dir(root)
+    ...  # target에 인덱스 저장
+    publish_version(root, target)
+    index_path = resolve_index_path(root)
+"""
+
+import datetime
+import logging
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CURRENT_FILE = "CURRENT"
+VERSION_PREFIX = "v"
+
+
+def current_version(root: Union[str, Path]) -> Optional[str]:
+    """CURRENT가 가리키는 버전 디렉토리 이름 (없으면 None)"""
+    path = Path(root) / CURRENT_FILE
+    if not path.exists():
+        return None
+    return path.read_text(encoding="utf-8").strip() or None
+
+
+def resolve_index_path(root: Union[str, Path]) -> Path:
+    """서빙할 인덱스 디렉토리 (CURRENT가 없으면 루트)"""
+    root = Path(root)
+    version = current_version(root)
+    return root / version if version else root
+
+
+def list_versions(root: Union[str, Path]) -> List[str]:
+    """버전 디렉토리 이름 (오래된 순)"""
+    root = Path(root)
+    if not root.exists():
+        return []
+    return sorted(
+        p.name for p in root.iterdir() if p.is_dir() and p.name.startswith(VERSION_PREFIX)
+    )
+
+
+def create_version_dir(root: Union[str, Path], seed_from: Optional[Path] = None) -> Path:
+    """
+    새 버전 디렉토리 생성
+
+    Args:
+        seed_from: 기존 인덱스 디렉토리
+            (증분 빌드 시 복사해 시작, 샤드 디렉토리 포함, 버전 디렉토리 제외)
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    while True:
+        # 이름 순 = 생성 순 (마이크로초까지)
+        target = root / f"{VERSION_PREFIX}{datetime.datetime.now():%Y%m%d-%H%M%S-%f}"
+        try:
+            target.mkdir()
+            break
+        except FileExistsError:
+            continue
+    if seed_from is not None and seed_from.exists():
+        for path in seed_from.iterdir():
+            if path.is_dir() and not path.name.startswith(VERSION_PREFIX):
+                shutil.copytree(path, target / path.name)
+            elif path.is_file() and path.name != CURRENT_FILE:
+                shutil.copy2(path, target / path.name)
+    return target
+
+
+def publish_version(root: Union[str, Path], version_dir: Union[str, Path]):
+    """CURRENT를 version_dir로 원자적으로 교체 (읽는 쪽은 이전 값 또는 새 값만 봄)"""
+    root = Path(root)
+    tmp = root / f".{CURRENT_FILE}.{uuid.uuid4().hex[:6]}"
+    tmp.write_text(Path(version_dir).name, encoding="utf-8")
+    os.replace(tmp, root / CURRENT_FILE)
+    logger.info("인덱스 버전 게시: %s", Path(version_dir).name)
+
+
+def prune_versions(root: Union[str, Path], keep: int = 3) -> List[str]:
+    """
+    오래된 버전 디렉토리 삭제 (CURRENT 버전 포함 최근 keep개 유지)
+
+    - 이미 로드된 mmap 인덱스는 파일이 삭제돼도 해당 프로세스에서 계속 유효 (POSIX)
+
+    Returns:
+        삭제한 버전 이름
+    """
+    root = Path(root)
+    current = current_version(root)
+    versions = [v for v in list_versions(root) if v != current]
+    stale = versions[:max(len(versions) - max(keep - 1, 0), 0)]
+    for version in stale:
+        shutil.rmtree(root / version, ignore_errors=True)
+    if stale:
+        logger.info("오래된 인덱스 버전 삭제: %s", ", ".join(stale))
+    return stale
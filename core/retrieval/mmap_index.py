@@ -0,0 +1,185 @@
+"""
+Memory-mapped Index
+pickle docstore 없이 mmap으로 여는 서빙용 RAG 인덱스 포맷
+
+- vectors.faiss: FAISS 인덱스 파일 → IO_FLAG_MMAP_IFC로 mmap 로드
+  (벡터를 프로세스 힙에 복사하지 않음, uvicorn 워커 간 OS 페이지 캐시 공유)
+  IO_FLAG_MMAP_IFC가 없는 faiss(1.10 미만)는 IO_FLAG_MMAP으로 로드
+  (IVF 역리스트만 mmap, 나머지 벡터는 힙에 복사)
+- chunks.db: 청크 텍스트/메타데이터 SQLite (pos = FAISS 행 번호, doc_id 인덱스)
+  → 검색된 청크만 조회, SQLite mmap_size로 역시 페이지 공유
+- pickle 역직렬화 없음 (allow_dangerous_deserialization 불필요), 시작 시간이 코퍼스 크기와 무관
+- quantization.json이 있으면 축소·양자화 인덱스 + 원본 벡터(mmap) 재채점 (QuantizedFAISS)
+- 읽기 전용: 갱신은 IncrementalIndexer가 pickle 포맷으로 수행 후 이 포맷으로 함께 저장
+
+사용법:
+    save_mmap_index(vectorstore, index_path)       # 빌드 시
+    vectorstore = load_mmap_index(index_path, embeddings)  # 서빙 시 (LangChain FAISS 그대로 사용)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import faiss
+import numpy as np
+from langchain_community.docstore.base import Docstore
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from core.retrieval.quantized import FULL_VECTORS_FILE, QuantizedFAISS, load_quantization
+
+logger = logging.getLogger(__name__)
+
+VECTORS_FILE = "vectors.faiss"
+CHUNKS_FILE = "chunks.db"
+
+# SQLite가 mmap으로 읽을 최대 크기 (256MB)
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+
+def has_mmap_index(index_path: Union[str, Path]) -> bool:
+    index_path = Path(index_path)
+    return (index_path / VECTORS_FILE).exists() and (index_path / CHUNKS_FILE).exists()
+
+
+class ChunkStore:
+    """
+    청크 SQLite 읽기 전용 저장소 (스레드별 연결)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._size = self._connect().execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.path.as_posix()}?mode=ro", uri=True)
+            conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+            self._local.conn = conn
+        return conn
+
+    def __len__(self) -> int:
+        return self._size
+
+    def id_at(self, pos: int) -> Optional[str]:
+        row = self._connect().execute("SELECT doc_id FROM chunks WHERE pos = ?", (pos,)).fetchone()
+        return row[0] if row else None
+
+    def get(self, doc_id: str) -> Optional[Document]:
+        row = self._connect().execute(
+            "SELECT text, metadata FROM chunks WHERE doc_id = ?", (doc_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return Document(id=doc_id, page_content=row[0], metadata=json.loads(row[1]))
+
+
+class MmapDocstore(Docstore):
+    """ChunkStore 기반 LangChain Docstore (읽기 전용)"""
+
+    def __init__(self, store: ChunkStore):
+        self.store = store
+
+    def search(self, search: str) -> Union[str, Document]:
+        doc = self.store.get(search)
+        # InMemoryDocstore와 같은 계약: 없으면 문자열 반환
+        return doc if doc is not None else f"ID {search} not found."
+
+    def delete(self, ids):
+        raise NotImplementedError(
+            "mmap 인덱스는 읽기 전용입니다. build_index.py로 다시 빌드하세요."
+        )
+
+
+class PositionIdMap(Mapping):
+    """FAISS 행 번호 → docstore ID (필요할 때만 조회, 전체를 메모리에 올리지 않음)"""
+
+    def __init__(self, store: ChunkStore):
+        self.store = store
+
+    def __getitem__(self, pos: int) -> str:
+        doc_id = self.store.id_at(int(pos))
+        if doc_id is None:
+            raise KeyError(pos)
+        return doc_id
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self.store)))
+
+
+def save_mmap_index(vectorstore: FAISS, index_path: Union[str, Path],
+                    index: Optional[faiss.Index] = None):
+    """
+    FAISS 벡터스토어를 mmap 포맷으로 저장 (임시 파일 작성 후 교체)
+
+    Args:
+        index: 벡터스토어 대신 저장할 FAISS 인덱스 (ANN 인덱스, 행 순서 동일해야 함)
+    """
+    index_path = Path(index_path)
+    index_path.mkdir(parents=True, exist_ok=True)
+
+    vectors_tmp = index_path / f"{VECTORS_FILE}.tmp"
+    faiss.write_index(index if index is not None else vectorstore.index, str(vectors_tmp))
+
+    chunks_tmp = index_path / f"{CHUNKS_FILE}.tmp"
+    chunks_tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(str(chunks_tmp))
+    try:
+        conn.execute(
+            "CREATE TABLE chunks (pos INTEGER PRIMARY KEY, doc_id TEXT NOT NULL UNIQUE,"
+            " text TEXT NOT NULL, metadata TEXT NOT NULL)"
+        )
+        rows = []
+        for pos, doc_id in sorted(vectorstore.index_to_docstore_id.items()):
+            doc = vectorstore.docstore.search(doc_id)
+            rows.append((pos, doc_id, doc.page_content,
+                         json.dumps(doc.metadata, ensure_ascii=False, default=str)))
+        conn.executemany("INSERT INTO chunks VALUES (?, ?, ?, ?)", rows)
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(vectors_tmp, index_path / VECTORS_FILE)
+    os.replace(chunks_tmp, index_path / CHUNKS_FILE)
+    logger.info("mmap 인덱스 저장: %s (%d개 청크)", index_path, len(rows))
+
+
+def mmap_io_flags() -> int:
+    """설치된 faiss가 지원하는 mmap 읽기 플래그 (IO_FLAG_MMAP_IFC 우선)"""
+    mmap_flag = getattr(faiss, "IO_FLAG_MMAP_IFC", None)
+    if mmap_flag is None:
+        mmap_flag = faiss.IO_FLAG_MMAP
+    return mmap_flag | faiss.IO_FLAG_READ_ONLY
+
+
+def load_mmap_index(index_path: Union[str, Path], embeddings: Embeddings) -> FAISS:
+    """
+    mmap 포맷 인덱스 로드 (LangChain FAISS 인스턴스, 검색 API 동일)
+    """
+    index_path = Path(index_path)
+    index = faiss.read_index(str(index_path / VECTORS_FILE), mmap_io_flags())
+    store = ChunkStore(index_path / CHUNKS_FILE)
+    if index.ntotal != len(store):
+        raise ValueError(
+            f"mmap 인덱스 불일치: 벡터 {index.ntotal}개, 청크 {len(store)}개 ({index_path})"
+        )
+    quantization = load_quantization(index_path)
+    if quantization is None:
+        return FAISS(embeddings, index, MmapDocstore(store), PositionIdMap(store))
+
+    full_path = index_path / FULL_VECTORS_FILE
+    full_vectors = np.load(full_path, mmap_mode="r") if full_path.exists() else None
+    return QuantizedFAISS(embeddings, index, MmapDocstore(store), PositionIdMap(store),
+                          quantization=quantization, full_vectors=full_vectors)
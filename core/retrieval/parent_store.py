@@ -0,0 +1,115 @@
+"""
+Parent Store
+부모 청크 저장소 + 자식 검색 결과 → 부모 청크 확장 (토큰 예산 안에서)
+
+- 검색은 작은 자식 청크로 정확하게, 프롬프트에는 자식이 속한 부모(조문 전체)를 넣음
+- 같은 부모의 자식이 여러 개 검색되면 부모 1개로 합침 (첫 자식의 순위/점수 사용)
+- token_budget 안에 들어가는 만큼만 부모를 채움 (첫 부모는 항상 포함)
+  → RAG_TOP_K를 늘리는 것보다 프롬프트 토큰당 문맥이 많음
+- 인덱스 디렉토리에 parents.json으로 저장
+
+사용법:
+    store = ParentStore.load(index_path)
+    docs = store.expand(agent.retrieve(question), token_budget=1500)
+"""
+
+import json
+import logging
+import math
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+PARENTS_FILE = "parents.json"
+
+_HANGUL = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ]")
+_SPACES = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    프롬프트 토큰 수 추정 (토크나이저 파일 다운로드 없이 동작)
+
+    - 한글 음절은 1자당 약 1토큰, 그 외(숫자/영문/기호)는 약 3자당 1토큰
+    """
+    hangul = len(_HANGUL.findall(text))
+    others = len(_SPACES.sub("", text)) - hangul
+    return hangul + math.ceil(others / 3)
+
+
+class ParentStore:
+    """
+    parent_id → 부모 Document
+    """
+
+    def __init__(self, parents: Dict[str, Document]):
+        self.parents = parents
+
+    @classmethod
+    def from_documents(cls, parents: Sequence[Document]) -> "ParentStore":
+        """split_parent_child()의 부모 목록으로 생성"""
+        return cls({doc.metadata["parent_id"]: doc for doc in parents})
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def get(self, parent_id: str) -> Optional[Document]:
+        return self.parents.get(parent_id)
+
+    def expand(
+        self,
+        scored_docs: Sequence[Tuple[Document, float]],
+        token_budget: int = 1500,
+    ) -> List[Tuple[Document, float]]:
+        """
+        자식 검색 결과 → 중복 제거된 부모 목록 (검색 순위 유지)
+
+        Args:
+            scored_docs: (자식 문서, 점수) - 검색 순위 순
+            token_budget: 부모 본문 토큰 합 상한 (0 이하면 제한 없음)
+
+        Returns:
+            (부모 문서, 첫 자식 점수) 리스트 - parent_id가 없는 문서는 그대로 포함
+        """
+        results, seen, used = [], set(), 0
+        for doc, score in scored_docs:
+            parent_id = doc.metadata.get("parent_id")
+            parent = doc
+            if parent_id is not None:
+                if parent_id in seen:
+                    continue
+                seen.add(parent_id)
+                parent = self.parents.get(parent_id, doc)
+            tokens = estimate_tokens(parent.page_content)
+            if results and token_budget > 0 and used + tokens > token_budget:
+                break
+            results.append((parent, score))
+            used += tokens
+        return results
+
+    # --------------------------
+    # 저장/로드
+    # --------------------------
+    def save(self, index_path: Union[str, Path]):
+        path = Path(index_path) / PARENTS_FILE
+        data = {
+            parent_id: {"page_content": doc.page_content, "metadata": doc.metadata}
+            for parent_id, doc in self.parents.items()
+        }
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, index_path: Union[str, Path]) -> Optional["ParentStore"]:
+        """parents.json 로드 (없으면 None)"""
+        path = Path(index_path) / PARENTS_FILE
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls({
+            parent_id: Document(page_content=item["page_content"], metadata=item["metadata"])
+            for parent_id, item in data.items()
+        })
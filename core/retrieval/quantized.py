@@ -0,0 +1,240 @@
+"""
+Quantized Vectors
+서빙 인덱스 벡터 양자화(float16 / int8) + Matryoshka 차원 축소 + 전체 정밀도 재채점
+
+- 검색용 인덱스(vectors.faiss)는 축소·양자화된 벡터로 구성 → 메모리 2~8배 절감
+    float16: 차원당 2바이트 (2배), int8: 차원당 1바이트 (4배), dims 절반이면 추가 2배
+- Matryoshka: text-embedding-3 계열처럼 앞쪽 차원에 정보가 몰린 모델은 앞 dims개만 사용
+  (잘라낸 벡터는 다시 L2 정규화)
+- 재채점: 상위 k x rescore개 후보만 원본 float32 벡터(vectors_full.npy, mmap)로 L2 거리 재계산
+  → 원본 벡터는 디스크에 두고 후보 행만 읽음
+- 설정은 인덱스 디렉토리의 quantization.json에 기록, RAGAgent 로드 시 자동 적용
+
+사용법:
+    config = QuantizationConfig.from_spec("int8:dims=512,rescore=4")
+    coarse = config.prepare(vectors)  # 인덱스 빌드용 (축소 + 정규화)
+    save_quantization(index_path, config, vectors)
+"""
+
+import json
+import logging
+import operator
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import faiss
+import numpy as np
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+
+logger = logging.getLogger(__name__)
+
+QUANTIZATION_FILE = "quantization.json"
+FULL_VECTORS_FILE = "vectors_full.npy"
+
+# dtype → FAISS 스칼라 양자화 코드 (index_factory 표기)
+STORAGE_CODES = {"float32": None, "float16": "SQfp16", "int8": "SQ8"}
+
+
+@dataclass
+class QuantizationConfig:
+    """벡터 양자화 설정"""
+    dtype: str = "float32"  # float32 | float16 | int8
+    dims: Optional[int] = None  # Matryoshka 축소 차원 (None이면 전체)
+    rescore: int = 4  # 재채점 후보 배수 (0이면 재채점 없음)
+
+    def __post_init__(self):
+        if self.dtype not in STORAGE_CODES:
+            raise ValueError(
+                f"지원하지 않는 dtype: {self.dtype} (가능: {', '.join(STORAGE_CODES)})"
+            )
+
+    @classmethod
+    def from_spec(cls, spec: Optional[str]) -> "QuantizationConfig":
+        """"dtype:키=값,..." 문자열 파싱 (예: "float16", "int8:dims=512,rescore=8")"""
+        if not spec:
+            return cls()
+        dtype, _, params = spec.strip().partition(":")
+        names = {f.name for f in fields(cls)} - {"dtype"}
+        values = {}
+        for item in filter(None, (p.strip() for p in params.split(","))):
+            key, _, value = item.partition("=")
+            if key.strip() not in names:
+                raise ValueError(f"알 수 없는 양자화 파라미터: {key}")
+            values[key.strip()] = int(value)
+        return cls(dtype=dtype.strip().lower() or "float32", **values)
+
+    @property
+    def enabled(self) -> bool:
+        return self.dtype != "float32" or self.dims is not None
+
+    @property
+    def storage(self) -> Optional[str]:
+        """FAISS 스칼라 양자화 코드 (float32면 None)"""
+        return STORAGE_CODES[self.dtype]
+
+    def prepare(self, vectors: np.ndarray) -> np.ndarray:
+        """검색 인덱스용 벡터 (앞 dims개 차원 + L2 재정규화)"""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if self.dims is None or self.dims >= vectors.shape[1]:
+            return vectors
+        truncated = np.array(vectors[:, :self.dims], copy=True)  # normalize_L2는 제자리 연산
+        faiss.normalize_L2(truncated)
+        return truncated
+
+
+def save_quantization(index_path: Union[str, Path], config: QuantizationConfig,
+                      vectors: np.ndarray):
+    """양자화 설정 + 재채점용 원본 벡터 저장 (비활성화면 이전 파일 삭제)"""
+    index_path = Path(index_path)
+    meta_path = index_path / QUANTIZATION_FILE
+    full_path = index_path / FULL_VECTORS_FILE
+    if not config.enabled:
+        meta_path.unlink(missing_ok=True)
+        full_path.unlink(missing_ok=True)
+        return
+    if config.rescore:
+        np.save(full_path, np.ascontiguousarray(vectors, dtype=np.float32))
+    else:
+        full_path.unlink(missing_ok=True)
+    meta_path.write_text(json.dumps(asdict(config)), encoding="utf-8")
+
+
+def load_quantization(index_path: Union[str, Path]) -> Optional[QuantizationConfig]:
+    path = Path(index_path) / QUANTIZATION_FILE
+    if not path.exists():
+        return None
+    return QuantizationConfig(**json.loads(path.read_text(encoding="utf-8")))
+
+
+class QuantizedFAISS(FAISS):
+    """
+    양자화 인덱스 + 재채점 FAISS 벡터스토어
+
+    - 질문 벡터를 같은 방식으로 축소해 후보 검색 → 원본 벡터로 재채점
+    - 반환 점수는 원본 벡터 기준 L2 거리 (flat 인덱스와 같은 스케일)
+    """
+
+    def __init__(self, *args, quantization: QuantizationConfig,
+                 full_vectors: Optional[np.ndarray] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.quantization = quantization
+        self.full_vectors = full_vectors
+
+    def similarity_search_with_score_by_vector(
+        self,
+        embedding: List[float],
+        k: int = 4,
+        filter: Optional[Union[Callable, Dict[str, Any]]] = None,
+        fetch_k: int = 20,
+        **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        query = np.array([embedding], dtype=np.float32)
+        n_candidates = k if filter is None else fetch_k
+        rescoring = self.quantization.rescore and self.full_vectors is not None
+        if rescoring:
+            n_candidates *= self.quantization.rescore
+
+        scores, indices = self.index.search(self.quantization.prepare(query), n_candidates)
+        positions = [int(i) for i in indices[0] if i != -1]
+        distances = [float(s) for s, i in zip(scores[0], indices[0]) if i != -1]
+        if rescoring and positions:
+            # 후보 행만 mmap에서 읽어 정확한 거리 계산
+            order = np.argsort(positions)
+            rows = np.asarray(self.full_vectors[np.asarray(positions)[order]])
+            exact = np.empty(len(positions), dtype=np.float32)
+            exact[order] = ((rows - query) ** 2).sum(axis=1)
+            ranked = np.argsort(exact, kind="stable")
+            positions = [positions[i] for i in ranked]
+            distances = [float(exact[i]) for i in ranked]
+
+        filter_func = self._create_filter_func(filter) if filter is not None else None
+        docs = []
+        for pos, distance in zip(positions, distances):
+            _id = self.index_to_docstore_id[pos]
+            doc = self.docstore.search(_id)
+            if not isinstance(doc, Document):
+                raise ValueError(f"Could not find document for id {_id}, got {doc}")
+            if filter_func is None or filter_func(doc.metadata):
+                docs.append((doc, distance))
+
+        score_threshold = kwargs.get("score_threshold")
+        if score_threshold is not None:
+            docs = [(doc, d) for doc, d in docs if operator.le(d, score_threshold)]
+        return docs[:k]
+
+
+# --------------------------
+# Benchmark
+# --------------------------
+@dataclass
+class QuantizationResult:
+    """양자화 설정별 메모리/recall 측정 결과"""
+    spec: str
+    bytes_per_vector: float
+    compression: float  # float32 flat 대비 배수
+    recall: float  # 재채점 없이 recall@k
+    recall_rescored: float  # 재채점 후 recall@k
+    p50_ms: float  # 재채점 포함 검색 지연
+
+
+def benchmark_quantization(
+    vectors: np.ndarray,
+    configs: Sequence[QuantizationConfig],
+    k: int = 10,
+    n_queries: int = 200,
+    noise: float = 0.1,
+    seed: int = 0,
+) -> List[QuantizationResult]:
+    """
+    양자화 설정별 인덱스 크기와 recall@k (정확 검색 대비) 측정
+
+    - 질의는 코퍼스 벡터 + 가우시안 잡음 (벡터 표준편차 대비 noise)
+    """
+    rng = np.random.default_rng(seed)
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    dim = vectors.shape[1]
+    base = vectors[rng.integers(0, len(vectors), n_queries)]
+    queries = (base + rng.normal(0, noise * float(vectors.std()), base.shape)).astype(np.float32)
+
+    exact = faiss.IndexFlatL2(dim)
+    exact.add(vectors)
+    _, truth = exact.search(queries, k)
+    flat_bytes = len(faiss.serialize_index(exact)) / len(vectors)
+
+    results = []
+    for config in configs:
+        coarse = config.prepare(vectors)
+        storage = config.storage
+        index = faiss.index_factory(coarse.shape[1], storage or "Flat")
+        if not index.is_trained:
+            index.train(coarse)
+        index.add(coarse)
+        bytes_per_vector = len(faiss.serialize_index(index)) / len(vectors)
+
+        factor = max(config.rescore, 1)
+        hits = hits_rescored = 0
+        latencies = []
+        for query, expected in zip(queries, truth):
+            started = time.perf_counter()
+            _, found = index.search(config.prepare(query[None, :]), k * factor)
+            candidates = found[0][found[0] != -1]
+            exact_d = ((vectors[candidates] - query) ** 2).sum(axis=1)
+            rescored = candidates[np.argsort(exact_d, kind="stable")[:k]]
+            latencies.append((time.perf_counter() - started) * 1000)
+            hits += len(set(found[0][:k]) & set(expected))
+            hits_rescored += len(set(rescored) & set(expected))
+
+        spec = config.dtype + (f":dims={config.dims}" if config.dims else "")
+        results.append(QuantizationResult(
+            spec=spec,
+            bytes_per_vector=round(bytes_per_vector, 1),
+            compression=round(flat_bytes / bytes_per_vector, 2),
+            recall=round(hits / (n_queries * k), 4),
+            recall_rescored=round(hits_rescored / (n_queries * k), 4),
+            p50_ms=round(float(np.percentile(latencies, 50)), 3),
+        ))
+        logger.info("양자화 벤치마크: %s", asdict(results[-1]))
+    return results
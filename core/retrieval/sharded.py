@@ -0,0 +1,264 @@
+"""
+Sharded Retrieval
+문서 묶음(원본 파일, 부서, 테넌트 등)별 샤드 인덱스 병렬 검색 + top-k 병합
+
+- 인덱스 디렉토리 구성 (build_index.py --shard-by source)
+    shards.json         샤드 카탈로그
+                        {샤드명: {"sources": {파일명: [첫 페이지, 끝 페이지]}, "chunks": N}}
+    shards/<샤드명>/    샤드별 FAISS + BM25 + 조문 조회 테이블
+                        (IncrementalIndexer 저장 형식 그대로)
+- 검색
+    1) 검색 범위(SearchFilter: 컬렉션/파일/페이지)를 카탈로그와 비교해 관련 샤드만 선택
+       (나머지는 검색하지 않음)
+    2) 질문 임베딩 1회 → 선택된 샤드를 스레드 풀에서 동시에 검색 (FAISS 검색은 GIL 해제)
+    3) 샤드별 벡터 후보는 L2 거리(같은 임베딩 모델이라 샤드 간 비교 가능)로,
+       BM25 후보는 점수로 병합 후 RRF로 결합해 top-k (BM25가 없으면 거리 순 top-k)
+- 샤드 안 필터는 샤드 전체가 범위에 들어가지 않을 때만 적용
+  (파일 단위 샤드 + 파일 필터면 후처리 없음)
+- 코퍼스가 커져도 샤드 크기는 문서 묶음 단위로 유지 → 검색 지연이 샤드 하나의 지연 수준
+- close(): 진행 중인 샤드 검색이 끝난 뒤 스레드 풀 종료 (인덱스 교체로 밀려난 검색기 정리),
+  이후 검색은 호출 스레드에서 순차 실행 (교체 직전에 이전 에이전트를 잡은 요청도 정상 응답)
+
+사용법:
+    retriever = ShardedRetriever(shards, max_workers=4)
+    scored_docs, mode = retriever.retrieve(question, 6, embeddings.embed_query,
+                                           SearchFilter(sources=["02_회사규정.pdf"]))
+"""
+
+import json
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from langchain_core.documents import Document
+
+from core.retrieval.bm25 import BM25Index
+from core.retrieval.hybrid import reciprocal_rank_fusion
+
+logger = logging.getLogger(__name__)
+
+SHARDS_FILE = "shards.json"
+SHARDS_DIR = "shards"
+
+_UNSAFE = re.compile(r"[^\w.-]+")
+
+
+@dataclass
+class SearchFilter:
+    """
+    검색 범위 (None인 항목은 제한 없음)
+
+    - collections: 샤드 이름
+    - sources: 원본 파일명 ("02_회사규정.pdf", 경로 없이)
+    - pages: 페이지 번호 (1부터, 출처 표기 "p.13"과 같은 기준)
+    """
+    collections: Optional[List[str]] = None
+    sources: Optional[List[str]] = None
+    pages: Optional[List[int]] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.collections or self.sources or self.pages)
+
+    def matches(self, metadata: dict) -> bool:
+        """청크 metadata가 범위 안인지 (collections는 샤드 선택에서만 사용)"""
+        if self.sources and Path(str(metadata.get("source", ""))).name not in self.sources:
+            return False
+        if self.pages:
+            page = metadata.get("page")
+            if not isinstance(page, int) or page + 1 not in self.pages:
+                return False
+        return True
+
+
+def shard_name(doc: Document, shard_by: str = "source") -> str:
+    """청크 → 샤드 이름 (source면 파일명 stem, 그 외엔 해당 metadata 값)"""
+    value = doc.metadata.get(shard_by) or "default"
+    if shard_by == "source":
+        value = Path(str(value)).stem
+    return _UNSAFE.sub("_", str(value)).strip("_") or "default"
+
+
+def group_shards(chunks: Sequence[Document], shard_by: str = "source") -> Dict[str, List[Document]]:
+    """청크를 샤드별로 묶음 (샤드 안 순서 유지)"""
+    groups: Dict[str, List[Document]] = {}
+    for chunk in chunks:
+        groups.setdefault(shard_name(chunk, shard_by), []).append(chunk)
+    return groups
+
+
+def build_catalog(groups: Dict[str, List[Document]]) -> Dict[str, dict]:
+    """샤드별 원본 파일/페이지 범위 (검색 전 샤드 선택용)"""
+    catalog = {}
+    for name, chunks in groups.items():
+        sources: Dict[str, List[int]] = {}
+        for chunk in chunks:
+            source = Path(str(chunk.metadata.get("source", ""))).name
+            page = chunk.metadata.get("page")
+            page = page + 1 if isinstance(page, int) else 0
+            low, high = sources.get(source, [page, page])
+            sources[source] = [min(low, page), max(high, page)]
+        catalog[name] = {"sources": sources, "chunks": len(chunks)}
+    return catalog
+
+
+def save_catalog(index_path: Union[str, Path], catalog: Dict[str, dict]):
+    path = Path(index_path) / SHARDS_FILE
+    path.write_text(json.dumps(catalog, ensure_ascii=False, indent=1), encoding="utf-8")
+
+
+def load_catalog(index_path: Union[str, Path]) -> Optional[Dict[str, dict]]:
+    """shards.json 로드 (샤드 인덱스가 아니면 None)"""
+    path = Path(index_path) / SHARDS_FILE
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8")) or None
+
+
+@dataclass
+class Shard:
+    """샤드 하나 (벡터스토어 + 선택적 BM25 + 카탈로그 항목)"""
+    name: str
+    vectorstore: object
+    bm25: Optional[BM25Index] = None
+    sources: Dict[str, List[int]] = field(default_factory=dict)  # 파일명 → [첫 페이지, 끝 페이지]
+
+    def coverage(self, search_filter: Optional[SearchFilter]) -> Optional[bool]:
+        """
+        검색 범위와 샤드 비교
+
+        Returns:
+            None: 범위 밖 (검색 안 함)
+            True: 샤드 전체가 범위 안 (필터 불필요)
+            False: 일부만 범위 안
+        """
+        if not search_filter:
+            return True
+        if search_filter.collections and self.name not in search_filter.collections:
+            return None
+        sources = {source: span for source, span in self.sources.items()
+                   if not search_filter.sources or source in search_filter.sources}
+        if not sources:
+            return None
+        if search_filter.pages:
+            spans = sources.values()
+            if not any(low <= page <= high for low, high in spans for page in search_filter.pages):
+                return None
+            return False
+        return len(sources) == len(self.sources)
+
+
+class ShardedRetriever:
+    """
+    샤드 병렬 검색기
+    """
+
+    def __init__(self, shards: Sequence[Shard], rrf_k: int = 60, max_workers: int = 4):
+        """
+        Args:
+            shards: 샤드 목록
+            rrf_k: 벡터/BM25 병합 RRF 상수
+            max_workers: 동시에 검색할 샤드 수
+        """
+        self.shards = {shard.name: shard for shard in shards}
+        self.rrf_k = rrf_k
+        self._pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(self.shards))),
+                                        thread_name_prefix="shard-search")
+        self._pool_lock = threading.Lock()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self.shards)
+
+    def get_document(self, doc_id: str) -> Optional[Document]:
+        """docstore ID → 문서 (샤드 순서대로 조회)"""
+        for shard in self.shards.values():
+            doc = shard.vectorstore.docstore.search(doc_id)
+            if isinstance(doc, Document):
+                return doc
+        return None
+
+    def select(self, search_filter: Optional[SearchFilter] = None) -> List[Tuple[Shard, bool]]:
+        """검색할 샤드 + 샤드 전체가 범위 안인지"""
+        selected = []
+        for shard in self.shards.values():
+            covered = shard.coverage(search_filter)
+            if covered is not None:
+                selected.append((shard, covered))
+        return selected
+
+    def _search_shard(self, shard: Shard, vector: List[float], question: str, candidate_k: int,
+                      metadata_filter: Optional[Callable[[dict], bool]]):
+        vector_hits = shard.vectorstore.similarity_search_with_score_by_vector(
+            vector, k=candidate_k, filter=metadata_filter, fetch_k=candidate_k * 4)
+        bm25_hits = []
+        if shard.bm25 is not None:
+            bm25_k = candidate_k * (4 if metadata_filter else 1)
+            for doc_id, score in shard.bm25.search(question, k=bm25_k):
+                doc = shard.vectorstore.docstore.search(doc_id)
+                if not isinstance(doc, Document):
+                    continue
+                if metadata_filter is None or metadata_filter(doc.metadata):
+                    bm25_hits.append((doc, score))
+            bm25_hits = bm25_hits[:candidate_k]
+        return vector_hits, bm25_hits
+
+    def retrieve(
+        self,
+        question: str,
+        k: int,
+        embed_query: Callable[[str], List[float]],
+        search_filter: Optional[SearchFilter] = None,
+    ) -> Tuple[List[Tuple[Document, float]], str]:
+        """
+        관련 샤드 병렬 검색 + 병합
+
+        Returns:
+            ((문서, 점수) 리스트, "hybrid" | "vector")
+            - hybrid: RRF 점수 (높을수록 관련), vector: L2 거리 (낮을수록 관련)
+        """
+        selected = self.select(search_filter)
+        if not selected:
+            return [], "vector"
+        hybrid = any(shard.bm25 is not None for shard, _ in selected)
+        candidate_k = max(k * 4, 20) if hybrid else k
+        vector = embed_query(question)
+        tasks = [(self._search_shard, shard, vector, question, candidate_k,
+                  None if covered else search_filter.matches)
+                 for shard, covered in selected]
+        # 제출과 close()의 종료 표시를 같은 락으로 묶음 (종료된 풀에 제출하지 않음)
+        with self._pool_lock:
+            futures = None if self._closed else [self._pool.submit(*task) for task in tasks]
+        results = ([future.result() for future in futures] if futures is not None
+                   else [task[0](*task[1:]) for task in tasks])
+        vector_hits, bm25_hits = [], []
+        for shard_vector, shard_bm25 in results:
+            vector_hits.extend(shard_vector)
+            bm25_hits.extend(shard_bm25)
+
+        vector_hits.sort(key=lambda hit: hit[1])
+        if not hybrid:
+            return vector_hits[:k], "vector"
+
+        # 샤드별 BM25 점수는 IDF가 샤드마다 달라 근사 비교 → 순위만 쓰는 RRF로 완화
+        bm25_hits.sort(key=lambda hit: -hit[1])
+        docs: Dict[str, Document] = {}
+        rankings = []
+        for hits in (vector_hits[:candidate_k], bm25_hits[:candidate_k]):
+            ranking = []
+            for doc, _ in hits:
+                doc_id = doc.id or doc.page_content
+                docs[doc_id] = doc
+                ranking.append(doc_id)
+            rankings.append(ranking)
+        fused = reciprocal_rank_fusion(rankings, rrf_k=self.rrf_k)
+        return [(docs[doc_id], score) for doc_id, score in fused[:k]], "hybrid"
+
+    def close(self):
+        """진행 중인 샤드 검색을 기다린 뒤 스레드 풀 종료 (이후 검색은 순차 실행)"""
+        with self._pool_lock:
+            self._closed = True
+        self._pool.shutdown(wait=True)
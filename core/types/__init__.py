@@ -13,8 +13,10 @@ from core.types.errors import (
     HRAgentError,
     SQLExecutionError,
     RAGRetrievalError,
+    IndexBuildError,
     RouterError,
     DatabaseConnectionError,
+    UnsupportedQueryError,
 )
 
 __all__ = [
@@ -27,6 +29,8 @@ __all__ = [
     "HRAgentError",
     "SQLExecutionError",
     "RAGRetrievalError",
+    "IndexBuildError",
     "RouterError",
     "DatabaseConnectionError",
+    "UnsupportedQueryError",
 ]
@@ -29,6 +29,8 @@ class SQLAgentState(TypedDict):
     results: Optional[List[Dict[str, Any]]]
     attempt: int
     max_attempts: int
+    engine: str  # 실행 엔진 ("mysql" | "replica" | "rollup" | "sample")
+    approximation: Optional[Dict[str, Any]]  # 표본 근사 응답 시 신뢰구간 등
 
 
 # ===== HR Agent State (LangGraph용) =====
@@ -38,3 +40,5 @@ class HRAgentState(TypedDict):
     agent_type: str
     agent_result: Optional[AgentResult]
     error: str
+    answer_mode: Optional[str]  # RAG 응답 방식 ("llm" | "extractive", None이면 기본값)
+    search_filter: Optional[Any]  # RAG 검색 범위 (core.retrieval.sharded.SearchFilter)
@@ -31,6 +31,13 @@ class RAGRetrievalError(HRAgentError):
         super().__init__(message, "RAG_RETRIEVAL_ERROR")
 
 
+class IndexBuildError(HRAgentError):
+    """RAG 인덱스 빌드 오류"""
+
+    def __init__(self, message: str):
+        super().__init__(message, "INDEX_BUILD_ERROR")
+
+
 class RouterError(HRAgentError):
     """라우팅 오류"""
 
@@ -43,3 +50,10 @@ class DatabaseConnectionError(HRAgentError):
 
     def __init__(self, message: str):
         super().__init__(message, "DATABASE_CONNECTION_ERROR")
+
+
+class UnsupportedQueryError(HRAgentError):
+    """인메모리 엔진이 처리할 수 없는 쿼리 (MySQL 폴백 신호)"""
+
+    def __init__(self, message: str):
+        super().__init__(message, "UNSUPPORTED_QUERY")
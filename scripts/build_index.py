@@ -6,25 +6,76 @@ FAISS 벡터 인덱스 빌드 스크립트
     python scripts/build_index.py                     # 기본 실행
     python scripts/build_index.py --test              # 검색 테스트만
     python scripts/build_index.py --source file.pdf   # 특정 파일
+    python scripts/build_index.py --incremental       # 변경/삭제된 청크만 반영
+    (빌드는 항상 data/faiss_index/v<시각>-<id>/에 저장 후 CURRENT를 원자적으로 교체
+     → 서빙 중 인덱스 무중단)
+    python scripts/build_index.py --workers 1         # 임베딩 동시 요청 수 (Ollama 로컬 등)
+    python scripts/build_index.py --pdf-workers 4     # PDF 추출 프로세스 수
+    python scripts/build_index.py --index-type "hnsw:m=32,ef_search=64"  # 서빙 인덱스 종류
+    python scripts/build_index.py --benchmark --bench-sizes 10000,100000  # ANN 인덱스 비교
+    python scripts/build_index.py --dedup-threshold 0 # 유사 중복 청크 제거 끄기
+    python scripts/build_index.py --chunker article   # 고정 길이 대신 조문(장/조/항) 단위 청킹
+    python scripts/build_index.py --child-size 200    # 부모-자식 인덱스 (자식으로 검색, 부모 반환)
+    python scripts/build_index.py --no-facts          # 수치 사실 테이블(facts.json) 추출 끄기
+    python scripts/build_index.py --faq-sources ""    # FAQ 색인(faq.json) 끄기
+    python scripts/build_index.py --shard-by source   # 원본 파일별 샤드 인덱스 (질의 시 병렬 검색)
+    # 오프라인 벤치마크 (외부 호출 없는 해싱 임베딩)
+    python scripts/build_index.py --embedding-provider local --embedding-model hash-384
+    python scripts/build_index.py --quantize "int8:dims=512"              # 서빙 벡터 양자화
+    python scripts/build_index.py --benchmark --bench-quant "float16;int8;int8:dims=512"
 """
 
 import argparse
+import hashlib
+import json
 import logging
 import os
+import shutil
 import sys
+from dataclasses import asdict
 from pathlib import Path
+from typing import Optional
 
 # 프로젝트 루트를 path에 추가
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+import faiss
 from dotenv import load_dotenv
-from pdfplumber import open as pdfopen
 from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
 
-from core.llm.factory import create_embeddings
+from core.indexing.article_chunker import chunk_articles
+from core.indexing.ann import INDEX_TYPES, ANNConfig, benchmark_indexes, reconstruct_vectors
+from core.indexing.dedup import deduplicate_chunks
+from core.indexing.embedding_pipeline import EmbeddingPipeline
+from core.indexing.fact_extraction import extract_facts
+from core.indexing.incremental import MANIFEST_FILE, IncrementalIndexer
+from core.indexing.parent_child import split_parent_child
+from core.indexing.pdf_extraction import ParseCache, PDFExtractor
+from core.retrieval.fact_table import FACTS_FILE, FactTable
+from core.retrieval.index_versions import (
+    create_version_dir,
+    prune_versions,
+    publish_version,
+    resolve_index_path,
+)
+from core.retrieval.faq_index import FAQ_FILE, FAQ_VECTORS_FILE, FAQIndex, load_faq_entries
+from core.retrieval.parent_store import PARENTS_FILE, ParentStore
+from core.retrieval.sharded import (
+    SHARDS_DIR,
+    SHARDS_FILE,
+    Shard,
+    ShardedRetriever,
+    build_catalog,
+    group_shards,
+    load_catalog,
+    save_catalog,
+)
+from core.retrieval.quantized import QuantizationConfig, benchmark_quantization
+from core.llm.embedding_cache import CachedEmbeddings, EmbeddingStore
+from core.llm.factory import create_embeddings, resolve_local_embedding_model
 
 # OpenMP 충돌 방지 (Windows)
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
@@ -42,43 +93,66 @@ def load_config():
     """환경변수에서 설정 로드"""
     load_dotenv(PROJECT_ROOT / ".env")
 
+    # 임베딩 Provider (RAG_EMBEDDING_PROVIDER가 없으면 LLM_PROVIDER)
+    provider = os.getenv("RAG_EMBEDDING_PROVIDER") or os.getenv("LLM_PROVIDER", "openai")
+    embedding_model = (
+        os.getenv("OLLAMA_EMBEDDING_MODEL", "qwen3-embedding")
+        if provider == "ollama"
+        else os.getenv("RAG_EMBEDDING_MODEL", "text-embedding-3-small")
+    )
+    if provider == "local":
+        embedding_model = resolve_local_embedding_model(embedding_model)
     return {
-        "provider": os.getenv("LLM_PROVIDER", "openai"),
-        "embedding_model": os.getenv("OLLAMA_EMBEDDING_MODEL", "qwen3-embedding")
-            if os.getenv("LLM_PROVIDER") == "ollama"
-            else os.getenv("RAG_EMBEDDING_MODEL", "text-embedding-3-small"),
+        "provider": provider,
+        "embedding_model": embedding_model,
         "base_url": os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
         "docs_path": PROJECT_ROOT / "data" / "company_docs",
         "index_path": PROJECT_ROOT / "data" / "faiss_index",
+        "embedding_cache_path": PROJECT_ROOT / os.getenv(
+            "RAG_EMBEDDING_CACHE_PATH", "data/embedding_cache.db"),
+        "parse_cache_path": PROJECT_ROOT / os.getenv("RAG_PARSE_CACHE_PATH", "data/parse_cache.db"),
+        "chunker": os.getenv("RAG_CHUNKER", "recursive"),
+        "child_chunk_size": int(os.getenv("RAG_CHILD_CHUNK_SIZE", "0")),
+        "fact_table": os.getenv("RAG_FACT_TABLE_ENABLED", "true").lower() == "true",
+        "faq_sources": os.getenv("RAG_FAQ_SOURCES",
+                                 "data/finetuning/rag_train.json,data/faq_approved.json"),
+        "dedup_threshold": float(os.getenv("RAG_DEDUP_THRESHOLD", "0.8")),
+        "index_type": os.getenv("RAG_INDEX_TYPE", "flat"),
+        "quantization": os.getenv("RAG_VECTOR_QUANTIZATION", "float32"),
+        "embed_batch_size": int(os.getenv("RAG_EMBED_BATCH_SIZE", "64")),
+        "embed_workers": int(os.getenv("RAG_EMBED_WORKERS", "4")),
+        "keep_versions": int(os.getenv("RAG_INDEX_KEEP_VERSIONS", "3")),
+        "shard_by": os.getenv("RAG_SHARD_BY", ""),
     }
 
 
-def load_documents(source_path: Path) -> list[Document]:
-    """PDF 문서 로드"""
-    documents = []
-
+def load_documents(source_path: Path, config: dict, workers: int = None) -> list[Document]:
+    """PDF 문서 로드 (프로세스 풀 병렬 추출, 바뀌지 않은 파일은 파싱 캐시 사용)"""
     if source_path.is_file():
         files = [source_path]
     else:
-        files = list(source_path.glob("*.pdf"))
+        files = sorted(source_path.glob("*.pdf"))
 
     for file_path in files:
         logger.info(f"로드 중: {file_path.name}")
-        with pdfopen(str(file_path)) as pdf:
-            for i, page in enumerate(pdf.pages):
-                text = page.extract_text()
-                if text:
-                    documents.append(Document(
-                        page_content=text,
-                        metadata={"source": file_path.name, "page": i}
-                    ))
-
-    logger.info(f"총 {len(documents)} 페이지 로드 완료")
+    extractor = PDFExtractor(cache=ParseCache(config["parse_cache_path"]), max_workers=workers)
+    documents = extractor.extract(files)
+
+    stats = extractor.last_stats
+    logger.info(
+        f"총 {len(documents)} 페이지 로드 완료"
+        f" (캐시 {stats.cached_pages} / 파싱 {stats.parsed_pages}, {stats.elapsed_sec}s)"
+    )
     return documents
 
 
-def chunk_documents(documents: list[Document], chunk_size: int = 500, overlap: int = 50) -> list[Document]:
-    """문서 청킹"""
+def chunk_documents(documents: list[Document], chunk_size: int = 500, overlap: int = 50,
+                    chunker: str = "recursive") -> list[Document]:
+    """문서 청킹 (article: 장/조/항 구조 기준, recursive: 고정 길이)"""
+    if chunker == "article":
+        chunks = chunk_articles(documents, fallback_chunk_size=chunk_size, fallback_overlap=overlap)
+        logger.info(f"총 {len(chunks)} 청크 생성 (조문 단위)")
+        return chunks
     splitter = RecursiveCharacterTextSplitter(
         chunk_size=chunk_size,
         chunk_overlap=overlap,
@@ -89,32 +163,190 @@ def chunk_documents(documents: list[Document], chunk_size: int = 500, overlap: i
     return chunks
 
 
-def build_index(chunks: list[Document], config: dict) -> FAISS:
-    """FAISS 인덱스 생성"""
-    logger.info(f"임베딩 모델: {config['provider']}/{config['embedding_model']}")
+def dedup_chunks(chunks: list[Document], threshold: float) -> list[Document]:
+    """유사 중복 청크 제거 (임베딩 전, threshold <= 0이면 생략)"""
+    if threshold <= 0:
+        return chunks
+    kept, report = deduplicate_chunks(chunks, threshold=threshold)
+    logger.info(
+        f"중복 제거: {report.total} → {report.kept} 청크 (중복 클러스터 {report.clusters}개)"
+    )
+    return kept
 
+
+def create_index_embeddings(config: dict) -> CachedEmbeddings:
+    """청크 임베딩 저장소를 둔 Embeddings ((모델, 내용 해시) 단위 재사용)"""
     embeddings = create_embeddings(
         provider=config["provider"],
         model=config["embedding_model"],
         base_url=config["base_url"] if config["provider"] == "ollama" else None
     )
+    return CachedEmbeddings(
+        embeddings,
+        namespace=f"{config['provider']}/{config['embedding_model']}:documents",
+        store=EmbeddingStore(config["embedding_cache_path"]),
+        cache_documents=True,
+    )
+
+
+def build_index(
+    chunks: list[Document], config: dict, incremental: bool = False
+) -> IncrementalIndexer:
+    """
+    FAISS 인덱스 생성
+
+    Args:
+        incremental: True면 기존 인덱스에 변경분만 반영, False면 전체 재빌드
+            (두 경우 모두 이미 임베딩한 청크는 저장소에서 재사용)
+    """
+    logger.info(f"임베딩 모델: {config['provider']}/{config['embedding_model']}")
+
+    embeddings = create_index_embeddings(config)
 
     # 임베딩 테스트
     test_vec = embeddings.embed_query("테스트")
     logger.info(f"벡터 차원: {len(test_vec)}")
 
     # 인덱스 생성
-    logger.info("인덱스 생성 중... (시간 소요)")
-    vectorstore = FAISS.from_documents(chunks, embeddings)
+    logger.info("인덱스 생성 중..." if incremental else "인덱스 생성 중... (시간 소요)")
+    pipeline = EmbeddingPipeline(
+        embeddings.base.embed_documents,
+        batch_size=config["embed_batch_size"],
+        max_workers=config["embed_workers"],
+    )
+    indexer = IncrementalIndexer(embeddings, config["index_path"], pipeline=pipeline,
+                                 ann_config=ANNConfig.from_spec(config["index_type"]),
+                                 quantization=QuantizationConfig.from_spec(config["quantization"]))
+    report = indexer.update(chunks, full=not incremental)
+    logger.info(
+        f"[{report.mode}] 전체 {report.total} / 추가 {report.added} / 삭제 {report.removed}"
+        f" / 유지 {report.unchanged} / 임베딩 호출 {report.embedded} / 재사용 {report.reused}"
+        f" ({report.elapsed_sec}s)"
+    )
+    if report.embedded:
+        logger.info(
+            f"임베딩 처리량: {report.chunks_per_sec} chunks/sec"
+            f" ({report.batches}배치, 재시도 {report.retries}회)"
+        )
+    return indexer
+
+
+def build_sharded_index(chunks: list[Document], config: dict,
+                        incremental: bool = False) -> tuple[CachedEmbeddings, str]:
+    """
+    샤드별 인덱스 생성 (shards/<샤드명>/) + 카탈로그(shards.json) 저장
+
+    Returns:
+        (임베딩, 인덱스 버전) - 버전은 샤드 버전들의 해시 (루트 manifest.json에 기록)
+    """
+    index_path = config["index_path"]
+    groups = group_shards(chunks, config["shard_by"])
+    versions = {}
+    for name, shard_chunks in groups.items():
+        logger.info(f"[샤드 {name}] 청크 {len(shard_chunks)}개")
+        shard_config = {**config, "index_path": index_path / SHARDS_DIR / name}
+        indexer = build_index(shard_chunks, shard_config, incremental=incremental)
+        indexer.save()
+        versions[name] = indexer.manifest["version"]
+    # 이전 빌드에서 없어진 샤드 정리 (증분 빌드는 이전 버전을 복사해 시작)
+    for stale in (index_path / SHARDS_DIR).glob("*"):
+        if stale.name not in groups:
+            shutil.rmtree(stale)
+    save_catalog(index_path, build_catalog(groups))
+    version = hashlib.sha1(json.dumps(versions, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+    (index_path / MANIFEST_FILE).write_text(
+        json.dumps({"version": version, "shards": versions}, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+    return indexer.embeddings, version
+
+
+def save_index(indexer: Optional[IncrementalIndexer], index_path: Path,
+               parents: list[Document] = None, facts: list = None):
+    """
+    인덱스 저장
+    (manifest 포함, 부모-자식 인덱스면 부모 청크, 사실 테이블이 있으면 facts.json도 저장)
+
+    Args:
+        indexer: 단일 인덱스
+            (None이면 샤드 인덱스 - 샤드는 build_sharded_index가 저장, 공용 파일만 저장)
+    """
+    if indexer is not None:
+        indexer.index_path = index_path
+        indexer.save()
+        # 단일 인덱스로 바뀐 경우 이전 샤드 제거
+        (index_path / SHARDS_FILE).unlink(missing_ok=True)
+        shutil.rmtree(index_path / SHARDS_DIR, ignore_errors=True)
+    if parents is not None:
+        ParentStore.from_documents(parents).save(index_path)
+    else:
+        (index_path / PARENTS_FILE).unlink(missing_ok=True)
+    if facts is not None:
+        FactTable(facts).save(index_path)
+    else:
+        (index_path / FACTS_FILE).unlink(missing_ok=True)
+
+
+def build_faq(embeddings: CachedEmbeddings, index_version: str, config: dict):
+    """FAQ 색인 생성 (FAQ 질문 임베딩 + 인덱스 버전 태그, 원본이 없으면 기존 FAQ 파일 삭제)"""
+    index_path = config["index_path"]
+    sources = [
+        PROJECT_ROOT / path.strip() for path in config["faq_sources"].split(",") if path.strip()
+    ]
+    entries = load_faq_entries(sources)
+    if not entries:
+        for name in (FAQ_FILE, FAQ_VECTORS_FILE):
+            (index_path / name).unlink(missing_ok=True)
+        return
+    faq = FAQIndex.build(
+        entries,
+        embeddings,
+        namespace=f"{config['provider']}/{config['embedding_model']}",
+        index_version=index_version,
+    )
+    faq.save(index_path)
+    logger.info(f"FAQ 색인: {len(faq)}개 (인덱스 버전 {faq.index_version})")
+
+
+def load_index_vectors(index_path: Path):
+    """빌드된 (flat) 인덱스의 청크 벡터"""
+    vectors = reconstruct_vectors(faiss.read_index(str(index_path / "index.faiss")))
+    logger.info(f"벤치마크 기준 벡터: {vectors.shape[0]}개 x {vectors.shape[1]}차원")
+    return vectors
+
 
-    return vectorstore
+def run_benchmark(index_path: Path, specs: list[str], sizes: list[int], k: int):
+    """빌드된 인덱스의 청크 벡터 분포로 ANN 인덱스 종류별 recall@k / 지연 비교"""
+    vectors = load_index_vectors(index_path)
 
+    configs = [ANNConfig.from_spec(spec) for spec in specs]
+    results = benchmark_indexes(vectors, configs, sizes=sizes, k=k)
 
-def save_index(vectorstore: FAISS, index_path: Path):
-    """인덱스 저장"""
-    index_path.mkdir(parents=True, exist_ok=True)
-    vectorstore.save_local(str(index_path))
-    logger.info(f"인덱스 저장 완료: {index_path}")
+    print("\n" + "=" * 86)
+    print(f"{'index':<32} {'size':>9} {'recall@' + str(k):>10} {'p50 ms':>8} {'p99 ms':>8}"
+          f" {'build s':>8} {'MB':>7}")
+    print("-" * 86)
+    for r in results:
+        print(f"{r.spec:<32} {r.size:>9,} {r.recall:>10.3f} {r.p50_ms:>8.3f} {r.p99_ms:>8.3f}"
+              f" {r.build_sec:>8.2f} {r.index_mb:>7.1f}")
+    print("=" * 86)
+    return results
+
+
+def run_quantization_benchmark(index_path: Path, specs: list[str], k: int):
+    """양자화 설정별 메모리 절감 배수와 recall@k (재채점 전/후) 비교"""
+    vectors = load_index_vectors(index_path)
+    configs = [QuantizationConfig.from_spec(spec) for spec in specs]
+    results = benchmark_quantization(vectors, configs, k=k)
+
+    print("\n" + "=" * 78)
+    print(f"{'quantization':<24} {'B/vec':>8} {'x':>6} {'recall':>8} {'rescored':>9} {'p50 ms':>8}")
+    print("-" * 78)
+    for r in results:
+        print(f"{r.spec:<24} {r.bytes_per_vector:>8.0f} {r.compression:>6.1f} {r.recall:>8.3f}"
+              f" {r.recall_rescored:>9.3f} {r.p50_ms:>8.3f}")
+    print("=" * 78)
+    return results
 
 
 def test_search(index_path: Path, config: dict):
@@ -127,11 +359,25 @@ def test_search(index_path: Path, config: dict):
         base_url=config["base_url"] if config["provider"] == "ollama" else None
     )
 
-    vectorstore = FAISS.load_local(
-        str(index_path),
-        embeddings,
-        allow_dangerous_deserialization=True
-    )
+    catalog = load_catalog(index_path)
+    if catalog:
+        retriever = ShardedRetriever([
+            Shard(name, FAISS.load_local(str(index_path / SHARDS_DIR / name), embeddings,
+                                         allow_dangerous_deserialization=True))
+            for name in catalog
+        ])
+
+        def search(query: str) -> list[Document]:
+            return [doc for doc, _ in retriever.retrieve(query, 1, embeddings.embed_query)[0]]
+    else:
+        vectorstore = FAISS.load_local(
+            str(index_path),
+            embeddings,
+            allow_dangerous_deserialization=True
+        )
+
+        def search(query: str) -> list[Document]:
+            return vectorstore.similarity_search(query, k=1)
 
     test_queries = [
         "연차휴가 일수",
@@ -145,7 +391,7 @@ def test_search(index_path: Path, config: dict):
     print("=" * 60)
 
     for query in test_queries:
-        results = vectorstore.similarity_search(query, k=1)
+        results = search(query)
         content = results[0].page_content[:100].replace("\n", " ")
         print(f"\n[Q] {query}")
         print(f"[A] {content}...")
@@ -156,30 +402,152 @@ def test_search(index_path: Path, config: dict):
 def main():
     parser = argparse.ArgumentParser(description="FAISS 인덱스 빌드")
     parser.add_argument("--source", type=str, help="소스 PDF 경로 (기본: data/company_docs/)")
-    parser.add_argument("--output", type=str, help="인덱스 저장 경로 (기본: data/faiss_index/)")
+    parser.add_argument("--output", type=str,
+                        help="인덱스 루트 경로 (기본: data/faiss_index/, 버전 디렉토리 + CURRENT)")
     parser.add_argument("--test", action="store_true", help="검색 테스트만 실행")
+    parser.add_argument("--embedding-provider", choices=["openai", "ollama", "local"],
+                        help="임베딩 Provider (local: 결정적 해싱 임베딩,"
+                             " 기본: RAG_EMBEDDING_PROVIDER 또는 LLM_PROVIDER)")
+    parser.add_argument("--embedding-model", type=str,
+                        help="임베딩 모델명 (local이면 hash-<차원>, 기본: RAG_EMBEDDING_MODEL)")
     parser.add_argument("--chunk-size", type=int, default=500, help="청크 크기")
+    parser.add_argument("--chunker", choices=["article", "recursive"],
+                        help="청킹 방식 (article: 조문 단위, recursive: 고정 길이,"
+                             " 기본: RAG_CHUNKER)")
+    parser.add_argument("--child-size", type=int,
+                        help="부모-자식 인덱스의 자식 청크 크기"
+                             " (0이면 끄기, 기본: RAG_CHILD_CHUNK_SIZE)")
+    parser.add_argument("--no-facts", action="store_true",
+                        help="수치 사실 테이블(facts.json) 추출 끄기"
+                             " (기본: RAG_FACT_TABLE_ENABLED)")
+    parser.add_argument("--faq-sources", type=str,
+                        help="FAQ 원본 JSON 경로"
+                             " (쉼표 구분, 빈 값이면 끄기, 기본: RAG_FAQ_SOURCES)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="변경/추가된 청크만 임베딩, 삭제된 청크는 인덱스에서 제거")
+    parser.add_argument("--shard-by", type=str,
+                        help="샤드 기준 metadata (source: 원본 파일별, 빈 값이면 단일 인덱스,"
+                             " 기본: RAG_SHARD_BY)")
+    parser.add_argument("--keep-versions", type=int,
+                        help="남길 인덱스 버전 수 (기본: RAG_INDEX_KEEP_VERSIONS)")
+    parser.add_argument("--batch-size", type=int,
+                        help="임베딩 배치 크기 (기본: RAG_EMBED_BATCH_SIZE)")
+    parser.add_argument("--workers", type=int, help="임베딩 동시 요청 수 (기본: RAG_EMBED_WORKERS)")
+    parser.add_argument("--pdf-workers", type=int, help="PDF 추출 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--dedup-threshold", type=float,
+                        help="유사 중복 청크로 볼 Jaccard 유사도"
+                             " (0이면 끄기, 기본: RAG_DEDUP_THRESHOLD)")
+    parser.add_argument("--index-type", type=str,
+                        help=f"서빙 인덱스 종류[:파라미터] ({'|'.join(INDEX_TYPES)},"
+                             " 기본: RAG_INDEX_TYPE)")
+    parser.add_argument("--quantize", type=str,
+                        help="서빙 벡터 양자화 (float32 | float16 | int8[:dims=N,rescore=M],"
+                             " 기본: RAG_VECTOR_QUANTIZATION)")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="빌드된 인덱스 벡터로 ANN 인덱스 recall/지연 비교")
+    parser.add_argument("--bench-types", type=str, default="flat;ivf;ivfpq;ivfsq;sq;hnsw",
+                        help="비교할 인덱스 스펙"
+                             " (';' 구분, 예: \"ivf:nprobe=8;hnsw:ef_search=32\")")
+    parser.add_argument("--bench-sizes", type=str, default="1000,10000,100000",
+                        help="코퍼스 크기 (',' 구분, 원본보다 크면 합성 벡터로 확장)")
+    parser.add_argument("--bench-quant", type=str,
+                        help="비교할 양자화 스펙 (';' 구분, 지정 시 ANN 대신 양자화 벤치마크)")
+    parser.add_argument("--bench-k", type=int, default=10, help="recall@k의 k")
+    parser.add_argument("--bench-json", type=str, help="벤치마크 결과 JSON 저장 경로")
     args = parser.parse_args()
 
     config = load_config()
 
+    if args.embedding_provider:
+        config["provider"] = args.embedding_provider
+        if args.embedding_provider == "local" and not args.embedding_model:
+            config["embedding_model"] = resolve_local_embedding_model(
+                os.getenv("RAG_EMBEDDING_MODEL"))
+    if args.embedding_model:
+        config["embedding_model"] = args.embedding_model
     if args.source:
         config["docs_path"] = Path(args.source)
     if args.output:
         config["index_path"] = Path(args.output)
+    if args.chunker:
+        config["chunker"] = args.chunker
+    if args.child_size is not None:
+        config["child_chunk_size"] = args.child_size
+    if args.no_facts:
+        config["fact_table"] = False
+    if args.faq_sources is not None:
+        config["faq_sources"] = args.faq_sources
+    if args.shard_by is not None:
+        config["shard_by"] = args.shard_by
+    if args.keep_versions:
+        config["keep_versions"] = args.keep_versions
+    if args.batch_size:
+        config["embed_batch_size"] = args.batch_size
+    if args.workers:
+        config["embed_workers"] = args.workers
+    if args.dedup_threshold is not None:
+        config["dedup_threshold"] = args.dedup_threshold
+    if args.index_type:
+        config["index_type"] = args.index_type
+    if args.quantize:
+        config["quantization"] = args.quantize
 
     logger.info(f"Provider: {config['provider']}")
     logger.info(f"Embedding: {config['embedding_model']}")
 
+    index_root = config["index_path"]
     if args.test:
-        test_search(config["index_path"], config)
+        test_search(resolve_index_path(index_root), config)
+        return
+
+    if args.benchmark and args.bench_quant:
+        results = run_quantization_benchmark(
+            resolve_index_path(index_root),
+            specs=["float32"] + [spec for spec in args.bench_quant.split(";") if spec.strip()],
+            k=args.bench_k,
+        )
+    elif args.benchmark:
+        results = run_benchmark(
+            resolve_index_path(index_root),
+            specs=[spec for spec in args.bench_types.split(";") if spec.strip()],
+            sizes=[int(size) for size in args.bench_sizes.split(",")],
+            k=args.bench_k,
+        )
+    if args.benchmark:
+        if args.bench_json:
+            Path(args.bench_json).write_text(
+                json.dumps([asdict(r) for r in results], ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
         return
 
     # 전체 파이프라인
-    documents = load_documents(config["docs_path"])
-    chunks = chunk_documents(documents, chunk_size=args.chunk_size)
-    vectorstore = build_index(chunks, config)
-    save_index(vectorstore, config["index_path"])
+    documents = load_documents(config["docs_path"], config, workers=args.pdf_workers)
+    chunks = chunk_documents(documents, chunk_size=args.chunk_size, chunker=config["chunker"])
+    chunks = dedup_chunks(chunks, config["dedup_threshold"])
+    # 수치 사실은 자식 분할 전 조문 단위 청크에서 추출 (문단이 잘리지 않도록)
+    facts = extract_facts(chunks) if config["fact_table"] else None
+    parents = None
+    if config["child_chunk_size"] > 0:
+        parents, chunks = split_parent_child(chunks, child_size=config["child_chunk_size"])
+
+    # 새 버전 디렉토리에 빌드 (증분이면 현재 버전을 복사해 시작) → 완료 후 CURRENT 교체
+    config["index_path"] = create_version_dir(
+        index_root, seed_from=resolve_index_path(index_root) if args.incremental else None)
+    try:
+        if config["shard_by"]:
+            embeddings, version = build_sharded_index(chunks, config, incremental=args.incremental)
+            save_index(None, config["index_path"], parents=parents, facts=facts)
+        else:
+            indexer = build_index(chunks, config, incremental=args.incremental)
+            save_index(indexer, config["index_path"], parents=parents, facts=facts)
+            embeddings, version = indexer.embeddings, indexer.manifest["version"]
+        build_faq(embeddings, version, config)
+    except BaseException:
+        shutil.rmtree(config["index_path"], ignore_errors=True)
+        raise
+    publish_version(index_root, config["index_path"])
+    prune_versions(index_root, keep=config["keep_versions"])
 
     # 자동 테스트
     test_search(config["index_path"], config)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+SQL 실행 로그 기반 인덱스 추천 스크립트
+
+SQL_QUERY_LOG_ENABLED=true 로 SQL Agent 실행 로그를 쌓은 뒤 실행
+
+사용법:
+    python scripts/index_advisor.py                  # 추천 목록 출력
+    python scripts/index_advisor.py --ddl            # CREATE INDEX 문만 출력
+    python scripts/index_advisor.py --since-hours 24 # 최근 24시간 로그만 분석
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.core.config import get_settings
+from core.analytics.index_advisor import IndexAdvisor, format_recommendations
+from core.analytics.query_log import QueryLog
+from core.database.connection import DatabaseConnection
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S"
+)
+logger = logging.getLogger(__name__)
+
+
+def print_shapes(query_log: QueryLog, limit: int, since):
+    """누적 지연 시간 상위 쿼리 형태 출력"""
+    logger.info("=== 상위 쿼리 형태 (누적 지연 기준) ===")
+    for shape in query_log.top_shapes(limit=limit, since=since):
+        examined = "-" if shape.avg_rows_examined is None else f"{shape.avg_rows_examined:,.0f}"
+        logger.info(
+            f"[{shape.count}회] 누적 {shape.total_latency_ms:,.1f}ms"
+            f" / 평균 {shape.avg_latency_ms:,.1f}ms"
+            f" / 조회 {examined}행 / {','.join(shape.engines)}"
+        )
+        logger.info(f"    {shape.fingerprint[:160]}")
+
+
+def main():
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(description="SQL 실행 로그 기반 인덱스 추천")
+    parser.add_argument("--log", type=str, default=settings.SQL_QUERY_LOG_PATH,
+                        help=f"쿼리 로그 경로 (기본: {settings.SQL_QUERY_LOG_PATH})")
+    parser.add_argument("--limit", type=int, default=20, help="분석할 상위 쿼리 형태 수")
+    parser.add_argument("--since-hours", type=float, help="최근 N시간 로그만 분석")
+    parser.add_argument("--min-executions", type=int, default=1, help="최소 실행 횟수")
+    parser.add_argument("--ddl", action="store_true", help="CREATE INDEX 문만 출력")
+    parser.add_argument("--json", action="store_true", help="추천 결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    log_path = PROJECT_ROOT / args.log if not Path(args.log).is_absolute() else Path(args.log)
+    if not log_path.exists():
+        logger.error(f"쿼리 로그가 없습니다: {log_path} (SQL_QUERY_LOG_ENABLED=true 로 수집)")
+        sys.exit(1)
+    if not settings.DATABASE_URL:
+        logger.error("DATABASE_URL이 설정되지 않았습니다.")
+        sys.exit(1)
+
+    since = time.time() - args.since_hours * 3600 if args.since_hours else None
+    query_log = QueryLog(log_path)
+    db = DatabaseConnection(connection_url=settings.DATABASE_URL)
+    advisor = IndexAdvisor(db=db, query_log=query_log)
+
+    recs = advisor.recommend(limit=args.limit, since=since, min_executions=args.min_executions)
+
+    if args.ddl:
+        for rec in recs:
+            print(rec.ddl)
+        return
+    if args.json:
+        print(json.dumps(format_recommendations(recs), ensure_ascii=False, indent=2))
+        return
+
+    print_shapes(query_log, args.limit, since)
+    logger.info("=== 인덱스 추천 ===")
+    if not recs:
+        logger.info("추천할 인덱스가 없습니다.")
+    for i, rec in enumerate(format_recommendations(recs), 1):
+        logger.info(f"[{i}] {rec['ddl']}")
+        logger.info(
+            f"    실행 {rec['executions']}회,"
+            f" 조회 행 {rec['rows_before']:,} → {rec['rows_after']:,}"
+            f" (추정), 누적 지연 감소 약 {rec['estimated_latency_saved_ms']:,}ms"
+        )
+        logger.info(f"    {rec['reason']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+"""
+Analytics Tests
+인메모리 컬럼형 엔진 / 레플리카 / 롤업 / 표본 근사 / 근태 분석 / 인덱스 추천 테스트
+"""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from core.analytics.attendance import AttendanceAnalyzer
+from core.analytics.columnar import ColumnarTable
+from core.analytics.engine import QueryEngine
+from core.analytics.index_advisor import IndexAdvisor
+from core.analytics.query_log import QueryLog
+from core.analytics.replica import ColumnarReplica
+from core.analytics.sampling import ApproximateAggregator, requires_exact, reservoir_slots
+from core.analytics.sql_parser import parse_select
+from core.types.errors import UnsupportedQueryError
+
+
+@pytest.fixture
+def hr_tables():
+    """테스트용 HR 테이블 (init.sql 축소판)"""
+    departments = [
+        {"dept_id": 1, "name": "개발", "location": "서울"},
+        {"dept_id": 2, "name": "영업", "location": "부산"},
+    ]
+    employees = [
+        {"emp_id": 1, "name": "김철수", "dept_id": 1, "position": "부장", "status": "ACTIVE"},
+        {"emp_id": 2, "name": "이영희", "dept_id": 1, "position": "과장", "status": "ACTIVE"},
+        {"emp_id": 3, "name": "박민수", "dept_id": 2, "position": "부장", "status": "ACTIVE"},
+        {"emp_id": 4, "name": "한지민", "dept_id": None, "position": "사원", "status": "LEAVE"},
+    ]
+    salaries = [
+        {"salary_id": 1, "emp_id": 1, "base_salary": 9500000, "bonus": 3000000},
+        {"salary_id": 2, "emp_id": 2, "base_salary": 7000000, "bonus": None},
+        {"salary_id": 3, "emp_id": 3, "base_salary": 9000000, "bonus": 5000000},
+    ]
+    return {
+        "departments": ColumnarTable.from_rows("departments", "dept_id", departments),
+        "employees": ColumnarTable.from_rows("employees", "emp_id", employees),
+        "salaries": ColumnarTable.from_rows("salaries", "salary_id", salaries),
+    }
+
+
+class TestQueryEngine:
+    """QueryEngine 단위 테스트"""
+
+    def test_group_by_join(self, hr_tables):
+        """부서별 직원 수 (JOIN + GROUP BY + ORDER BY)"""
+        engine = QueryEngine(hr_tables)
+        sql = """
+            SELECT d.name, COUNT(*) AS cnt
+            FROM employees e JOIN departments d ON e.dept_id = d.dept_id
+            GROUP BY d.name ORDER BY cnt DESC;
+        """
+        results = engine.execute(parse_select(sql))
+
+        assert results == [{"name": "개발", "cnt": 2}, {"name": "영업", "cnt": 1}]
+
+    def test_aggregate_ignores_null(self, hr_tables):
+        """AVG는 NULL을 제외 (MySQL 규칙)"""
+        engine = QueryEngine(hr_tables)
+        results = engine.execute(parse_select("SELECT AVG(bonus), COUNT(*) FROM salaries;"))
+
+        assert results == [{"AVG(bonus)": 4000000.0, "COUNT(*)": 3}]
+
+    def test_where_case_insensitive(self, hr_tables):
+        """문자열 비교는 대소문자 무시 (utf8mb4_unicode_ci)"""
+        engine = QueryEngine(hr_tables)
+        results = engine.execute(
+            parse_select("SELECT name FROM employees WHERE status = 'leave';")
+        )
+
+        assert results == [{"name": "한지민"}]
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT YEAR(payment_date) FROM salaries;",
+        "SELECT name FROM employees WHERE dept_id = 1 OR dept_id = 2;",
+        "SELECT name FROM employees WHERE dept_id = (SELECT dept_id FROM departments);",
+    ])
+    def test_unsupported_query(self, hr_tables, sql):
+        """지원 범위 밖 쿼리는 UnsupportedQueryError"""
+        with pytest.raises(UnsupportedQueryError):
+            QueryEngine(hr_tables).execute(parse_select(sql))
+
+
+class TestColumnarReplica:
+    """ColumnarReplica 테스트"""
+
+    def test_incremental_refresh(self, mock_db):
+        """증분 갱신은 기본키 이후 행만 조회"""
+        employees = [{"emp_id": 1, "name": "김철수"}]
+
+        def execute_query(sql):
+            if "FROM employees" in sql:
+                return list(employees), None
+            return [], None
+
+        mock_db.execute_query.side_effect = execute_query
+        replica = ColumnarReplica(db=mock_db)
+        replica.refresh()
+
+        employees[:] = [{"emp_id": 2, "name": "이영희"}]
+        replica.refresh()
+
+        executed = [call.args[0] for call in mock_db.execute_query.call_args_list]
+        assert "SELECT * FROM employees WHERE emp_id > 1" in executed
+        assert replica.execute("SELECT COUNT(*) FROM employees;") == [{"COUNT(*)": 2}]
+
+
+class TestRollupStore:
+    """RollupStore 쿼리 재작성 테스트"""
+
+    @pytest.fixture
+    def store(self, mock_db):
+        """사전 집계된 급여 롤업을 반환하는 Mock DB"""
+        from core.analytics.rollups import RollupStore
+
+        salary_rows = [
+            {"dept_id": 1, "dept_name": "개발", "dept_location": "서울", "position": "부장",
+             "emp_status": "ACTIVE", "has_departments": 1, "has_employees": 1,
+             "yr": 2024, "mon": 1, "row_count": 2,
+             "base_salary_count": 2, "base_salary_sum": 18000000,
+             "base_salary_min": 8500000, "base_salary_max": 9500000,
+             "bonus_count": 1, "bonus_sum": 3000000, "bonus_min": 3000000, "bonus_max": 3000000},
+            {"dept_id": 2, "dept_name": "영업", "dept_location": "부산", "position": "사원",
+             "emp_status": "ACTIVE", "has_departments": 1, "has_employees": 1,
+             "yr": 2024, "mon": 2, "row_count": 1,
+             "base_salary_count": 1, "base_salary_sum": 3600000,
+             "base_salary_min": 3600000, "base_salary_max": 3600000,
+             "bonus_count": 0, "bonus_sum": None, "bonus_min": None, "bonus_max": None},
+        ]
+
+        def execute_query(sql):
+            if "FROM salaries s" in sql:
+                return salary_rows, None
+            if "COUNT(*) AS n" in sql:
+                return [{"n": 3, "max_pk": 3}], None
+            return [], None
+
+        mock_db.execute_query.side_effect = execute_query
+        return RollupStore(db=mock_db)
+
+    def test_rewrite_average_by_position(self, store):
+        """직급별 평균 급여는 합계/건수로 재집계"""
+        results = store.execute(
+            "SELECT e.position, AVG(s.base_salary) AS avg_salary "
+            "FROM salaries s JOIN employees e ON s.emp_id = e.emp_id "
+            "GROUP BY e.position ORDER BY avg_salary DESC;"
+        )
+
+        assert results == [
+            {"position": "부장", "avg_salary": 9000000.0},
+            {"position": "사원", "avg_salary": 3600000.0},
+        ]
+
+    def test_month_aligned_filter(self, store):
+        """월 경계 날짜 조건은 롤업 month 컬럼으로 변환"""
+        results = store.execute(
+            "SELECT COUNT(*) FROM salaries WHERE payment_date >= '2024-02-01';"
+        )
+
+        assert results == [{"COUNT(*)": 1}]
+
+    def test_unaligned_filter_falls_back(self, store):
+        """월 중간 날짜 조건은 롤업으로 답하지 않음"""
+        with pytest.raises(UnsupportedQueryError):
+            store.execute("SELECT COUNT(*) FROM salaries WHERE payment_date >= '2024-01-15';")
+
+    def test_update_without_new_rows_triggers_rebuild(self, mock_db):
+        """행 수/최대 PK가 같아도 행 내용 체크섬이 바뀌면 재계산 (UPDATE 반영)"""
+        from core.analytics.rollups import DEFAULT_ROLLUPS, RollupStore
+
+        checksum = {"value": 1}
+        mock_db.execute_query.side_effect = lambda sql: (
+            ([{"n": 3, "max_pk": 3, "checksum": checksum["value"]}], None)
+            if "COUNT(*) AS n" in sql else ([], None)
+        )
+        store = RollupStore(db=mock_db, specs=DEFAULT_ROLLUPS[:1], checksum_interval=0)
+
+        assert store.refresh() == [DEFAULT_ROLLUPS[0].name]
+        assert store.refresh() == []
+        checksum["value"] = 2
+        assert store.refresh() == [DEFAULT_ROLLUPS[0].name]
+
+    def test_signatures_shared_and_checksum_throttled(self, mock_db):
+        """시그니처는 원본 테이블당 한 번 조회, 체크섬(전체 스캔)은 checksum_interval마다"""
+        from core.analytics.rollups import RollupStore
+
+        mock_db.execute_query.side_effect = lambda sql: (
+            ([{"n": 3, "max_pk": 3, "checksum": 1}], None)
+            if "COUNT(*) AS n" in sql else ([], None)
+        )
+        store = RollupStore(db=mock_db, checksum_interval=3600)
+
+        def probes():
+            calls = [c.args[0] for c in mock_db.execute_query.call_args_list
+                     if "COUNT(*) AS n" in c.args[0]]
+            mock_db.execute_query.reset_mock()
+            return calls
+
+        store.refresh()
+        first = probes()
+        store.refresh()
+        second = probes()
+
+        # employees/departments는 세 롤업이 공유 → 테이블 4개
+        assert len(first) == len(second) == 4
+        assert all("CRC32" in sql for sql in first)
+        assert not any("CRC32" in sql for sql in second)
+
+
+class TestAttendanceAnalyzer:
+    """근태 이상 감지 테스트"""
+
+    @pytest.fixture
+    def analyzer(self, mock_db):
+        def day(n):
+            return datetime.date(2024, 1, n)
+
+        def at(hour, minute):
+            return datetime.timedelta(hours=hour, minutes=minute)
+
+        def row(emp_id, name, n, check_in, status):
+            return {"emp_id": emp_id, "name": name, "date": day(n), "check_in": check_in,
+                    "status": status}
+
+        rows = [
+            # 김철수: 지각 - 휴가 - 지각 - 지각 (휴가 건너뛰고 3일 연속)
+            row(1, "김철수", 2, at(9, 10), "LATE"),
+            row(1, "김철수", 3, None, "VACATION"),
+            row(1, "김철수", 4, at(9, 20), "LATE"),
+            row(1, "김철수", 5, at(9, 15), "LATE"),
+            row(1, "김철수", 8, at(8, 50), "PRESENT"),
+        ]
+        # 이영희: 평소 08:50 출근, 하루만 11:30 출근 (이상치)
+        rows += [row(2, "이영희", d, at(8, 50), "PRESENT") for d in (2, 3, 4, 5)]
+        rows.append(row(2, "이영희", 8, at(11, 30), "LATE"))
+        mock_db.execute_query.side_effect = lambda sql: (
+            ([{"n": len(rows), "max_id": len(rows)}], None) if "COUNT" in sql
+            else (rows[::-1], None)
+        )
+        return AttendanceAnalyzer(db=mock_db, cache_ttl=0)
+
+    def test_streaks_and_outliers(self, analyzer):
+        report = analyzer.analyze()
+        kim, lee = report.employees
+
+        assert kim["name"] == "김철수"
+        assert kim["late_days"] == 3
+        assert kim["longest_late_streak"] == 3
+        assert kim["current_late_streak"] == 0
+        assert kim["checkin_median"] == "09:12"
+
+        assert lee["current_late_streak"] == 1
+        assert lee["outlier_days"] == 1
+        assert report.anomalies[0]["name"] == "이영희"
+        assert report.anomalies[0]["check_in"] == "11:30"
+
+    def test_cache_reused_when_signature_unchanged(self, analyzer, mock_db):
+        first = analyzer.analyze()
+        assert analyzer.analyze() is first
+
+        load_calls = [c for c in mock_db.execute_query.call_args_list if "COUNT" not in c.args[0]]
+        assert len(load_calls) == 1
+
+    def test_tool_lookup_by_name(self, analyzer):
+        tool = analyzer.as_tool()
+        result = tool.invoke({"emp_name": "김철수"})
+
+        assert [e["emp_id"] for e in result["employees"]] == [1]
+        assert result["anomalies"] == []
+
+
+class TestApproximateAggregator:
+    """표본 근사 집계 테스트"""
+
+    @pytest.fixture
+    def aggregator(self, mock_db):
+        rng = np.random.default_rng(0)
+        rows = [
+            {"att_id": i + 1, "emp_id": i % 10 + 1, "status": "LATE" if i % 5 == 0 else "PRESENT",
+             "hours": float(rng.normal(8, 1))}
+            for i in range(5000)
+        ]
+
+        def execute_query(sql):
+            if "COUNT(*) AS n" in sql:
+                return [{"n": len(rows), "max_pk": len(rows)}], None
+            if "RAND()" in sql:
+                return [rows[i] for i in rng.choice(len(rows), 2000, replace=False)], None
+            if "FROM attendance" in sql:
+                return list(rows), None
+            return [], None
+
+        mock_db.execute_query.side_effect = execute_query
+        aggregator = ApproximateAggregator(
+            db=mock_db, sample_size=2000, min_population=1000, max_relative_error=0.2,
+            sampled_tables={"attendance": "att_id"}, dimension_tables={}, seed=0,
+        )
+        aggregator.refresh()
+        return aggregator, rows
+
+    def test_count_with_confidence_interval(self, aggregator):
+        aggregator, rows = aggregator
+        results, approximation = aggregator.execute(
+            "SELECT status, COUNT(*) AS cnt FROM attendance GROUP BY status ORDER BY cnt DESC;"
+        )
+
+        assert [r["status"] for r in results] == ["PRESENT", "LATE"]
+        assert approximation["population"] == 5000
+        assert approximation["sample_size"] == 2000
+        low, high = approximation["confidence_intervals"][1]["cnt"]
+        assert low <= 1000 <= high
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT MAX(hours) FROM attendance;",
+        "SELECT COUNT(DISTINCT emp_id) FROM attendance;",
+        "SELECT COUNT(*) FROM employees;",
+    ])
+    def test_unsupported_falls_back(self, aggregator, sql):
+        aggregator, _ = aggregator
+        with pytest.raises(UnsupportedQueryError):
+            aggregator.execute(sql)
+
+    def test_reservoir_keeps_capacity(self):
+        rng = np.random.default_rng(0)
+        rows, slots = reservoir_slots(size=90, capacity=100, population=90, n_new=1000, rng=rng)
+
+        assert set(range(90, 100)) <= set(slots.tolist())
+        assert slots.max() < 100
+        assert len(set(slots.tolist())) == len(slots)
+
+    def test_requires_exact(self):
+        assert requires_exact("정확한 평균 근무시간은?")
+        assert not requires_exact("평균 근무시간은?")
+
+
+class TestIndexAdvisor:
+    """쿼리 로그 / 인덱스 추천 테스트"""
+
+    def test_fingerprint_groups_literals(self):
+        log = QueryLog(":memory:")
+        log.record("SELECT * FROM attendance WHERE emp_id = 3 AND status IN ('LATE', 'ABSENT');",
+                   engine="mysql", latency_ms=30.0, rows_examined=1000, rows_returned=2)
+        log.record("select *  from attendance where emp_id = 7 and status in ('LATE');",
+                   engine="mysql", latency_ms=10.0, rows_examined=1000, rows_returned=1)
+
+        (shape,) = log.top_shapes()
+        assert shape.fingerprint == "select * from attendance where emp_id = ? and status in (?)"
+        assert shape.count == 2
+        assert shape.total_latency_ms == 40.0
+        assert shape.avg_rows_examined == 1000
+
+    def test_recommends_equality_then_range(self, mock_db):
+        log = QueryLog(":memory:")
+        sql = ("SELECT a.date, a.status FROM attendance a JOIN employees e ON a.emp_id = e.emp_id "
+               "WHERE e.name = '김철수' AND a.date >= '2024-01-01';")
+        for _ in range(3):
+            log.record(sql, engine="mysql", latency_ms=100.0, rows_examined=10000)
+
+        def execute_query(query):
+            if query.startswith("EXPLAIN"):
+                return [
+                    {"table": "e", "type": "ALL", "key": None, "rows": 20, "filtered": 10.0},
+                    {"table": "a", "type": "ALL", "key": None, "rows": 10000, "filtered": 1.0},
+                ], None
+            if query == "SHOW INDEX FROM attendance":
+                return [{"Key_name": "PRIMARY", "Seq_in_index": 1, "Column_name": "att_id"}], None
+            return [], None
+
+        mock_db.execute_query.side_effect = execute_query
+        mock_db.explain.side_effect = lambda q: execute_query(f"EXPLAIN {q}")
+        recs = IndexAdvisor(db=mock_db, query_log=log).recommend()
+
+        top = recs[0]
+        assert top.table == "attendance"
+        assert top.columns == ("emp_id", "date")
+        assert top.ddl == "CREATE INDEX idx_attendance_emp_id_date ON attendance (emp_id, date);"
+        assert top.executions == 3
+        assert top.estimated_latency_saved_ms > 250
+
+    def test_unparsed_sql_uses_where_columns(self, mock_db):
+        advisor = IndexAdvisor(db=mock_db, query_log=QueryLog(":memory:"))
+        usage = advisor.column_usage(
+            "SELECT emp_id, COUNT(*) FROM evaluations WHERE year = 2024 OR score > 4 "
+            "GROUP BY emp_id HAVING COUNT(*) > 1;"
+        )
+
+        assert usage["evaluations"].equality == ["year"]
+        assert usage["evaluations"].range == ["score"]
@@ -0,0 +1,348 @@
+"""
+Indexing Tests
+인덱스 빌드 파이프라인 테스트 (가짜 임베딩)
+"""
+
+import shutil
+from pathlib import Path
+
+import faiss
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from core.indexing.ann import ANNConfig, benchmark_indexes
+from core.indexing.article_chunker import chunk_articles
+from core.indexing.dedup import deduplicate_chunks
+from core.indexing.embedding_pipeline import EmbeddingPipeline
+from core.indexing.fact_extraction import extract_facts
+from core.indexing.incremental import IncrementalIndexer
+from core.indexing.pdf_extraction import ParseCache, PDFExtractor, extract_page_range
+from core.llm.embedding_cache import CachedEmbeddings, EmbeddingStore
+from core.retrieval.mmap_index import load_mmap_index
+from core.retrieval.quantized import QuantizationConfig, QuantizedFAISS
+from core.types.errors import IndexBuildError
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    """embed_documents로 임베딩한 텍스트 수 기록"""
+    embedded: int = 0
+
+    def embed_documents(self, texts):
+        self.embedded += len(texts)
+        return super().embed_documents(texts)
+
+
+def make_chunks(texts, source="규정.pdf"):
+    return [Document(page_content=t, metadata={"source": source, "page": i})
+            for i, t in enumerate(texts)]
+
+
+@pytest.fixture
+def base_embeddings():
+    return CountingEmbeddings(size=16)
+
+
+@pytest.fixture
+def make_indexer(tmp_path, base_embeddings):
+    store = EmbeddingStore(tmp_path / "embeddings.db")
+
+    def factory(namespace="fake/16:documents"):
+        embeddings = CachedEmbeddings(base_embeddings, namespace=namespace, store=store,
+                                      cache_documents=True)
+        return IncrementalIndexer(embeddings, tmp_path / "index")
+    return factory
+
+
+class TestIncrementalIndexer:
+    """증분 빌드 테스트"""
+
+    TEXTS = ["제1조 목적", "제2조 적용범위", "제3조 근무시간은 1일 8시간", "제4조 휴게시간"]
+
+    def test_only_changed_chunks_are_embedded(self, make_indexer, base_embeddings):
+        first = make_indexer()
+        first.update(make_chunks(self.TEXTS))
+        first.save()
+        assert base_embeddings.embedded == 4
+
+        edited = list(self.TEXTS)
+        edited[2] = "제3조 근무시간은 1일 7시간"
+        del edited[3]  # 마지막 페이지 삭제
+
+        second = make_indexer()
+        report = second.update(make_chunks(edited))
+        second.save()
+
+        assert report.mode == "incremental"
+        assert (report.added, report.removed, report.unchanged) == (1, 2, 2)
+        assert report.embedded == 1
+        assert base_embeddings.embedded == 5
+
+        contents = {doc.page_content for doc in second.vectorstore.docstore._dict.values()}
+        assert contents == set(edited)
+        assert second.vectorstore.index.ntotal == 3
+
+    def test_full_rebuild_reuses_stored_embeddings(self, make_indexer, base_embeddings):
+        make_indexer().update(make_chunks(self.TEXTS))
+
+        report = make_indexer().update(make_chunks(self.TEXTS), full=True)
+
+        assert report.mode == "full"
+        assert report.reused == 4
+        assert base_embeddings.embedded == 4
+
+    def test_model_change_forces_full_build(self, make_indexer):
+        indexer = make_indexer()
+        indexer.update(make_chunks(self.TEXTS))
+        indexer.save()
+
+        report = make_indexer(namespace="other/16:documents").update(make_chunks(self.TEXTS))
+
+        assert report.mode == "full"
+        assert report.embedded == 4
+
+
+class TestEmbeddingPipeline:
+    """배치·병렬 임베딩 테스트"""
+
+    def make_pipeline(self, embed_fn, **kwargs):
+        pipeline = EmbeddingPipeline(embed_fn, backoff_base=0.01, **kwargs)
+        pipeline._sleep = lambda seconds: None
+        return pipeline
+
+    def test_batches_are_retried_and_streamed(self):
+        base = CountingEmbeddings(size=8)
+        failures = {"left": 2}
+
+        def flaky(texts):
+            if failures["left"]:
+                failures["left"] -= 1
+                raise RuntimeError("429 Too Many Requests")
+            return base.embed_documents(texts)
+
+        received = {}
+        texts = [f"청크 {i}" for i in range(10)]
+        stats = self.make_pipeline(flaky, batch_size=3, max_workers=2).run(
+            texts, lambda start, vectors: received.update({start: vectors}))
+
+        assert sorted(received) == [0, 3, 6, 9]
+        assert (stats.chunks, stats.batches, stats.retries) == (10, 4, 2)
+        assert received[9] == base.embed_documents(["청크 9"])
+
+    def test_exhausted_retries_raise(self):
+        def broken(texts):
+            raise RuntimeError("connection refused")
+
+        with pytest.raises(IndexBuildError):
+            self.make_pipeline(broken, max_retries=1).run(["a", "b"], lambda *args: None)
+
+    def test_indexer_uses_pipeline_for_misses(self, tmp_path, base_embeddings):
+        embeddings = CachedEmbeddings(base_embeddings, namespace="fake/16:documents",
+                                      store=EmbeddingStore(tmp_path / "embeddings.db"),
+                                      cache_documents=True)
+        pipeline = self.make_pipeline(base_embeddings.embed_documents, batch_size=2)
+        texts = TestIncrementalIndexer.TEXTS + [TestIncrementalIndexer.TEXTS[0]]
+
+        report = IncrementalIndexer(embeddings, tmp_path / "index", pipeline=pipeline).update(
+            make_chunks(texts))
+
+        assert (report.total, report.embedded, report.batches) == (5, 4, 2)
+        assert base_embeddings.embedded == 4
+        assert embeddings.store.count("fake/16:documents") == 4
+
+
+SAMPLE_PDF = Path(__file__).parent.parent / "data" / "company_docs" / "회사규정.pdf"
+
+
+class TestPDFExtractor:
+    """병렬 PDF 추출 + 파싱 캐시 테스트"""
+
+    def test_parallel_extraction_matches_sequential(self, tmp_path):
+        extractor = PDFExtractor(cache=ParseCache(tmp_path / "parse.db"),
+                                 max_workers=2, pages_per_task=2)
+
+        documents = extractor.extract([SAMPLE_PDF])
+
+        expected = [text for _, text in extract_page_range(str(SAMPLE_PDF), 0, 6) if text]
+        assert [doc.page_content for doc in documents] == expected
+        assert [doc.metadata["page"] for doc in documents] == list(range(len(expected)))
+        assert extractor.last_stats.tasks == 3
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        cache = ParseCache(tmp_path / "parse.db")
+        PDFExtractor(cache=cache, max_workers=1).extract([SAMPLE_PDF])
+
+        renamed = tmp_path / "renamed.pdf"
+        shutil.copy(SAMPLE_PDF, renamed)
+        extractor = PDFExtractor(cache=cache, max_workers=1)
+        documents = extractor.extract([renamed])
+
+        assert extractor.last_stats.parsed_pages == 0
+        assert extractor.last_stats.cached_pages == 6
+        assert documents[0].metadata["source"] == "renamed.pdf"
+
+
+class TestANNIndex:
+    """ANN 인덱스 설정 + 벤치마크 테스트"""
+
+    def test_spec_round_trip(self):
+        config = ANNConfig.from_spec("ivf:nlist=64,nprobe=8")
+
+        assert (config.kind, config.nlist, config.nprobe) == ("ivf", 64, 8)
+        assert ANNConfig.from_spec(config.spec) == config
+        with pytest.raises(ValueError):
+            ANNConfig.from_spec("annoy")
+
+    def test_benchmark_reports_recall_against_exact(self):
+        vectors = np.random.default_rng(0).normal(size=(500, 16)).astype(np.float32)
+
+        results = benchmark_indexes(vectors, [ANNConfig("flat"), ANNConfig("hnsw")],
+                                    sizes=[300], k=5, n_queries=20)
+
+        assert [r.spec for r in results] == ["flat", "hnsw"]
+        assert results[0].recall == 1.0
+        assert results[1].recall > 0.8
+        assert all(r.p99_ms >= r.p50_ms for r in results)
+
+    def test_serving_index_uses_configured_type(self, tmp_path, base_embeddings):
+        embeddings = CachedEmbeddings(base_embeddings, namespace="fake/16:documents",
+                                      cache_documents=True)
+        indexer = IncrementalIndexer(embeddings, tmp_path / "index",
+                                     ann_config=ANNConfig.from_spec("hnsw:m=8"))
+        indexer.update(make_chunks(TestIncrementalIndexer.TEXTS))
+        indexer.save()
+
+        served = faiss.read_index(str(tmp_path / "index" / "vectors.faiss"))
+        assert isinstance(served, faiss.IndexHNSWFlat)
+        assert served.ntotal == 4
+        assert indexer.manifest["ann_index"] == "hnsw:m=8"
+
+
+class TestQuantizedIndex:
+    """벡터 양자화 + 재채점 테스트"""
+
+    def test_quantized_index_rescores_to_exact_ranking(self, tmp_path, base_embeddings):
+        embeddings = CachedEmbeddings(base_embeddings, namespace="fake/16:documents",
+                                      cache_documents=True)
+        indexer = IncrementalIndexer(embeddings, tmp_path / "index",
+                                     quantization=QuantizationConfig.from_spec("int8:dims=8"))
+        indexer.update(make_chunks(TestIncrementalIndexer.TEXTS))
+        indexer.save()
+
+        served = load_mmap_index(tmp_path / "index", embeddings)
+        query = TestIncrementalIndexer.TEXTS[2]
+        exact = indexer.vectorstore.similarity_search_with_score(query, k=2)
+        quantized = served.similarity_search_with_score(query, k=2)
+
+        assert isinstance(served, QuantizedFAISS)
+        assert served.index.d == 8
+        assert [d.page_content for d, _ in quantized] == [d.page_content for d, _ in exact]
+        assert [s for _, s in quantized] == pytest.approx([s for _, s in exact], abs=1e-4)
+
+
+class TestChunkDedup:
+    """유사 중복 청크 제거 테스트"""
+
+    ARTICLE = ("제15조(연차휴가) 1년간 80% 이상 출근한 직원에게 15일의 유급휴가를 부여한다. "
+               "3년 이상 근속한 직원에게는 매 2년마다 1일을 가산한다.")
+
+    def test_near_duplicates_collapse_with_provenance(self):
+        chunks = [
+            Document(page_content=self.ARTICLE, metadata={"source": "회사규정.pdf", "page": 3}),
+            Document(page_content="제8조(근무시간) 근무시간은 1일 8시간, 1주 40시간으로 한다.",
+                     metadata={"source": "회사규정.pdf", "page": 1}),
+            # 줄바꿈/공백만 다른 판본
+            Document(page_content=self.ARTICLE.replace(" ", "\n", 3),
+                     metadata={"source": "02_회사규정.pdf", "page": 7}),
+        ]
+
+        kept, report = deduplicate_chunks(chunks)
+
+        assert (report.kept, report.removed, report.clusters) == (2, 1, 1)
+        assert kept[0].metadata["sources"] == [
+            {"source": "회사규정.pdf", "page": 3}, {"source": "02_회사규정.pdf", "page": 7}]
+        assert kept[1].metadata["sources"] == [{"source": "회사규정.pdf", "page": 1}]
+
+    def test_distinct_articles_are_kept(self):
+        chunks = make_chunks(TestIncrementalIndexer.TEXTS)
+
+        kept, report = deduplicate_chunks(chunks)
+
+        assert report.removed == 0
+        assert [c.page_content for c in kept] == TestIncrementalIndexer.TEXTS
+
+
+class TestArticleChunker:
+    """조문 단위 청킹 테스트"""
+
+    PAGES = [
+        "## 제1 장 총칙\n**제1 조 목적**\n이 규정은 인사 운영 기준을 정한다.\n"
+        "## 1-1 (제1 조 ~ 제2 조)\n**제2 조 연차휴가 사용 촉진**\n① 회사는 미사용 연차를",
+        "사용하도록 촉진한다.\n② 직원은 사용 계획을 제출한다.\n"
+        "## 제2 장 근무\n**제1 조의2 (근무시간 예외)**\n" + "① 야간 근무는 승인 후 가능하다. " * 10
+        + "\n② 휴일 근무는 " + "보상휴가로 대체할 수 있다. " * 10,
+    ]
+
+    def make_pages(self):
+        return [Document(page_content=text, metadata={"source": "규정.pdf", "page": n})
+                for n, text in enumerate(self.PAGES)]
+
+    def test_articles_are_not_split_across_pages(self):
+        chunks = chunk_articles(self.make_pages())
+
+        article = next(c for c in chunks if c.metadata.get("article_key") == "제1장 제2조")
+        assert article.page_content.startswith("[제1장 총칙] 제2조 연차휴가 사용 촉진\n")
+        assert "미사용 연차를\n사용하도록" in article.page_content
+        assert article.metadata["page"] == 0
+        # 장 안의 소구분("1-1 ...")은 장을 바꾸지 않음
+        assert [c.metadata["article_key"] for c in chunks] == [
+            "제1장 제1조", "제1장 제2조", "제2장 제1조의2"]
+
+    def test_long_article_is_split_at_paragraphs(self):
+        chunks = chunk_articles(self.make_pages(), max_chars=200)
+
+        parts = [c for c in chunks if c.metadata.get("article_id") == "제1조의2"]
+        assert [c.metadata["part"] for c in parts] == [0, 1]
+        head = "[제2장 근무] 제1조의2 근무시간 예외\n"
+        assert all(c.page_content.startswith(head) for c in parts)
+        assert parts[1].page_content.split("\n")[1].startswith("② 휴일 근무는")
+
+
+class TestFactExtraction:
+    """수치 사실 추출 테스트"""
+
+    ARTICLE = Document(
+        page_content="[제3장 휴가] 제2조 휴가 및 휴직\n"
+                     "① 연차휴가 신청: 사용 3일 전까지 신청한다.\n"
+                     "② 질병휴직은 최대 3개월까지 가능하며 1회 연장할 수 있다. "
+                     "연장 시 진단서를 제출한다.\n"
+                     "③ 지각 및 조퇴는 월 3회를 넘을 수 없다.\n"
+                     "④ 회사는 매년 1월에 휴가 사용 계획을 공지한다.\n"
+                     "⑤ 육아휴직: 만 8세 이하 자녀를 위해 1년간 근무를 중단하는 것을\n"
+                     "사례 1: 질병휴직 2개월 후 복직한 경우",
+        metadata={"source": "규정.pdf", "page": 4, "section": "제3장 휴가", "article_id": "제2조",
+                  "article_key": "제3장 제2조", "article_title": "휴가 및 휴직"},
+    )
+
+    def test_subjects_and_citations(self):
+        facts = extract_facts([self.ARTICLE])
+
+        assert [(f.key, f.text) for f in facts] == [
+            ("연차휴가신청", "연차휴가 신청: 사용 3일 전까지 신청한다."),
+            ("질병휴직", "질병휴직은 최대 3개월까지 가능하며 1회 연장할 수 있다."),
+            ("지각", "지각 및 조퇴는 월 3회를 넘을 수 없다."),
+            ("조퇴", "지각 및 조퇴는 월 3회를 넘을 수 없다."),
+        ]
+        assert facts[0].citation == "규정.pdf p.5 · 제3장 제2조 휴가 및 휴직"
+        assert facts[0].article_key == "제3장 제2조"
+
+    def test_subject_is_inherited_within_paragraph(self):
+        doc = Document(page_content="출산휴가는 출산 전후로 부여한다. 기간은 90일로 한다.",
+                       metadata={"source": "규정.pdf"})
+
+        facts = extract_facts([doc])
+
+        assert [(f.key, f.text, f.direct) for f in facts] == [
+            ("출산휴가", "기간은 90일로 한다.", False),
+        ]
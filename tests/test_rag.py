@@ -0,0 +1,728 @@
+"""
+RAG Tests
+RAG Agent 검색/생성 파이프라인 테스트 (가짜 임베딩 + 가짜 LLM)
+"""
+
+import json
+from types import SimpleNamespace
+
+import faiss
+import numpy as np
+import pytest
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from app.core.config import Settings
+from core.agents import rag_agent as rag_agent_module
+from core.agents.index_reloader import IndexReloader
+from core.agents.rag_agent import RAGAgent
+from core.container import Container
+from core.indexing.parent_child import split_parent_child
+from core.llm.embedding_cache import CachedEmbeddings, EmbeddingStore
+from core.llm.factory import create_embeddings
+from core.llm.hashing_embeddings import HashingEmbeddings
+from core.retrieval.adaptive import AdaptiveKConfig, select_adaptive
+from core.retrieval.article_index import ArticleIndex
+from core.retrieval.bm25 import BM25Index, tokenize
+from core.retrieval.compression import ContextCompressor
+from core.retrieval.extractive import ExtractiveAnswerer, split_sentences
+from core.retrieval.fact_table import Fact, FactTable
+from core.retrieval.faq_index import FAQEntry, FAQIndex, load_faq_entries
+from core.retrieval.hybrid import reciprocal_rank_fusion
+from core.retrieval.index_versions import (
+    create_version_dir,
+    list_versions,
+    prune_versions,
+    publish_version,
+    resolve_index_path,
+)
+from core.retrieval.parent_store import ParentStore, estimate_tokens
+from core.retrieval.mmap_index import MmapDocstore, mmap_io_flags, save_mmap_index
+from core.retrieval.sharded import (
+    SHARDS_DIR,
+    SearchFilter,
+    build_catalog,
+    group_shards,
+    save_catalog,
+)
+from core.types.errors import RAGRetrievalError
+
+
+REGULATION_TEXTS = [
+    "제15조(연차휴가) 1년간 80% 이상 출근한 직원에게 15일의 유급휴가를 부여한다.",
+    "제8조(근무시간) 근무시간은 1일 8시간, 1주 40시간으로 한다.",
+    "제20조(경조휴가) 본인 결혼 시 5일의 경조휴가를 부여한다.",
+]
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    """embed_query 호출 횟수 기록"""
+    query_calls: int = 0
+
+    def embed_query(self, text):
+        self.query_calls += 1
+        return super().embed_query(text)
+
+
+@pytest.fixture
+def embeddings():
+    return CountingEmbeddings(size=32)
+
+
+@pytest.fixture
+def rag_index(tmp_path, embeddings):
+    """테스트용 FAISS 인덱스"""
+    FAISS.from_texts(REGULATION_TEXTS, embeddings).save_local(str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def rag_agent(rag_index, embeddings, monkeypatch):
+    monkeypatch.setattr(rag_agent_module, "create_embeddings", lambda **kwargs: embeddings)
+    monkeypatch.setattr(
+        rag_agent_module, "create_chat_model",
+        lambda **kwargs: FakeListChatModel(responses=["연차는 15일입니다."] * 4),
+    )
+    agent = RAGAgent(top_k=2, index_path=str(rag_index))
+    embeddings.query_calls = 0
+    return agent
+
+
+class TestRAGAgent:
+    """RAG Agent 파이프라인 테스트"""
+
+    def test_query_retrieves_once(self, rag_agent, embeddings):
+        """질문 임베딩/검색은 요청당 1회"""
+        result = rag_agent.query(REGULATION_TEXTS[0])
+
+        assert result["success"] is True
+        assert embeddings.query_calls == 1
+        assert result["metadata"]["source_docs"][0] == REGULATION_TEXTS[0]
+        assert len(result["metadata"]["source_scores"]) == 2
+        assert set(result["metadata"]["timings"]) == {"retrieve_ms", "generate_ms", "total_ms"}
+
+    def test_stream_retrieves_once(self, rag_agent, embeddings):
+        chunks = list(rag_agent.stream("연차는 며칠인가요?"))
+
+        assert "".join(chunks) == "연차는 15일입니다."
+        assert embeddings.query_calls == 1
+
+
+class TestHashingEmbeddings:
+    """로컬 해싱 임베딩 테스트"""
+
+    def test_deterministic_normalized_vectors(self):
+        embeddings = create_embeddings(provider="local", model="hash-64")
+        vectors = np.array(embeddings.embed_documents(REGULATION_TEXTS + [""]))
+
+        assert isinstance(embeddings, HashingEmbeddings) and vectors.shape == (4, 64)
+        assert np.allclose(np.linalg.norm(vectors[:3], axis=1), 1.0) and not vectors[3].any()
+        # 배치 계산 = 단건 계산, 새 인스턴스에서도 같은 값
+        direct = HashingEmbeddings(dimension=64).embed_query(REGULATION_TEXTS[1])
+        assert np.allclose(vectors[1], direct)
+
+    def test_lexical_overlap_ranks_first(self):
+        embeddings = HashingEmbeddings()
+        vectors = np.array(embeddings.embed_documents(REGULATION_TEXTS))
+        query = np.array(embeddings.embed_query("결혼하면 경조휴가 며칠"))
+
+        assert int(np.argmax(vectors @ query)) == 2
+
+    def test_invalid_model_name(self):
+        with pytest.raises(ValueError):
+            create_embeddings(provider="local", model="text-embedding-3-small")
+
+    def test_rag_agent_runs_offline(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            rag_agent_module, "create_chat_model",
+            lambda **kwargs: FakeListChatModel(responses=["근무시간은 8시간입니다."]),
+        )
+        index = FAISS.from_texts(REGULATION_TEXTS, HashingEmbeddings(dimension=128))
+        index.save_local(str(tmp_path))
+        agent = RAGAgent(top_k=1, index_path=str(tmp_path), embedding_provider="local",
+                         embedding_model="hash-128")
+
+        assert agent.embeddings.namespace == "local/hash-128"
+        assert agent.retrieve("1주 근무시간")[0][0].page_content == REGULATION_TEXTS[1]
+
+    def test_container_defaults_local_model(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            rag_agent_module, "create_chat_model",
+            lambda **kwargs: FakeListChatModel(responses=["근무시간은 8시간입니다."]),
+        )
+        FAISS.from_texts(REGULATION_TEXTS, HashingEmbeddings()).save_local(str(tmp_path))
+        settings = Settings(
+            RAG_EMBEDDING_PROVIDER="local",  # RAG_EMBEDDING_MODEL은 기본값(OpenAI 모델명)
+            RAG_INDEX_PATH=str(tmp_path),
+            RAG_EMBEDDING_CACHE_ENABLED=False,
+        )
+
+        agent = Container(settings=settings).rag_agent
+
+        assert agent.embeddings.namespace == "local/hash-384"
+        assert agent.retrieve("1주 근무시간")[0][0].page_content == REGULATION_TEXTS[1]
+
+
+class TestEmbeddingCache:
+    """질문 임베딩 캐시 테스트"""
+
+    def test_repeated_question_skips_embedding(self, rag_agent, embeddings):
+        rag_agent.query("연차는 몇일인가요?")
+        rag_agent.query("연차는  몇일인가요? ")
+
+        assert embeddings.query_calls == 1
+        assert rag_agent.embeddings.stats["memory_hits"] == 1
+
+    def test_disk_tier_shared_across_instances(self, tmp_path, embeddings):
+        store = EmbeddingStore(tmp_path / "cache.db")
+        first = CachedEmbeddings(embeddings, namespace="fake/32", store=store)
+        vector = first.embed_query("연차는 몇일인가요?")
+
+        # 다른 워커 (새 프로세스 가정: 메모리 LRU 비어 있음)
+        second = CachedEmbeddings(embeddings, namespace="fake/32",
+                                  store=EmbeddingStore(tmp_path / "cache.db"))
+        assert second.embed_query("연차는 몇일인가요?") == pytest.approx(vector, abs=1e-6)
+        assert embeddings.query_calls == 1
+        assert second.stats["disk_hits"] == 1
+
+        # 모델이 다르면 캐시를 공유하지 않음
+        other = CachedEmbeddings(embeddings, namespace="fake/other", store=store)
+        other.embed_query("연차는 몇일인가요?")
+        assert embeddings.query_calls == 2
+
+
+class TestHybridRetrieval:
+    """BM25 + 벡터 하이브리드 검색 테스트"""
+
+    def test_tokenize_korean_bigrams(self):
+        tokens = tokenize("제15조 육아휴직을 15일")
+
+        assert {"제15조", "15일", "육아", "휴직"} <= set(tokens)
+
+    def test_bm25_exact_term_ranks_first(self):
+        docs = [Document(page_content=text) for text in REGULATION_TEXTS]
+        bm25 = BM25Index.from_documents(["a", "b", "c"], docs)
+
+        assert bm25.search("경조사 결혼", k=3)[0][0] == "c"
+        assert bm25.search("무관한 질문", k=3) == []
+
+    def test_rrf_rewards_agreement(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "c"]])
+
+        assert [doc_id for doc_id, _ in fused] == ["b", "c", "a"]
+
+    def test_agent_uses_bm25_when_index_has_it(self, rag_index, rag_agent):
+        vectorstore = FAISS.load_local(str(rag_index), rag_agent.embeddings,
+                                       allow_dangerous_deserialization=True)
+        BM25Index.from_vectorstore(vectorstore).save(rag_index)
+        agent = RAGAgent(top_k=1, index_path=str(rag_index), hybrid=True)
+
+        result = agent.query("경조사 결혼")
+
+        assert result["metadata"]["retrieval"] == "hybrid"
+        assert result["metadata"]["source_docs"] == [REGULATION_TEXTS[2]]
+
+
+class TestArticleLookup:
+    """조문 직접 조회 테스트"""
+
+    ARTICLES = [
+        ("제1장", "제2조", "연차휴가 사용 촉진", 0,
+         "[제1장 총칙] 제2조 연차휴가 사용 촉진\n① 미사용 연차를 촉진한다."),
+        ("제1장", "제2조", "연차휴가 사용 촉진", 1,
+         "[제1장 총칙] 제2조 연차휴가 사용 촉진\n② 계획을 제출한다."),
+        ("제1장", "제3조", "목적", 0, "[제1장 총칙] 제3조 목적\n인사 운영 기준을 정한다."),
+        ("제2장", "제2조", "근무시간", 0, "[제2장 근무] 제2조 근무시간\n1일 8시간으로 한다."),
+    ]
+
+    def make_index(self, embeddings):
+        docs = [
+            Document(page_content=text, metadata={
+                "section": section, "article_id": aid, "article_key": f"{section} {aid}",
+                "article_title": title, "part": part})
+            for section, aid, title, part, text in self.ARTICLES
+        ]
+        return FAISS.from_documents(docs, embeddings)
+
+    def test_lookup_by_number_title_and_chapter(self, embeddings):
+        vectorstore = self.make_index(embeddings)
+        articles = ArticleIndex.from_vectorstore(vectorstore)
+        ids = list(vectorstore.index_to_docstore_id.values())
+
+        assert articles.lookup("제1장 제2조 알려줘") == ids[:2]
+        assert articles.lookup("연차휴가 사용촉진 절차는?") == ids[:2]
+        assert articles.lookup("제 3 조의 내용") == [ids[2]]
+        # 장 표기 없는 제2조는 두 장 모두 해당, 제목으로 좁혀짐
+        assert articles.lookup("제2조 근무시간") == [ids[3]]
+        assert articles.lookup("제2조", max_articles=1) == []
+        assert articles.lookup("목적이 뭔가요") == []  # 짧은 제목은 매칭 제외
+
+    def test_agent_bypasses_vector_search(self, tmp_path, embeddings, rag_agent):
+        vectorstore = self.make_index(embeddings)
+        vectorstore.save_local(str(tmp_path))
+        ArticleIndex.from_vectorstore(vectorstore).save(tmp_path)
+        agent = RAGAgent(top_k=2, index_path=str(tmp_path), article_lookup=True)
+        embeddings.query_calls = 0
+
+        result = agent.query("제2장 제2조 내용")
+
+        assert result["metadata"]["retrieval"] == "article"
+        assert result["metadata"]["source_docs"] == [self.ARTICLES[3][4]]
+        assert embeddings.query_calls == 0
+
+
+class TestParentChildRetrieval:
+    """부모-자식 검색 테스트"""
+
+    def make_index(self, index_path, embeddings):
+        articles = [
+            Document(page_content=f"[제1장 총칙] {text.split(')')[0]})\n{text}",
+                     metadata={"source": "규정.pdf", "page": n, "article_key": f"제1장 제{n}조"})
+            for n, text in enumerate(REGULATION_TEXTS)
+        ]
+        parents, children = split_parent_child(articles, child_size=20, child_overlap=0)
+        FAISS.from_documents(children, embeddings).save_local(str(index_path))
+        ParentStore.from_documents(parents).save(index_path)
+        return parents, children
+
+    def test_children_repeat_article_header(self, tmp_path, embeddings):
+        parents, children = self.make_index(tmp_path, embeddings)
+
+        assert len(children) > len(parents)
+        assert all(c.page_content.startswith("[제1장 총칙] 제") for c in children)
+        parent_ids = {p.metadata["parent_id"] for p in parents}
+        assert {c.metadata["parent_id"] for c in children} == parent_ids
+
+    def test_children_expand_to_deduplicated_parents(self, tmp_path, embeddings, rag_agent):
+        parents, children = self.make_index(tmp_path, embeddings)
+        agent = RAGAgent(top_k=2, index_path=str(tmp_path), parent_child=True,
+                         context_token_budget=0)
+
+        result = agent.query(children[1].page_content)
+
+        docs = result["metadata"]["source_docs"]
+        assert docs[0] == parents[0].page_content
+        assert len(docs) == len(set(docs)) == len(parents)  # 같은 부모의 자식은 하나로 합침
+        assert result["metadata"]["context_tokens"] == sum(
+            estimate_tokens(p.page_content) for p in parents)
+
+    def test_token_budget_limits_parents(self, tmp_path, embeddings, rag_agent):
+        parents, _ = self.make_index(tmp_path, embeddings)
+        budget = estimate_tokens(parents[0].page_content) + 1
+        agent = RAGAgent(top_k=2, index_path=str(tmp_path), parent_child=True,
+                         context_token_budget=budget)
+
+        scored = agent.retrieve(REGULATION_TEXTS[0])
+
+        assert len(scored) == 1  # 첫 부모는 항상 포함, 다음 부모는 예산 초과
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("연차 휴가") == 4
+        assert estimate_tokens("15일 abc") == 1 + 2
+
+
+class TestAdaptiveK:
+    """적응형 top-k 테스트"""
+
+    @staticmethod
+    def scored(*scores, texts=None):
+        texts = texts or [f"문서 {n}" for n in range(len(scores))]
+        return [(Document(page_content=t), s) for t, s in zip(texts, scores)]
+
+    def test_score_gap_cuts_after_dominant_hit(self):
+        config = AdaptiveKConfig(min_k=1, max_k=6)
+
+        easy = select_adaptive(self.scored(0.1, 0.9, 0.95, 1.0), config, higher_is_better=False)
+        hard = select_adaptive(
+            self.scored(0.5, 0.55, 0.6, 0.65, 0.7), config, higher_is_better=False
+        )
+        fused = select_adaptive(
+            self.scored(0.033, 0.032, 0.016, 0.015), config, higher_is_better=True
+        )
+
+        assert len(easy) == 1
+        assert len(hard) == 5
+        assert [s for _, s in fused] == [0.033, 0.032]
+
+    def test_distance_threshold_respects_bounds(self):
+        config = AdaptiveKConfig(min_k=2, max_k=3, max_distance=0.3, score_gap=0)
+
+        docs = select_adaptive(self.scored(0.2, 0.8, 0.9, 1.0), config, higher_is_better=False)
+
+        assert [s for _, s in docs] == [0.2, 0.8]  # 임계값 밖이어도 min_k개 유지
+
+    def test_mmr_skips_redundant_results(self):
+        texts = ["연차휴가 15일 부여", "연차휴가 15일 부여 기준", "경조휴가 5일 부여"]
+        config = AdaptiveKConfig(max_k=3, score_gap=0, mmr=True, mmr_lambda=0.3)
+
+        docs = select_adaptive(
+            self.scored(0.1, 0.2, 0.3, texts=texts), config, higher_is_better=False
+        )
+
+        assert [doc.page_content for doc, _ in docs][:2] == [texts[0], texts[2]]
+
+    def test_agent_returns_fewer_docs_for_exact_question(self, rag_index, rag_agent):
+        agent = RAGAgent(top_k=2, index_path=str(rag_index), adaptive=AdaptiveKConfig(max_k=3))
+
+        result = agent.query(REGULATION_TEXTS[0])
+
+        assert result["metadata"]["source_docs"] == [REGULATION_TEXTS[0]]
+
+
+class TestExtractiveAnswer:
+    """추출 응답 테스트"""
+
+    ARTICLE = Document(
+        page_content="[제4장 근무] 제3조 근무시간\n① 기본근무시간은 1일 7시간 30분으로 한다. "
+                     "② 점심시간은 근무시간에 포함하지 않는다.\n"
+                     "| **연장근로** | 통상임금의 50%를 가산한다. |",
+        metadata={"source": "data/02_회사규정.pdf", "page": 12, "section": "제4장 근무",
+                  "article_id": "제3조", "article_key": "제4장 제3조", "article_title": "근무시간"},
+    )
+
+    def test_split_sentences_skips_header_and_table_markup(self):
+        assert split_sentences(self.ARTICLE) == [
+            "① 기본근무시간은 1일 7시간 30분으로 한다.",
+            "② 점심시간은 근무시간에 포함하지 않는다.",
+            "연장근로: 통상임금의 50%를 가산한다.",
+        ]
+
+    def test_confident_sentence_is_returned_with_citation(self, embeddings):
+        extractor = ExtractiveAnswerer(embeddings, min_score=0.5, lexical_weight=1.0)
+
+        extracted = extractor.answer("기본근무시간은 하루 몇 시간인가요?", [self.ARTICLE])
+
+        assert extracted.sentence == "① 기본근무시간은 1일 7시간 30분으로 한다."
+        assert extracted.citation == "02_회사규정.pdf p.13 · 제4장 제3조 근무시간"
+        assert extracted.text.endswith("(출처: 02_회사규정.pdf p.13 · 제4장 제3조 근무시간)")
+
+    def test_low_confidence_returns_none(self, embeddings):
+        extractor = ExtractiveAnswerer(embeddings, min_score=0.5, lexical_weight=1.0)
+
+        assert extractor.answer("출장비 정산 절차는?", [self.ARTICLE]) is None
+
+    def test_agent_skips_llm_per_request_and_reports_rate(self, rag_agent, embeddings):
+        embeddings.query_calls = 0
+        skipped = rag_agent.query(REGULATION_TEXTS[1], answer_mode="extractive")
+        assert embeddings.query_calls == 1  # 추출도 검색과 같은 질문 벡터 사용
+        fallback = rag_agent.query("회사 복지 정책 전반을 설명해줘", answer_mode="extractive")
+        default = rag_agent.query(REGULATION_TEXTS[1])
+
+        assert skipped["answer"] == REGULATION_TEXTS[1]
+        assert skipped["metadata"]["answered_by"] == "extractive"
+        assert fallback["metadata"]["answered_by"] == "llm"
+        assert default["metadata"]["answered_by"] == "llm"
+        assert rag_agent.answer_stats() == {
+            "queries": 3, "faq_answers": 0, "fact_answers": 0,
+            "extractive_requests": 2, "llm_skipped": 1, "llm_skip_rate": 0.5}
+
+
+class TestFactTable:
+    """수치 사실 테이블 테스트"""
+
+    FACTS = [
+        Fact(key="연차", subject="연차", text="연차는 15일을 부여한다.",
+             citation="규정.pdf p.3 · 제15조 연차휴가"),
+        Fact(key="연차휴가신청", subject="연차휴가 신청", text="사용 3일 전까지 신청한다.",
+             citation="규정.pdf p.4 · 제16조 연차휴가 신청"),
+        Fact(key="지각", subject="지각", text="지각은 월 3회를 넘을 수 없다.",
+             citation="규정.pdf p.9"),
+        Fact(key="지각", subject="지각", text="3회 초과 시 경고한다.",
+             citation="규정.pdf p.9", direct=False),
+    ]
+
+    def test_lookup_matches_whole_subject_only(self):
+        table = FactTable(self.FACTS)
+
+        assert table.lookup("연차는 며칠인가요?") == [self.FACTS[0]]
+        assert table.lookup("연차 휴가 신청은 며칠 전까지?") == [self.FACTS[1]]
+        assert table.lookup("연차수당은 얼마인가요?") is None  # "연차"로 매칭하지 않음
+        assert table.lookup("연차 신청 방법은?") is None  # 수치 질문이 아님
+
+    def test_answers_only_single_or_agreeing_fact(self):
+        table = FactTable(self.FACTS)
+        conflicting = Fact(key="지각", subject="지각", text="지각은 월 5회를 넘을 수 없다.",
+                           citation="규정.pdf p.10")
+
+        assert table.lookup("지각은 몇 번까지?") == [self.FACTS[2]]  # 두 사실 모두 3회
+        assert table.lookup("지각 몇 번이면 경고?") == [self.FACTS[3]]  # 질문 단어가 있는 사실
+        assert table.lookup("지각은 몇 분부터?") is None  # 묻는 단위(분)의 수치가 없음
+        assert FactTable(self.FACTS + [conflicting]).lookup("지각은 몇 번까지?") is None
+
+    def test_skips_truncated_sentences(self):
+        fragment = Fact(key="육아휴직", subject="육아휴직",
+                        text="육아휴직: 만 8세 이하 자녀를 위해 1년간 근무를 중단하는 것을",
+                        citation="규정.pdf p.1")
+
+        assert FactTable([fragment]).lookup("육아휴직은 몇 년까지 가능해?") is None
+
+    def test_agent_answers_from_table_without_retrieval(self, rag_index, rag_agent, embeddings):
+        FactTable(self.FACTS).save(rag_index)
+        agent = RAGAgent(top_k=2, index_path=str(rag_index), fact_lookup=True)
+        embeddings.query_calls = 0
+
+        result = agent.query("연차는 며칠인가요?")
+        streamed = "".join(agent.stream("연차는 며칠인가요?"))
+
+        expected = "연차는 15일을 부여한다.\n\n(출처: 규정.pdf p.3 · 제15조 연차휴가)"
+        assert result["answer"] == expected
+        assert streamed == result["answer"]
+        assert result["metadata"]["answered_by"] == "fact"
+        assert embeddings.query_calls == 0
+        assert agent.answer_stats()["fact_answers"] == 2
+
+
+class TestFAQIndex:
+    """FAQ 색인 테스트"""
+
+    ENTRIES = [
+        FAQEntry("기본 근무시간은?", "기본근무시간은 1일 7시간 30분입니다.", "rag_train.json"),
+        FAQEntry("코어타임이 뭐야?", "코어타임은 10:00~16:00입니다.", "rag_train.json"),
+    ]
+
+    def test_entries_load_with_approved_answers_overriding(self, tmp_path):
+        train = tmp_path / "rag_train.json"
+        train.write_text(json.dumps([{"conversations": [
+            {"role": "user", "content": "코어타임이 뭐야?"},
+            {"role": "assistant", "content": "코어타임은 필수 근무 시간대입니다."},
+        ]}]), encoding="utf-8")
+        approved = tmp_path / "faq_approved.json"
+        approved.write_text(json.dumps(
+            [{"question": "코어타임이 뭐야", "answer": "코어타임은 10:00~16:00입니다."}]),
+            encoding="utf-8")
+
+        entries = load_faq_entries([train, approved, tmp_path / "missing.json"])
+
+        assert [(e.answer, e.source) for e in entries] == [
+            ("코어타임은 10:00~16:00입니다.", "faq_approved.json"),
+        ]
+
+    def test_match_exact_and_lexical(self, embeddings):
+        faq = FAQIndex.build(self.ENTRIES, embeddings, namespace="test",
+                             lexical_weight=1.0, min_score=0.5)
+        calls = []
+
+        def embed_query(text):
+            calls.append(text)
+            return embeddings.embed_query(text)
+
+        assert faq.match("기본 근무 시간은??", embed_query).entry is self.ENTRIES[0]
+        assert calls == []  # 완전 일치는 임베딩 없음
+        assert faq.match("코어타임이 뭐야 알려줘", embed_query).entry is self.ENTRIES[1]
+        assert faq.match("출장비 정산 절차", embed_query) is None
+
+    def test_agent_answers_faq_and_reuses_query_vector_on_miss(
+        self, rag_index, rag_agent, embeddings
+    ):
+        namespace = rag_agent.embeddings.namespace
+        FAQIndex.build(self.ENTRIES, embeddings, namespace=namespace).save(rag_index)
+        agent = RAGAgent(top_k=2, index_path=str(rag_index), faq=True)
+        embeddings.query_calls = 0
+
+        hit = agent.query("기본 근무시간은?")
+        assert hit["answer"] == self.ENTRIES[0].answer
+        assert hit["metadata"]["answered_by"] == "faq"
+        assert embeddings.query_calls == 0
+
+        miss = agent.query("기본 근무시간 외 연장근로 수당은?")
+        assert miss["metadata"]["answered_by"] == "llm"
+        assert embeddings.query_calls == 1  # FAQ 비교와 검색이 같은 질문 벡터 사용
+        assert agent.answer_stats()["faq_answers"] == 1
+
+    def test_stale_index_version_is_ignored(self, rag_index, embeddings):
+        faq = FAQIndex.build(self.ENTRIES, embeddings, namespace="test", index_version="v1")
+        faq.save(rag_index)
+        (rag_index / "manifest.json").write_text(json.dumps({"version": "v2"}), encoding="utf-8")
+
+        assert FAQIndex.load(rag_index) is None
+
+
+class TestContextCompression:
+    """문맥 압축 테스트"""
+
+    ARTICLE = Document(
+        page_content="[제2장 휴가] 제15조 연차휴가\n"
+                     "① 연차휴가는 1년간 80% 이상 출근한 직원에게 15일을 부여한다.\n"
+                     "② 연차휴가 신청은 사내 근태 시스템으로 한다.\n"
+                     "③ 회사는 매년 사용 계획을 공지한다.",
+        metadata={"source": "규정.pdf", "page": 2, "article_id": "제15조",
+                  "article_key": "제2장 제15조"},
+    )
+    OTHER = Document(page_content="출장비는 실비로 정산한다. 숙박비는 1박 10만원 한도로 지급한다.",
+                     metadata={"source": "규정.pdf", "page": 9})
+
+    def test_keeps_relevant_sentences_in_order_within_budget(self):
+        compressor = ContextCompressor(token_budget=60)
+
+        docs = compressor.compress("연차휴가는 며칠 부여하나요?", [self.ARTICLE, self.OTHER])
+
+        assert len(docs) == 1
+        assert docs[0].page_content.startswith("[제2장 휴가] 제15조 연차휴가\n① 연차휴가는")
+        assert "출장비" not in docs[0].page_content
+        assert docs[0].metadata["article_key"] == "제2장 제15조"
+        assert estimate_tokens(docs[0].page_content) <= 60
+
+    def test_short_context_is_unchanged(self):
+        docs = [self.ARTICLE, self.OTHER]
+
+        assert ContextCompressor(token_budget=1000).compress("연차는?", docs) == docs
+
+    def test_agent_prompt_uses_compressed_context(self, rag_index, rag_agent, embeddings):
+        agent = RAGAgent(top_k=2, index_path=str(rag_index), context_compression=True,
+                         compression_token_budget=20)
+        embeddings.query_calls = 0
+
+        result = agent.query(REGULATION_TEXTS[0])
+
+        metadata = result["metadata"]
+        assert 0 < metadata["prompt_context_tokens"] < metadata["context_tokens"]
+        assert embeddings.query_calls == 1  # 압축도 검색과 같은 질문 벡터 사용
+
+
+class TestIndexHotSwap:
+    """버전별 인덱스 디렉토리 + 무중단 교체 테스트"""
+
+    def publish(self, root, texts, embeddings):
+        target = create_version_dir(root)
+        FAISS.from_texts(texts, embeddings).save_local(str(target))
+        publish_version(root, target)
+        return target.name
+
+    def test_publish_resolve_and_prune(self, tmp_path, embeddings):
+        assert resolve_index_path(tmp_path) == tmp_path  # CURRENT 없으면 루트 (기존 인덱스 호환)
+        names = [self.publish(tmp_path, REGULATION_TEXTS, embeddings) for _ in range(4)]
+
+        assert resolve_index_path(tmp_path) == tmp_path / names[-1]
+        assert prune_versions(tmp_path, keep=2) == names[:2]
+        assert list_versions(tmp_path) == names[2:]
+
+    def test_reload_swaps_agent_and_keeps_old_one_serving(self, tmp_path, rag_agent, embeddings):
+        first = self.publish(tmp_path, REGULATION_TEXTS, embeddings)
+        old = RAGAgent(top_k=1, index_path=str(tmp_path))
+        holder = SimpleNamespace(rag_agent=old)
+        swapped = []
+        reloader = IndexReloader(holder, tmp_path, on_swap=swapped.append)
+
+        assert old.index_version == first
+        assert reloader.reload().swapped is False
+
+        second = self.publish(tmp_path, ["제15조(연차휴가) 연차는 20일을 부여한다."], embeddings)
+        report = reloader.reload()
+
+        assert (report.swapped, report.previous_version, report.version) == (True, first, second)
+        assert swapped == [holder.rag_agent] and holder.rag_agent is not old
+        assert holder.rag_agent.retrieve("연차")[0][0].page_content.endswith("20일을 부여한다.")
+        assert old.retrieve(REGULATION_TEXTS[1])[0][0].page_content == REGULATION_TEXTS[1]
+        old.query(REGULATION_TEXTS[1])
+        assert holder.rag_agent.answer_stats()["queries"] == 1  # 통계는 교체 후에도 누적
+
+    def test_failed_load_keeps_current_agent(self, tmp_path, rag_agent, embeddings):
+        self.publish(tmp_path, REGULATION_TEXTS, embeddings)
+        old = RAGAgent(top_k=1, index_path=str(tmp_path))
+        holder = SimpleNamespace(rag_agent=old)
+        publish_version(tmp_path, create_version_dir(tmp_path))  # 빈 버전
+
+        with pytest.raises(RAGRetrievalError):
+            IndexReloader(holder, tmp_path).reload()
+        assert holder.rag_agent is old
+
+
+class TestShardedRetrieval:
+    """샤드 인덱스 병렬 검색 + 검색 범위 테스트"""
+
+    @staticmethod
+    def build(root, embeddings):
+        pages = [("docs/a.pdf", 0), ("docs/a.pdf", 2), ("docs/b.pdf", 0)]
+        docs = [
+            Document(page_content=text, metadata={"source": source, "page": page})
+            for text, (source, page) in zip(REGULATION_TEXTS, pages)
+        ]
+        groups = group_shards(docs)
+        for name, shard_docs in groups.items():
+            FAISS.from_documents(shard_docs, embeddings).save_local(str(root / SHARDS_DIR / name))
+        save_catalog(root, build_catalog(groups))
+        return root
+
+    @pytest.fixture
+    def sharded_index(self, tmp_path, embeddings):
+        return self.build(tmp_path / "sharded", embeddings)
+
+    def test_catalog_records_sources_and_pages(self, sharded_index):
+        catalog = json.loads((sharded_index / "shards.json").read_text(encoding="utf-8"))
+        assert catalog == {
+            "a": {"sources": {"a.pdf": [1, 3]}, "chunks": 2},
+            "b": {"sources": {"b.pdf": [1, 1]}, "chunks": 1},
+        }
+
+    def test_retrieves_across_shards(self, rag_agent, sharded_index):
+        agent = RAGAgent(top_k=3, index_path=str(sharded_index))
+
+        assert agent.sharded is not None and len(agent.sharded) == 2
+        assert agent.retrieve(REGULATION_TEXTS[2])[0][0].page_content == REGULATION_TEXTS[2]
+        assert len(agent.retrieve(REGULATION_TEXTS[0])) == 3
+
+    def test_filter_selects_shards_and_pages(self, rag_agent, sharded_index):
+        agent = RAGAgent(top_k=3, index_path=str(sharded_index))
+
+        def contents(search_filter):
+            return [doc.page_content
+                    for doc, _ in agent.retrieve(REGULATION_TEXTS[0], search_filter=search_filter)]
+
+        by_source = SearchFilter(sources=["b.pdf"])
+        selected = agent.sharded.select(by_source)
+        assert [(shard.name, covered) for shard, covered in selected] == [("b", True)]
+        assert contents(by_source) == [REGULATION_TEXTS[2]]
+
+        by_page = SearchFilter(sources=["a.pdf"], pages=[3])
+        assert contents(by_page) == [REGULATION_TEXTS[1]]
+        assert agent.sharded.select(SearchFilter(collections=["c"])) == []
+
+    def test_reload_closes_previous_shard_pool(self, tmp_path, rag_agent, embeddings):
+        publish_version(tmp_path, self.build(create_version_dir(tmp_path), embeddings))
+        old = RAGAgent(top_k=3, index_path=str(tmp_path))
+        holder = SimpleNamespace(rag_agent=old)
+        publish_version(tmp_path, self.build(create_version_dir(tmp_path), embeddings))
+
+        assert IndexReloader(holder, tmp_path).reload().swapped
+        assert old.sharded._pool._shutdown and not holder.rag_agent.sharded._pool._shutdown
+        # 교체 전에 이전 에이전트를 잡은 요청도 응답 (샤드 순차 검색)
+        assert old.retrieve(REGULATION_TEXTS[2])[0][0].page_content == REGULATION_TEXTS[2]
+
+    def test_filter_on_single_index(self, rag_agent):
+        docs = rag_agent.retrieve(REGULATION_TEXTS[0], search_filter=SearchFilter(pages=[99]))
+        assert docs == []
+
+
+class TestMmapIndex:
+    """mmap 인덱스 포맷 테스트"""
+
+    def test_mmap_index_matches_pickle_results(self, rag_index, rag_agent):
+        pickled = rag_agent.retrieve(REGULATION_TEXTS[1])
+        save_mmap_index(rag_agent.vectorstore, rag_index)
+
+        agent = RAGAgent(top_k=2, index_path=str(rag_index))
+        mapped = agent.retrieve(REGULATION_TEXTS[1])
+
+        assert isinstance(agent.vectorstore.docstore, MmapDocstore)
+        assert [doc.page_content for doc, _ in mapped] == [doc.page_content for doc, _ in pickled]
+        assert [doc.id for doc, _ in mapped] == [doc.id for doc, _ in pickled]
+
+    def test_loads_without_mmap_ifc_flag(self, rag_index, rag_agent, monkeypatch):
+        # faiss 1.9 (requirements.txt 고정 버전)에는 IO_FLAG_MMAP_IFC가 없음
+        monkeypatch.delattr(faiss, "IO_FLAG_MMAP_IFC", raising=False)
+        save_mmap_index(rag_agent.vectorstore, rag_index)
+
+        agent = RAGAgent(top_k=2, index_path=str(rag_index))
+
+        assert mmap_io_flags() == faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+        assert isinstance(agent.vectorstore.docstore, MmapDocstore)
+        assert agent.retrieve(REGULATION_TEXTS[1])[0][0].page_content == REGULATION_TEXTS[1]
+
+    def test_pickle_format_can_be_forced(self, rag_index, rag_agent):
+        save_mmap_index(rag_agent.vectorstore, rag_index)
+
+        agent = RAGAgent(top_k=2, index_path=str(rag_index), index_format="pickle")
+
+        assert not isinstance(agent.vectorstore.docstore, MmapDocstore)